@@ -0,0 +1,74 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Performance benchmarks for PyGranta BoM Analytics.
+
+Each query type is run against a mocked Granta MI server which returns synthetic responses scaled to the requested
+number of records or parts. The :class:`~ansys.grantami.bomanalytics.BoMHandler` load, dump and convert operations are
+run on synthetic BoMs of the same size.
+
+Synthetic BoMs and the matching BoM query responses are created by :class:`SyntheticDatabase`, which can also be used
+to run tests on large BoMs without access to Granta MI.
+
+Run the benchmarks from the root of the repository and store the results::
+
+    python -m benchmarks run --scale 10000 --output baseline.json
+
+Compare a later run with the stored results, and exit with a non-zero status if any benchmark is slower or uses more
+memory than the baseline by more than the tolerance::
+
+    python -m benchmarks run --scale 10000 --output current.json
+    python -m benchmarks compare baseline.json current.json --tolerance 0.2
+"""
+
+from ._cases import BENCHMARKS, HandlerBenchmark, QueryBenchmark
+from ._runner import (
+    BenchmarkResult,
+    Regression,
+    compare,
+    dump_results,
+    format_results,
+    load_results,
+    read_results,
+    run_benchmark,
+    run_benchmarks,
+)
+from ._synthetic import LEGISLATION_THRESHOLD, BoMShape, SyntheticDatabase
+
+__all__ = [
+    "BENCHMARKS",
+    "BenchmarkResult",
+    "BoMShape",
+    "HandlerBenchmark",
+    "LEGISLATION_THRESHOLD",
+    "QueryBenchmark",
+    "Regression",
+    "SyntheticDatabase",
+    "compare",
+    "dump_results",
+    "format_results",
+    "load_results",
+    "read_results",
+    "run_benchmark",
+    "run_benchmarks",
+]
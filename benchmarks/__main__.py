@@ -0,0 +1,83 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Command line interface for the benchmarks. Run ``python -m benchmarks --help`` for usage."""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from ._runner import compare, dump_results, format_results, read_results, run_benchmarks
+
+
+def _check(baseline_path: str, current_path: str, tolerance: float) -> int:
+    regressions = compare(read_results(baseline_path), read_results(current_path), tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        return 1
+    print(f"No regressions compared to {baseline_path} (tolerance {tolerance:.0%})")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument("--scale", type=int, default=1000, help="Number of records or parts. Default: 1000.")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Number of measured runs. Default: 5.")
+    run_parser.add_argument("--warmup", type=int, default=1, help="Number of unmeasured runs. Default: 1.")
+    run_parser.add_argument("--no-memory", action="store_true", help="Do not measure peak memory.")
+    run_parser.add_argument("--only", nargs="+", metavar="NAME", help="Names of the benchmarks to run.")
+    run_parser.add_argument("--output", help="Write the results to this JSON file.")
+    run_parser.add_argument("--baseline", help="Compare the results to this JSON file after the run.")
+    run_parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed fractional increase. Default: 0.2.")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two stored runs.")
+    compare_parser.add_argument("baseline", help="JSON file with the reference results.")
+    compare_parser.add_argument("current", help="JSON file with the results to check.")
+    compare_parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed fractional increase. Default: 0.2."
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        return _check(args.baseline, args.current, args.tolerance)
+
+    results = run_benchmarks(args.scale, args.repeat, args.warmup, not args.no_memory, args.only)
+    print(format_results(results))
+    output = args.output
+    if output is not None:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(dump_results(results), f, indent=2)
+    if args.baseline is None:
+        return 0
+    if output is None:
+        raise SystemExit("--baseline requires --output")
+    return _check(args.baseline, output, args.tolerance)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmarks for each query type and for the :class:`~ansys.grantami.bomanalytics.BoMHandler` class."""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Type, Union, cast
+
+from ansys.grantami.bomanalytics import BoMHandler, indicators, queries
+from ansys.grantami.bomanalytics.bom_types import eco2412, eco2505
+
+from . import _payloads
+from ._synthetic import BoMShape, SyntheticDatabase
+
+INDICATORS = [
+    indicators.WatchListIndicator(name=_payloads.WATCH_LIST_INDICATOR, legislation_ids=[_payloads.LEGISLATION_ID]),
+    indicators.RoHSIndicator(name=_payloads.ROHS_INDICATOR, legislation_ids=["RoHS"]),
+]
+DATABASE = SyntheticDatabase(seed=0)
+"""Records referenced by the BoMs in the BoM query and BoM handler benchmarks."""
+
+
+@dataclass(frozen=True)
+class QueryBenchmark:
+    """Run a query against a mocked Granta MI server.
+
+    The inputs are created once by ``prepare``. Building the query from the inputs with ``build`` is included in the
+    measured time, running the query is measured, and ``responses`` returns the encoded response to each batch in the
+    order the batches are sent.
+    """
+
+    name: str
+    prepare: Callable[[int], Any]
+    build: Callable[[Any], queries._BaseQuery]
+    responses: Callable[[queries._BaseQuery, Any], List[bytes]]
+
+
+@dataclass(frozen=True)
+class HandlerBenchmark:
+    """Call a :class:`~ansys.grantami.bomanalytics.BoMHandler` method.
+
+    ``prepare`` creates the inputs and returns a function which performs the measured operation.
+    """
+
+    name: str
+    prepare: Callable[[int], Callable[[], Any]]
+
+
+Benchmark = Union[QueryBenchmark, HandlerBenchmark]
+
+
+def _record_benchmark(
+    query_type: Type[queries._RecordBasedQueryBuilder],
+    add_records: str,
+    item_type: str,
+    reference_type: str,
+) -> QueryBenchmark:
+    def prepare(scale: int) -> List[str]:
+        return [f"{reference_type}-{index}" for index in range(scale)]
+
+    def build(references: List[str]) -> queries._BaseQuery:
+        query = getattr(query_type(), add_records)(references)
+        if isinstance(query, queries._ComplianceMixin):
+            return query.with_indicators(INDICATORS)
+        return query.with_legislation_ids([_payloads.LEGISLATION_ID])
+
+    def responses(query: queries._BaseQuery, references: List[str]) -> List[bytes]:
+        batch_size = query._data.batch_size
+        batches = [references[start : start + batch_size] for start in range(0, len(references), batch_size)]
+        return [_payloads.encode(_payloads.record_response(item_type, reference_type, batch)) for batch in batches]
+
+    return QueryBenchmark(query_type.__name__, prepare, build, responses)
+
+
+def _bom_benchmark(
+    query_type: Type[queries._BomQueryBuilder],
+    create_response: Callable[[eco2505.BillOfMaterials, queries._BaseQuery], Dict[str, Any]],
+) -> QueryBenchmark:
+    def build(bom: eco2505.BillOfMaterials) -> queries._BaseQuery:
+        query = query_type().with_bom(bom)
+        if isinstance(query, queries._ComplianceMixin):
+            return query.with_indicators(INDICATORS)
+        if isinstance(query, queries._ImpactedSubstanceMixin):
+            return query.with_legislation_ids([_payloads.LEGISLATION_ID])
+        return query
+
+    def responses(query: queries._BaseQuery, bom: eco2505.BillOfMaterials) -> List[bytes]:
+        return [_payloads.encode(create_response(bom, query))]
+
+    return QueryBenchmark(query_type.__name__, _make_bom, build, responses)
+
+
+def _make_bom(scale: int) -> eco2505.BillOfMaterials:
+    return cast(eco2505.BillOfMaterials, DATABASE.generate_bom(BoMShape.with_part_count(scale)))
+
+
+def _part_count(bom: eco2505.BillOfMaterials) -> int:
+    count = 0
+    stack = list(bom.components)
+    while stack:
+        part = stack.pop()
+        stack.extend(part.components)
+        count += 1
+    return count
+
+
+def _load_bom(scale: int) -> Callable[[], Any]:
+    handler = BoMHandler()
+    text = handler.dump_bom(_make_bom(scale))
+    return lambda: handler.load_bom_from_text(text)
+
+
+def _dump_bom(scale: int) -> Callable[[], Any]:
+    handler = BoMHandler()
+    bom = _make_bom(scale)
+    return lambda: handler.dump_bom(bom)
+
+
+def _convert_bom(scale: int) -> Callable[[], Any]:
+    handler = BoMHandler()
+    bom = _make_bom(scale)
+    return lambda: handler.convert(bom, eco2412.BillOfMaterials)
+
+
+BENCHMARKS: List[Benchmark] = [
+    _record_benchmark(queries.MaterialComplianceQuery, "with_material_ids", "Materials", "MaterialId"),
+    _record_benchmark(queries.PartComplianceQuery, "with_part_numbers", "Parts", "PartNumber"),
+    _record_benchmark(
+        queries.SpecificationComplianceQuery, "with_specification_ids", "Specifications", "SpecificationId"
+    ),
+    _record_benchmark(queries.SubstanceComplianceQuery, "with_cas_numbers", "Substances", "CasNumber"),
+    _record_benchmark(
+        queries.MaterialImpactedSubstancesQuery, "with_material_ids", "ImpactedSubstancesMaterials", "MaterialId"
+    ),
+    _record_benchmark(
+        queries.PartImpactedSubstancesQuery, "with_part_numbers", "ImpactedSubstancesParts", "PartNumber"
+    ),
+    _record_benchmark(
+        queries.SpecificationImpactedSubstancesQuery,
+        "with_specification_ids",
+        "ImpactedSubstancesSpecifications",
+        "SpecificationId",
+    ),
+    _bom_benchmark(queries.BomComplianceQuery, lambda bom, query: DATABASE.compliance_response(bom, INDICATORS)),
+    _bom_benchmark(
+        queries.BomImpactedSubstancesQuery,
+        lambda bom, query: DATABASE.impacted_substances_response(bom, [_payloads.LEGISLATION_ID]),
+    ),
+    _bom_benchmark(queries.BomSustainabilityQuery, lambda bom, query: DATABASE.sustainability_response(bom)),
+    _bom_benchmark(
+        queries.BomSustainabilitySummaryQuery,
+        lambda bom, query: _payloads.bom_sustainability_summary_response(_part_count(bom)),
+    ),
+    HandlerBenchmark("BoMHandler.load_bom_from_text", _load_bom),
+    HandlerBenchmark("BoMHandler.dump_bom", _dump_bom),
+    HandlerBenchmark("BoMHandler.convert", _convert_bom),
+]
+"""All benchmarks, in the order they are run."""
@@ -0,0 +1,231 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Synthetic Granta MI responses for record-based queries and BoM sustainability summary queries.
+
+Responses contain the same items as the payloads in ``tests/inputs/payloads``, repeated to reach the required size.
+Responses are encoded to JSON in advance so that the mocked server does not contribute to the measured time. Responses
+for the other BoM queries are created by :class:`~benchmarks.SyntheticDatabase`.
+"""
+
+import json
+from typing import Any, Dict, List
+
+LEGISLATION_ID = "SINList"
+WATCH_LIST_INDICATOR = "Indicator 1"
+ROHS_INDICATOR = "Indicator 2"
+
+
+def encode(response: Dict[str, Any]) -> bytes:
+    """Encode a response in the same compact form returned by Granta MI."""
+    return json.dumps(response, separators=(",", ":")).encode("utf-8")
+
+
+def _indicators(watch_list_flag: str, rohs_flag: str) -> List[Dict[str, str]]:
+    return [{"Name": WATCH_LIST_INDICATOR, "Flag": watch_list_flag}, {"Name": ROHS_INDICATOR, "Flag": rohs_flag}]
+
+
+def _substance_with_compliance(reference_value: str) -> Dict[str, Any]:
+    return {
+        "Indicators": _indicators("WatchListBelowThreshold", "RohsBelowThreshold"),
+        "PercentageAmount": 0.1,
+        "ReferenceType": "MiRecordHistoryIdentity",
+        "ReferenceValue": reference_value,
+    }
+
+
+def _material_with_compliance(reference_type: str, reference_value: str) -> Dict[str, Any]:
+    return {
+        "Indicators": _indicators("WatchListAllSubstancesBelowThreshold", "RohsCompliant"),
+        "Substances": [_substance_with_compliance("12345")],
+        "ReferenceType": reference_type,
+        "ReferenceValue": reference_value,
+    }
+
+
+def _part_with_compliance(reference_value: str, parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "Indicators": _indicators("WatchListAllSubstancesBelowThreshold", "RohsCompliant"),
+        "Parts": parts,
+        "Specifications": [],
+        "Materials": [] if parts else [_material_with_compliance("MiRecordHistoryIdentity", "23456")],
+        "Substances": [],
+        "ReferenceType": "PartNumber",
+        "ReferenceValue": reference_value,
+    }
+
+
+def _specification_with_compliance(reference_value: str) -> Dict[str, Any]:
+    return {
+        "Indicators": _indicators("WatchListAllSubstancesBelowThreshold", "RohsCompliant"),
+        "Specifications": [],
+        "Coatings": [],
+        "Materials": [_material_with_compliance("MiRecordHistoryIdentity", "23456")],
+        "Substances": [],
+        "ReferenceType": "SpecificationId",
+        "ReferenceValue": reference_value,
+    }
+
+
+def _impacted_substances() -> List[Dict[str, Any]]:
+    return [
+        {
+            "LegislationId": LEGISLATION_ID,
+            "ImpactedSubstances": [
+                {
+                    "SubstanceName": "1,3-Butadiene",
+                    "CasNumber": "106-99-0",
+                    "EcNumber": "203-450-8",
+                    "MaxPercentageAmountInMaterial": None,
+                    "LegislationThreshold": 0.1,
+                },
+                {
+                    "SubstanceName": "Butylated hydroxytoluene [BAN:NF]",
+                    "CasNumber": "128-37-0",
+                    "EcNumber": "204-881-4",
+                    "MaxPercentageAmountInMaterial": None,
+                    "LegislationThreshold": 0.1,
+                },
+            ],
+        }
+    ]
+
+
+def record_response(item_type: str, reference_type: str, reference_values: List[str]) -> Dict[str, Any]:
+    """Create the response to a batch of a record-based query.
+
+    Parameters
+    ----------
+    item_type : str
+        Type of item in the response, and the name of the response field which contains the items. One of
+        ``"Materials"``, ``"Parts"``, ``"Specifications"`` or ``"Substances"`` for compliance queries, or the same
+        name prefixed with ``"ImpactedSubstances"`` for impacted substances queries.
+    reference_type : str
+        Type of reference used to identify the items in the request.
+    reference_values : list[str]
+        References of the items in the request. The response contains one item for each reference.
+    """
+    if item_type.startswith("ImpactedSubstances"):
+        field = item_type[len("ImpactedSubstances") :]
+        items = [
+            {"Legislations": _impacted_substances(), "ReferenceType": reference_type, "ReferenceValue": value}
+            for value in reference_values
+        ]
+        return {field: items, "LogMessages": []}
+    if item_type == "Materials":
+        items = [_material_with_compliance(reference_type, value) for value in reference_values]
+    elif item_type == "Parts":
+        items = [_part_with_compliance(value, []) for value in reference_values]
+    elif item_type == "Specifications":
+        items = [_specification_with_compliance(value) for value in reference_values]
+    elif item_type == "Substances":
+        items = [{**_substance_with_compliance(value), "ReferenceType": reference_type} for value in reference_values]
+    else:
+        raise ValueError(f'Unknown item type "{item_type}"')
+    return {item_type: items, "LogMessages": []}
+
+
+def _value(value: float, unit: str) -> Dict[str, Any]:
+    return {"Value": value, "Unit": unit}
+
+
+def _reference(reference_value: str) -> Dict[str, Any]:
+    return {"ReferenceType": "MiRecordGuid", "ReferenceValue": reference_value}
+
+
+def _phase_summary(phase: str) -> Dict[str, Any]:
+    return {
+        "Phase": phase,
+        "EmbodiedEnergy": _value(100.0, "MJ"),
+        "EmbodiedEnergyPercentage": 33.3,
+        "ClimateChange": _value(10.0, "kg"),
+        "ClimateChangePercentage": 33.3,
+    }
+
+
+def _impact(percentage: float) -> Dict[str, Any]:
+    return {
+        "EmbodiedEnergy": _value(10.0, "MJ"),
+        "EmbodiedEnergyPercentage": percentage,
+        "ClimateChange": _value(1.0, "kg"),
+        "ClimateChangePercentage": percentage,
+    }
+
+
+def bom_sustainability_summary_response(part_count: int) -> Dict[str, Any]:
+    """Create the response to a BoM sustainability summary query with one material, process and transport stage
+    summary for each part."""
+    percentage = 100.0 / max(part_count, 1)
+    materials = [
+        {
+            "Identity": f"Material {index}",
+            "RecordReference": _reference("cebc4725-623e-4507-818f-06e8a734c681"),
+            **_impact(percentage),
+            "MassBeforeProcessing": _value(2.5, "kg"),
+            "MassAfterProcessing": _value(2.0, "kg"),
+            "LargestContributors": [
+                {
+                    "ComponentName": f"Part {index}",
+                    "ComponentPartNumber": f"P{index}",
+                    "RecordReference": {"ExternalIdentity": str(index), "Name": "", "Id": f"P{index}"},
+                    "MaterialMassBeforeProcessing": _value(2.5, "kg"),
+                }
+            ],
+        }
+        for index in range(part_count)
+    ]
+    processes = [
+        {
+            "ProcessName": f"Process {index}",
+            "ProcessRecordReference": _reference("03de1a28-7dd7-4354-bbd8-c839cfa00ec7"),
+            "MaterialRecordReference": _reference("cebc4725-623e-4507-818f-06e8a734c681"),
+            "MaterialIdentity": f"Material {index}",
+            **_impact(percentage),
+        }
+        for index in range(part_count)
+    ]
+    transports = [
+        {
+            "StageName": f"Transport {index}",
+            "RecordReference": {**_reference("b916ed6b-5e06-4343-9131-d4d562e2d12b"), "Id": f"T{index}"},
+            "Distance": _value(200.0, "km"),
+            **_impact(percentage),
+        }
+        for index in range(part_count)
+    ]
+    return {
+        "MaterialSummary": {"Summary": materials, "PhaseSummary": _phase_summary("Material")},
+        "ProcessSummary": {
+            "PrimaryProcesses": [],
+            "SecondaryProcesses": processes,
+            "JoiningAndFinishingProcesses": [],
+            "PhaseSummary": _phase_summary("Processes"),
+        },
+        "TransportSummary": {
+            "Summary": transports,
+            "PartSummary": [],
+            "CategorySummary": [],
+            "PhaseSummary": _phase_summary("Transport"),
+        },
+        "LogMessages": [],
+    }
@@ -0,0 +1,273 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Run benchmarks, and compare the results of two runs."""
+
+from dataclasses import asdict, dataclass, field
+from itertools import cycle
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import requests_mock
+
+from ansys.grantami.bomanalytics import Connection, __version__
+from ansys.grantami.bomanalytics._connection import BomAnalyticsClient
+
+from ._cases import BENCHMARKS, Benchmark, QueryBenchmark
+
+SERVICE_LAYER_URL = "http://localhost/mi_servicelayer"
+LICENSE_RESPONSE = {"LogMessages": [], "RestrictedSubstances": True, "Sustainability": True}
+RESULTS_FORMAT = "bomanalytics-benchmarks"
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements for a single benchmark. All times are in seconds, and are the median of all repeats."""
+
+    name: str
+    scale: int
+    """Number of records or parts."""
+    repeat: int
+    wall_time: float
+    min_time: float
+    throughput: float
+    """Number of records or parts processed per second."""
+    peak_memory: Optional[int] = None
+    """Largest amount of memory allocated by Python while the benchmark was running, in bytes."""
+    breakdown: Dict[str, float] = field(default_factory=dict)
+    """Time spent building requests, in the mocked server, decoding JSON responses, and constructing the result. Only
+    populated for query benchmarks."""
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A measurement that is worse than the baseline by more than the tolerance."""
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.metric} increased from {self.baseline:.6g} to {self.current:.6g} ({self.ratio:.2f}x)"
+        )
+
+
+def _connect(mocker: requests_mock.Mocker) -> BomAnalyticsClient:
+    mocker.get(requests_mock.ANY, json=LICENSE_RESPONSE)
+    return Connection(api_url=SERVICE_LAYER_URL).with_anonymous().connect()
+
+
+def _breakdown(elapsed: float, result: Any) -> Dict[str, float]:
+    report = result.execution_report
+    breakdown = {
+        "server": report.server_latency,
+        "json_decode": report.deserialization_time,
+        "result_construction": report.result_build_time,
+    }
+    breakdown["request_building"] = max(elapsed - sum(breakdown.values()), 0.0)
+    return breakdown
+
+
+def _measure(
+    iteration: Callable[[], Any], repeat: int, warmup: int, memory: bool, with_breakdown: bool
+) -> Tuple[List[float], List[Dict[str, float]], Optional[int]]:
+    for _ in range(warmup):
+        iteration()
+    times = []
+    breakdowns = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = iteration()
+        elapsed = time.perf_counter() - started
+        times.append(elapsed)
+        if with_breakdown:
+            breakdowns.append(_breakdown(elapsed, result))
+        del result
+    peak_memory = None
+    if memory:
+        # Tracing allocations slows down the benchmark, so memory is measured in a separate run
+        tracemalloc.start()
+        try:
+            iteration()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return times, breakdowns, peak_memory
+
+
+def run_benchmark(
+    benchmark: Benchmark, scale: int, repeat: int = 5, warmup: int = 1, memory: bool = True
+) -> BenchmarkResult:
+    """Run a single benchmark.
+
+    Parameters
+    ----------
+    benchmark : QueryBenchmark | HandlerBenchmark
+        Benchmark to run.
+    scale : int
+        Number of records or parts.
+    repeat : int, default: 5
+        Number of measured runs.
+    warmup : int, default: 1
+        Number of runs before the measured runs, which populate caches such as the BoM schemas.
+    memory : bool, default: True
+        Whether to measure the peak memory in an additional run.
+    """
+    if isinstance(benchmark, QueryBenchmark):
+        with requests_mock.Mocker() as mocker:
+            connection = _connect(mocker)
+            inputs = benchmark.prepare(scale)
+            bodies = cycle(benchmark.responses(benchmark.build(inputs), inputs))
+            mocker.post(
+                requests_mock.ANY,
+                content=lambda request, context: next(bodies),
+                headers={"Content-Type": "application/json"},
+            )
+            times, breakdowns, peak_memory = _measure(
+                lambda: connection.run(benchmark.build(inputs)), repeat, warmup, memory, with_breakdown=True
+            )
+    else:
+        times, breakdowns, peak_memory = _measure(
+            benchmark.prepare(scale), repeat, warmup, memory, with_breakdown=False
+        )
+    wall_time = statistics.median(times)
+    return BenchmarkResult(
+        name=benchmark.name,
+        scale=scale,
+        repeat=repeat,
+        wall_time=wall_time,
+        min_time=min(times),
+        throughput=scale / wall_time if wall_time else 0.0,
+        peak_memory=peak_memory,
+        breakdown={key: statistics.median(b[key] for b in breakdowns) for key in breakdowns[0]} if breakdowns else {},
+    )
+
+
+def run_benchmarks(
+    scale: int,
+    repeat: int = 5,
+    warmup: int = 1,
+    memory: bool = True,
+    names: Optional[Iterable[str]] = None,
+) -> List[BenchmarkResult]:
+    """Run all benchmarks, or the benchmarks with the specified names.
+
+    Parameters are passed to :func:`run_benchmark`.
+    """
+    selected = BENCHMARKS
+    if names is not None:
+        names = set(names)
+        unknown = names - {benchmark.name for benchmark in BENCHMARKS}
+        if unknown:
+            raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+        selected = [benchmark for benchmark in BENCHMARKS if benchmark.name in names]
+    return [run_benchmark(benchmark, scale, repeat, warmup, memory) for benchmark in selected]
+
+
+def dump_results(results: List[BenchmarkResult]) -> Dict[str, Any]:
+    """Convert results to a JSON-compatible document, including details of the environment they were measured in."""
+    return {
+        "format": RESULTS_FORMAT,
+        "version": 1,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "bomanalytics": __version__,
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def load_results(document: Dict[str, Any]) -> List[BenchmarkResult]:
+    """Read results from a document created by :func:`dump_results`."""
+    if document.get("format") != RESULTS_FORMAT:
+        raise ValueError("Not a benchmark results document.")
+    return [BenchmarkResult(**result) for result in document["results"]]
+
+
+def read_results(path: str) -> List[BenchmarkResult]:
+    """Read results from a JSON file."""
+    with open(path, encoding="utf-8") as f:
+        return load_results(json.load(f))
+
+
+def compare(
+    baseline: List[BenchmarkResult], current: List[BenchmarkResult], tolerance: float = 0.2
+) -> List[Regression]:
+    """Find benchmarks which are slower or use more memory than the baseline.
+
+    Benchmarks are compared if they have the same name and scale. Benchmarks which are only in one of the runs are
+    ignored.
+
+    Parameters
+    ----------
+    baseline : list[BenchmarkResult]
+        Results of the reference run.
+    current : list[BenchmarkResult]
+        Results of the run to check.
+    tolerance : float, default: 0.2
+        Fractional increase allowed for each measurement. For example, ``0.2`` allows the current run to be 20% slower
+        than the baseline.
+    """
+    baseline_results = {(result.name, result.scale): result for result in baseline}
+    regressions = []
+    for result in current:
+        reference = baseline_results.get((result.name, result.scale))
+        if reference is None:
+            continue
+        measurements = [("wall_time", reference.wall_time, result.wall_time)]
+        if reference.peak_memory and result.peak_memory is not None:
+            measurements.append(("peak_memory", reference.peak_memory, result.peak_memory))
+        for metric, reference_value, value in measurements:
+            if value > reference_value * (1 + tolerance):
+                regressions.append(Regression(result.name, metric, reference_value, value))
+    return regressions
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    """Format results as a table."""
+    header = (
+        f"{'Benchmark':<40}{'Scale':>9}{'Time (s)':>11}{'Items/s':>12}{'Peak (MiB)':>12}"
+        f"{'Request':>9}{'Server':>9}{'Decode':>9}{'Result':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        peak = f"{result.peak_memory / 2**20:.1f}" if result.peak_memory is not None else "-"
+        line = f"{result.name:<40}{result.scale:>9}{result.wall_time:>11.4f}{result.throughput:>12.0f}{peak:>12}"
+        if result.breakdown:
+            total = sum(result.breakdown.values()) or 1.0
+            for key in ("request_building", "server", "json_decode", "result_construction"):
+                line += f"{result.breakdown[key] / total:>9.0%}"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,600 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Seedable synthetic BoMs, and Granta MI responses which are consistent with them.
+
+A :class:`SyntheticDatabase` contains a fixed set of material, substance, process and transport records, and defines
+the substances in each material. BoMs generated by the database reference these records, and the responses created
+for a BoM report the substances and impacts of the records it references. The same seed always produces the same
+records, BoMs and responses.
+"""
+
+from dataclasses import dataclass
+import random
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
+import uuid
+
+from ansys.grantami.bomanalytics import indicators
+from ansys.grantami.bomanalytics.bom_types import eco2301, eco2412, eco2505
+
+BillOfMaterials = Union[eco2301.BillOfMaterials, eco2412.BillOfMaterials, eco2505.BillOfMaterials]
+Indicator = Union[indicators.RoHSIndicator, indicators.WatchListIndicator]
+
+_bom_modules: Dict[Type[BillOfMaterials], ModuleType] = {
+    eco2301.BillOfMaterials: eco2301,
+    eco2412.BillOfMaterials: eco2412,
+    eco2505.BillOfMaterials: eco2505,
+}
+
+DATABASE_KEY = "MI_Restricted_Substances"
+LEGISLATION_THRESHOLD = 0.1
+"""Percentage above which a substance is reported as above threshold for all legislations."""
+
+
+@dataclass(frozen=True)
+class BoMShape:
+    """Structure of a generated BoM.
+
+    The BoM contains a single product part. Parts are added level by level, with ``fan_out`` children for each part,
+    until ``depth`` levels have been added below the product or the BoM contains ``max_parts`` parts. Parts without
+    children contain materials and substances.
+    """
+
+    depth: int = 3
+    """Number of levels of parts below the product."""
+
+    fan_out: int = 10
+    """Number of child parts of each assembly."""
+
+    max_parts: Optional[int] = None
+    """Maximum number of parts in the BoM, including the product. If ``None``, all levels are complete."""
+
+    materials_per_part: int = 1
+    """Number of materials in each part without children."""
+
+    processes_per_material: int = 1
+    """Number of processes applied to each material."""
+
+    substances_per_part: int = 0
+    """Number of substances declared directly in each part without children."""
+
+    transport_stages: int = 0
+    """Number of transport stages for the BoM as a whole."""
+
+    transport_stages_per_part: int = 0
+    """Number of transport stages in each part without children. Not supported by 23/01 BoMs."""
+
+    @property
+    def part_count(self) -> int:
+        """Number of parts in a BoM with this shape, including the product."""
+        complete = sum(self.fan_out**level for level in range(self.depth + 1))
+        return complete if self.max_parts is None else min(complete, self.max_parts)
+
+    @classmethod
+    def with_part_count(cls, part_count: int, fan_out: int = 10, **kwargs: Any) -> "BoMShape":
+        """Create a shape with exactly ``part_count`` parts, with as many levels as required by ``fan_out``.
+
+        Other keyword arguments are passed to the constructor.
+        """
+        if part_count < 1:
+            raise ValueError("A BoM must contain at least one part.")
+        depth, capacity = 0, 1
+        while capacity < part_count:
+            depth += 1
+            capacity += fan_out**depth
+        return cls(depth=depth, fan_out=fan_out, max_parts=part_count, **kwargs)
+
+
+@dataclass(frozen=True)
+class _Substance:
+    guid: str
+    name: str
+    cas_number: str
+    ec_number: str
+
+
+@dataclass(frozen=True)
+class _Material:
+    guid: str
+    name: str
+    substances: Tuple[Tuple[_Substance, float], ...]
+    """Substances in the material, and the percentage of each substance."""
+    embodied_energy: float
+    """Embodied energy per kg, in MJ."""
+    climate_change: float
+    """CO2 footprint per kg, in kg."""
+    recyclable: bool
+
+
+@dataclass(frozen=True)
+class _Process:
+    guid: str
+    name: str
+    embodied_energy: float
+    climate_change: float
+
+
+def _value(value: float, unit: str) -> Dict[str, Any]:
+    return {"Value": value, "Unit": unit}
+
+
+def _record_reference(guid: str) -> Dict[str, str]:
+    return {"ReferenceType": "MiRecordGuid", "ReferenceValue": guid}
+
+
+class SyntheticDatabase:
+    """Records referenced by generated BoMs, and the content and impact of each record.
+
+    Parameters
+    ----------
+    seed : int, default: 0
+        Seed for all random values. Databases with the same seed and parameters are identical.
+    material_count : int, default: 1000
+        Number of material records. Parts choose materials from these records, so a smaller number of records
+        produces more repeated materials in a BoM.
+    substance_count : int, default: 5000
+        Number of substance records.
+    substances_per_material : int, default: 3
+        Number of substances in each material.
+    above_threshold_fraction : float, default: 0.05
+        Fraction of substances in materials and parts with a percentage above :data:`LEGISLATION_THRESHOLD`.
+    process_count : int, default: 50
+        Number of process records.
+    transport_count : int, default: 20
+        Number of transport records.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        material_count: int = 1000,
+        substance_count: int = 5000,
+        substances_per_material: int = 3,
+        above_threshold_fraction: float = 0.05,
+        process_count: int = 50,
+        transport_count: int = 20,
+    ) -> None:
+        if substances_per_material > substance_count:
+            raise ValueError("substances_per_material cannot be larger than substance_count.")
+        self.seed = seed
+        self.above_threshold_fraction = above_threshold_fraction
+        rng = random.Random(seed)
+        self._substances = [
+            _Substance(self._guid(rng), f"Substance {index}", f"{100 + index}-00-{index % 10}", f"200-{index:03d}-0")
+            for index in range(substance_count)
+        ]
+        self._materials = [
+            _Material(
+                guid=self._guid(rng),
+                name=f"Material {index}",
+                substances=tuple(
+                    (substance, self._substance_percentage(rng))
+                    for substance in rng.sample(self._substances, substances_per_material)
+                ),
+                embodied_energy=rng.uniform(10.0, 500.0),
+                climate_change=rng.uniform(0.5, 30.0),
+                recyclable=rng.random() < 0.5,
+            )
+            for index in range(material_count)
+        ]
+        self._processes = [
+            _Process(self._guid(rng), f"Process {index}", rng.uniform(0.1, 20.0), rng.uniform(0.01, 2.0))
+            for index in range(process_count)
+        ]
+        self._transports = [
+            _Process(self._guid(rng), f"Transport {index}", rng.uniform(0.001, 0.05), rng.uniform(0.0001, 0.005))
+            for index in range(transport_count)
+        ]
+        self._materials_by_guid = {material.guid: material for material in self._materials}
+        self._substances_by_guid = {substance.guid: substance for substance in self._substances}
+        self._processes_by_guid = {process.guid: process for process in [*self._processes, *self._transports]}
+
+    @staticmethod
+    def _guid(rng: random.Random) -> str:
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    def _substance_percentage(self, rng: random.Random) -> float:
+        if rng.random() < self.above_threshold_fraction:
+            return round(rng.uniform(LEGISLATION_THRESHOLD, 5.0), 4)
+        return round(rng.uniform(0.001, LEGISLATION_THRESHOLD), 4)
+
+    def generate_bom(
+        self,
+        shape: BoMShape = BoMShape(),
+        bom_type: Type[BillOfMaterials] = eco2505.BillOfMaterials,
+        seed: Optional[int] = None,
+    ) -> BillOfMaterials:
+        """Generate a BoM which references the records in this database.
+
+        Every element in the BoM has a unique internal ID, which is reported as the ``Id`` of the corresponding item
+        in the sustainability response.
+
+        Parameters
+        ----------
+        shape : BoMShape, default: BoMShape()
+            Structure of the BoM.
+        bom_type : type, default: eco2505.BillOfMaterials
+            ``BillOfMaterials`` class of the BoM version to generate.
+        seed : int, optional
+            Seed for the choice of records, quantities and masses. If ``None``, the seed of the database is used.
+
+        Returns
+        -------
+        eco2301.BillOfMaterials | eco2412.BillOfMaterials | eco2505.BillOfMaterials
+            The BoM, of type ``bom_type``.
+        """
+        try:
+            types = _bom_modules[bom_type]
+        except KeyError:
+            raise ValueError(f'bom_type "{bom_type}" is not a BillOfMaterials class.') from None
+        if shape.transport_stages_per_part and types is eco2301:
+            raise ValueError("23/01 BoMs do not support transport stages in parts.")
+        return _BoMBuilder(self, types, shape, random.Random(self.seed if seed is None else seed)).build()
+
+    def _material(self, guid: str) -> _Material:
+        try:
+            return self._materials_by_guid[guid]
+        except KeyError:
+            raise ValueError(f'Material "{guid}" is not a record in this synthetic database.') from None
+
+    def _process(self, guid: str) -> _Process:
+        try:
+            return self._processes_by_guid[guid]
+        except KeyError:
+            raise ValueError(f'Process "{guid}" is not a record in this synthetic database.') from None
+
+    def _declared_substances(self, part: Any) -> Iterable[Tuple[_Substance, float]]:
+        for substance in part.substances:
+            guid = substance.mi_substance_reference.record_guid
+            try:
+                yield self._substances_by_guid[guid], substance.percentage
+            except KeyError:
+                raise ValueError(f'Substance "{guid}" is not a record in this synthetic database.') from None
+
+    def compliance_response(self, bom: BillOfMaterials, indicators: Sequence[Indicator]) -> Dict[str, Any]:
+        """Create a ``GetComplianceForBomResponse`` payload for a BoM generated by this database.
+
+        Substances are above threshold for every indicator if their percentage is above :data:`LEGISLATION_THRESHOLD`.
+        Materials and parts are non-compliant if they contain a substance above threshold.
+
+        Parameters
+        ----------
+        bom : eco2301.BillOfMaterials | eco2412.BillOfMaterials | eco2505.BillOfMaterials
+            BoM generated by :meth:`generate_bom`.
+        indicators : list[RoHSIndicator | WatchListIndicator]
+            Indicators in the compliance query.
+        """
+        return _ComplianceResponseBuilder(self, indicators).build(bom)
+
+    def impacted_substances_response(self, bom: BillOfMaterials, legislation_ids: Sequence[str]) -> Dict[str, Any]:
+        """Create a ``GetImpactedSubstancesForBomResponse`` payload for a BoM generated by this database.
+
+        Every substance in the BoM is impacted by every legislation, and is reported once with its largest percentage.
+
+        Parameters
+        ----------
+        bom : eco2301.BillOfMaterials | eco2412.BillOfMaterials | eco2505.BillOfMaterials
+            BoM generated by :meth:`generate_bom`.
+        legislation_ids : list[str]
+            Legislations in the impacted substances query.
+        """
+        amounts: Dict[str, float] = {}
+        substances: Dict[str, _Substance] = {}
+        stack = list(bom.components)
+        while stack:
+            part = stack.pop()
+            stack.extend(part.components)
+            contents = [
+                substance
+                for material in part.materials
+                for substance in self._material(material.mi_material_reference.record_guid).substances
+            ]
+            for substance, percentage in [*contents, *self._declared_substances(part)]:
+                substances[substance.guid] = substance
+                amounts[substance.guid] = max(percentage, amounts.get(substance.guid, 0.0))
+        impacted_substances = [
+            {
+                "SubstanceName": substance.name,
+                "CasNumber": substance.cas_number,
+                "EcNumber": substance.ec_number,
+                "MaxPercentageAmountInMaterial": amounts[guid],
+                "LegislationThreshold": LEGISLATION_THRESHOLD,
+            }
+            for guid, substance in substances.items()
+        ]
+        return {
+            "Legislations": [
+                {"LegislationId": legislation_id, "ImpactedSubstances": impacted_substances}
+                for legislation_id in legislation_ids
+            ],
+            "LogMessages": [],
+        }
+
+    def sustainability_response(self, bom: BillOfMaterials) -> Dict[str, Any]:
+        """Create a ``GetSustainabilityForBomResponse`` payload for a BoM generated by this database.
+
+        The mass of each part is its quantity multiplied by its mass per unit, or by the total mass of its children.
+        Impacts are proportional to the mass of each material, and to the distance of each transport stage. The impacts
+        of a part are the total of its materials and children.
+
+        Parameters
+        ----------
+        bom : eco2301.BillOfMaterials | eco2412.BillOfMaterials | eco2505.BillOfMaterials
+            BoM generated by :meth:`generate_bom`.
+        """
+        return _SustainabilityResponseBuilder(self).build(bom)
+
+
+class _BoMBuilder:
+    """Create the parts of a BoM level by level, then add materials and substances to parts without children."""
+
+    def __init__(self, database: SyntheticDatabase, types: ModuleType, shape: BoMShape, rng: random.Random) -> None:
+        self._database = database
+        self._types = types
+        # 25/05 BoMs use extended record references, which is the type created when a BoM is loaded from XML
+        self._reference_type = getattr(types, "ExtendedMIRecordReference", types.MIRecordReference)
+        self._shape = shape
+        self._rng = rng
+        self._next_id = 0
+
+    def _internal_id(self, prefix: str) -> str:
+        self._next_id += 1
+        return f"{prefix}{self._next_id}"
+
+    def _reference(self, guid: str) -> Any:
+        return self._reference_type(db_key=DATABASE_KEY, record_guid=guid)
+
+    def _part(self) -> Any:
+        internal_id = self._internal_id("P")
+        return self._types.Part(
+            part_number=f"PN-{internal_id}",
+            quantity=self._types.UnittedValue(value=float(self._rng.randint(1, 4)), unit="Each"),
+            internal_id=internal_id,
+        )
+
+    def _transport_stage(self) -> Any:
+        transport = self._rng.choice(self._database._transports)
+        return self._types.TransportStage(
+            name=transport.name,
+            mi_transport_reference=self._reference(transport.guid),
+            distance=self._types.UnittedValue(value=round(self._rng.uniform(10.0, 5000.0), 1), unit="km"),
+            internal_id=self._internal_id("T"),
+        )
+
+    def _material(self, percentage: float) -> Any:
+        material = self._rng.choice(self._database._materials)
+        processes = [
+            self._types.Process(
+                mi_process_reference=self._reference(process.guid),
+                dimension_type=self._types.DimensionType.Mass,
+                percentage=100.0,
+                internal_id=self._internal_id("R"),
+            )
+            for process in self._rng.sample(self._database._processes, self._shape.processes_per_material)
+        ]
+        return self._types.Material(
+            mi_material_reference=self._reference(material.guid),
+            percentage=percentage,
+            processes=processes,
+            internal_id=self._internal_id("M"),
+        )
+
+    def _fill(self, part: Any) -> None:
+        shape, rng, types = self._shape, self._rng, self._types
+        part.mass_per_unit_of_measure = types.UnittedValue(value=round(rng.uniform(0.01, 10.0), 3), unit="kg/Part")
+        if shape.materials_per_part:
+            percentage = 100.0 / shape.materials_per_part
+            part.materials = [self._material(percentage) for _ in range(shape.materials_per_part)]
+        for substance in rng.sample(self._database._substances, shape.substances_per_part):
+            part.substances.append(
+                types.Substance(
+                    mi_substance_reference=self._reference(substance.guid),
+                    percentage=self._database._substance_percentage(rng),
+                    category=types.Category.Incorporated,
+                    internal_id=self._internal_id("S"),
+                )
+            )
+        if shape.transport_stages_per_part:
+            part.transport_phase = [self._transport_stage() for _ in range(shape.transport_stages_per_part)]
+
+    def build(self) -> BillOfMaterials:
+        shape = self._shape
+        product = self._part()
+        parts = [product]
+        level = [product]
+        for _ in range(shape.depth):
+            children = []
+            for parent in level:
+                for _ in range(shape.fan_out):
+                    if shape.max_parts is not None and len(parts) >= shape.max_parts:
+                        break
+                    child = self._part()
+                    parent.components.append(child)
+                    children.append(child)
+                    parts.append(child)
+            level = children
+        for part in parts:
+            if not part.components:
+                self._fill(part)
+        return self._types.BillOfMaterials(
+            components=[product],
+            transport_phase=[self._transport_stage() for _ in range(shape.transport_stages)],
+        )
+
+
+class _ComplianceResponseBuilder:
+    """Create compliance results for each part in a BoM, rolling up the worst result from the part contents."""
+
+    def __init__(self, database: SyntheticDatabase, query_indicators: Sequence[Indicator]) -> None:
+        self._database = database
+        self._names = [indicator.name for indicator in query_indicators]
+        self._is_rohs = [isinstance(indicator, indicators.RoHSIndicator) for indicator in query_indicators]
+        # Materials are identical wherever they appear in the BoM, so the same object is reused
+        self._materials: Dict[str, Tuple[Dict[str, Any], bool]] = {}
+
+    def _indicators(self, impacted: bool, above_threshold: bool, substance: bool) -> List[Dict[str, str]]:
+        if substance:
+            flags = ("RohsAboveThreshold", "WatchListAboveThreshold")
+            compliant_flags = ("RohsBelowThreshold", "WatchListBelowThreshold")
+        else:
+            flags = ("RohsNonCompliant", "WatchListHasSubstanceAboveThreshold")
+            compliant_flags = ("RohsCompliant", "WatchListAllSubstancesBelowThreshold")
+        if not impacted:
+            compliant_flags = ("RohsNotImpacted", "WatchListNotImpacted")
+        result = []
+        for name, is_rohs in zip(self._names, self._is_rohs):
+            rohs_flag, watch_list_flag = flags if above_threshold else compliant_flags
+            result.append({"Name": name, "Flag": rohs_flag if is_rohs else watch_list_flag})
+        return result
+
+    def _substance(self, substance: _Substance, percentage: float) -> Tuple[Dict[str, Any], bool]:
+        above_threshold = percentage > LEGISLATION_THRESHOLD
+        result = {
+            "Indicators": self._indicators(True, above_threshold, substance=True),
+            "PercentageAmount": percentage,
+            **_record_reference(substance.guid),
+        }
+        return result, above_threshold
+
+    def _material(self, guid: str) -> Tuple[Dict[str, Any], bool]:
+        try:
+            return self._materials[guid]
+        except KeyError:
+            pass
+        material = self._database._material(guid)
+        substances = [self._substance(substance, percentage) for substance, percentage in material.substances]
+        above_threshold = any(above for _, above in substances)
+        result = {
+            "Indicators": self._indicators(bool(substances), above_threshold, substance=False),
+            "Substances": [substance for substance, _ in substances],
+            **_record_reference(guid),
+        }
+        self._materials[guid] = result, above_threshold
+        return result, above_threshold
+
+    def _part(self, part: Any) -> Tuple[Dict[str, Any], bool]:
+        children = [self._part(child) for child in part.components]
+        materials = [self._material(material.mi_material_reference.record_guid) for material in part.materials]
+        substances = [self._substance(*substance) for substance in self._database._declared_substances(part)]
+        contents = [*children, *materials, *substances]
+        above_threshold = any(above for _, above in contents)
+        result = {
+            "Indicators": self._indicators(bool(contents), above_threshold, substance=False),
+            "Parts": [child for child, _ in children],
+            "Specifications": [],
+            "Materials": [material for material, _ in materials],
+            "Substances": [substance for substance, _ in substances],
+        }
+        return result, above_threshold
+
+    def build(self, bom: BillOfMaterials) -> Dict[str, Any]:
+        return {"Parts": [self._part(part)[0] for part in bom.components], "LogMessages": []}
+
+
+class _SustainabilityResponseBuilder:
+    """Create sustainability results for each part in a BoM, totalling the impacts of the part contents."""
+
+    def __init__(self, database: SyntheticDatabase) -> None:
+        self._database = database
+        self._transport_stages: List[Dict[str, Any]] = []
+
+    @staticmethod
+    def _impacts(result: Dict[str, Any], embodied_energy: float, climate_change: float) -> Dict[str, Any]:
+        result["EmbodiedEnergy"] = _value(embodied_energy, "MJ")
+        result["ClimateChange"] = _value(climate_change, "kg")
+        return result
+
+    @staticmethod
+    def _totals(results: Iterable[Dict[str, Any]]) -> Tuple[float, float]:
+        embodied_energy = climate_change = 0.0
+        for result in results:
+            embodied_energy += result["EmbodiedEnergy"]["Value"]
+            climate_change += result["ClimateChange"]["Value"]
+        return embodied_energy, climate_change
+
+    def _process(self, process: Any, mass: float) -> Dict[str, Any]:
+        record = self._database._process(process.mi_process_reference.record_guid)
+        result = {"Name": record.name, **_record_reference(record.guid), "Id": process.internal_id}
+        return self._impacts(result, record.embodied_energy * mass, record.climate_change * mass)
+
+    def _material(self, material: Any, part_mass: float) -> Dict[str, Any]:
+        record = self._database._material(material.mi_material_reference.record_guid)
+        mass = part_mass * material.percentage / 100.0
+        processes = [self._process(process, mass) for process in material.processes]
+        embodied_energy, climate_change = self._totals(processes)
+        result = {
+            "Processes": processes,
+            "Recyclable": record.recyclable,
+            "Biodegradable": False,
+            "FunctionalRecycle": record.recyclable,
+            "ReportedMass": _value(mass, "kg"),
+            "Name": record.name,
+            **_record_reference(record.guid),
+            "Id": material.internal_id,
+        }
+        return self._impacts(
+            result, embodied_energy + record.embodied_energy * mass, climate_change + record.climate_change * mass
+        )
+
+    def _transport_stage(self, stage: Any) -> None:
+        record = self._database._process(stage.mi_transport_reference.record_guid)
+        distance = stage.distance.value
+        result = {
+            "StageName": stage.name,
+            **_record_reference(record.guid),
+            "Id": stage.internal_id,
+        }
+        self._transport_stages.append(
+            self._impacts(result, record.embodied_energy * distance, record.climate_change * distance)
+        )
+
+    def _part(self, part: Any) -> Tuple[Dict[str, Any], float]:
+        quantity = part.quantity.value if part.quantity is not None else 1.0
+        children = [self._part(child) for child in part.components]
+        if part.mass_per_unit_of_measure is not None:
+            mass = quantity * part.mass_per_unit_of_measure.value
+        else:
+            mass = quantity * sum(child_mass for _, child_mass in children)
+        materials = [self._material(material, mass) for material in part.materials]
+        for stage in getattr(part, "transport_phase", []):
+            self._transport_stage(stage)
+        child_results = [child for child, _ in children]
+        embodied_energy, climate_change = self._totals([*child_results, *materials])
+        result = {
+            "Parts": child_results,
+            "Materials": materials,
+            "Processes": [],
+            "ReportedMass": _value(mass, "kg"),
+            "Name": part.part_number,
+            "Id": part.internal_id,
+        }
+        return self._impacts(result, embodied_energy, climate_change), mass
+
+    def build(self, bom: BillOfMaterials) -> Dict[str, Any]:
+        (product, _), *others = [self._part(part) for part in bom.components]
+        if others:
+            raise ValueError("Sustainability responses can only be created for a BoM with a single product.")
+        for stage in bom.transport_phase:
+            self._transport_stage(stage)
+        return {"Part": product, "TransportStages": self._transport_stages, "LogMessages": []}
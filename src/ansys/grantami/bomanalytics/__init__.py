@@ -20,11 +20,62 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+
+from importlib import import_module
 from importlib import metadata as metadata
+from typing import TYPE_CHECKING, Any
 
-from ._bom_helper import BoMHandler
-from ._connection import Connection
-from ._exceptions import GrantaMIException, LicensingException
-from ._item_results import TransportCategory
+if TYPE_CHECKING:
+    from . import bom_types, indicators, queries
+    from ._bom_diff import BoMDiff, PartChange, PartChangeType, PartKey
+    from ._bom_helper import BoMHandler, BoMLoadResult
+    from ._bom_index import BoMIndex
+    from ._connection import Connection
+    from ._exceptions import GrantaMIException, LicensingException
+    from ._hooks import MetricsCollector, TracingAdapter
+    from ._item_results import TransportCategory
+    from ._serialization import QuerySerializer
+    from ._sharding import ShardedQueryRunner
+    from ._tabular_bom import TabularBoMBuilder
 
 __version__ = metadata.version("ansys-grantami-bomanalytics")
+
+# Public names are imported from their defining module when they are first accessed, so that importing the package
+# does not load xmlschema, the BoM types, or the API client until they are used.
+_lazy_attributes = {
+    "BoMDiff": "._bom_diff",
+    "PartChange": "._bom_diff",
+    "PartChangeType": "._bom_diff",
+    "PartKey": "._bom_diff",
+    "BoMHandler": "._bom_helper",
+    "BoMLoadResult": "._bom_helper",
+    "BoMIndex": "._bom_index",
+    "Connection": "._connection",
+    "GrantaMIException": "._exceptions",
+    "LicensingException": "._exceptions",
+    "MetricsCollector": "._hooks",
+    "TracingAdapter": "._hooks",
+    "TransportCategory": "._item_results",
+    "QuerySerializer": "._serialization",
+    "ShardedQueryRunner": "._sharding",
+    "TabularBoMBuilder": "._tabular_bom",
+}
+_lazy_submodules = ("bom_types", "indicators", "queries")
+
+__all__ = ["__version__", *_lazy_attributes, *_lazy_submodules]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_attributes:
+        value = getattr(import_module(_lazy_attributes[name], __name__), name)
+    elif name in _lazy_submodules:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Later accesses find the attribute in the module namespace, and do not call this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()).union(__all__))
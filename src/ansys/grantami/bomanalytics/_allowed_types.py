@@ -22,7 +22,8 @@
 
 """BoM Analytics runtime type checker.
 
-Provides a decorator that performs runtime type checking of the arguments passed into a function or method.
+Provides a decorator that performs runtime type checking of the arguments passed into a function or method, and a
+check for the validation level arguments accepted when loading, dumping and querying BoMs.
 
 Attributes
 ----------
@@ -30,12 +31,20 @@ T
     Generic type to ensure static-type checking works as expected.
 """
 
+from array import array
 import functools
 import inspect
-from typing import Any, Callable, TypeVar
+from operator import itemgetter
+from typing import Any, Callable, FrozenSet, Iterable, List, Sequence, Type, TypeVar
 
 T = TypeVar("T")
 
+_Checker = Callable[[Any], bool]
+"""A compiled type specification, which returns ``True`` if a value matches the specification."""
+
+_INTEGER_TYPECODES = frozenset("bBhHiIlLqQ")
+_FLOAT_TYPECODES = frozenset("fd")
+
 
 def validate_argument_type(argument_name: str, *allowed_types: Any) -> Callable:
     """
@@ -53,6 +62,13 @@ def validate_argument_type(argument_name: str, *allowed_types: Any) -> Callable:
       - To define a homogeneous dictionary or set, provide a dictionary or set with a single element.
       - Heterogeneous dictionaries or sets are not supported.
 
+    A homogeneous list of integers also accepts a ``range`` object, and a homogeneous list of integers or floats also
+    accepts an ``array.array`` object with a matching type code. The items of these objects are not checked
+    individually.
+
+    The allowed types are compiled into a checker function when the callable is decorated, so validating a large
+    container only checks each distinct type of item in the container once.
+
     Parameters
     ----------
     argument_name : str
@@ -92,12 +108,14 @@ def validate_argument_type(argument_name: str, *allowed_types: Any) -> Callable:
                 raise ValueError(
                     f"{type(allowed_type)} must contain exactly 1 item. '{allowed_type}' has length {len(allowed_type)}"
                 )
+    checkers = [_compile_type_spec(allowed_type) for allowed_type in allowed_types]
 
     def decorator(callable_: Callable[..., T]) -> Callable[..., T]:
         callable_params = inspect.signature(callable_).parameters
 
         if argument_name not in callable_params:
             raise ValueError(f"Argument '{argument_name}' not found in signature for callable {repr(callable_)}")
+        position = list(callable_params).index(argument_name)
 
         @functools.wraps(callable_)
         def check_types(*args: Any, **kwargs: Any) -> T:
@@ -106,99 +124,160 @@ def validate_argument_type(argument_name: str, *allowed_types: Any) -> Callable:
                 value = kwargs[argument_name]
             except KeyError:
                 # If not, try to extract from the tuple of positional args
-                for idx, param in enumerate(callable_params.keys()):
-                    if param == argument_name:
-                        break
                 try:
-                    value = args[idx]
+                    value = args[position]
                 except IndexError:
                     # If there are not enough positional parameters, then this argument wasn't provided.
                     return callable_(*args, **kwargs)
 
-            result = any([_check_type_wrapper(value, t) for t in allowed_types])
-            if not result:
-                allowed_types_str = ", ".join(f"'{repr(t)}'" for t in allowed_types)
-                if len(allowed_types) != 1:
-                    allowed_types_str = f"one of {allowed_types_str}"
-                raise TypeError(
-                    f"Incorrect type for argument '{argument_name}' value {repr(value)}. Expected {allowed_types_str}"
-                )
-            return callable_(*args, **kwargs)
+            for checker in checkers:
+                if checker(value):
+                    return callable_(*args, **kwargs)
+            allowed_types_str = ", ".join(f"'{repr(t)}'" for t in allowed_types)
+            if len(allowed_types) != 1:
+                allowed_types_str = f"one of {allowed_types_str}"
+            raise TypeError(
+                f"Incorrect type for argument '{argument_name}' value {repr(value)}. Expected {allowed_types_str}"
+            )
 
         return check_types
 
     return decorator
 
 
-def _check_type_wrapper(value_obj: Any, type_obj: Any) -> bool:
-    try:
-        _check_type(value_obj, type_obj)
-        return True
-    except AssertionError:
-        return False
+def _compile_type_spec(type_obj: Any) -> _Checker:
+    """Compile an allowed type, as accepted by ``validate_argument_type``, into a checker function.
 
+    Container types are compiled recursively, so the structure of the allowed type is only inspected once.
+    """
+    if isinstance(type_obj, (list, tuple)):
+        if len(type_obj) == 1:
+            return _compile_homogeneous_container(type(type_obj), type_obj[0])
+        return _compile_heterogeneous_sequence(type(type_obj), list(type_obj))
 
-def _check_type(value_obj: Any, type_obj: Any) -> None:
-    """Recursively checks the type of an object against an allowed type.
+    if isinstance(type_obj, set):
+        return _compile_homogeneous_container(set, next(iter(type_obj)))
 
-    Recursive checking is performed if the ``allowed_type`` parameter is a container. First the type of the
-    container itself is checked. The contents of object are then checked against the contents of the
-    ``allowed_type`` parameter.
+    if isinstance(type_obj, dict):
+        key_type, value_type = next(iter(type_obj.items()))
+        check_key = _compile_type_spec(key_type)
+        check_value = _compile_type_spec(value_type)
 
-    Parameters
-    ----------
-    value_obj
-        Object to check.
-    type_obj
-        Object to checked against.
+        def check_dict(value_obj: Any) -> bool:
+            if not isinstance(value_obj, dict):
+                return False
+            return all(map(check_key, value_obj.keys())) and all(map(check_value, value_obj.values()))
 
-    Returns
-    -------
-    None
-        This function never returns a value. It either returns ``None`` or raises an exception.
+        return check_dict
 
-    Raises
-    ------
-    AssertionError
-        If the type of ``obj`` does not match the type of ``allowed_type``.
-    ValueError
-        If a container's length is mismatched against the object being checked.
-    """
+    def check_instance(value_obj: Any) -> bool:
+        return isinstance(value_obj, type_obj)
 
-    if isinstance(type_obj, (list, tuple)):
-        if not isinstance(value_obj, type(type_obj)):
-            raise AssertionError
-        if len(type_obj) == 1:
-            contained_type = type_obj[0]
-            for value in value_obj:
-                _check_type(value, contained_type)
-        elif len(type_obj) == len(value_obj):
-            for value, contained_type in zip(value_obj, type_obj):
-                _check_type(value, contained_type)
-        else:
+    return check_instance
+
+
+def _compile_heterogeneous_sequence(container_type: Type[Any], item_type_objs: List[Any]) -> _Checker:
+    length = len(item_type_objs)
+
+    def check_length(value_obj: Any) -> None:
+        if len(value_obj) != length:
             raise ValueError(
                 "List or tuple containers must be either of length one or the same length as the "
                 "object being checked."
-                f"Container length: {len(type_obj)}, object length: {len(value_obj)}"
+                f"Container length: {length}, object length: {len(value_obj)}"
             )
 
-    elif isinstance(type_obj, set):
-        if not isinstance(value_obj, set):
-            raise AssertionError
-        contained_type = next(iter(type_obj))
-        for value in value_obj:
-            _check_type(value, contained_type)
-
-    elif isinstance(type_obj, dict):
-        if not isinstance(value_obj, dict):
-            raise AssertionError
-        contained_key_type = next(iter(type_obj.keys()))
-        for key in value_obj.keys():
-            _check_type(key, contained_key_type)
-        contained_value_type = next(iter(type_obj.values()))
-        for value in value_obj.values():
-            _check_type(value, contained_value_type)
-
-    else:
-        if not isinstance(value_obj, type_obj):
-            raise AssertionError
+    if all(isinstance(item_type_obj, type) for item_type_obj in item_type_objs):
+        # Sequences of simple types, such as (str, Number), are checked without creating a checker for each item
+        def check_simple_sequence(value_obj: Any) -> bool:
+            if not isinstance(value_obj, container_type):
+                return False
+            check_length(value_obj)
+            return all(map(isinstance, value_obj, item_type_objs))
+
+        return check_simple_sequence
+
+    item_checkers = [_compile_type_spec(item_type_obj) for item_type_obj in item_type_objs]
+
+    def check_sequence(value_obj: Any) -> bool:
+        if not isinstance(value_obj, container_type):
+            return False
+        check_length(value_obj)
+        return all(check(value) for check, value in zip(item_checkers, value_obj))
+
+    return check_sequence
+
+
+def _has_only_types(values: Iterable[Any], allowed_type: type) -> bool:
+    # The items in a container usually all have the same type, so each distinct type is checked once instead of each
+    # item
+    return all(issubclass(value_type, allowed_type) for value_type in set(map(type, values)))
+
+
+def _compile_homogeneous_container(container_type: Type[Any], item_type_obj: Any) -> _Checker:
+    check_item = _compile_type_spec(item_type_obj)
+    if (
+        isinstance(item_type_obj, (list, tuple))
+        and len(item_type_obj) > 1
+        and all(isinstance(field_type, type) for field_type in item_type_obj)
+    ):
+        # Fast path for containers of records of simple types, such as list[tuple[str, Number]]. Each field is
+        # checked for all records at once.
+        record_type = type(item_type_obj)
+        record_length = len(item_type_obj)
+        field_types = list(enumerate(item_type_obj))
+
+        def check_record_container(value_obj: Any) -> bool:
+            if not isinstance(value_obj, container_type):
+                return False
+            if (
+                _has_only_types(value_obj, record_type)
+                and set(map(len, value_obj)) <= {record_length}
+                and all(_has_only_types(map(itemgetter(idx), value_obj), field_type) for idx, field_type in field_types)
+            ):
+                return True
+            # Records with the wrong length raise a ValueError, and other records are checked individually
+            return all(map(check_item, value_obj))
+
+        return check_record_container
+
+    if not isinstance(item_type_obj, type):
+
+        def check_container(value_obj: Any) -> bool:
+            return isinstance(value_obj, container_type) and all(map(check_item, value_obj))
+
+        return check_container
+
+    # Fast paths for containers of a simple type, such as list[int] or set[str]
+    item_type = item_type_obj
+    accepts_ranges = container_type is list and issubclass(int, item_type)
+    array_typecodes: FrozenSet[str] = frozenset()
+    if container_type is list:
+        if issubclass(int, item_type):
+            array_typecodes |= _INTEGER_TYPECODES
+        if issubclass(float, item_type):
+            array_typecodes |= _FLOAT_TYPECODES
+
+    def check_simple_container(value_obj: Any) -> bool:
+        if not isinstance(value_obj, container_type):
+            if accepts_ranges and isinstance(value_obj, range):
+                return True
+            return isinstance(value_obj, array) and value_obj.typecode in array_typecodes
+        if _has_only_types(value_obj, item_type):
+            return True
+        # Objects can report a different class to isinstance() than their type, for example mocks with a spec
+        return all(map(check_item, value_obj))
+
+    return check_simple_container
+
+
+_validation_levels = ("none", "lax", "strict")
+
+
+def _check_validation_level(validation: str, validation_levels: Sequence[str] = _validation_levels) -> None:
+    if validation not in validation_levels:
+        quoted_levels = [f'"{level}"' for level in validation_levels]
+        raise ValueError(
+            f'validation "{validation}" is not a valid validation level. '
+            f"Specify one of {', '.join(quoted_levels[:-1])} or {quoted_levels[-1]}."
+        )
@@ -0,0 +1,362 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Non-validating conversion between XML BoMs and xmlschema JSON format dictionaries."""
+
+from decimal import Decimal
+import math
+from typing import Any, Callable, Dict, Optional
+from xml.etree.ElementTree import Element, SubElement, indent
+
+from xmlschema import XMLSchema
+from xmlschema.validators import XsdElement
+
+_XSD_NAMESPACE = "http://www.w3.org/2001/XMLSchema"
+_XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
+
+
+def _to_bool(text: str) -> bool:
+    value = text.strip()
+    if value in ("true", "1"):
+        return True
+    if value in ("false", "0"):
+        return False
+    raise ValueError(f"'{value}' is not a valid boolean value.")
+
+
+_builtin_converters: Dict[str, Callable[[str], Any]] = {
+    f"{{{_XSD_NAMESPACE}}}double": float,
+    f"{{{_XSD_NAMESPACE}}}float": float,
+    f"{{{_XSD_NAMESPACE}}}decimal": Decimal,
+    f"{{{_XSD_NAMESPACE}}}integer": int,
+    f"{{{_XSD_NAMESPACE}}}boolean": _to_bool,
+}
+
+
+def _replace_whitespace(text: str) -> str:
+    return text.replace("\t", " ").replace("\n", " ").replace("\r", " ")
+
+
+def _collapse_whitespace(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _get_converter(simple_type: Any) -> Callable[[str], Any]:
+    """
+    Get the function used to convert the text of an element or attribute to a Python value.
+
+    The type hierarchy is walked up to the first XSD built-in type with a non-string Python representation. All other
+    types are decoded as strings, with whitespace normalized according to the type's ``whiteSpace`` facet.
+    """
+    base_type = simple_type
+    while base_type is not None:
+        converter = _builtin_converters.get(base_type.name)
+        if converter is not None:
+            return converter
+        base_type = getattr(base_type, "base_type", None)
+    white_space = getattr(simple_type, "white_space", None)
+    if white_space == "collapse":
+        return _collapse_whitespace
+    if white_space == "replace":
+        return _replace_whitespace
+    return str
+
+
+def _to_text(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "INF" if value > 0 else "-INF"
+    return str(value)
+
+
+class _TypeModel:
+    """The attributes, child elements and text content permitted by an XSD complex type."""
+
+    __slots__ = ("attributes", "elements", "text_converter")
+
+    def __init__(self) -> None:
+        self.attributes: Dict[str, Callable[[str], Any]] = {}
+        self.elements: Dict[str, "_ElementModel"] = {}
+        self.text_converter: Optional[Callable[[str], Any]] = None
+
+
+class _ElementModel:
+    """A child element declared in an XSD complex type.
+
+    Exactly one of ``type_model`` and ``converter`` is defined, depending on whether the element has a complex or a
+    simple type.
+    """
+
+    __slots__ = ("is_single", "position", "type_model", "converter")
+
+    def __init__(
+        self,
+        is_single: bool,
+        position: int,
+        type_model: Optional[_TypeModel],
+        converter: Optional[Callable[[str], Any]],
+    ):
+        self.is_single = is_single
+        self.position = position
+        self.type_model = type_model
+        self.converter = converter
+
+
+class _BoMCodec:
+    def __init__(self, schema: XMLSchema):
+        """
+        Converts between XML BoMs and dictionaries in the format produced and consumed by xmlschema, without
+        validating the BoM against the schema.
+
+        The schema is compiled once into a lookup table of the types it declares. Decoding and encoding then only
+        require a single pass over the document, and produce the same output as xmlschema does for valid BoMs.
+
+        Parameters
+        ----------
+        schema: XMLSchema
+            Parsed XMLSchema representing a valid Eco BoM format
+        """
+        self._schema = schema
+        root_element = schema.elements["PartsEco"]
+        self.root_tag: str = root_element.name
+        self._root_model = self._compile(root_element.type)
+
+        self._prefixes: Dict[str, str] = {schema.target_namespace: ""}
+        for prefix, uri in schema.namespaces.items():
+            if prefix and uri not in self._prefixes:
+                self._prefixes[uri] = prefix
+
+    @staticmethod
+    def _compile(root_type: Any) -> _TypeModel:
+        models: Dict[Any, _TypeModel] = {root_type: _TypeModel()}
+        pending = [root_type]
+        while pending:
+            xsd_type = pending.pop()
+            model = models[xsd_type]
+            for attribute_name, attribute in xsd_type.attributes.items():
+                if isinstance(attribute_name, str):
+                    model.attributes[attribute_name] = _get_converter(attribute.type)
+            if xsd_type.has_simple_content():
+                model.text_converter = _get_converter(xsd_type.content)
+                continue
+            for position, element in enumerate(xsd_type.content.iter_elements()):
+                if not isinstance(element, XsdElement):
+                    continue
+                if element.type.is_simple():
+                    element_model = _ElementModel(element.is_single(), position, None, _get_converter(element.type))
+                else:
+                    if element.type not in models:
+                        models[element.type] = _TypeModel()
+                        pending.append(element.type)
+                    element_model = _ElementModel(element.is_single(), position, models[element.type], None)
+                model.elements[element.name] = element_model
+        return models[root_type]
+
+    def decode(self, root: Element) -> Dict[str, Any]:
+        """
+        Convert a parsed XML BoM into a dictionary in xmlschema JSON format.
+
+        Elements and attributes which are not defined in the schema are decoded as strings, so they can be reported
+        as unsupported data by the BoM reader.
+
+        Parameters
+        ----------
+        root: Element
+            The root element of the parsed XML BoM.
+
+        Returns
+        -------
+        dict
+            The deserialized BoM.
+
+        Raises
+        ------
+        ValueError
+            If the text of a numeric or boolean element or attribute cannot be converted.
+        """
+        prefixes = self._prefixes.copy()
+        used_namespaces: Dict[str, str] = {}
+        keys: Dict[str, str] = {}
+
+        def get_key(name: str) -> str:
+            try:
+                return keys[name]
+            except KeyError:
+                pass
+            if name[0] != "{":
+                key = name
+            else:
+                namespace, _, local_name = name[1:].partition("}")
+                if namespace not in prefixes:
+                    prefixes[namespace] = f"ns{len(prefixes)}"
+                prefix = prefixes[namespace]
+                used_namespaces[namespace] = prefix
+                key = f"{prefix}:{local_name}" if prefix else local_name
+            keys[name] = key
+            return key
+
+        bom: Dict[str, Any] = {}
+        stack: list[tuple[Element, Optional[_TypeModel], Dict[str, Any]]] = [(root, self._root_model, bom)]
+        while stack:
+            element, model, obj = stack.pop()
+            for name, text in element.attrib.items():
+                if name.startswith(f"{{{_XSI_NAMESPACE}}}"):
+                    continue
+                converter = model.attributes.get(name) if model is not None else None
+                obj[f"@{get_key(name)}"] = self._convert(converter, text, name)
+            if model is not None and model.text_converter is not None:
+                obj["$"] = self._convert(model.text_converter, element.text or "", element.tag)
+            elif model is None and element.text and element.text.strip():
+                obj["$"] = element.text
+
+            for child in element:
+                if not isinstance(child.tag, str):
+                    # Comments and processing instructions
+                    continue
+                key = get_key(child.tag)
+                element_model = model.elements.get(child.tag) if model is not None else None
+                value: Any
+                if element_model is not None and element_model.type_model is None:
+                    value = self._convert(element_model.converter, child.text or "", child.tag)
+                else:
+                    child_model = element_model.type_model if element_model is not None else None
+                    value = self._decode_complex_element(child, child_model, stack)
+
+                if element_model is not None and not element_model.is_single:
+                    obj.setdefault(key, []).append(value)
+                elif element_model is None and key in obj:
+                    if not isinstance(obj[key], list):
+                        obj[key] = [obj[key]]
+                    obj[key].append(value)
+                else:
+                    obj[key] = value
+
+        namespace_declarations = {
+            f"@xmlns:{prefix}" if prefix else "@xmlns": namespace for namespace, prefix in used_namespaces.items()
+        }
+        return {**namespace_declarations, **bom}
+
+    @staticmethod
+    def _decode_complex_element(
+        element: Element,
+        model: Optional[_TypeModel],
+        stack: list[tuple[Element, Optional[_TypeModel], Dict[str, Any]]],
+    ) -> Any:
+        """
+        Decode an element with attributes or child elements.
+
+        Simple content is returned directly if the element has no attributes, and empty elements are returned as
+        ``None``. Otherwise an empty dictionary is returned, and the element is added to the stack to be populated.
+        """
+        has_children = len(element) > 0
+        if not element.attrib:
+            if model is not None and model.text_converter is not None:
+                return _BoMCodec._convert(model.text_converter, element.text or "", element.tag)
+            if not has_children:
+                if model is None and element.text:
+                    return element.text
+                return None
+        obj: Dict[str, Any] = {}
+        stack.append((element, model, obj))
+        return obj
+
+    @staticmethod
+    def _convert(converter: Optional[Callable[[str], Any]], text: str, name: str) -> Any:
+        if converter is None:
+            return text
+        try:
+            return converter(text)
+        except ValueError as e:
+            raise ValueError(f"Invalid BoM:\nValue '{text}' of '{name}' could not be decoded ({str(e)}).") from e
+
+    def encode(self, obj: Dict[str, Any]) -> Element:
+        """
+        Convert a dictionary in xmlschema JSON format into an XML BoM.
+
+        Child elements are ordered according to the schema. Elements which are not defined in the schema are written
+        after all other child elements. The document is indented in the same way as by xmlschema.
+
+        Parameters
+        ----------
+        obj: dict
+            The BoM in xmlschema JSON format.
+
+        Returns
+        -------
+        Element
+            The root element of the XML BoM.
+        """
+        namespaces = dict(self._schema.namespaces)
+        for key, value in obj.items():
+            if key == "@xmlns":
+                namespaces[""] = value
+            elif key.startswith("@xmlns:"):
+                namespaces[key[7:]] = value
+
+        tags: Dict[str, str] = {}
+
+        def get_tag(key: str, is_attribute: bool) -> str:
+            try:
+                return tags[key]
+            except KeyError:
+                pass
+            prefix, _, local_name = key.rpartition(":")
+            if not prefix and is_attribute:
+                tag = local_name
+            else:
+                tag = f"{{{namespaces[prefix]}}}{local_name}" if namespaces.get(prefix) else local_name
+            tags[key] = tag
+            return tag
+
+        root = Element(self.root_tag)
+        stack: list[tuple[Element, Optional[_TypeModel], Dict[str, Any]]] = [(root, self._root_model, obj)]
+        while stack:
+            element, model, data = stack.pop()
+            children: list[tuple[int, str, Optional[_ElementModel], Any]] = []
+            for key, value in data.items():
+                if key.startswith("@xmlns"):
+                    continue
+                if key == "$":
+                    element.text = _to_text(value)
+                elif key[0] == "@":
+                    element.set(get_tag(key[1:], is_attribute=True), _to_text(value))
+                else:
+                    tag = get_tag(key, is_attribute=False)
+                    element_model = model.elements.get(tag) if model is not None else None
+                    position = element_model.position if element_model is not None else len(children) + 1_000_000
+                    children.append((position, tag, element_model, value))
+            children.sort(key=lambda child: child[0])
+
+            for _, tag, element_model, value in children:
+                child_model = element_model.type_model if element_model is not None else None
+                for item in value if isinstance(value, list) else [value]:
+                    child = SubElement(element, tag)
+                    if isinstance(item, dict):
+                        stack.append((child, child_model, item))
+                    elif item is not None:
+                        child.text = _to_text(item)
+        indent(root, space="    ")
+        return root
@@ -0,0 +1,492 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Structural comparison of BoMs, and incremental compliance updates based on the comparison."""
+
+from copy import copy, deepcopy
+from dataclasses import dataclass, fields, replace
+from enum import Enum
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union, cast
+
+from ._execution_report import ExecutionReport
+from .bom_types import eco2301, eco2412, eco2505
+
+if TYPE_CHECKING:
+    from ._item_results import PartWithComplianceResult
+    from ._query_results import BomComplianceQueryResult
+    from .indicators import RoHSIndicator, WatchListIndicator
+
+
+class PartChangeType(Enum):
+    """The type of change made to a part between two versions of a BoM.
+
+    :class:`~enum.Enum` class.
+
+    .. versionadded:: 2.5
+    """
+
+    ADDED = "Added"
+    """The part only exists in the current BoM."""
+
+    REMOVED = "Removed"
+    """The part only exists in the previous BoM."""
+
+    MODIFIED = "Modified"
+    """The part exists in both BoMs, but its properties, materials, specifications, substances, or other child
+    items are different. Changes to child parts are reported separately."""
+
+
+@dataclass(frozen=True)
+class PartKey:
+    """Identifies a part within the list of components of its parent.
+
+    Parts in two versions of a BoM are considered to be the same part if they have the same parent and the same key.
+
+    .. versionadded:: 2.5
+    """
+
+    part_number: str
+    """The part number of the part."""
+
+    internal_id: Optional[str] = None
+    """The internal identity of the part in the BoM."""
+
+    mi_part_reference: Optional[Tuple[Union[str, int, None], ...]] = None
+    """The values which identify the record referenced by the part: the database key, record history identity,
+    record version number, record GUID, record history GUID, and lookup value."""
+
+    @classmethod
+    def from_part(cls, part: eco2505.Part) -> "PartKey":
+        """Create the key for a part.
+
+        Parameters
+        ----------
+        part : :class:`~ansys.grantami.bomanalytics.bom_types.eco2505.Part`
+
+        Returns
+        -------
+        PartKey
+        """
+        reference = part.mi_part_reference
+        reference_key = (
+            (
+                reference.db_key,
+                reference.record_history_identity,
+                reference.record_version_number,
+                reference.record_guid,
+                reference.record_history_guid,
+                reference.lookup_value,
+            )
+            if reference is not None
+            else None
+        )
+        return cls(part.part_number, part.internal_id, reference_key)
+
+
+@dataclass
+class PartChange:
+    """A single change to a part between two versions of a BoM.
+
+    .. versionadded:: 2.5
+    """
+
+    change_type: PartChangeType
+    """The type of change."""
+
+    path: Tuple[PartKey, ...]
+    """The keys of the part and all its parent parts, starting from the root part of the BoM."""
+
+    previous_part: Optional[eco2505.Part]
+    """The part in the previous BoM, or ``None`` if the part was added."""
+
+    current_part: Optional[eco2505.Part]
+    """The part in the current BoM, or ``None`` if the part was removed."""
+
+    def __repr__(self) -> str:
+        path = " / ".join(key.part_number for key in self.path)
+        return f"<{self.__class__.__name__}: {self.change_type.value} {path}>"
+
+
+_content_fields = [f.name for f in fields(eco2505.Part) if f.name != "components"]
+"""Fields which are compared to determine if a part has been modified. Child parts are compared separately."""
+
+
+class _PartNode:
+    """A part in the current BoM, together with the matching part in the previous BoM."""
+
+    __slots__ = (
+        "current_part",
+        "previous_part",
+        "previous_index",
+        "parent",
+        "path",
+        "children",
+        "removed",
+        "modified",
+        "reordered",
+        "changed",
+        "rebuilt",
+        "submitted",
+        "below_submitted",
+        "previous_result",
+        "result",
+    )
+
+    def __init__(
+        self,
+        current_part: Optional[eco2505.Part],
+        previous_part: Optional[eco2505.Part],
+        previous_index: Optional[int],
+        parent: Optional["_PartNode"],
+        path: Tuple[PartKey, ...],
+    ):
+        self.current_part = current_part
+        self.previous_part = previous_part
+        self.previous_index = previous_index
+        self.parent = parent
+        self.path = path
+        self.children: List[_PartNode] = []
+        self.removed: List[eco2505.Part] = []
+        self.modified = False
+        self.reordered = False
+        # State used by incremental compliance updates
+        self.changed = False
+        self.rebuilt = False
+        self.submitted = False
+        self.below_submitted = False
+        self.previous_result: Optional["PartWithComplianceResult"] = None
+        self.result: Optional["PartWithComplianceResult"] = None
+
+
+class BoMDiff:
+    """Structural comparison of two versions of an Eco 25/05 BoM.
+
+    Parts are compared level by level. The child parts of two matching parts are matched on their
+    :class:`PartKey`, in order of appearance if several child parts have the same key. All other properties and child
+    items of matching parts are compared for equality.
+
+    Added and removed parts are reported once, for the top-level part of the added or removed subtree.
+
+    .. versionadded:: 2.5
+
+    Parameters
+    ----------
+    previous_bom : :class:`~ansys.grantami.bomanalytics.bom_types.eco2505.BillOfMaterials`
+        The previous version of the BoM.
+    current_bom : :class:`~ansys.grantami.bomanalytics.bom_types.eco2505.BillOfMaterials`
+        The current version of the BoM.
+
+    Examples
+    --------
+    >>> diff = BoMDiff(previous_bom, current_bom)
+    >>> diff.changes
+    [<PartChange: Modified Assembly / Bracket>]
+    """
+
+    def __init__(self, previous_bom: eco2505.BillOfMaterials, current_bom: eco2505.BillOfMaterials):
+        self._previous_bom = previous_bom
+        self._current_bom = current_bom
+        self._root = _PartNode(None, None, None, None, ())
+        self._nodes: List[_PartNode] = []
+        self._changes: List[PartChange] = []
+        self._compare()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: {len(self.added)} added, {len(self.removed)} removed, "
+            f"{len(self.modified)} modified>"
+        )
+
+    @property
+    def previous_bom(self) -> eco2505.BillOfMaterials:
+        """The previous version of the BoM."""
+        return self._previous_bom
+
+    @property
+    def current_bom(self) -> eco2505.BillOfMaterials:
+        """The current version of the BoM."""
+        return self._current_bom
+
+    @property
+    def changes(self) -> List[PartChange]:
+        """All changes between the two BoMs, in depth-first order. Parts removed from a parent part are listed
+        directly after the parent part."""
+        return self._changes
+
+    @property
+    def added(self) -> List[PartChange]:
+        """Parts which only exist in the current BoM."""
+        return [change for change in self._changes if change.change_type is PartChangeType.ADDED]
+
+    @property
+    def removed(self) -> List[PartChange]:
+        """Parts which only exist in the previous BoM."""
+        return [change for change in self._changes if change.change_type is PartChangeType.REMOVED]
+
+    @property
+    def modified(self) -> List[PartChange]:
+        """Parts which exist in both BoMs, but are different."""
+        return [change for change in self._changes if change.change_type is PartChangeType.MODIFIED]
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether there are any changes between the two BoMs, including changes to the order of parts."""
+        return bool(self._changes) or any(node.reordered for node in self._nodes)
+
+    def _compare(self) -> None:
+        # Parts are compared with an explicit work stack, so the depth of the BoM is not limited by the recursion limit
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            self._nodes.append(node)
+            if node is self._root:
+                previous_components = self._previous_bom.components
+                current_components = self._current_bom.components
+            elif node.previous_part is None:
+                self._changes.append(PartChange(PartChangeType.ADDED, node.path, None, node.current_part))
+                continue
+            else:
+                assert node.current_part is not None
+                if node.modified:
+                    change = PartChange(PartChangeType.MODIFIED, node.path, node.previous_part, node.current_part)
+                    self._changes.append(change)
+                previous_components = node.previous_part.components
+                current_components = node.current_part.components
+
+            previous_indices: Dict[PartKey, List[int]] = {}
+            for idx, previous_part in enumerate(previous_components):
+                previous_indices.setdefault(PartKey.from_part(previous_part), []).append(idx)
+
+            last_index = -1
+            for current_part in current_components:
+                key = PartKey.from_part(current_part)
+                indices = previous_indices.get(key)
+                if not indices:
+                    node.children.append(_PartNode(current_part, None, None, node, node.path + (key,)))
+                    continue
+                previous_index = indices.pop(0)
+                previous_part = previous_components[previous_index]
+                child = _PartNode(current_part, previous_part, previous_index, node, node.path + (key,))
+                child.modified = any(
+                    getattr(previous_part, name) != getattr(current_part, name) for name in _content_fields
+                )
+                node.reordered = node.reordered or previous_index < last_index
+                last_index = previous_index
+                node.children.append(child)
+
+            for key, indices in previous_indices.items():
+                for idx in indices:
+                    node.removed.append(previous_components[idx])
+                    path = node.path + (key,)
+                    self._changes.append(PartChange(PartChangeType.REMOVED, path, previous_components[idx], None))
+
+            stack.extend(reversed(node.children))
+
+
+def _can_roll_up(part: Union[eco2301.Part, eco2412.Part, eco2505.Part]) -> bool:
+    """
+    Whether the compliance of a part can be determined from the compliance of its child parts only.
+
+    This is the case for assemblies which do not reference a record, and do not declare exemptions or any child items
+    other than parts. The compliance of any other part depends on information which is only available on the server.
+    """
+    return (
+        part.mi_part_reference is None
+        and not part.rohs_exemptions
+        and not part.specifications
+        and not part.materials
+        and not part.substances
+        and len(part.components) > 0
+    )
+
+
+def _roll_up(
+    indicator_definitions: Dict[str, Union["WatchListIndicator", "RoHSIndicator"]],
+    parts: List["PartWithComplianceResult"],
+) -> Dict[str, Union["WatchListIndicator", "RoHSIndicator"]]:
+    """Determine the compliance of an assembly as the worst compliance of its child parts for each indicator."""
+    indicators = deepcopy(indicator_definitions)
+    for name, indicator in indicators.items():
+        flags = [part.indicators[name].flag for part in parts if part.indicators[name].flag is not None]
+        if flags:
+            indicator.flag = max(flags, key=lambda flag: flag.value).name  # type: ignore[union-attr]
+    return indicators
+
+
+class _IncrementalComplianceUpdate:
+    def __init__(self, diff: BoMDiff, previous_result: "BomComplianceQueryResult"):
+        """
+        Determines the parts which must be resubmitted to update a BoM compliance result after a BoM has changed, and
+        combines the compliance of the resubmitted parts with the previous result.
+
+        A part is resubmitted if it was added or modified. If the child parts of a part have changed, the compliance of
+        the part is rolled up from its child parts if possible, and otherwise the part is resubmitted. Resubmitted
+        parts are submitted with all their child parts, as the root parts of a reduced BoM.
+
+        Parameters
+        ----------
+        diff : BoMDiff
+            Comparison between the BoM used to obtain ``previous_result`` and the current BoM.
+        previous_result : BomComplianceQueryResult
+            The compliance result for the previous BoM.
+        """
+        self._diff = diff
+        self._previous_result = previous_result
+        self._submitted_nodes: List[_PartNode] = []
+        self._apply_lock = threading.Lock()
+
+        root = diff._root
+        # Children appear after their parents in the list of nodes, so the nodes are visited bottom-up in reverse
+        for node in reversed(diff._nodes):
+            if node is root:
+                continue
+            if node.previous_part is None or node.modified:
+                node.changed = node.rebuilt = node.submitted = True
+                continue
+            node.changed = bool(node.removed) or any(child.changed for child in node.children)
+            node.rebuilt = node.changed or node.reordered or any(child.rebuilt for child in node.children)
+            assert node.current_part is not None
+            node.submitted = node.changed and not _can_roll_up(node.current_part)
+
+        for node in diff._nodes:
+            parent = node.parent
+            node.below_submitted = parent is not None and (parent.submitted or parent.below_submitted)
+            if node.submitted and not node.below_submitted:
+                self._submitted_nodes.append(node)
+
+        self.reduced_bom: Optional[eco2505.BillOfMaterials] = None
+        """BoM containing the parts to resubmit, or ``None`` if no parts must be resubmitted."""
+        if self._submitted_nodes:
+            components = [cast(eco2505.Part, node.current_part) for node in self._submitted_nodes]
+            self.reduced_bom = eco2505.BillOfMaterials(components=components)
+
+    @property
+    def current_bom(self) -> eco2505.BillOfMaterials:
+        """The current BoM, including the parts which are not resubmitted."""
+        return self._diff.current_bom
+
+    @property
+    def indicator_names(self) -> Optional[List[str]]:
+        """Names of the indicators in the previous result, or ``None`` if the previous result contains no parts."""
+        results = self._previous_result.compliance_by_part_and_indicator
+        if not results:
+            return None
+        return list(results[0]._indicator_definitions)
+
+    def apply(self, submitted_result: Optional["BomComplianceQueryResult"]) -> "BomComplianceQueryResult":
+        """
+        Combine the compliance result for the reduced BoM with the previous result.
+
+        The previous result is not modified.
+
+        Parameters
+        ----------
+        submitted_result : BomComplianceQueryResult, optional
+            The compliance result for :attr:`reduced_bom`, or ``None`` if no parts were resubmitted.
+
+        Returns
+        -------
+        BomComplianceQueryResult
+            The compliance result for the current BoM.
+
+        Raises
+        ------
+        ValueError
+            If the previous result does not correspond to the previous BoM.
+        """
+        started = time.perf_counter()
+        # The results are stored on the nodes of the diff, so a query cannot apply results from two runs at once
+        with self._apply_lock:
+            current_result, reused_part_count = self._apply(submitted_result)
+
+        report = submitted_result.execution_report if submitted_result is not None else None
+        if report is None:
+            report = ExecutionReport()
+        current_result._execution_report = replace(
+            report,
+            batches=list(report.batches),
+            result_build_time=report.result_build_time + time.perf_counter() - started,
+            cache_hits=report.cache_hits + reused_part_count,
+        )
+        return current_result
+
+    def _apply(self, submitted_result: Optional["BomComplianceQueryResult"]) -> Tuple["BomComplianceQueryResult", int]:
+        submitted_parts = submitted_result.compliance_by_part_and_indicator if submitted_result is not None else []
+        if len(submitted_parts) != len(self._submitted_nodes):
+            raise ValueError("The compliance result does not contain a result for each resubmitted part.")
+        for node, part_result in zip(self._submitted_nodes, submitted_parts):
+            node.result = part_result
+
+        root = self._diff._root
+        previous_results = self._previous_result.compliance_by_part_and_indicator
+        self._check_previous_results(len(self._diff.previous_bom.components), previous_results)
+        nodes = [node for node in self._diff._nodes if node is not root and not node.below_submitted]
+
+        # Find the previous result for each part, top-down
+        for node in nodes:
+            if node.previous_index is None:
+                continue
+            parent = node.parent
+            assert parent is not None
+            if parent is root:
+                node.previous_result = previous_results[node.previous_index]
+            else:
+                assert parent.previous_result is not None
+                node.previous_result = parent.previous_result.parts[node.previous_index]
+            if node.rebuilt and not node.submitted:
+                assert node.previous_part is not None
+                self._check_previous_results(len(node.previous_part.components), node.previous_result.parts)
+
+        # Create the result for each part, bottom-up
+        reused_part_count = 0
+        for node in reversed(nodes):
+            if node.submitted:
+                continue
+            if not node.rebuilt:
+                node.result = node.previous_result
+                # Count the unchanged parts whose parent part is changed, not the child parts of unchanged parts
+                if node.parent is root or cast(_PartNode, node.parent).rebuilt:
+                    reused_part_count += 1
+                continue
+            result = copy(node.previous_result)
+            assert result is not None
+            result._parts = [child.result for child in node.children]  # type: ignore[misc]
+            if node.changed:
+                result._indicators = _roll_up(result._indicator_definitions, result._parts)
+            node.result = result
+
+        current_result = copy(self._previous_result)
+        current_result._results = [child.result for child in root.children]
+        # The result is not equivalent to a single response from Granta MI
+        current_result._response_items = None
+        current_result._messages = list(self._previous_result.messages)
+        if submitted_result is not None:
+            current_result._messages.extend(submitted_result.messages)
+        return current_result, reused_part_count
+
+    @staticmethod
+    def _check_previous_results(expected_count: int, results: List["PartWithComplianceResult"]) -> None:
+        if len(results) != expected_count:
+            raise ValueError("The previous compliance result does not correspond to the previous BoM.")
@@ -20,15 +20,37 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from dataclasses import dataclass
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from functools import cache
 from pathlib import Path
+import pickle
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, TextIO, Type, TypeAlias, TypeVar, cast
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    Optional,
+    TextIO,
+    Type,
+    TypeAlias,
+    TypeVar,
+    Union,
+    cast,
+)
+from xml.etree.ElementTree import Element
+
+from defusedxml import ElementTree
 import xmlschema
 from xmlschema import XMLSchema, XMLSchemaValidationError
 
+from ._allowed_types import _check_validation_level
+from ._bom_codec import _BoMCodec
+from ._fingerprint import fingerprint_bom
 from .bom_types import eco2301, eco2412, eco2505
+from .bom_types._base_types import _SHARED_EMPTY_LIST, BaseType
+from .bom_types._bom_converter import _BoMConverter
 from .schemas import bom_schema_2301, bom_schema_2412, bom_schema_2505
 
 if TYPE_CHECKING:
@@ -67,6 +89,8 @@ class BoMHandler:
         self._schemas: list[XMLSchema] = []
         self._readers: dict[XMLSchema, "_GenericBoMReader"] = {}
         self._writers: dict[XMLSchema, "_GenericBoMWriter"] = {}
+        self._codecs: dict[XMLSchema, _BoMCodec] = {}
+        self._converters: dict[tuple[XMLSchema, XMLSchema], _BoMConverter] = {}
 
         for bom_type in _type_map.keys():
             self._initialize(bom_type)
@@ -87,7 +111,32 @@ class BoMHandler:
         except StopIteration:
             raise ValueError("Invalid BoM. BoM is not compliant with any supported Ansys Granta BoM XML schema.")
 
-    def load_bom_from_file(self, file_path: Path, allow_unsupported_data: bool = True) -> BillOfMaterials:
+    def _get_codec(self, schema: XMLSchema) -> _BoMCodec:
+        # Codecs are only compiled when a BoM is first processed without validation
+        try:
+            return self._codecs[schema]
+        except KeyError:
+            codec = self._codecs[schema] = _BoMCodec(schema)
+            return codec
+
+    def _get_converter(self, source_schema: XMLSchema, target_schema: XMLSchema) -> _BoMConverter:
+        # Converters cache the mapping between source and target types, and are reused for all conversions
+        try:
+            return self._converters[(source_schema, target_schema)]
+        except KeyError:
+            converter = _BoMConverter(self._writers[source_schema], self._readers[target_schema])
+            self._converters[(source_schema, target_schema)] = converter
+            return converter
+
+    def _decode_without_validation(self, root: Element) -> "_DeserializedBoM":
+        for schema in self._schemas:
+            if root.tag == f"{{{schema.target_namespace}}}PartsEco":
+                return _DeserializedBoM(self._get_codec(schema).decode(root), schema)
+        raise ValueError("Invalid BoM. BoM is not compliant with any supported Ansys Granta BoM XML schema.")
+
+    def load_bom_from_file(
+        self, file_path: Path, allow_unsupported_data: bool = True, validation: str = "lax"
+    ) -> BillOfMaterials:
         """
         Read a BoM from a file and return the corresponding BillOfMaterials object for use.
 
@@ -99,6 +148,16 @@ class BoMHandler:
             If ``False``, an exception is raised if there is data in the BoM XML that cannot be deserialized.
 
             .. versionadded:: 2.3
+        validation : str, default: "lax"
+            The level of validation to perform against the BoM XML schema:
+
+            * ``"lax"``: All schema errors in the BoM are reported in a single exception.
+            * ``"strict"``: An exception is raised for the first schema error in the BoM.
+            * ``"none"``: The BoM is not validated. Use this level only for BoMs from a trusted source, such as
+              BoMs created with :meth:`dump_bom`. Invalid BoMs may produce incomplete or invalid
+              ``BillOfMaterials`` objects.
+
+            .. versionadded:: 2.5
 
         Returns
         -------
@@ -112,16 +171,23 @@ class BoMHandler:
             If the BoM contains data that cannot be represented by :ref:`ref_grantami_bomanalytics_bom_eco2412` or
             :ref:`ref_grantami_bomanalytics_bom_eco2301` classes and ``allow_unsupported_data = False`` is specified.
             The additional data fields are reported in the exception message.
+        ValueError
+            If the ``validation`` argument is not a valid validation level.
         """
-        deserializer = _Deserializer(self._schemas)
+        _check_validation_level(validation)
         with open(file_path, "r", encoding="utf-8") as fp:
-            result = deserializer.deserialize_file(fp)
+            if validation == "none":
+                result = self._decode_without_validation(_parse_xml(fp))
+            else:
+                result = _Deserializer(self._schemas, validation).deserialize_file(fp)
         bom, undeserialized_fields = self._readers[result.selected_schema].read_bom(result.bom)
         if undeserialized_fields and not allow_unsupported_data:
             self._raise_undeserialized_fields(undeserialized_fields)
         return cast(BillOfMaterials, bom)
 
-    def load_bom_from_text(self, bom_text: str, allow_unsupported_data: bool = True) -> BillOfMaterials:
+    def load_bom_from_text(
+        self, bom_text: str, allow_unsupported_data: bool = True, validation: str = "lax"
+    ) -> BillOfMaterials:
         """
         Read a BoM from a string and return the corresponding BillOfMaterials object for use.
 
@@ -133,6 +199,16 @@ class BoMHandler:
             If ``False``, an exception is raised if there is data in the BoM XML that cannot be deserialized.
 
             .. versionadded:: 2.3
+        validation : str, default: "lax"
+            The level of validation to perform against the BoM XML schema:
+
+            * ``"lax"``: All schema errors in the BoM are reported in a single exception.
+            * ``"strict"``: An exception is raised for the first schema error in the BoM.
+            * ``"none"``: The BoM is not validated. Use this level only for BoMs from a trusted source, such as
+              BoMs created with :meth:`dump_bom`. Invalid BoMs may produce incomplete or invalid
+              ``BillOfMaterials`` objects.
+
+            .. versionadded:: 2.5
 
         Returns
         -------
@@ -146,14 +222,85 @@ class BoMHandler:
             If the BoM contains data that cannot be represented by :ref:`ref_grantami_bomanalytics_bom_eco2412` or
             :ref:`ref_grantami_bomanalytics_bom_eco2301` classes and ``allow_unsupported_data = False`` is specified.
             The additional data fields are reported in the exception message.
+        ValueError
+            If the ``validation`` argument is not a valid validation level.
         """
-        deserializer = _Deserializer(self._schemas)
-        result = deserializer.deserialize_string(bom_text)
+        _check_validation_level(validation)
+        if validation == "none":
+            result = self._decode_without_validation(_parse_xml(bom_text))
+        else:
+            result = _Deserializer(self._schemas, validation).deserialize_string(bom_text)
         bom, undeserialized_fields = self._readers[result.selected_schema].read_bom(result.bom)
         if undeserialized_fields and not allow_unsupported_data:
             self._raise_undeserialized_fields(undeserialized_fields)
         return cast(BillOfMaterials, bom)
 
+    def load_boms(
+        self,
+        file_paths: Iterable[Path],
+        allow_unsupported_data: bool = True,
+        validation: str = "lax",
+        workers: Optional[int] = None,
+        in_completion_order: bool = False,
+    ) -> Iterator["BoMLoadResult"]:
+        """
+        Read multiple BoMs from files in parallel, and return the corresponding BillOfMaterials objects for use.
+
+        Each BoM is read in a separate process, using the same rules as :meth:`load_bom_from_file`. Each worker
+        process creates a single ``BoMHandler`` object, which is reused for all BoMs read by that process. If a BoM
+        cannot be read, the exception is reported in the corresponding result instead of being raised, and the
+        remaining BoMs are still read.
+
+        .. versionadded:: 2.5
+
+        Parameters
+        ----------
+        file_paths : Iterable[:class:`~pathlib.Path`]
+            Locations of the BoM XML files.
+        allow_unsupported_data : bool, default: True
+            If ``False``, a BoM is reported as an error if there is data in the BoM XML that cannot be deserialized.
+        validation : str, default: "lax"
+            The level of validation to perform against the BoM XML schema. See :meth:`load_bom_from_file` for the
+            supported values.
+        workers : int, optional
+            The number of worker processes to use. Defaults to the number of processors on the machine. If ``1`` is
+            specified, the BoMs are read sequentially in the current process with this ``BoMHandler``.
+        in_completion_order : bool, default: False
+            If ``False``, results are returned in the same order as ``file_paths``. If ``True``, each result is
+            returned as soon as the corresponding BoM has been read.
+
+        Returns
+        -------
+        Iterator[:class:`BoMLoadResult`]
+            One result for each file in ``file_paths``. The worker processes are stopped when the iterator is
+            exhausted or closed.
+
+        Raises
+        ------
+        ValueError
+            If the ``validation`` argument is not a valid validation level.
+        ValueError
+            If the ``workers`` argument is less than 1.
+        """
+        _check_validation_level(validation)
+        if workers is not None and workers < 1:
+            raise ValueError(f'workers "{workers}" is not a valid number of worker processes. Specify at least 1.')
+        file_paths = list(file_paths)
+        if workers == 1:
+            return self._load_boms_sequentially(file_paths, allow_unsupported_data, validation)
+        return _load_boms_in_parallel(file_paths, allow_unsupported_data, validation, workers, in_completion_order)
+
+    def _load_boms_sequentially(
+        self, file_paths: list[Path], allow_unsupported_data: bool, validation: str
+    ) -> Iterator["BoMLoadResult"]:
+        for file_path in file_paths:
+            try:
+                bom = self.load_bom_from_file(file_path, allow_unsupported_data, validation)
+            except Exception as e:
+                yield BoMLoadResult(file_path, error=e)
+            else:
+                yield BoMLoadResult(file_path, bom=bom)
+
     def convert(self, bom: BillOfMaterials, target_bom_version: Type[T], allow_unsupported_data: bool = True) -> T:
         """
         Convert a BoM from one version to another.
@@ -190,65 +337,290 @@ class BoMHandler:
         if target_bom_version not in _type_map:
             raise ValueError(f'target_bom_version "{target_bom_version}" is not a valid BoM target.')
 
-        # Convert Python objects to dictionary
         schema = self._get_xmlschema_for_bom(bom)
-        writer = self._writers[schema]
-
-        bom_dict = writer.convert_bom_to_dict(bom)
-        current_eco_namespace = schema.namespaces["eco"]
-
-        # Replace namespace recursively through dictionary
-        target_eco_namespace = target_bom_version.namespace
-        self._modify_namespace(bom_dict, current_eco_namespace, target_eco_namespace)
-
-        # Convert dictionary to Python objects
-        target_reader = next(r for r in self._readers.values() if r.target_namespace == target_eco_namespace)
-        converted_bom, undeserialized_fields = target_reader.read_bom(bom_dict)
+        target_schema = next(s for s in self._schemas if s.target_namespace == target_bom_version.namespace)
+        converter = self._get_converter(schema, target_schema)
+        converted_bom, undeserialized_fields = converter.convert(bom)
         if undeserialized_fields and not allow_unsupported_data:
             self._raise_undeserialized_fields(undeserialized_fields)
         return cast(T, converted_bom)
 
+    @staticmethod
+    def compact(bom: T) -> T:
+        """
+        Reduce the memory used by a BoM by replacing all empty lists in the BoM with a single shared empty list.
+
+        Most lists in a BoM are empty, such as the ``components`` list of parts which do not contain other parts, or the
+        ``processes`` list of most items. By default, each of these lists is a separate object. This method is intended
+        for BoMs which are held in memory for a long time and are not modified, for example to compare them with
+        other BoMs.
+
+        The shared empty list compares equal to any other empty list, but cannot be modified. To add items to an empty
+        list field of a compacted BoM, assign a new list to the field instead. The BoM is modified in place.
+
+        .. versionadded:: 2.5
+
+        Parameters
+        ----------
+        bom : :class:`.eco2505.BillOfMaterials` or :class:`.eco2412.BillOfMaterials` or \
+              :class:`.eco2301.BillOfMaterials`
+            The BoM to compact.
+
+        Returns
+        -------
+        :class:`.eco2505.BillOfMaterials` or :class:`.eco2412.BillOfMaterials` or :class:`.eco2301.BillOfMaterials`
+            The provided BoM.
+
+        Examples
+        --------
+        >>> bom = bom_handler.compact(bom_handler.load_bom_from_file(Path("bom.xml")))
+        >>> bom.components[0].processes.append(process)
+        TypeError: This empty list is shared between BoM objects and cannot be modified. ...
+        >>> bom.components[0].processes = [process]
+        """
+        stack: list[BaseType] = [bom]
+        while stack:
+            obj = stack.pop()
+            names, props, list_props = _get_child_fields(type(obj))
+            for name in names:
+                value = getattr(obj, name)
+                if isinstance(value, list):
+                    if not value:
+                        if value is not _SHARED_EMPTY_LIST:
+                            setattr(obj, name, _SHARED_EMPTY_LIST)
+                    elif name in list_props:
+                        stack.extend(value)
+                elif value is not None and name in props:
+                    stack.append(value)
+        return bom
+
+    @staticmethod
+    def fingerprint(bom: Union[BillOfMaterials, str, bytes]) -> str:
+        """
+        Compute a fingerprint of a BoM which can be used to detect identical BoMs, for example to cache results.
+
+        BoMs in XML form are compared in canonical form: namespace prefixes, the order of attributes, comments, and
+        whitespace which surrounds text or separates elements do not affect the fingerprint. The document is hashed in
+        a single streaming pass, without building an element tree. BillOfMaterials objects are compared by the values
+        of their fields, where empty lists and ``None`` are equivalent.
+
+        A BillOfMaterials object and the same BoM in XML form have different fingerprints. Compare fingerprints of BoMs
+        in the same form only, or fingerprint the output of :meth:`dump_bom` to compare an object with a BoM in XML
+        form.
+
+        .. versionadded:: 2.5
+
+        Parameters
+        ----------
+        bom : :class:`.eco2505.BillOfMaterials` or :class:`.eco2412.BillOfMaterials` or \
+              :class:`.eco2301.BillOfMaterials` or str or bytes
+            The BoM to fingerprint, as a BillOfMaterials object or in XML form.
+
+        Returns
+        -------
+        str
+            SHA-256 hash of the canonical form of the BoM, as a hexadecimal string.
+
+        Raises
+        ------
+        ValueError
+            If the BoM is provided in XML form and is not valid XML.
+        """
+        return fingerprint_bom(bom)
+
     @staticmethod
     def _raise_undeserialized_fields(fields: list[str]) -> None:
         formatted_fields = "  \n".join(fields)
         raise ValueError(f"The following fields in the provided BoM could not be deserialized:\n{formatted_fields}")
 
-    def _modify_namespace(self, obj: dict[str, Any], current_namespace: str, new_namespace: str) -> None:
-        for k, v in obj.items():
-            if k.startswith("@xmlns") and v == current_namespace:
-                obj[k] = new_namespace
-            elif isinstance(v, dict):
-                self._modify_namespace(v, current_namespace, new_namespace)
-
-    def dump_bom(self, bom: BillOfMaterials) -> str:
+    def dump_bom(self, bom: BillOfMaterials, validation: str = "lax") -> str:
         """
         Convert a BillOfMaterials object into a string XML representation.
 
         Parameters
         ----------
         bom : :class:`.eco2412.BillOfMaterials` or :class:`.eco2301.BillOfMaterials`
+        validation : str, default: "lax"
+            The level of validation to perform against the BoM XML schema:
+
+            * ``"lax"``: All schema errors in the BoM are reported in a single exception.
+            * ``"strict"``: An exception is raised for the first schema error in the BoM.
+            * ``"none"``: The BoM is not validated. Use this level only if the BoM is known to be valid, for example
+              if it was loaded from a validated XML document and has not been modified.
+
+            .. versionadded:: 2.5
 
         Returns
         -------
         str
             Serialized representation of the BoM.
+
+        Raises
+        ------
+        ValueError
+            If the BoM is not valid according to the BoM XML schema.
+        ValueError
+            If the ``validation`` argument is not a valid validation level.
         """
+        _check_validation_level(validation)
+        output = xmlschema.etree_tostring(self._encode_bom(bom, validation))
+        return cast(str, output)
+
+    def _encode_bom(self, bom: BillOfMaterials, validation: str) -> Element:
+        """Convert a BillOfMaterials object into an XML element tree, validated to the specified level."""
         schema = self._get_xmlschema_for_bom(bom)
         writer = self._writers[schema]
 
         bom_dict = writer.convert_bom_to_dict(bom)
-        result = schema.encode(bom_dict, validation="lax", namespaces=schema.namespaces, unordered=True)
-        if result is None:
-            raise ValueError("Unhandled error during BoM serialization.")
+        obj: Any
+        if validation == "none":
+            obj = self._get_codec(schema).encode(bom_dict)
+        elif validation == "strict":
+            try:
+                obj = schema.encode(bom_dict, validation="strict", namespaces=schema.namespaces, unordered=True)
+            except XMLSchemaValidationError as e:
+                raise ValueError(f"Invalid BoM object:\n{e.msg}") from e
+        else:
+            result = schema.encode(bom_dict, validation="lax", namespaces=schema.namespaces, unordered=True)
+            if result is None:
+                raise ValueError("Unhandled error during BoM serialization.")
 
-        obj, errors = result
+            obj, errors = result
 
-        if obj is None or len(errors) > 0:
-            newline = "\n"
-            raise ValueError(f"Invalid BoM object:\n{newline.join([error.msg for error in errors])}")
+            if obj is None or len(errors) > 0:
+                newline = "\n"
+                raise ValueError(f"Invalid BoM object:\n{newline.join([error.msg for error in errors])}")
+        return cast(Element, obj)
 
-        output = xmlschema.etree_tostring(obj)
-        return cast(str, output)
+
+@dataclass
+class BoMLoadResult:
+    """
+    The result of reading a single BoM with :meth:`BoMHandler.load_boms`.
+
+    .. versionadded:: 2.5
+    """
+
+    file_path: Path
+    """Location of the BoM XML file."""
+
+    bom: Optional[BillOfMaterials] = None
+    """The BillOfMaterials object, or ``None`` if the BoM could not be read."""
+
+    error: Optional[Exception] = None
+    """The exception raised when reading the BoM, or ``None`` if the BoM was read successfully."""
+
+
+_worker_bom_handler: Optional[BoMHandler] = None
+"""BoMHandler used for all BoMs read by the current worker process."""
+
+
+def _load_bom_in_worker(file_path: Path, allow_unsupported_data: bool, validation: str) -> tuple[bool, bytes]:
+    global _worker_bom_handler
+    if _worker_bom_handler is None:
+        _worker_bom_handler = BoMHandler()
+    bom = _worker_bom_handler.load_bom_from_file(file_path, allow_unsupported_data, validation)
+    return _pack_bom(bom)
+
+
+def _load_boms_in_parallel(
+    file_paths: list[Path],
+    allow_unsupported_data: bool,
+    validation: str,
+    workers: Optional[int],
+    in_completion_order: bool,
+) -> Iterator[BoMLoadResult]:
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {
+            executor.submit(_load_bom_in_worker, file_path, allow_unsupported_data, validation): file_path
+            for file_path in file_paths
+        }
+        for future in as_completed(futures) if in_completion_order else futures:
+            yield _get_load_result(futures[future], future)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _get_load_result(file_path: Path, future: "Future[tuple[bool, bytes]]") -> BoMLoadResult:
+    try:
+        bom = _unpack_bom(*future.result())
+    except Exception as e:
+        return BoMLoadResult(file_path, error=e)
+    return BoMLoadResult(file_path, bom=bom)
+
+
+def _pack_bom(bom: BillOfMaterials) -> tuple[bool, bytes]:
+    """
+    Serialize a BillOfMaterials object for transfer between processes.
+
+    The standard pickle format is used where possible, since it is implemented in C. The standard format is
+    recursive, and so BoMs which are too deeply nested are first flattened into a list of records.
+
+    Returns
+    -------
+    tuple[bool, bytes]
+        Whether the BoM was flattened, and the pickled BoM.
+    """
+    try:
+        return False, pickle.dumps(bom, protocol=pickle.HIGHEST_PROTOCOL)
+    except RecursionError:
+        return True, pickle.dumps(_flatten_bom(bom), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _unpack_bom(flattened: bool, data: bytes) -> BillOfMaterials:
+    """Deserialize a BillOfMaterials object created by :func:`_pack_bom`."""
+    if flattened:
+        return cast(BillOfMaterials, _rebuild_bom(pickle.loads(data)))
+    return cast(BillOfMaterials, pickle.loads(data))
+
+
+@cache
+def _get_child_fields(type_: Type[BaseType]) -> tuple[list[str], set[str], set[str]]:
+    names = [field.name for field in fields(cast(Any, type_))]
+    props = {prop for _, prop, _ in type_._props}
+    list_props = {prop for _, prop, _, _ in type_._list_props}
+    return names, props, list_props
+
+
+def _flatten_bom(bom: BaseType) -> list[tuple[Type[BaseType], dict[str, Any]]]:
+    """
+    Flatten a hierarchy of objects into a list of records, without recursion.
+
+    Each record contains the type and the field values of an object. Child objects are replaced by their index in the
+    list. Children always appear after their parent in the list.
+    """
+    records: list[tuple[Type[BaseType], dict[str, Any]]] = []
+    objects = [bom]
+    for obj in objects:
+        names, props, list_props = _get_child_fields(type(obj))
+        values = {}
+        for name in names:
+            value = getattr(obj, name)
+            if value is not None and name in props:
+                objects.append(value)
+                value = len(objects) - 1
+            elif value is not None and name in list_props:
+                value = list(range(len(objects), len(objects) + len(value)))
+                objects.extend(getattr(obj, name))
+            values[name] = value
+        records.append((type(obj), values))
+    return records
+
+
+def _rebuild_bom(records: list[tuple[Type[BaseType], dict[str, Any]]]) -> BaseType:
+    """Rebuild a hierarchy of objects flattened by :func:`_flatten_bom`, without recursion."""
+    objects: list[Any] = [None] * len(records)
+    for idx in range(len(records) - 1, -1, -1):
+        type_, values = records[idx]
+        _, props, list_props = _get_child_fields(type_)
+        for name, value in values.items():
+            if value is not None and name in props:
+                values[name] = objects[value]
+            elif value is not None and name in list_props:
+                values[name] = [objects[item] for item in value]
+        objects[idx] = type_(**values)
+    return cast(BaseType, objects[0])
 
 
 @dataclass
@@ -258,7 +630,7 @@ class _DeserializedBoM:
 
 
 class _Deserializer:
-    def __init__(self, schemas: list[XMLSchema]):
+    def __init__(self, schemas: list[XMLSchema], validation: str = "lax"):
         """
         Deserializes an XML BoM to a dictionary given a list of valid xmlschema.XMLSchema objects.
 
@@ -266,8 +638,11 @@ class _Deserializer:
         ----------
         schemas : list[xmlschema.XMLSchema]
             The valid schemas against which to validate the incoming XML BoM.
+        validation : str, default: "lax"
+            The xmlschema validation mode, either ``"lax"`` or ``"strict"``.
         """
         self._schemas = schemas
+        self._validation = validation
 
     def deserialize_file(self, bom: TextIO) -> _DeserializedBoM:
         """
@@ -285,13 +660,7 @@ class _Deserializer:
         """
         for schema in self._schemas:
             try:
-                result = schema.decode(
-                    bom,
-                    validation="lax",
-                    keep_empty=True,
-                    xmlns_processing="collapsed",
-                )
-                deserialized_bom = self._postprocess_output(result)
+                deserialized_bom = self._decode(schema, bom)
                 return _DeserializedBoM(deserialized_bom, schema)
             except xmlschema.exceptions.XMLSchemaKeyError:
                 bom.seek(0)
@@ -313,18 +682,27 @@ class _Deserializer:
         """
         for schema in self._schemas:
             try:
-                result = schema.decode(
-                    bom,
-                    validation="lax",
-                    keep_empty=True,
-                    xmlns_processing="collapsed",
-                )
-                deserialized_bom = self._postprocess_output(result)
+                deserialized_bom = self._decode(schema, bom)
                 return _DeserializedBoM(deserialized_bom, schema)
             except xmlschema.exceptions.XMLSchemaKeyError:
                 pass
         raise ValueError("Invalid BoM. BoM is not compliant with any supported Ansys Granta BoM XML schema.")
 
+    def _decode(self, schema: XMLSchema, bom: TextIO | str) -> dict:
+        if self._validation == "strict":
+            try:
+                result = schema.decode(bom, validation="strict", keep_empty=True, xmlns_processing="collapsed")
+            except XMLSchemaValidationError as e:
+                raise ValueError(f"Invalid BoM:\n{e.msg}") from e
+            return cast(dict, result)
+        result = schema.decode(
+            bom,
+            validation="lax",
+            keep_empty=True,
+            xmlns_processing="collapsed",
+        )
+        return self._postprocess_output(result)
+
     @staticmethod
     def _postprocess_output(result: tuple[Any | None, list[XMLSchemaValidationError]] | None) -> dict:
         """
@@ -347,3 +725,20 @@ class _Deserializer:
             newline = "\n"
             raise ValueError(f"Invalid BoM:\n{newline.join([error.msg for error in errors])}")
         return cast(dict, deserialized_bom)
+
+
+def _parse_xml(source: TextIO | str) -> Element:
+    """
+    Parse an XML BoM without validation.
+
+    Raises
+    ------
+    ValueError
+        If the BoM is not valid XML.
+    """
+    try:
+        if isinstance(source, str):
+            return ElementTree.fromstring(source)
+        return cast(Element, ElementTree.parse(source).getroot())
+    except ElementTree.ParseError as e:
+        raise ValueError(f"BoM provided as input is not valid XML ({str(e)}).") from e
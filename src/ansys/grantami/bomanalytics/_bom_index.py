@@ -0,0 +1,351 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Index over the objects in a BoM, for fast lookups without repeated traversal."""
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from ._bom_helper import BillOfMaterials, _get_child_fields
+from .bom_types import eco2301, eco2412, eco2505
+from .bom_types._base_types import BaseType
+from .bom_types.gbt1205 import MIRecordReference
+
+if TYPE_CHECKING:
+    from .bom_types.eco2301 import Part as Part2301
+    from .bom_types.eco2412 import Part as Part2412
+    from .bom_types.eco2505 import Part as Part2505
+
+TItem = TypeVar("TItem", bound=BaseType)
+
+_part_types = (eco2301.Part, eco2412.Part, eco2505.Part)
+
+
+class _IndexData:
+    """The lookup tables of a ``BoMIndex``, built in a single traversal of the BoM."""
+
+    __slots__ = (
+        "items",
+        "parents",
+        "parts_by_number",
+        "items_by_record_guid",
+        "items_by_record_history_guid",
+        "items_by_record_history_identity",
+        "items_by_internal_id",
+        "items_by_type",
+        "part_count",
+        "max_part_depth",
+    )
+
+    def __init__(self, bom: BaseType) -> None:
+        # Parent and depth of each item, by the id of the item. BoM objects are not hashable.
+        self.parents: Dict[int, Tuple[Optional[BaseType], int]] = {}
+        self.items: List[BaseType] = []
+        self.parts_by_number: Dict[str, List[BaseType]] = {}
+        self.items_by_record_guid: Dict[str, List[BaseType]] = {}
+        self.items_by_record_history_guid: Dict[str, List[BaseType]] = {}
+        self.items_by_record_history_identity: Dict[int, List[BaseType]] = {}
+        self.items_by_internal_id: Dict[str, BaseType] = {}
+        self.items_by_type: Dict[Type[BaseType], List[BaseType]] = {}
+        self.part_count = 0
+        self.max_part_depth = 0
+
+        stack: List[Tuple[BaseType, Optional[BaseType], int]] = [(bom, None, 0)]
+        while stack:
+            item, parent, depth = stack.pop()
+            self._add_item(item, parent, depth)
+            names, props, list_props = _get_child_fields(type(item))
+            children: List[BaseType] = []
+            for name in names:
+                value = getattr(item, name)
+                if value is None:
+                    continue
+                if name in props:
+                    children.append(value)
+                elif name in list_props:
+                    children.extend(value)
+            # Children are popped from the end of the stack, so they are pushed in reverse order to visit the items in
+            # document order
+            stack.extend((child, item, depth + 1) for child in reversed(children))
+
+    def _add_item(self, item: BaseType, parent: Optional[BaseType], depth: int) -> None:
+        self.items.append(item)
+        self.parents[id(item)] = (parent, depth)
+        self.items_by_type.setdefault(type(item), []).append(item)
+
+        internal_id = getattr(item, "internal_id", None)
+        if internal_id is not None:
+            self.items_by_internal_id.setdefault(internal_id, item)
+        if isinstance(item, _part_types):
+            self.parts_by_number.setdefault(item.part_number, []).append(item)
+            self.part_count += 1
+            self.max_part_depth = max(self.max_part_depth, depth)
+        if isinstance(item, MIRecordReference) and parent is not None:
+            # Records are looked up by the item which references them, not the reference itself
+            if item.record_guid is not None:
+                self.items_by_record_guid.setdefault(item.record_guid, []).append(parent)
+            if item.record_history_guid is not None:
+                self.items_by_record_history_guid.setdefault(item.record_history_guid, []).append(parent)
+            if item.record_history_identity is not None:
+                self.items_by_record_history_identity.setdefault(item.record_history_identity, []).append(parent)
+
+
+class BoMIndex:
+    def __init__(self, bom: BillOfMaterials):
+        """
+        Index over all the objects in a BoM, for fast lookups without repeated traversal of the BoM.
+
+        The index supports lookups by part number, referenced record, and internal ID, and provides the parent and depth
+        of every object in the BoM. The index is built in a single traversal the first time it is used. If the BoM is
+        modified after the index is built, call :meth:`invalidate` to rebuild the index when it is next used.
+
+        The BillOfMaterials object has depth 0, objects directly in the BillOfMaterials, such as the root parts, have
+        depth 1, and every other object has a depth one greater than the depth of its parent. For example, a record
+        reference on a root part has depth 2, and a child part of a root part also has depth 2.
+
+        BoM objects of all supported BoM versions can be indexed.
+
+        .. versionadded:: 2.5
+
+        Parameters
+        ----------
+        bom : :class:`.eco2505.BillOfMaterials` or :class:`.eco2412.BillOfMaterials` or \
+              :class:`.eco2301.BillOfMaterials`
+            The BoM to index.
+
+        Examples
+        --------
+        >>> index = BoMIndex(bom_handler.load_bom_from_file(Path("bom.xml")))
+        >>> index.part_count
+        1520
+        >>> part = index.parts_by_part_number("PN-001")[0]
+        >>> index.parent(part).part_number
+        'ASM-100'
+        """
+        self._bom = bom
+        self._data: Optional[_IndexData] = None
+
+    def __repr__(self) -> str:
+        state = f"{len(self._index.items)} items" if self._data is not None else "not built"
+        return f"<{self.__class__.__name__}: {state}>"
+
+    @property
+    def bom(self) -> BillOfMaterials:
+        """The indexed BoM."""
+        return self._bom
+
+    @property
+    def _index(self) -> _IndexData:
+        if self._data is None:
+            self._data = _IndexData(self._bom)
+        return self._data
+
+    def invalidate(self) -> None:
+        """Discard the index, so that it is rebuilt from the current state of the BoM when it is next used.
+
+        Call this method after the BoM has been modified.
+        """
+        self._data = None
+
+    @property
+    def items(self) -> List[BaseType]:
+        """All objects in the BoM in document order, starting with the BillOfMaterials object itself."""
+        return list(self._index.items)
+
+    def parent(self, item: BaseType) -> Optional[BaseType]:
+        """Get the object which contains an object in the BoM.
+
+        Parameters
+        ----------
+        item : BaseType
+            An object in the BoM.
+
+        Returns
+        -------
+        BaseType | None
+            The object which contains ``item``, or ``None`` if ``item`` is the BillOfMaterials object.
+
+        Raises
+        ------
+        ValueError
+            If ``item`` is not in the indexed BoM.
+        """
+        return self._get_position(item)[0]
+
+    def depth(self, item: BaseType) -> int:
+        """Get the depth of an object in the BoM.
+
+        Parameters
+        ----------
+        item : BaseType
+            An object in the BoM.
+
+        Returns
+        -------
+        int
+            Number of objects between ``item`` and the BillOfMaterials object, plus one.
+
+        Raises
+        ------
+        ValueError
+            If ``item`` is not in the indexed BoM.
+        """
+        return self._get_position(item)[1]
+
+    def ancestors(self, item: BaseType) -> List[BaseType]:
+        """Get all the objects which contain an object in the BoM.
+
+        Parameters
+        ----------
+        item : BaseType
+            An object in the BoM.
+
+        Returns
+        -------
+        list[BaseType]
+            The parent of ``item``, followed by the parent of the parent, and so on up to the BillOfMaterials object.
+
+        Raises
+        ------
+        ValueError
+            If ``item`` is not in the indexed BoM.
+        """
+        ancestors = []
+        parent = self.parent(item)
+        while parent is not None:
+            ancestors.append(parent)
+            parent = self.parent(parent)
+        return ancestors
+
+    def _get_position(self, item: BaseType) -> Tuple[Optional[BaseType], int]:
+        try:
+            return self._index.parents[id(item)]
+        except KeyError:
+            raise ValueError(f"{type(item).__name__} object is not in the indexed BoM.") from None
+
+    def parts_by_part_number(self, part_number: str) -> List[Union["Part2301", "Part2412", "Part2505"]]:
+        """Get all parts with a part number.
+
+        Parameters
+        ----------
+        part_number : str
+            Part number to look up.
+
+        Returns
+        -------
+        list[Part]
+            Parts with the part number, in document order.
+        """
+        return list(self._index.parts_by_number.get(part_number, []))  # type: ignore[arg-type]
+
+    def items_by_record_guid(self, record_guid: str) -> List[BaseType]:
+        """Get all objects which reference a Granta MI record by record GUID.
+
+        Parameters
+        ----------
+        record_guid : str
+            Record GUID to look up.
+
+        Returns
+        -------
+        list[BaseType]
+            Objects with a record reference with the record GUID, such as parts, materials, or processes, in document
+            order.
+        """
+        return list(self._index.items_by_record_guid.get(record_guid, []))
+
+    def items_by_record_history_guid(self, record_history_guid: str) -> List[BaseType]:
+        """Get all objects which reference a Granta MI record by record history GUID.
+
+        Parameters
+        ----------
+        record_history_guid : str
+            Record history GUID to look up.
+
+        Returns
+        -------
+        list[BaseType]
+            Objects with a record reference with the record history GUID, in document order.
+        """
+        return list(self._index.items_by_record_history_guid.get(record_history_guid, []))
+
+    def items_by_record_history_identity(self, record_history_identity: int) -> List[BaseType]:
+        """Get all objects which reference a Granta MI record by record history identity.
+
+        Parameters
+        ----------
+        record_history_identity : int
+            Record history identity to look up.
+
+        Returns
+        -------
+        list[BaseType]
+            Objects with a record reference with the record history identity, in document order.
+        """
+        return list(self._index.items_by_record_history_identity.get(record_history_identity, []))
+
+    def item_by_internal_id(self, internal_id: str) -> Optional[BaseType]:
+        """Get the object with an internal ID.
+
+        Internal IDs must be unique within a valid BoM. If more than one object has the internal ID, the first object in
+        document order is returned.
+
+        Parameters
+        ----------
+        internal_id : str
+            Internal ID to look up.
+
+        Returns
+        -------
+        BaseType | None
+            The object with the internal ID, or ``None`` if no object has the internal ID.
+        """
+        return self._index.items_by_internal_id.get(internal_id)
+
+    def items_of_type(self, item_type: Type[TItem]) -> List[TItem]:
+        """Get all objects of a type.
+
+        Parameters
+        ----------
+        item_type : Type[BaseType]
+            Type of the objects to get, such as :class:`.eco2505.Material`. Subclasses are not included.
+
+        Returns
+        -------
+        list[BaseType]
+            Objects of the type, in document order.
+        """
+        return list(self._index.items_by_type.get(item_type, []))  # type: ignore[arg-type]
+
+    @property
+    def counts(self) -> Dict[Type[BaseType], int]:
+        """Number of objects of each type in the BoM, including the BillOfMaterials object."""
+        return {item_type: len(items) for item_type, items in self._index.items_by_type.items()}
+
+    @property
+    def part_count(self) -> int:
+        """Total number of parts in the BoM, at all levels."""
+        return self._index.part_count
+
+    @property
+    def max_part_depth(self) -> int:
+        """Maximum depth of any part in the BoM, or 0 if the BoM contains no parts. Root parts have depth 1."""
+        return self._index.max_part_depth
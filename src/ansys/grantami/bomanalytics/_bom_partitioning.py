@@ -0,0 +1,335 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Partitioning of BoMs into smaller BoMs which can be analyzed independently, and merging of the results."""
+
+from copy import copy
+from dataclasses import fields
+from functools import cache
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Type, Union, cast
+
+from ansys.grantami.bomanalytics_openapi.v2 import models
+
+from ._bom_diff import _can_roll_up
+from ._typing import _convert_unset_to_none, _raise_if_empty
+from .bom_types import eco2301, eco2412, eco2505
+from .bom_types._base_types import BaseType
+from .indicators import RoHSFlag, WatchListFlag
+
+_BillOfMaterials = Union[eco2301.BillOfMaterials, eco2412.BillOfMaterials, eco2505.BillOfMaterials]
+_Part = Union[eco2301.Part, eco2412.Part, eco2505.Part]
+_part_types: Dict[Type[BaseType], Callable[..., _Part]] = {
+    eco2301.BillOfMaterials: eco2301.Part,
+    eco2412.BillOfMaterials: eco2412.Part,
+    eco2505.BillOfMaterials: eco2505.Part,
+}
+
+
+class _SplitPart:
+    """A part which is not submitted to Granta MI, and whose result is determined from the results of its children."""
+
+    __slots__ = ("part", "children", "result")
+
+    def __init__(self, part: _Part):
+        self.part = part
+        # Each child is either a split part, or the index of a part which is submitted as the root of a sub-BoM
+        self.children: List[Union["_SplitPart", int]] = []
+        self.result: Optional[models.CommonPartWithCompliance] = None
+
+
+class _BoMPartitioning:
+    def __init__(self, bom: _BillOfMaterials, max_parts: Optional[int] = None, deduplicate: bool = False):
+        """
+        Splits a BoM into BoMs which contain at most ``max_parts`` parts each, and merges the results of the BoMs into
+        the result for the entire BoM.
+
+        Parts which contain more than ``max_parts`` parts including themselves are not submitted if their result can be
+        determined from their child parts only (see ``_can_roll_up``). Instead, their child parts are partitioned
+        separately, and the result of the part is created from the results of its child parts. Any other part is
+        submitted as a root part of a BoM together with all its child parts, even if it contains more than
+        ``max_parts`` parts.
+
+        If ``deduplicate`` is ``True``, all parts whose result can be determined from their child parts are split,
+        and parts which are identical to a part which is already submitted are not submitted again. Parts are
+        identical if they and all their child parts are equal, ignoring the ``quantity`` of parts and the
+        ``internal_id`` of all objects, which do not affect the result of the part. The result for the submitted part
+        is used for every occurrence of the part.
+
+        The submitted parts are assigned to BoMs in depth-first order, so that the results for the root parts of the
+        BoMs are in the same order as the submitted parts. The BoMs have the same version as the partitioned BoM.
+
+        Parameters
+        ----------
+        bom : eco2301.BillOfMaterials | eco2412.BillOfMaterials | eco2505.BillOfMaterials
+            The BoM to partition.
+        max_parts : int, optional
+            The maximum number of parts in each BoM. If ``None``, all parts are submitted in a single BoM.
+        deduplicate : bool, default: False
+            Whether to submit identical parts only once.
+        """
+        self._root = _SplitPart(_part_types[type(bom)](part_number="", components=bom.components))
+        self._submitted_parts: List[_Part] = []
+        self._split_parts: List[_SplitPart] = []
+        self.partitions: List[_BillOfMaterials] = []
+        """BoMs to submit to Granta MI."""
+        self.reused_part_count = 0
+        """Number of parts which are not submitted because they are identical to a submitted part."""
+
+        sizes, keys = _analyse_parts(bom, deduplicate)
+        submitted_indices: Dict[int, int] = {}
+        # Each entry is either a split part to expand, or a split part and the index of a child part to submit
+        stack: List[Tuple[_SplitPart, Optional[int]]] = [(self._root, None)]
+        while stack:
+            split_part, child_idx = stack.pop()
+            if child_idx is not None:
+                part = split_part.part.components[child_idx]
+                if deduplicate:
+                    submitted_idx = submitted_indices.setdefault(keys[id(part)], len(self._submitted_parts))
+                else:
+                    submitted_idx = len(self._submitted_parts)
+                if submitted_idx == len(self._submitted_parts):
+                    self._submitted_parts.append(part)
+                else:
+                    self.reused_part_count += 1
+                split_part.children[child_idx] = submitted_idx
+                continue
+            self._split_parts.append(split_part)
+            entries: List[Tuple[_SplitPart, Optional[int]]] = []
+            children: Sequence[_Part] = split_part.part.components
+            for idx, child in enumerate(children):
+                is_large = max_parts is not None and sizes[id(child)] > max_parts
+                if (deduplicate or is_large) and _can_roll_up(child):
+                    child_split_part = _SplitPart(child)
+                    split_part.children.append(child_split_part)
+                    entries.append((child_split_part, None))
+                else:
+                    split_part.children.append(-1)
+                    entries.append((split_part, idx))
+            stack.extend(reversed(entries))
+
+        components: List[_Part] = []
+        count = 0
+        for part in self._submitted_parts:
+            size = sizes[id(part)]
+            if components and max_parts is not None and count + size > max_parts:
+                self.partitions.append(self._create_partition(bom, components))
+                components = []
+                count = 0
+            components.append(part)
+            count += size
+        if components or not self.partitions:
+            self.partitions.append(self._create_partition(bom, components))
+
+    @staticmethod
+    def _create_partition(bom: _BillOfMaterials, components: List[_Part]) -> _BillOfMaterials:
+        partition = copy(bom)
+        # All parts are of the part type for the version of the BoM, which cannot be expressed as a static type
+        partition.components = cast(List[Any], components)
+        return partition
+
+    def merge_compliance(
+        self, responses: List[models.GetComplianceForBomResponse]
+    ) -> models.GetComplianceForBomResponse:
+        """
+        Merge the compliance results for the partitions into the compliance result for the entire BoM.
+
+        The compliance of each split part is the worst compliance of its child parts for each indicator.
+
+        Parameters
+        ----------
+        responses : list[models.GetComplianceForBomResponse]
+            The response for each partition, in the same order as :attr:`partitions`.
+
+        Returns
+        -------
+        models.GetComplianceForBomResponse
+            A response equivalent to the response for the entire BoM. Log messages are not included.
+        """
+        submitted_results = [part for response in responses for part in _raise_if_empty(response.parts)]
+        if len(submitted_results) != len(self._submitted_parts):
+            raise ValueError("The compliance results do not contain a result for each submitted part.")
+        for split_part in reversed(self._split_parts):
+            parts = [
+                _raise_if_empty(child.result) if isinstance(child, _SplitPart) else submitted_results[child]
+                for child in split_part.children
+            ]
+            split_part.result = models.CommonPartWithCompliance(
+                input_part_number=split_part.part.part_number,
+                indicators=self._roll_up(parts),
+                parts=parts,
+                materials=[],
+                specifications=[],
+                substances=[],
+            )
+        root_result = _raise_if_empty(self._root.result)
+        return models.GetComplianceForBomResponse(parts=root_result.parts, log_messages=[])
+
+    @staticmethod
+    def _roll_up(parts: List[models.CommonPartWithCompliance]) -> List[models.CommonIndicatorResult]:
+        """Determine the worst flag of the parts for each indicator, in the order the indicators are returned."""
+        flags: Dict[str, Optional[str]] = {}
+        for part in parts:
+            for indicator in _raise_if_empty(part.indicators):
+                name = _raise_if_empty(indicator.name)
+                flag = _convert_unset_to_none(indicator.flag)
+                current_flag = flags.get(name)
+                if current_flag is None or (flag is not None and _get_flag_value(flag) > _get_flag_value(current_flag)):
+                    flags[name] = flag
+        return [
+            (
+                models.CommonIndicatorResult(name=name, flag=flag)
+                if flag is not None
+                else models.CommonIndicatorResult(name=name)
+            )
+            for name, flag in flags.items()
+        ]
+
+    def merge_impacted_substances(
+        self, responses: List[models.GetImpactedSubstancesForBomResponse]
+    ) -> models.GetImpactedSubstancesForBomResponse:
+        """
+        Merge the impacted substances for the partitions into the impacted substances for the entire BoM.
+
+        Legislations and substances are listed in the order they first appear in the responses. Granta MI lists each
+        impacted substance once for each legislation, with the largest percentage amount in the BoM. The same rule is
+        applied to the merged response: if a substance is listed more than once for a legislation, in the same or in
+        different partitions, it is listed once with the maximum percentage amount.
+
+        Parameters
+        ----------
+        responses : list[models.GetImpactedSubstancesForBomResponse]
+            The response for each partition, in the same order as :attr:`partitions`.
+
+        Returns
+        -------
+        models.GetImpactedSubstancesForBomResponse
+            A response equivalent to the response for the entire BoM. Log messages are not included.
+        """
+        merged: Dict[str, List[models.CommonImpactedSubstance]] = {}
+        indices: Dict[str, Dict[Tuple, int]] = {}
+        for response in responses:
+            for legislation in _raise_if_empty(response.legislations):
+                legislation_id = _raise_if_empty(legislation.legislation_id)
+                substances = merged.setdefault(legislation_id, [])
+                previous_indices = indices.setdefault(legislation_id, {})
+                for substance in _raise_if_empty(legislation.impacted_substances):
+                    key = _get_substance_key(substance)
+                    previous_idx = previous_indices.get(key)
+                    if previous_idx is None:
+                        previous_indices[key] = len(substances)
+                        substances.append(substance)
+                        continue
+                    existing = substances[previous_idx]
+                    existing_amount = _convert_unset_to_none(existing.max_percentage_amount_in_material)
+                    amount = _max_amount(
+                        existing_amount, _convert_unset_to_none(substance.max_percentage_amount_in_material)
+                    )
+                    if amount != existing_amount:
+                        combined = copy(existing)
+                        combined.max_percentage_amount_in_material = amount
+                        substances[previous_idx] = combined
+        legislations = [
+            models.CommonLegislationWithImpactedSubstances(
+                legislation_id=legislation_id, impacted_substances=substances
+            )
+            for legislation_id, substances in merged.items()
+        ]
+        return models.GetImpactedSubstancesForBomResponse(legislations=legislations, log_messages=[])
+
+
+def _analyse_parts(bom: _BillOfMaterials, deduplicate: bool) -> Tuple[Dict[int, int], Dict[int, int]]:
+    """
+    Count the parts in each part including the part itself, and if ``deduplicate`` is ``True``, determine a key for
+    each part which is the same for identical parts.
+
+    Parts are visited bottom-up with an explicit work stack. Keys are small integers assigned to each distinct
+    combination of the content of a part and the keys of its child parts, so the cost of determining the key of a part
+    does not depend on the size of its subtree.
+
+    Returns
+    -------
+    tuple[dict[int, int], dict[int, int]]
+        The number of parts and the key for each part, indexed by the ``id`` of the part.
+    """
+    sizes: Dict[int, int] = {}
+    keys: Dict[int, int] = {}
+    key_ids: Dict[Hashable, int] = {}
+    stack: List[Tuple[_Part, bool]] = [(part, False) for part in bom.components]
+    while stack:
+        part, visited = stack.pop()
+        if visited:
+            sizes[id(part)] = 1 + sum(sizes[id(child)] for child in part.components)
+            if deduplicate:
+                key = (_get_content_key(part), tuple(keys[id(child)] for child in part.components))
+                keys[id(part)] = key_ids.setdefault(key, len(key_ids))
+        elif id(part) not in sizes:
+            stack.append((part, True))
+            stack.extend((child, False) for child in part.components)
+    return sizes, keys
+
+
+@cache
+def _get_content_fields(type_: Type[BaseType]) -> Tuple[str, ...]:
+    is_part = type_ in _part_types.values()
+    excluded_fields = {"internal_id", "components", "quantity"} if is_part else {"internal_id"}
+    return tuple(f.name for f in fields(type_) if f.name not in excluded_fields)  # type: ignore[arg-type]
+
+
+def _get_content_key(obj: BaseType) -> Hashable:
+    """
+    Get a hashable representation of the content of a BoM object, excluding internal identifiers.
+
+    For parts, child parts and the quantity are excluded. Other BoM objects are only nested a few levels deep, so they
+    are visited recursively.
+    """
+    return (type(obj), tuple(_get_value_key(getattr(obj, name)) for name in _get_content_fields(type(obj))))
+
+
+def _get_value_key(value: Any) -> Hashable:
+    if isinstance(value, BaseType):
+        return _get_content_key(value)
+    if isinstance(value, list):
+        return tuple(_get_value_key(item) for item in value)
+    hashable_value: Hashable = value
+    return hashable_value
+
+
+def _get_flag_value(flag: str) -> int:
+    flag_type = RoHSFlag if flag in RoHSFlag.__members__ else WatchListFlag
+    value: int = flag_type[flag].value
+    return value
+
+
+def _get_substance_key(substance: models.CommonImpactedSubstance) -> Tuple[Optional[str], ...]:
+    return (
+        _convert_unset_to_none(substance.substance_name),
+        _convert_unset_to_none(substance.cas_number),
+        _convert_unset_to_none(substance.ec_number),
+    )
+
+
+def _max_amount(first: Optional[float], second: Optional[float]) -> Optional[float]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return max(first, second)
@@ -48,6 +48,8 @@ GRANTA_APPLICATION_NAME_HEADER : str
     Identifier used internally by the Granta MI Server.
 """
 
+import threading
+import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, overload
 
 from ansys.grantami.bomanalytics_openapi.v2 import api, models
@@ -58,8 +60,11 @@ from ansys.openapi.common import (
     SessionConfiguration,
     generate_user_agent,
 )
+import requests
 
 from ._exceptions import LicensingException
+from ._execution_report import _batch_started, _recording_batch
+from ._hooks import QueryHooks, _current_query, _run_with_hooks
 from ._item_results import ItemResultFactory
 from ._logger import logger
 
@@ -233,6 +238,19 @@ class Connection(ApiClientFactory):
 class BomAnalyticsClient(ApiClient):
     """Communicates with Granta MI. This class is instantiated by the
     :class:`~ansys.grantami.bomanalytics.Connection` class described earlier and should not be instantiated directly.
+
+    Notes
+    -----
+    A single client can be used to run queries from multiple threads at the same time, and the same query object
+    can be run by several threads at the same time. Each run stores its results separately, so runs do not affect each
+    other. All runs share the HTTP session of the client, and so share its connection pool and authentication.
+
+    Changes to the database details and the maximum specification-to-specification link depth are applied atomically.
+    A query which is already running when the settings are changed uses either the previous or the new settings for
+    all of its requests.
+
+    .. versionchanged:: 2.5
+       Queries can be run from multiple threads at the same time.
     """
 
     def __init__(self, servicelayer_url: str, **kwargs: Any) -> None:
@@ -244,6 +262,8 @@ class BomAnalyticsClient(ApiClient):
 
         super().__init__(api_url=sl_url_with_service, **kwargs)
 
+        self._configuration_lock = threading.Lock()
+        """Lock which ensures that the connection-level settings used by a query are never partially updated."""
         self._db_key: str = DEFAULT_DBKEY
         self._table_names: Dict[str, Optional[str]] = {
             "material_universe_table_name": None,
@@ -254,6 +274,20 @@ class BomAnalyticsClient(ApiClient):
             "coatings_table_name": None,
         }
         self._max_spec_depth: Optional[int] = None
+        self.hooks = QueryHooks()
+        """Callbacks invoked as queries are run with this client, for example to collect metrics.
+
+        .. versionadded:: 2.5
+        """
+        self.retain_responses = False
+        """Whether results keep the responses returned by Granta MI, so that they can be serialized with
+        :meth:`QuerySerializer.dump_result() <ansys.grantami.bomanalytics.QuerySerializer.dump_result>`.
+
+        The default is ``False``, in which case the responses are released when the result is created, which halves
+        the memory used by large results.
+
+        .. versionadded:: 2.5
+        """
 
     def __repr__(self) -> str:
         max_link_value: Union[str, int] = (
@@ -307,7 +341,8 @@ class BomAnalyticsClient(ApiClient):
     def maximum_spec_link_depth(self, value: Optional[int]) -> None:
         if value is not None and value < 0:
             raise ValueError("maximum_spec_link_depth must be a non-negative integer or None")
-        self._max_spec_depth = value
+        with self._configuration_lock:
+            self._max_spec_depth = value
 
     def set_database_details(
         self,
@@ -396,16 +431,22 @@ class BomAnalyticsClient(ApiClient):
         ...                          in_house_materials_table_name = "My Materials")
         """
 
-        self._db_key = database_key
-        self._table_names["material_universe_table_name"] = material_universe_table_name
-        self._table_names["inhouse_materials_table_name"] = in_house_materials_table_name
-        self._table_names["specifications_table_name"] = specifications_table_name
-        self._table_names["products_and_parts_table_name"] = products_and_parts_table_name
-        self._table_names["substances_table_name"] = substances_table_name
-        self._table_names["coatings_table_name"] = coatings_table_name
-        self._table_names["process_universe_table_name"] = process_universe_table_name
-        self._table_names["locations_table_name"] = location_table_name
-        self._table_names["transport_table_name"] = transport_table_name
+        # Queries running in other threads use the table names dictionary, so it is replaced and not modified
+        table_names = {
+            **self._table_names,
+            "material_universe_table_name": material_universe_table_name,
+            "inhouse_materials_table_name": in_house_materials_table_name,
+            "specifications_table_name": specifications_table_name,
+            "products_and_parts_table_name": products_and_parts_table_name,
+            "substances_table_name": substances_table_name,
+            "coatings_table_name": coatings_table_name,
+            "process_universe_table_name": process_universe_table_name,
+            "locations_table_name": location_table_name,
+            "transport_table_name": transport_table_name,
+        }
+        with self._configuration_lock:
+            self._db_key = database_key
+            self._table_names = table_names
 
     @overload
     def run(self, query: "MaterialImpactedSubstancesQuery") -> "MaterialImpactedSubstancesQueryResult": ...
@@ -440,6 +481,9 @@ class BomAnalyticsClient(ApiClient):
     @overload
     def run(self, query: "BomSustainabilitySummaryQuery") -> "BomSustainabilitySummaryQueryResult": ...
 
+    @overload
+    def run(self, query: "_BaseQuery") -> "ResultBaseClass": ...
+
     def run(self, query: "_BaseQuery") -> "ResultBaseClass":
         """Run a query against the Granta MI database.
 
@@ -467,7 +511,57 @@ class BomAnalyticsClient(ApiClient):
 
         logger.info(f"Running query {query} with connection {self}")
         api_instance = query.api_class(self)
-        return query._run_query(api_instance=api_instance, static_arguments=self._query_arguments)
+        if not self.hooks:
+            result = query._run_query(api_instance=api_instance, static_arguments=self._query_arguments)
+        else:
+            result = _run_with_hooks(
+                self.hooks,
+                query,
+                lambda: query._run_query(api_instance=api_instance, static_arguments=self._query_arguments),
+            )
+        if not self.retain_responses:
+            result._response_items = None
+        return result
+
+    def fingerprint(self, query: "_BaseQuery") -> str:
+        """Compute a fingerprint of a query when it is run with this connection.
+
+        Two queries have the same fingerprint if they would send the same requests to Granta MI, and so produce the
+        same result. The fingerprint includes the type of the query, its indicators or legislations, its units, the
+        records or BoM added to the query, and the connection-level settings, such as the database key, table names,
+        and maximum specification-to-specification link depth. Use the fingerprint to cache query results, or to avoid
+        running the same query more than once.
+
+        BoMs in XML form are compared in canonical form, so namespace prefixes, attribute order, comments, and
+        insignificant whitespace do not affect the fingerprint. The fingerprint is not affected by settings which only
+        change how the query is sent to Granta MI, such as the batch size or BoM partitioning. BillOfMaterials objects
+        are fingerprinted in the XML form that is sent to Granta MI, so a query with a BillOfMaterials object and a
+        query with the same BoM in XML form have the same fingerprint.
+
+        .. versionadded:: 2.5
+
+        Parameters
+        ----------
+        query
+            A compliance, impacted substances, or sustainability query object.
+
+        Returns
+        -------
+        str
+            SHA-256 hash of the canonical form of the query, as a hexadecimal string.
+
+        Raises
+        ------
+        ValueError
+            Error raised if the BoM added to the query is not valid XML.
+
+        Examples
+        --------
+        >>> fingerprint = cxn.fingerprint(query)
+        >>> if fingerprint not in cache:
+        ...     cache[fingerprint] = cxn.run(query)
+        """
+        return query._fingerprint(static_arguments=self._query_arguments)
 
     @property
     def _query_arguments(
@@ -490,29 +584,32 @@ class BomAnalyticsClient(ApiClient):
         The database key is always required. The default is only included here for convenience.
         """
 
+        with self._configuration_lock:
+            db_key, table_names, max_spec_depth = self._db_key, self._table_names, self._max_spec_depth
+
         config = models.CommonRequestConfig()
-        if self._max_spec_depth is not None:
-            logger.info(f"Using maximum specification-to-specification link depth: {self._max_spec_depth}")
-            config.maximum_spec_chain_node_count = self._max_spec_depth + 1
+        if max_spec_depth is not None:
+            logger.info(f"Using maximum specification-to-specification link depth: {max_spec_depth}")
+            config.maximum_spec_chain_node_count = max_spec_depth + 1
         else:
             logger.info(f"No specification-to-specification link depth limit is specified. All links will be followed.")
-        if any(self._table_names.values()):
-            for table_type, name in self._table_names.items():
+        if any(table_names.values()):
+            for table_type, name in table_names.items():
                 if name is not None:
                     setattr(config, table_type, name)
-            table_mapping = [f"{n}: {v}" for n, v in self._table_names.items() if v]
+            table_mapping = [f"{n}: {v}" for n, v in table_names.items() if v]
             logger.info(f"Using custom table config:")
             for line in table_mapping:
                 logger.info(line)
         else:
             logger.info(f"Using default table config")
 
-        if self._db_key != DEFAULT_DBKEY:
-            logger.info(f"Using custom database key: {self._db_key}")
+        if db_key != DEFAULT_DBKEY:
+            logger.info(f"Using custom database key: {db_key}")
         else:
-            logger.info(f"Using default database key ({self._db_key})")
+            logger.info(f"Using default database key ({db_key})")
 
-        arguments: Dict[str, Union[str, models.CommonRequestConfig]] = {"config": config, "database_key": self._db_key}
+        arguments: Dict[str, Union[str, models.CommonRequestConfig]] = {"config": config, "database_key": db_key}
         return arguments
 
     def _get_licensing_information(self) -> "Licensing":
@@ -538,3 +635,56 @@ class BomAnalyticsClient(ApiClient):
         api_instance = api.DocumentationApi(self)
         result: str = api_instance.get_yaml()
         return result
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:
+        """Make the HTTP request, and record its size and latency if it is part of a query.
+
+        The ``on_batch_request`` hook is invoked before the request is sent, and the ``on_retry`` hook is invoked after
+        the response is received for each time the request was retried.
+
+        The response body is read before this method returns, so the latency includes the time taken to download the
+        response.
+        """
+        statistics = _recording_batch()
+        if statistics is None:
+            return super().request(method, url, *args, **kwargs)
+        started = time.perf_counter()
+        statistics.serialization_time += started - _batch_started()
+        body = kwargs.get("body")
+        if isinstance(body, str):
+            request_bytes = len(body.encode("utf-8"))
+        elif isinstance(body, bytes):
+            request_bytes = len(body)
+        else:
+            request_bytes = 0
+        statistics.request_bytes += request_bytes
+        current_query = _current_query.get()
+        if current_query is not None:
+            hooks, query = current_query
+            hooks._emit("on_batch_request", query, request_bytes)
+
+        response = super().request(method, url, *args, **kwargs)
+        statistics.response_bytes += len(response.content)
+        statistics.server_latency += time.perf_counter() - started
+        retries = getattr(getattr(response.raw, "retries", None), "history", ())
+        statistics.retries += len(retries)
+        if current_query is not None:
+            for retry in retries:
+                hooks._emit("on_retry", query, retry)
+        return response
+
+    def deserialize(self, response: requests.Response, response_type: Optional[str]) -> Any:
+        """Deserialize the response into an object, and record the time taken if the response is part of a query.
+
+        The ``on_batch_response`` hook is invoked after the response is deserialized.
+        """
+        started = time.perf_counter()
+        result = super().deserialize(response, response_type)
+        statistics = _recording_batch()
+        if statistics is not None:
+            statistics.deserialization_time += time.perf_counter() - started
+            current_query = _current_query.get()
+            if current_query is not None:
+                hooks, query = current_query
+                hooks._emit("on_batch_response", query, statistics)
+        return result
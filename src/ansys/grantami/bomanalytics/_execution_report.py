@@ -0,0 +1,171 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Statistics which describe how a query was run, such as the number of batches and the time spent in each step."""
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class BatchStatistics:
+    """Statistics for a single request sent to Granta MI.
+
+    All times are in seconds.
+
+    .. versionadded:: 2.5
+    """
+
+    request_bytes: int = 0
+    """Size of the request body sent to Granta MI."""
+
+    response_bytes: int = 0
+    """Size of the response body returned by Granta MI."""
+
+    server_latency: float = 0.0
+    """Time from sending the request until the entire response was received, including any retries."""
+
+    serialization_time: float = 0.0
+    """Time spent creating the request object and converting it to JSON."""
+
+    deserialization_time: float = 0.0
+    """Time spent converting the response from JSON to low-level API objects."""
+
+    retries: int = 0
+    """Number of times the request was retried by the HTTP session."""
+
+
+@dataclass
+class ExecutionReport:
+    """Statistics which describe how a query was run.
+
+    Use the report to tune the batch size or BoM partitioning of a query, or to estimate the load on Granta MI. All
+    times are in seconds.
+
+    .. versionadded:: 2.5
+
+    Examples
+    --------
+    >>> result = cxn.run(query)
+    >>> result.execution_report.batch_count
+    12
+    >>> result.execution_report.to_dict()["server_latency"]
+    3.62
+    """
+
+    batches: List[BatchStatistics] = field(default_factory=list)
+    """Statistics for each request sent to Granta MI, in the order the requests were sent."""
+
+    result_build_time: float = 0.0
+    """Time spent creating the result object from the low-level API objects, including merging the results of
+    partitioned BoMs and applying BoM changes to a previous result."""
+
+    cache_hits: int = 0
+    """Number of parts whose result was reused instead of being requested from Granta MI. Parts are reused if they are
+    identical to another part in a BoM query with deduplication, or if they are unchanged in a BoM query with BoM
+    changes."""
+
+    @property
+    def batch_count(self) -> int:
+        """Number of requests sent to Granta MI."""
+        return len(self.batches)
+
+    @property
+    def request_bytes(self) -> int:
+        """Total size of all request bodies."""
+        return sum(batch.request_bytes for batch in self.batches)
+
+    @property
+    def response_bytes(self) -> int:
+        """Total size of all response bodies."""
+        return sum(batch.response_bytes for batch in self.batches)
+
+    @property
+    def server_latency(self) -> float:
+        """Total latency of all requests. If requests are sent concurrently, the total is greater than the elapsed
+        time."""
+        return sum(batch.server_latency for batch in self.batches)
+
+    @property
+    def serialization_time(self) -> float:
+        """Total time spent creating requests."""
+        return sum(batch.serialization_time for batch in self.batches)
+
+    @property
+    def deserialization_time(self) -> float:
+        """Total time spent reading responses."""
+        return sum(batch.deserialization_time for batch in self.batches)
+
+    @property
+    def retries(self) -> int:
+        """Total number of retried requests."""
+        return sum(batch.retries for batch in self.batches)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the report as a dictionary of built-in types, for example to write it to a JSON file.
+
+        Returns
+        -------
+        dict[str, Any]
+            Totals for all requests, and a ``"batches"`` list with the statistics for each request.
+        """
+        return {
+            "batch_count": self.batch_count,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "server_latency": self.server_latency,
+            "serialization_time": self.serialization_time,
+            "deserialization_time": self.deserialization_time,
+            "result_build_time": self.result_build_time,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "batches": [asdict(batch) for batch in self.batches],
+        }
+
+
+_recording = threading.local()
+"""Batch statistics being recorded by the current thread, and the time at which the batch was started."""
+
+
+@contextmanager
+def _record_batch(statistics: BatchStatistics) -> Iterator[None]:
+    """Record the HTTP request and response made by the current thread in a batch statistics object."""
+    _recording.statistics = statistics
+    _recording.started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _recording.statistics = None
+
+
+def _recording_batch() -> Optional[BatchStatistics]:
+    """Get the batch statistics being recorded by the current thread, if any."""
+    return getattr(_recording, "statistics", None)
+
+
+def _batch_started() -> float:
+    """Get the time at which the batch being recorded by the current thread was started."""
+    return float(_recording.started)
@@ -0,0 +1,295 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from dataclasses import fields
+from enum import Enum
+from functools import cache
+import hashlib
+from typing import Any, Dict, Iterable, List, NamedTuple, Type, Union, cast
+
+from defusedxml.ElementTree import DefusedXMLParser, ParseError
+
+from .bom_types._base_types import BaseType
+
+# Token tags. Each token is written as its tag, the length of its payload, and the payload, so that no sequence of
+# tokens can be confused with another sequence.
+_XML_DOCUMENT = b"X"
+_OBJECT_DOCUMENT = b"O"
+_START = b"S"
+_ATTRIBUTE = b"A"
+_TEXT = b"T"
+_END = b"E"
+_FIELD = b"F"
+_LIST = b"L"
+_DICT = b"D"
+_STRING = b"s"
+_NUMBER = b"n"
+_BOOLEAN = b"b"
+_NULL = b"0"
+_ENUM = b"e"
+
+_FORMAT_VERSION = "1"
+_BUFFER_SIZE = 1 << 16
+
+
+class _Token(NamedTuple):
+    """A token which is added to the hash when it is popped from a work stack."""
+
+    tag: bytes
+    payload: str
+
+
+@cache
+def _get_field_names(type_: Type[BaseType]) -> List[str]:
+    return [field.name for field in fields(cast(Any, type_))]
+
+
+class _CanonicalHasher:
+    """
+    Computes a SHA-256 hash over a sequence of tokens that describe BoMs and query arguments.
+
+    Tokens are buffered and passed to the hash function in large blocks, so that documents are hashed in a single
+    streaming pass without building an intermediate representation.
+    """
+
+    __slots__ = ("_hash", "_buffer")
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+        self._buffer = bytearray()
+
+    def hexdigest(self) -> str:
+        """Return the hash of all tokens added so far as a hexadecimal string."""
+        self._flush()
+        return self._hash.hexdigest()
+
+    def _add_token(self, tag: bytes, payload: str = "") -> None:
+        data = payload.encode("utf-8")
+        buffer = self._buffer
+        buffer += tag
+        buffer += len(data).to_bytes(8, "big")
+        buffer += data
+        if len(buffer) > _BUFFER_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._hash.update(self._buffer)
+        self._buffer.clear()
+
+    def add_bom_xml(self, bom: Union[str, bytes]) -> None:
+        """
+        Add a BoM in XML form.
+
+        Namespace prefixes, the order of attributes, comments, processing instructions, and whitespace which
+        surrounds text or separates elements do not affect the hash. The document is parsed with a streaming parser,
+        and no element tree is built.
+
+        Parameters
+        ----------
+        bom : str | bytes
+            BoM in XML form.
+
+        Raises
+        ------
+        ValueError
+            If the BoM is not valid XML.
+        """
+        self._add_token(_XML_DOCUMENT, _FORMAT_VERSION)
+        parser = DefusedXMLParser(target=_CanonicalXMLTarget(self))
+        try:
+            parser.feed(bom)
+            parser.close()
+        except ParseError as e:
+            raise ValueError(f"BoM provided as input is not valid XML ({str(e)}).") from e
+
+    def add_bom(self, bom: BaseType) -> None:
+        """
+        Add a BoM object, or any other object in a BoM.
+
+        The hash is computed from the namespace and name of the type of each object and the values of its fields.
+        Empty lists and ``None`` are equivalent, as they are in XML form. Integer and float values are equivalent if
+        they are numerically equal. Objects are visited with an explicit work stack, so deeply nested BoMs do not
+        exceed the recursion limit.
+
+        Parameters
+        ----------
+        bom : BaseType
+            BoM object.
+        """
+        self._add_token(_OBJECT_DOCUMENT, _FORMAT_VERSION)
+        add_token = self._add_token
+        stack: List[Union[BaseType, _Token]] = [bom]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, _Token):
+                add_token(*obj)
+                continue
+            type_ = type(obj)
+            add_token(_START, f"{{{type_.namespace}}}{type_.__name__}")
+            stack.append(_Token(_END, ""))
+            children: List[Union[BaseType, _Token]] = []
+            for name in _get_field_names(type_):
+                value = getattr(obj, name)
+                if value is None or (isinstance(value, list) and not value):
+                    continue
+                if isinstance(value, BaseType):
+                    children.append(_Token(_FIELD, name))
+                    children.append(value)
+                elif isinstance(value, list) and isinstance(value[0], BaseType):
+                    children.append(_Token(_LIST, name))
+                    children.extend(value)
+                else:
+                    add_token(_FIELD, name)
+                    self.add_value(value)
+            # Items are popped from the end of the stack, so child objects are pushed in reverse order
+            stack.extend(reversed(children))
+
+    def add_value(self, value: Any) -> None:
+        """
+        Add a value made up of strings, numbers, booleans, enums, ``None``, lists, dictionaries, and low-level API
+        models.
+
+        Dictionary keys are sorted, and dictionary entries and model properties which are not set are ignored.
+
+        Parameters
+        ----------
+        value : Any
+            Value to add.
+
+        Raises
+        ------
+        TypeError
+            If the value or one of its items is of an unsupported type.
+        """
+        # The API client is only needed for query arguments, so it is not loaded to fingerprint BoMs
+        from ansys.openapi.common import ModelBase, Unset_Type
+
+        add_token = self._add_token
+        stack: List[Any] = [value]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, ModelBase):
+                item = item.to_dict()
+            if isinstance(item, _Token):
+                add_token(*item)
+            elif isinstance(item, Enum):
+                add_token(_ENUM, f"{type(item).__name__}.{item.name}")
+            elif isinstance(item, str):
+                add_token(_STRING, item)
+            elif isinstance(item, bool):
+                add_token(_BOOLEAN, str(item))
+            elif isinstance(item, (int, float)):
+                add_token(_NUMBER, repr(float(item)))
+            elif item is None:
+                add_token(_NULL)
+            elif isinstance(item, dict):
+                entries = sorted(
+                    ((str(k), v) for k, v in item.items() if not isinstance(v, Unset_Type)), key=lambda e: e[0]
+                )
+                add_token(_DICT, str(len(entries)))
+                for key, entry in reversed(entries):
+                    stack.append(entry)
+                    stack.append(_Token(_FIELD, key))
+            elif isinstance(item, (list, tuple)):
+                add_token(_LIST, str(len(item)))
+                stack.extend(reversed(item))
+            else:
+                raise TypeError(f"Values of type {type(item).__name__} cannot be fingerprinted.")
+
+    def add_sequence(self, values: Iterable[Any], length: int) -> None:
+        """
+        Add a list of values from an iterable, without building the list.
+
+        The result is the same as adding the list with :meth:`add_value`.
+
+        Parameters
+        ----------
+        values : Iterable[Any]
+            Values to add, of any type supported by :meth:`add_value`.
+        length : int
+            Number of values produced by ``values``.
+        """
+        self._add_token(_LIST, str(length))
+        for value in values:
+            self.add_value(value)
+
+
+class _CanonicalXMLTarget:
+    """
+    Parser target which adds the elements of an XML document to a ``_CanonicalHasher`` as they are parsed.
+
+    Element and attribute names are received from the parser with the namespace URI in braces, so namespace prefixes
+    do not affect the result. Text is stripped of surrounding whitespace, and whitespace-only text is ignored.
+    """
+
+    __slots__ = ("_hasher", "_text")
+
+    def __init__(self, hasher: _CanonicalHasher) -> None:
+        self._hasher = hasher
+        self._text: List[str] = []
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        self._flush_text()
+        add_token = self._hasher._add_token
+        add_token(_START, tag)
+        for name in sorted(attrib):
+            add_token(_ATTRIBUTE, name)
+            add_token(_STRING, attrib[name])
+
+    def end(self, tag: str) -> None:
+        self._flush_text()
+        self._hasher._add_token(_END)
+
+    def data(self, data: str) -> None:
+        self._text.append(data)
+
+    def close(self) -> None:
+        self._flush_text()
+
+    def _flush_text(self) -> None:
+        if self._text:
+            text = "".join(self._text).strip()
+            self._text.clear()
+            if text:
+                self._hasher._add_token(_TEXT, text)
+
+
+def fingerprint_bom(bom: Union[BaseType, str, bytes]) -> str:
+    """
+    Compute a fingerprint of a BoM in XML form or of a BoM object.
+
+    Parameters
+    ----------
+    bom : BaseType | str | bytes
+        BoM to fingerprint.
+
+    Returns
+    -------
+    str
+        SHA-256 hash of the canonical form of the BoM, as a hexadecimal string.
+    """
+    hasher = _CanonicalHasher()
+    if isinstance(bom, (str, bytes)):
+        hasher.add_bom_xml(bom)
+    else:
+        hasher.add_bom(bom)
+    return hasher.hexdigest()
@@ -0,0 +1,475 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Callbacks which are invoked as queries are run, and reference implementations for metrics and tracing.
+
+The callbacks registered on a :class:`~ansys.grantami.bomanalytics._connection.BomAnalyticsClient` object are invoked
+for every query run with that client. The query which is being run is tracked in a context variable, so events for
+batches which are sent concurrently from other threads are associated with the correct query.
+"""
+
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple
+import uuid
+
+from ._logger import logger
+
+if TYPE_CHECKING:
+    from ._execution_report import BatchStatistics
+    from ._query_results import ResultBaseClass
+    from .queries import _BaseQuery
+
+HOOK_EVENTS = (
+    "on_query_start",
+    "on_batch_request",
+    "on_batch_response",
+    "on_retry",
+    "on_log_message",
+    "on_query_end",
+)
+"""Names of the events that callbacks can be registered for."""
+
+
+class QueryHooks:
+    """Registry of callbacks which are invoked as queries are run.
+
+    Each :class:`~ansys.grantami.bomanalytics._connection.BomAnalyticsClient` object has its own registry, available as
+    the :attr:`~ansys.grantami.bomanalytics._connection.BomAnalyticsClient.hooks` attribute. Callbacks are invoked
+    with the following arguments:
+
+    * ``on_query_start(query)``: Before the first request for a query is created.
+    * ``on_batch_request(query, request_bytes)``: Before a request is sent to Granta MI.
+    * ``on_batch_response(query, statistics)``: After a response is received and deserialized. ``statistics`` is a
+      :class:`~ansys.grantami.bomanalytics._execution_report.BatchStatistics` object.
+    * ``on_retry(query, retry)``: After a response is received, once for each time the request was retried by the HTTP
+      session. ``retry`` is the ``urllib3.util.retry.RequestHistory`` entry which describes the failed attempt.
+    * ``on_log_message(query, severity, message)``: For each message returned by Granta MI.
+    * ``on_query_end(query, result, error, elapsed_time)``: After the query has completed. ``result`` is ``None`` if
+      the query raised the exception ``error``, otherwise ``error`` is ``None``. ``elapsed_time`` is in seconds.
+
+    Batch events are invoked in the thread which sends the request, which is not the thread which runs the query if
+    requests are sent concurrently. Callbacks must be thread-safe. Exceptions raised by callbacks are logged, and do not
+    affect the query.
+
+    If no callbacks are registered, queries are run without checking for callbacks for each event.
+
+    .. versionadded:: 2.5
+
+    Examples
+    --------
+    >>> def log_latency(query, statistics):
+    ...     print(f"{type(query).__name__}: {statistics.server_latency:.3f} s")
+    >>> cxn.hooks.register("on_batch_response", log_latency)
+
+    Register all callbacks defined by an object:
+
+    >>> collector = MetricsCollector()
+    >>> cxn.hooks.register_all(collector)
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: Dict[str, Tuple[Callable[..., Any], ...]] = {}
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._callbacks)
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{event}: {len(callbacks)}" for event, callbacks in self._callbacks.items())
+        return f"<{self.__class__.__name__}: {{{counts}}}>"
+
+    def register(self, event: str, callback: Callable[..., Any]) -> None:
+        """Register a callback for an event.
+
+        Callbacks are invoked in the order they are registered.
+
+        Parameters
+        ----------
+        event : str
+            Name of the event, for example ``"on_batch_response"``.
+        callback : Callable
+            Function to invoke with the arguments of the event.
+
+        Raises
+        ------
+        ValueError
+            Error raised if the event name is not recognized.
+        """
+        self._check_event(event)
+        # Callbacks are replaced rather than modified, so events can be emitted without acquiring the lock
+        with self._lock:
+            callbacks = {**self._callbacks}
+            callbacks[event] = callbacks.get(event, ()) + (callback,)
+            self._callbacks = callbacks
+
+    def unregister(self, event: str, callback: Callable[..., Any]) -> None:
+        """Remove a callback registered for an event.
+
+        Parameters
+        ----------
+        event : str
+            Name of the event.
+        callback : Callable
+            Callback to remove.
+
+        Raises
+        ------
+        ValueError
+            Error raised if the callback is not registered for the event.
+        """
+        self._check_event(event)
+        with self._lock:
+            callbacks = {**self._callbacks}
+            registered = list(callbacks.get(event, ()))
+            if callback not in registered:
+                raise ValueError(f'Callback {callback!r} is not registered for event "{event}".')
+            registered.remove(callback)
+            if registered:
+                callbacks[event] = tuple(registered)
+            else:
+                del callbacks[event]
+            self._callbacks = callbacks
+
+    def register_all(self, handler: object) -> None:
+        """Register every method of an object whose name is an event name.
+
+        Parameters
+        ----------
+        handler : object
+            Object with methods such as ``on_query_start`` or ``on_batch_response``, for example a
+            :class:`MetricsCollector` or :class:`TracingAdapter` object.
+        """
+        for event in HOOK_EVENTS:
+            callback = getattr(handler, event, None)
+            if callback is not None:
+                self.register(event, callback)
+
+    def unregister_all(self, handler: object) -> None:
+        """Remove every callback registered by :meth:`register_all` for an object.
+
+        Parameters
+        ----------
+        handler : object
+            Object which was passed to :meth:`register_all`.
+        """
+        for event in HOOK_EVENTS:
+            callback = getattr(handler, event, None)
+            if callback is not None and callback in self._callbacks.get(event, ()):
+                self.unregister(event, callback)
+
+    def _emit(self, event: str, *args: Any) -> None:
+        """Invoke the callbacks registered for an event. Exceptions raised by callbacks are logged."""
+        for callback in self._callbacks.get(event, ()):
+            try:
+                callback(*args)
+            except Exception:
+                logger.warning(f'Exception raised by callback for event "{event}"', exc_info=True)
+
+    @staticmethod
+    def _check_event(event: str) -> None:
+        if event not in HOOK_EVENTS:
+            raise ValueError(f'Unknown event "{event}". Supported events are {", ".join(HOOK_EVENTS)}.')
+
+
+_current_query: ContextVar[Optional[Tuple[QueryHooks, "_BaseQuery"]]] = ContextVar("_current_query", default=None)
+"""Hooks of the client running the query in the current context, and the query itself."""
+
+
+def _run_with_hooks(hooks: QueryHooks, query: "_BaseQuery", run: Callable[[], "ResultBaseClass"]) -> "ResultBaseClass":
+    """Run a query, emit its start and end events, and make it available to the batch and message events."""
+    token = _current_query.set((hooks, query))
+    started = time.perf_counter()
+    try:
+        hooks._emit("on_query_start", query)
+        try:
+            result = run()
+        except BaseException as e:
+            hooks._emit("on_query_end", query, None, e, time.perf_counter() - started)
+            raise
+        hooks._emit("on_query_end", query, result, None, time.perf_counter() - started)
+        return result
+    finally:
+        _current_query.reset(token)
+
+
+def _emit_query_event(event: str, *args: Any) -> None:
+    """Emit an event for the query which is being run in the current context, if any callbacks are registered."""
+    current = _current_query.get()
+    if current is not None:
+        hooks, query = current
+        hooks._emit(event, query, *args)
+
+
+class MetricsCollector:
+    """Collects metrics for queries in the current process, grouped by the type of query.
+
+    Register the collector with :meth:`QueryHooks.register_all`, and call :meth:`snapshot` periodically to export the
+    metrics to a metrics system such as Prometheus or StatsD. All counters increase monotonically until :meth:`reset`
+    is called. Times are in seconds.
+
+    .. versionadded:: 2.5
+
+    Examples
+    --------
+    >>> collector = MetricsCollector()
+    >>> cxn.hooks.register_all(collector)
+    >>> cxn.run(query)
+    >>> collector.snapshot()
+    {'MaterialComplianceQuery': {'queries': 1, 'failures': 0, 'query_duration': 1.72, 'batches': 2, ...}}
+    """
+
+    _counters = (
+        "queries",
+        "failures",
+        "query_duration",
+        "batches",
+        "request_bytes",
+        "response_bytes",
+        "server_latency",
+        "serialization_time",
+        "deserialization_time",
+        "retries",
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Dict[str, Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self._metrics)} query types>"
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get the current value of all metrics.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Metrics for each type of query. Each entry contains the counters ``queries``, ``failures``,
+            ``query_duration``, ``batches``, ``request_bytes``, ``response_bytes``, ``server_latency``,
+            ``serialization_time``, ``deserialization_time``, and ``retries``, and the number of messages returned by
+            Granta MI for each severity in ``log_messages``.
+        """
+        with self._lock:
+            return {
+                query_type: {**metrics, "log_messages": dict(metrics["log_messages"])}
+                for query_type, metrics in self._metrics.items()
+            }
+
+    def reset(self) -> None:
+        """Set all metrics to zero."""
+        with self._lock:
+            self._metrics = {}
+
+    def on_query_end(
+        self, query: "_BaseQuery", result: Optional["ResultBaseClass"], error: Optional[BaseException], elapsed: float
+    ) -> None:
+        with self._lock:
+            metrics = self._get_metrics(query)
+            metrics["queries"] += 1
+            metrics["failures"] += error is not None
+            metrics["query_duration"] += elapsed
+
+    def on_batch_response(self, query: "_BaseQuery", statistics: "BatchStatistics") -> None:
+        with self._lock:
+            metrics = self._get_metrics(query)
+            metrics["batches"] += 1
+            metrics["request_bytes"] += statistics.request_bytes
+            metrics["response_bytes"] += statistics.response_bytes
+            metrics["server_latency"] += statistics.server_latency
+            metrics["serialization_time"] += statistics.serialization_time
+            metrics["deserialization_time"] += statistics.deserialization_time
+
+    def on_retry(self, query: "_BaseQuery", retry: Any) -> None:
+        with self._lock:
+            self._get_metrics(query)["retries"] += 1
+
+    def on_log_message(self, query: "_BaseQuery", severity: str, message: str) -> None:
+        with self._lock:
+            self._get_metrics(query)["log_messages"][severity] += 1
+
+    def _get_metrics(self, query: "_BaseQuery") -> Dict[str, Any]:
+        query_type = type(query).__name__
+        metrics = self._metrics.get(query_type)
+        if metrics is None:
+            metrics = {counter: 0 for counter in self._counters}
+            metrics["log_messages"] = defaultdict(int)
+            self._metrics[query_type] = metrics
+        return metrics
+
+
+@dataclass
+class Span:
+    """A timed operation recorded by a :class:`TracingAdapter` object.
+
+    Times are in seconds since the epoch.
+
+    .. versionadded:: 2.5
+    """
+
+    name: str
+    """Name of the operation, either ``"query"`` or ``"batch"``."""
+
+    trace_id: str
+    """Identifier shared by a query span and its batch spans."""
+
+    span_id: str
+    """Identifier of the span."""
+
+    parent_id: Optional[str]
+    """Identifier of the query span for batch spans, or ``None`` for query spans."""
+
+    start_time: float
+    """Time the operation started."""
+
+    end_time: Optional[float] = None
+    """Time the operation ended, or ``None`` if the operation has not ended."""
+
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    """Properties of the operation, such as the query type or the request size."""
+
+    events: List[Tuple[str, float, Dict[str, Any]]] = field(default_factory=list)
+    """Name, time, and attributes of events which occurred during the operation, such as retries and log messages."""
+
+    error: Optional[BaseException] = None
+    """Exception raised by the operation, if any."""
+
+
+_query_spans: ContextVar[Mapping["TracingAdapter", Span]] = ContextVar("_query_spans", default={})
+"""Query span in progress in the current context for each tracing adapter."""
+
+_batch_spans: ContextVar[Mapping["TracingAdapter", Span]] = ContextVar("_batch_spans", default={})
+"""Batch span in progress in the current context for each tracing adapter."""
+
+
+def _get_span(spans: ContextVar[Mapping["TracingAdapter", Span]], adapter: "TracingAdapter") -> Optional[Span]:
+    return spans.get().get(adapter)
+
+
+def _set_span(
+    spans: ContextVar[Mapping["TracingAdapter", Span]], adapter: "TracingAdapter", span: Optional[Span]
+) -> None:
+    """Set or clear the span of an adapter in the current context.
+
+    The mapping is replaced instead of modified, because contexts copied for concurrent batches share the same mapping.
+    """
+    updated = {key: value for key, value in spans.get().items() if key is not adapter}
+    if span is not None:
+        updated[adapter] = span
+    spans.set(updated)
+
+
+class TracingAdapter:
+    """Records a span for each query and a child span for each batch, and passes finished spans to an exporter.
+
+    Use the exporter to forward spans to a tracing system, for example by creating OpenTelemetry spans with the same
+    start and end times, attributes, and events.
+
+    .. versionadded:: 2.5
+
+    Parameters
+    ----------
+    exporter : Callable[[Span], None]
+        Function invoked with each span when it ends. Batch spans end before the query span which contains them.
+
+    Examples
+    --------
+    >>> spans = []
+    >>> cxn.hooks.register_all(TracingAdapter(spans.append))
+    >>> cxn.run(query)
+    >>> [span.name for span in spans]
+    ['batch', 'batch', 'query']
+    """
+
+    def __init__(self, exporter: Callable[[Span], None]) -> None:
+        self._exporter = exporter
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: exporter={self._exporter!r}>"
+
+    def on_query_start(self, query: "_BaseQuery") -> None:
+        span = Span(
+            name="query",
+            trace_id=uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=None,
+            start_time=time.time(),
+            attributes={"query.type": type(query).__name__},
+        )
+        _set_span(_query_spans, self, span)
+
+    def on_batch_request(self, query: "_BaseQuery", request_bytes: int) -> None:
+        parent = _get_span(_query_spans, self)
+        if parent is None:
+            return
+        span = Span(
+            name="batch",
+            trace_id=parent.trace_id,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id,
+            start_time=time.time(),
+            attributes={"query.type": parent.attributes["query.type"], "request.bytes": request_bytes},
+        )
+        _set_span(_batch_spans, self, span)
+
+    def on_batch_response(self, query: "_BaseQuery", statistics: "BatchStatistics") -> None:
+        span = _get_span(_batch_spans, self)
+        if span is None:
+            return
+        _set_span(_batch_spans, self, None)
+        span.end_time = time.time()
+        span.attributes.update(
+            {
+                "response.bytes": statistics.response_bytes,
+                "server.latency": statistics.server_latency,
+                "serialization.time": statistics.serialization_time,
+                "deserialization.time": statistics.deserialization_time,
+                "retries": statistics.retries,
+            }
+        )
+        self._exporter(span)
+
+    def on_retry(self, query: "_BaseQuery", retry: Any) -> None:
+        span = _get_span(_batch_spans, self)
+        if span is not None:
+            attributes = {"status": getattr(retry, "status", None), "error": repr(getattr(retry, "error", None))}
+            span.events.append(("retry", time.time(), attributes))
+
+    def on_log_message(self, query: "_BaseQuery", severity: str, message: str) -> None:
+        span = _get_span(_query_spans, self)
+        if span is not None:
+            span.events.append(("log_message", time.time(), {"severity": severity, "message": message}))
+
+    def on_query_end(
+        self, query: "_BaseQuery", result: Optional["ResultBaseClass"], error: Optional[BaseException], elapsed: float
+    ) -> None:
+        span = _get_span(_query_spans, self)
+        if span is None:
+            return
+        _set_span(_query_spans, self, None)
+        span.end_time = time.time()
+        span.error = error
+        self._exporter(span)
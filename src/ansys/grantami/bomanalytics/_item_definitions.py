@@ -29,7 +29,7 @@ These are sub-classed in the ``_bom_item_results.py`` file to include the result
 from abc import ABC, abstractmethod
 from enum import Enum, auto
 import numbers
-from typing import Any, Dict, Optional, Union, cast
+from typing import Any, Dict, Optional, Type, Union, cast
 
 from ansys.grantami.bomanalytics_openapi.v2 import models
 from ansys.openapi.common import Unset_Type
@@ -189,6 +189,9 @@ class RecordDefinition(RecordReference):
     a query.
     """
 
+    _model_type: Type[models.ModelBase]
+    """Low-level API model which defines the record in a request."""
+
     @property
     @abstractmethod
     def _definition(self) -> models.ModelBase:
@@ -243,6 +246,8 @@ class PartReference(CommonIdentifiersMixin, RecordReference):
 class PartDefinition(RecordDefinition, PartReference):
     """Represents a part record from the concrete :class:`RecordDefinition` subclass."""
 
+    _model_type = models.CommonPartReference
+
     @property
     def _definition(self) -> models.CommonPartReference:
         """Low-level API part definition.
@@ -293,6 +298,8 @@ class MaterialReference(CommonIdentifiersMixin, RecordReference):
 class MaterialDefinition(RecordDefinition, MaterialReference):
     """Represents a material record from the concrete :class:`RecordDefinition` subclass."""
 
+    _model_type = models.CommonMaterialReference
+
     @property
     def _definition(self) -> models.CommonMaterialReference:
         """Low-level API material definition.
@@ -343,6 +350,8 @@ class SpecificationReference(CommonIdentifiersMixin, RecordReference):
 class SpecificationDefinition(RecordDefinition, SpecificationReference):
     """Represents a specification record from the concrete :class:`RecordDefinition` subclass."""
 
+    _model_type = models.CommonSpecificationReference
+
     @property
     def _definition(self) -> models.CommonSpecificationReference:
         """Low-level API specification definition.
@@ -429,6 +438,7 @@ class SubstanceDefinition(RecordDefinition, SubstanceReference):
     """
 
     _default_percentage_amount = 100  # Default to worst case scenario
+    _model_type = models.GetComplianceForSubstancesSubstanceWithAmount
 
     def __init__(
         self,
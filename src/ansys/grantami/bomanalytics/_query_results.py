@@ -28,10 +28,11 @@ the entire query result instead of being constrained to individual parts and mat
 
 from abc import ABC
 from collections import defaultdict, namedtuple
-from typing import Any, Callable, Dict, List, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 from ansys.grantami.bomanalytics_openapi.v2 import models
 
+from ._execution_report import ExecutionReport
 from ._item_results import (
     ImpactedSubstance,
     ItemResultFactory,
@@ -143,10 +144,22 @@ class QueryResultFactory:
             raise RuntimeError(f"Unregistered response type" f' "{response_type}"').with_traceback(e.__traceback__)
 
         item_result: ResultBaseClass = item_factory_class(results=results, messages=messages, **kwargs)
+        item_result._response_items = results if isinstance(results, list) else [results]
+        item_result._factory_arguments = kwargs
         return item_result
 
 
 class ResultBaseClass(ABC):
+    _response_items: Optional[List[models.ModelBase]] = None
+    """Low-level API objects the result was created from, used to serialize the result. ``None`` if the result was not
+    created by the :class:`QueryResultFactory` class, or if it was returned by a connection which does not retain
+    responses."""
+
+    _factory_arguments: Dict[str, Any] = {}
+    """Additional arguments the result was created with, such as the indicator definitions for compliance results."""
+
+    _execution_report: Optional[ExecutionReport] = None
+
     def __init__(self, log_messages: List[models.CommonLogEntry]) -> None:
         self._messages = [LogMessage(severity=msg.severity, message=msg.message) for msg in log_messages]
 
@@ -163,6 +176,19 @@ class ResultBaseClass(ABC):
 
         return self._messages
 
+    @property
+    def execution_report(self) -> Optional[ExecutionReport]:
+        """Statistics which describe how the query was run, such as the number of requests sent to Granta MI, the size
+        and latency of each request, and the time spent creating the result.
+
+        ``None`` if the result was not returned by
+        :meth:`~ansys.grantami.bomanalytics._connection.BomAnalyticsClient.run`, for example if it was loaded with
+        :meth:`~ansys.grantami.bomanalytics.QuerySerializer.load_result`.
+
+        .. versionadded:: 2.5
+        """
+        return self._execution_report
+
 
 class ImpactedSubstancesBaseClass(ResultBaseClass):
     """Retrieves an impacted substances query result.
@@ -0,0 +1,270 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Compact columnar storage for the records added to record-based queries.
+
+Records added to a query are stored as columns of reference values and amounts instead of as one definition object per
+record. The low-level API models are only created when the records are sent to the server, one batch at a time.
+"""
+
+from array import array
+from collections.abc import Mapping
+import numbers
+from typing import Any, List, Optional, Type, Union, cast
+
+from ansys.grantami.bomanalytics_openapi.v2 import models
+
+from ._item_definitions import RecordDefinition, ReferenceType, SubstanceDefinition
+
+_INTEGER_REFERENCE_TYPES = frozenset([ReferenceType.MiRecordHistoryIdentity])
+"""Reference types with integer reference values. All other reference values are strings."""
+
+
+def _to_list(values: Any, argument_name: str) -> List[Any]:
+    """Convert a sequence or iterable of values to a list.
+
+    NumPy arrays, pandas Series, and ``array.array`` objects are converted with their ``tolist()`` method, which
+    converts all items to the equivalent built-in Python types in a single call. Any other iterable is consumed into a
+    new list.
+
+    Raises
+    ------
+    TypeError
+        If ``values`` is a string, a mapping, or is not iterable.
+    """
+    message = f"Incorrect type for argument '{argument_name}' value {repr(values)}. Expected a sequence of values"
+    if isinstance(values, (str, bytes, Mapping)):
+        raise TypeError(message)
+    tolist = getattr(values, "tolist", None)
+    if callable(tolist):
+        result = tolist()
+        # Zero-dimensional NumPy arrays are converted to a scalar
+        if not isinstance(result, list):
+            raise TypeError(message)
+        return result
+    try:
+        return list(values)
+    except TypeError:
+        raise TypeError(message) from None
+
+
+def _check_reference_values(values: List[Any], value_type: Type[Any], argument_name: str) -> None:
+    """Check that all reference values are of the expected type and are not empty.
+
+    The types of the values are checked in a single pass over the distinct types, and the values are only checked one
+    at a time to report the first invalid value.
+    """
+    value_types = set(map(type, values))
+    if all(issubclass(t, value_type) and t is not bool for t in value_types) and (value_type is int or all(values)):
+        return
+    for index, value in enumerate(values):
+        if not isinstance(value, value_type) or isinstance(value, bool):
+            raise TypeError(
+                f"Incorrect type for item {index} of argument '{argument_name}' value {repr(value)}. Expected "
+                f"'{repr(value_type)}'"
+            )
+        if not value and value_type is str:
+            raise TypeError(
+                f"Attempted to add a null record reference to a query. Item {index} of argument '{argument_name}' is "
+                f"an empty string."
+            )
+
+
+def _to_amounts(amounts: Any, argument_name: str, count: int) -> "array[float]":
+    """Convert a sequence of percentage amounts to a column of floats, and check that all amounts are valid.
+
+    Raises
+    ------
+    TypeError
+        If an amount is not a number.
+    ValueError
+        If the number of amounts is not equal to ``count``, or if an amount does not satisfy 0 < value <= 100.
+    """
+    amounts_list = _to_list(amounts, argument_name)
+    if len(amounts_list) != count:
+        raise ValueError(
+            f"Argument '{argument_name}' contains {len(amounts_list)} amounts, but {count} record references were "
+            f"specified. Specify one amount for each record reference."
+        )
+    try:
+        column = array("d", amounts_list)
+    except TypeError:
+        for value in amounts_list:
+            if not isinstance(value, numbers.Real):
+                raise TypeError(f'percentage_amount must be a number. Specified type was "{type(value)}"') from None
+        raise
+    # NaN does not satisfy the comparison, so it is rejected
+    if not all(0.0 < value <= 100.0 for value in column):
+        for value in column:
+            if not 0.0 < value <= 100.0:
+                raise ValueError(f'percentage_amount must be between 0 and 100. Specified value was "{value}"')
+    return column
+
+
+class _RecordColumns:
+    """Records of a single type, stored as a column of reference values and an optional column of amounts.
+
+    Integer reference values are stored in an ``array.array``, and string reference values in a list. Amounts are stored
+    in an ``array.array`` of floats.
+
+    Parameters
+    ----------
+    definition_type : Type[RecordDefinition]
+        Type of the definition which represents each record, for example ``PartDefinition``.
+    reference_type : ReferenceType
+        Type of the reference values.
+    values : list[str] | array.array
+        Reference values.
+    database_key : str, optional
+        Database key of the database which contains the records.
+    amounts : array.array, optional
+        Percentage amount of each substance. Only supported for substance records.
+    """
+
+    __slots__ = ("definition_type", "reference_type", "values", "database_key", "amounts")
+
+    def __init__(
+        self,
+        definition_type: Type[RecordDefinition],
+        reference_type: ReferenceType,
+        values: Union[List[str], "array[int]"],
+        database_key: Optional[str] = None,
+        amounts: Optional["array[float]"] = None,
+    ) -> None:
+        self.definition_type = definition_type
+        self.reference_type = reference_type
+        self.values = values
+        self.database_key = database_key
+        self.amounts = amounts
+
+    @classmethod
+    def from_values(
+        cls,
+        definition_type: Type[RecordDefinition],
+        reference_type: ReferenceType,
+        values: Any,
+        database_key: Optional[str] = None,
+        amounts: Any = None,
+        argument_name: str = "values",
+        amounts_argument_name: str = "amounts",
+    ) -> "_RecordColumns":
+        """Create a column of records from a sequence or iterable of values, and check all values.
+
+        Parameters
+        ----------
+        definition_type : Type[RecordDefinition]
+            Type of the definition which represents each record.
+        reference_type : ReferenceType
+            Type of the reference values.
+        values : Any
+            Reference values, as any sequence or iterable, including NumPy arrays and pandas Series.
+        database_key : str, optional
+            Database key of the database which contains the records.
+        amounts : Any, optional
+            Percentage amount of each substance, in the same order as ``values``.
+        argument_name : str
+            Name of the argument which provided the values, for error messages.
+        amounts_argument_name : str
+            Name of the argument which provided the amounts, for error messages.
+
+        Raises
+        ------
+        TypeError
+            If a value is of the wrong type or is empty, or if an amount is not a number.
+        ValueError
+            If there is not exactly one amount for each value, or if an amount does not satisfy 0 < value <= 100.
+        """
+        value_list = _to_list(values, argument_name)
+        if reference_type in _INTEGER_REFERENCE_TYPES:
+            _check_reference_values(value_list, int, argument_name)
+            try:
+                column: Union[List[str], "array[int]"] = array("q", value_list)
+            except OverflowError:
+                raise ValueError(f"Argument '{argument_name}' contains a value which is too large.") from None
+        else:
+            _check_reference_values(value_list, str, argument_name)
+            column = value_list
+        amounts_column = None
+        if amounts is not None:
+            amounts_column = _to_amounts(amounts, amounts_argument_name, len(value_list))
+        return cls(definition_type, reference_type, column, database_key, amounts_column)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _common_arguments(self) -> dict:
+        arguments: dict = {"reference_type": self.reference_type.name}
+        if self.database_key is not None:
+            arguments["database_key"] = self.database_key
+        return arguments
+
+    def models(self, start: int, stop: int) -> List[models.ModelBase]:
+        """Create the low-level API models for a range of the records.
+
+        Parameters
+        ----------
+        start : int
+            Index of the first record.
+        stop : int
+            Index after the last record.
+
+        Returns
+        -------
+        list[models.ModelBase]
+            One model for each record, equal to the ``_definition`` of the equivalent definition object.
+        """
+        model_type = self.definition_type._model_type
+        arguments = self._common_arguments()
+        values = self.values[start:stop]
+        if self.amounts is not None:
+            amounts = self.amounts[start:stop]
+            return [
+                model_type(reference_value=str(value), percentage_amount=amount, **arguments)
+                for value, amount in zip(values, amounts)
+            ]
+        if issubclass(self.definition_type, SubstanceDefinition):
+            arguments["percentage_amount"] = self.definition_type._default_percentage_amount
+        return [model_type(reference_value=str(value), **arguments) for value in values]
+
+    def definitions(self) -> List[RecordDefinition]:
+        """Create a definition object for each record.
+
+        Returns
+        -------
+        list[RecordDefinition]
+            Definition objects, equivalent to the objects created by the ``BomItemDefinitionFactory`` subclasses.
+        """
+        definition_type = cast(Any, self.definition_type)
+        if self.amounts is not None:
+            return [
+                definition_type(
+                    reference_type=self.reference_type,
+                    reference_value=value,
+                    percentage_amount=amount,
+                    database_key=self.database_key,
+                )
+                for value, amount in zip(self.values, self.amounts)
+            ]
+        return [
+            definition_type(reference_type=self.reference_type, reference_value=value, database_key=self.database_key)
+            for value in self.values
+        ]
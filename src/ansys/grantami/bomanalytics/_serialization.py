@@ -0,0 +1,466 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Compact JSON serialization of queries, query results, and connection settings.
+
+Queries are serialized to the settings and items they were built with, and query results to the low-level API objects
+returned by Granta MI. Both can be sent to another process and restored there without a connection to Granta MI.
+"""
+
+import inspect
+import io
+from itertools import groupby
+import json
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from ansys.grantami.bomanalytics_openapi.v2 import models
+from ansys.openapi.common import ApiClient, SessionConfiguration
+import requests
+
+from . import queries
+from ._item_definitions import RecordDefinition, ReferenceType, SubstanceDefinition
+from ._query_results import QueryResultFactory, ResultBaseClass
+from ._record_columns import _RecordColumns
+from .indicators import RoHSIndicator, WatchListIndicator, _Indicator
+
+if TYPE_CHECKING:
+    from ._connection import BomAnalyticsClient
+
+FORMAT_VERSION = 1
+"""Version of the serialization format. Documents with a different version cannot be loaded."""
+
+_QUERY_FORMAT = "ansys-grantami-bomanalytics/query"
+_RESULT_FORMAT = "ansys-grantami-bomanalytics/result"
+_SETTINGS_FORMAT = "ansys-grantami-bomanalytics/connection-settings"
+
+_indicator_types: Dict[str, Tuple[Type[_Indicator], str]] = {
+    "RoHSIndicator": (RoHSIndicator, "ignore_exemptions"),
+    "WatchListIndicator": (WatchListIndicator, "ignore_process_chemicals"),
+}
+"""Indicator classes, and the name of the argument specific to each class, by class name."""
+
+_table_name_arguments = {
+    "material_universe_table_name": "material_universe_table_name",
+    "inhouse_materials_table_name": "in_house_materials_table_name",
+    "specifications_table_name": "specifications_table_name",
+    "products_and_parts_table_name": "products_and_parts_table_name",
+    "substances_table_name": "substances_table_name",
+    "coatings_table_name": "coatings_table_name",
+    "process_universe_table_name": "process_universe_table_name",
+    "locations_table_name": "location_table_name",
+    "transport_table_name": "transport_table_name",
+}
+"""Arguments of ``BomAnalyticsClient.set_database_details``, by the key used to store the table name in the client."""
+
+
+def _dumps(document: Dict[str, Any]) -> str:
+    return json.dumps(document, separators=(",", ":"), ensure_ascii=False)
+
+
+def _dump_record_column(
+    reference_type: ReferenceType,
+    database_key: Optional[str],
+    values: Sequence[object],
+    amounts: Optional[Iterable[float]],
+) -> Dict[str, Any]:
+    column: Dict[str, Any] = {"reference_type": reference_type.name, "values": values}
+    if database_key is not None:
+        column["database_key"] = database_key
+    if amounts is not None:
+        column["amounts"] = list(amounts)
+    return column
+
+
+def _loads(text: Union[str, bytes], document_format: str) -> Dict[str, Any]:
+    """Parse a serialized document, and check its format and version.
+
+    Raises
+    ------
+    ValueError
+        If the text is not a JSON document of the expected format and version.
+    """
+    try:
+        document = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Serialized document is not valid JSON ({e}).") from e
+    if not isinstance(document, dict) or document.get("format") != document_format:
+        raise ValueError(f'Serialized document is not in the "{document_format}" format.')
+    if document.get("version") != FORMAT_VERSION:
+        raise ValueError(
+            f'Serialized document has version {document.get("version")}, but only version {FORMAT_VERSION} is '
+            f"supported."
+        )
+    return document
+
+
+class _ModelSerializer(ApiClient):
+    """Converts low-level API objects to and from the JSON representation used by Granta MI.
+
+    The client is never used to send requests.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(requests.Session(), "", SessionConfiguration())
+        self.setup_client(models)
+
+    def to_json(self, model: Any) -> Any:
+        return self.sanitize_for_serialization(model)
+
+    def from_json(self, data: Any, type_name: str) -> Any:
+        # The public deserialize method only accepts HTTP responses, so the data is wrapped in a response object
+        response = requests.Response()
+        response.raw = io.BytesIO(json.dumps(data).encode("utf-8"))
+        response.encoding = "utf-8"
+        return self.deserialize(response, type_name)
+
+
+class QuerySerializer:
+    """Serializes queries, query results, and connection settings to compact, versioned JSON documents.
+
+    Use this class to send queries to other processes, such as the workers of a :class:`multiprocessing.Pool`
+    or the consumers of a job queue, and to return the results. Serialized queries contain the settings and items of
+    the query, and serialized results contain the responses returned by Granta MI. Loading a result does not require a
+    connection to Granta MI.
+
+    Each document contains a format version. Documents can only be loaded by a version of this package which supports
+    the same format version.
+
+    Results can only be serialized if the connection used to run the query keeps the responses returned by Granta MI,
+    see :attr:`~ansys.grantami.bomanalytics._connection.BomAnalyticsClient.retain_responses`.
+
+    .. versionadded:: 2.5
+
+    Examples
+    --------
+    >>> serializer = QuerySerializer()
+    >>> text = serializer.dump_query(query)
+    >>> settings = serializer.dump_connection_settings(cxn)
+
+    In the worker process:
+
+    >>> serializer.load_connection_settings(worker_cxn, settings)
+    >>> worker_cxn.retain_responses = True
+    >>> result = worker_cxn.run(serializer.load_query(text))
+    >>> result_text = serializer.dump_result(result)
+    """
+
+    def __init__(self) -> None:
+        self._models = _ModelSerializer()
+        self._query_types: Dict[str, Type[queries._ApiMixin]] = {
+            name: value
+            for name, value in vars(queries).items()
+            if inspect.isclass(value)
+            and issubclass(value, queries._ApiMixin)
+            and not name.startswith("_")
+            and not inspect.isabstract(value)
+        }
+        self._result_types: Dict[str, Tuple[Callable[..., ResultBaseClass], str]] = {
+            result_type.__name__: (result_type, item_type.__name__)
+            for item_type, result_type in QueryResultFactory.registry.items()
+        }
+
+    def dump_query(self, query: "queries._ApiMixin") -> str:
+        """Serialize a query to a JSON document.
+
+        The document contains the items added to the query, its indicators, legislations, or units, and its settings
+        such as the batch size. BoMs are serialized as XML. If the query was created with
+        :meth:`~ansys.grantami.bomanalytics.queries.BomComplianceQuery.with_bom_changes`, the complete current BoM is
+        serialized, so the loaded query analyzes the entire BoM.
+
+        Parameters
+        ----------
+        query
+            A compliance, impacted substances, or sustainability query object.
+
+        Returns
+        -------
+        str
+            Serialized query.
+
+        Raises
+        ------
+        TypeError
+            Error raised if the object is not a query.
+        """
+        return _dumps(self._query_document(query))
+
+    def _query_document(self, query: "queries._ApiMixin") -> Dict[str, Any]:
+        """Create the JSON-compatible document which represents a query."""
+        query_type = type(query).__name__
+        if self._query_types.get(query_type) is not type(query):
+            raise TypeError(f"Objects of type {query_type} cannot be serialized as a query.")
+        document: Dict[str, Any] = {"format": _QUERY_FORMAT, "version": FORMAT_VERSION, "type": query_type}
+        if isinstance(query, queries._RecordBasedQueryBuilder):
+            document["batch_size"] = query._data.batch_size
+            document["records"] = self._dump_record_blocks(query._data._record_blocks)
+        elif isinstance(query, queries._BomQueryBuilder):
+            data = query._data
+            document["bom"] = self._dump_query_bom(data)
+            document["max_parts_per_request"] = data.max_parts_per_request
+            document["max_concurrent_requests"] = data.max_concurrent_requests
+            document["deduplicate_parts"] = data.deduplicate_parts
+        if isinstance(query, queries._ComplianceMixin):
+            document["indicators"] = [self._dump_indicator(indicator) for indicator in query._indicators.values()]
+        elif isinstance(query, queries._ImpactedSubstanceMixin):
+            document["legislation_ids"] = list(query._legislations)
+        elif isinstance(query, queries._SustainabilityMixin):
+            document["preferred_units"] = self._models.to_json(query._preferred_units)
+        return document
+
+    def load_query(self, text: Union[str, bytes]) -> "queries._ApiMixin":
+        """Create a query from a JSON document created by :meth:`dump_query`.
+
+        Parameters
+        ----------
+        text : str | bytes
+            Serialized query.
+
+        Returns
+        -------
+        Query
+            Query of the serialized type, with the serialized settings and items.
+
+        Raises
+        ------
+        ValueError
+            Error raised if the document is not a serialized query, or if its format version is not supported.
+        """
+        document = _loads(text, _QUERY_FORMAT)
+        try:
+            query = self._query_types[document["type"]]()
+        except KeyError:
+            raise ValueError(f'Serialized query has an unknown type "{document.get("type")}".') from None
+        if isinstance(query, queries._RecordBasedQueryBuilder):
+            query._data.batch_size = document["batch_size"]
+            for block in document["records"]:
+                query._data.append_record_columns(self._load_record_block(query._definition_type, block))
+        elif isinstance(query, queries._BomQueryBuilder):
+            if document["bom"] is not None:
+                query.with_bom(document["bom"], validation="none")
+            query._data.max_parts_per_request = document["max_parts_per_request"]
+            query._data.max_concurrent_requests = document["max_concurrent_requests"]
+            query._data.deduplicate_parts = document["deduplicate_parts"]
+        if isinstance(query, queries._ComplianceMixin):
+            query.with_indicators([self._load_indicator(indicator) for indicator in document["indicators"]])
+        elif isinstance(query, queries._ImpactedSubstanceMixin):
+            query.with_legislation_ids(document["legislation_ids"])
+        elif isinstance(query, queries._SustainabilityMixin):
+            query._preferred_units = self._models.from_json(document["preferred_units"], "CommonPreferredUnits")
+        return query
+
+    def dump_result(self, result: ResultBaseClass) -> str:
+        """Serialize a query result to a JSON document.
+
+        The document contains the responses returned by Granta MI and the indicators used to create the result.
+
+        Parameters
+        ----------
+        result
+            Result returned by :meth:`~ansys.grantami.bomanalytics._connection.BomAnalyticsClient.run`.
+
+        Returns
+        -------
+        str
+            Serialized result.
+
+        Raises
+        ------
+        ValueError
+            Error raised if the responses returned by Granta MI were not kept when the query was run, or if the
+            result was not returned by Granta MI as a single response, for example if it is the result of a query
+            created with :meth:`~ansys.grantami.bomanalytics.queries.BomComplianceQuery.with_bom_changes`.
+        """
+        if result._response_items is None:
+            raise ValueError(
+                f"{type(result).__name__} objects which were not created from a response cannot be serialized. Set "
+                f"retain_responses to True on the connection to keep the responses returned by Granta MI."
+            )
+        document: Dict[str, Any] = {
+            "format": _RESULT_FORMAT,
+            "version": FORMAT_VERSION,
+            "type": type(result).__name__,
+            "items": self._models.to_json(result._response_items),
+            "messages": [[message.severity, message.message] for message in result.messages],
+        }
+        indicators = result._factory_arguments.get("indicator_definitions")
+        if indicators is not None:
+            document["indicators"] = [self._dump_indicator(indicator) for indicator in indicators.values()]
+        return _dumps(document)
+
+    def load_result(self, text: Union[str, bytes]) -> ResultBaseClass:
+        """Create a query result from a JSON document created by :meth:`dump_result`.
+
+        Parameters
+        ----------
+        text : str | bytes
+            Serialized result.
+
+        Returns
+        -------
+        Query Result
+            Result of the serialized type.
+
+        Raises
+        ------
+        ValueError
+            Error raised if the document is not a serialized result, or if its format version is not supported.
+        """
+        document = _loads(text, _RESULT_FORMAT)
+        try:
+            result_type, item_type = self._result_types[document["type"]]
+        except KeyError:
+            raise ValueError(f'Serialized result has an unknown type "{document.get("type")}".') from None
+        items = self._models.from_json(document["items"], f"list[{item_type}]")
+        messages = [
+            models.CommonLogEntry(severity=severity, message=message) for severity, message in document["messages"]
+        ]
+        kwargs: Dict[str, Any] = {}
+        if "indicators" in document:
+            indicators = [self._load_indicator(indicator) for indicator in document["indicators"]]
+            kwargs["indicator_definitions"] = {indicator.name: indicator for indicator in indicators}
+        result = result_type(results=items, messages=messages, **kwargs)
+        result._response_items = items
+        result._factory_arguments = kwargs
+        return result
+
+    def dump_connection_settings(self, client: "BomAnalyticsClient") -> str:
+        """Serialize the database key, table names, and maximum specification-to-specification link depth of a
+        connection to a JSON document.
+
+        The URL and credentials of the connection are not serialized.
+
+        Parameters
+        ----------
+        client : :class:`~ansys.grantami.bomanalytics._connection.BomAnalyticsClient`
+            Connection to serialize the settings of.
+
+        Returns
+        -------
+        str
+            Serialized settings.
+        """
+        with client._configuration_lock:
+            db_key, table_names, max_spec_depth = client._db_key, client._table_names, client._max_spec_depth
+        document = {
+            "format": _SETTINGS_FORMAT,
+            "version": FORMAT_VERSION,
+            "database_key": db_key,
+            "table_names": {_table_name_arguments[key]: name for key, name in table_names.items() if name is not None},
+            "maximum_spec_link_depth": max_spec_depth,
+        }
+        return _dumps(document)
+
+    def load_connection_settings(self, client: "BomAnalyticsClient", text: Union[str, bytes]) -> None:
+        """Apply settings created by :meth:`dump_connection_settings` to a connection.
+
+        Parameters
+        ----------
+        client : :class:`~ansys.grantami.bomanalytics._connection.BomAnalyticsClient`
+            Connection to apply the settings to.
+        text : str | bytes
+            Serialized settings.
+
+        Raises
+        ------
+        ValueError
+            Error raised if the document is not serialized connection settings, or if its format version is not
+            supported.
+        """
+        document = _loads(text, _SETTINGS_FORMAT)
+        client.set_database_details(database_key=document["database_key"], **document["table_names"])
+        client.maximum_spec_link_depth = document["maximum_spec_link_depth"]
+
+    def _dump_query_bom(self, data: "queries._BomQueryDataManager") -> Optional[str]:
+        if data.incremental_update is not None:
+            return queries._get_bom_handler().dump_bom(data.incremental_update.current_bom, validation="none")
+        if not data.populated_inputs:
+            return None
+        return data.bom
+
+    @staticmethod
+    def _dump_record_blocks(blocks: List[Union[List[RecordDefinition], _RecordColumns]]) -> List[Dict[str, Any]]:
+        """Serialize the records in a query as columns of reference values, with an optional column of amounts.
+
+        Columns of records are serialized unchanged. Lists of definitions are split into runs of consecutive records
+        with the same reference type and database key.
+        """
+        serialized = []
+        for block in blocks:
+            if isinstance(block, _RecordColumns):
+                serialized.append(
+                    _dump_record_column(block.reference_type, block.database_key, list(block.values), block.amounts)
+                )
+                continue
+            for (reference_type, database_key), group in groupby(
+                block, key=lambda definition: (definition._reference_type, definition._database_key)
+            ):
+                definitions = list(group)
+                amounts: Optional[List[float]] = None
+                if isinstance(definitions[0], SubstanceDefinition):
+                    amounts = [cast(SubstanceDefinition, definition).percentage_amount for definition in definitions]
+                values = [definition._reference_value for definition in definitions]
+                serialized.append(_dump_record_column(reference_type, database_key, values, amounts))
+        return serialized
+
+    @staticmethod
+    def _load_record_block(definition_type: Type[RecordDefinition], block: Dict[str, Any]) -> _RecordColumns:
+        return _RecordColumns.from_values(
+            definition_type,
+            ReferenceType[block["reference_type"]],
+            block["values"],
+            database_key=block.get("database_key"),
+            amounts=block.get("amounts"),
+        )
+
+    @staticmethod
+    def _dump_indicator(indicator: _Indicator) -> Dict[str, Any]:
+        indicator_type = type(indicator).__name__
+        _, option_name = _indicator_types[indicator_type]
+        return {
+            "type": indicator_type,
+            "name": indicator.name,
+            "legislation_ids": list(indicator.legislation_ids),
+            "default_threshold_percentage": indicator.default_threshold_percentage,
+            option_name: getattr(indicator, f"_{option_name}"),
+        }
+
+    @staticmethod
+    def _load_indicator(serialized: Dict[str, Any]) -> _Indicator:
+        arguments = dict(serialized)
+        try:
+            indicator_type, _ = _indicator_types[arguments.pop("type")]
+        except KeyError:
+            raise ValueError(f'Serialized indicator has an unknown type "{serialized.get("type")}".') from None
+        return indicator_type(**arguments)
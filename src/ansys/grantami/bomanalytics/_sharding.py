@@ -0,0 +1,288 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Runs record-based queries in a pool of worker processes.
+
+The records in a query are divided into shards, and each shard is run as a separate query by a worker process with its
+own connection to Granta MI. The results of the shards are combined into a single result in the parent process.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import copyreg
+import gc
+import io
+from itertools import chain
+import logging
+from multiprocessing.context import BaseContext
+import os
+import pickle
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union, cast
+
+from ansys.openapi.common import Unset_Type
+
+from ._connection import Connection
+from ._execution_report import ExecutionReport
+from ._logger import logger
+from ._serialization import QuerySerializer, _dumps
+
+if TYPE_CHECKING:
+    from ._connection import BomAnalyticsClient
+    from ._query_results import ResultBaseClass
+    from .queries import _ApiMixin
+
+_worker_client: Optional["BomAnalyticsClient"] = None
+"""Connection to Granta MI used by the current worker process."""
+
+_worker_serializer: Optional[QuerySerializer] = None
+
+
+def _start_worker(connect: Callable[[], "BomAnalyticsClient"], log_level: int) -> None:
+    """Connect to Granta MI when a worker process starts."""
+    global _worker_client, _worker_serializer
+    logger.setLevel(log_level)
+    _worker_client = connect()
+    _worker_serializer = QuerySerializer()
+
+
+def _run_shard(query_text: str, settings_text: str, retain_responses: bool) -> bytes:
+    """Run a serialized query in a worker process, with the serialized connection settings of the parent process.
+
+    The result is returned pickled. The responses returned by Granta MI are only included if the connection of the
+    parent process retains responses, so the result is usually smaller than the responses it was created from.
+    """
+    assert _worker_client is not None and _worker_serializer is not None
+    _worker_serializer.load_connection_settings(_worker_client, settings_text)
+    _worker_client.retain_responses = retain_responses
+    result = _worker_client.run(_worker_serializer.load_query(query_text))
+    return _dump_shard_result(result)
+
+
+def _reduce_unset(value: Unset_Type) -> str:
+    # Pickle the marker by name, so that it is the same object as the marker in the parent process when unpickled
+    return "Unset"
+
+
+def _dump_shard_result(result: "ResultBaseClass") -> bytes:
+    """Pickle the result of a shard.
+
+    Results and low-level API objects contain the ``Unset`` marker, which is compared by identity, so the marker is
+    pickled as a reference to the marker object defined by the API client.
+    """
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = {**copyreg.dispatch_table, Unset_Type: _reduce_unset}
+    pickler.dump(result)
+    return buffer.getvalue()
+
+
+def _load_shard_result(data: bytes) -> "ResultBaseClass":
+    """Unpickle the result of a shard.
+
+    Every object created while unpickling remains referenced, so garbage collection is paused until the result is
+    loaded. Otherwise, the collections triggered by the new objects take several times longer than unpickling itself.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return cast("ResultBaseClass", pickle.loads(data))
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _slice_columns(columns: List[Dict[str, Any]], start: int, stop: int) -> List[Dict[str, Any]]:
+    """Get the serialized columns which contain the records from index ``start`` up to but excluding ``stop``."""
+    sliced = []
+    offset = 0
+    for column in columns:
+        length = len(column["values"])
+        column_start, column_stop = max(start - offset, 0), min(stop - offset, length)
+        if column_start < column_stop:
+            shard_column = {**column, "values": column["values"][column_start:column_stop]}
+            if "amounts" in column:
+                shard_column["amounts"] = column["amounts"][column_start:column_stop]
+            sliced.append(shard_column)
+        offset += length
+    return sliced
+
+
+def _merge_shard_results(results: List["ResultBaseClass"]) -> "ResultBaseClass":
+    """Combine the results of the shards of a query, in the order of the shards."""
+    merged = copy.copy(results[0])
+    merged._results = list(chain.from_iterable(result._results for result in results))  # type: ignore[attr-defined]
+    merged._messages = list(chain.from_iterable(result._messages for result in results))
+    reports = [result._execution_report for result in results if result._execution_report is not None]
+    if len(reports) < len(results):
+        merged._execution_report = None
+    else:
+        merged._execution_report = ExecutionReport(
+            batches=list(chain.from_iterable(report.batches for report in reports)),
+            result_build_time=sum(report.result_build_time for report in reports),
+            cache_hits=sum(report.cache_hits for report in reports),
+        )
+    response_items = [result._response_items for result in results if result._response_items is not None]
+    if len(response_items) < len(results):
+        merged._response_items = None
+    else:
+        merged._response_items = list(chain.from_iterable(response_items))
+    return merged
+
+
+class ShardedQueryRunner:
+    """Runs record-based queries in a pool of worker processes.
+
+    The records added to a query are divided into one shard for each worker process. Each worker process connects to
+    Granta MI once when it starts, and runs its shard of the query with the database details and maximum
+    specification-to-specification link depth of the connection passed to :meth:`run`. The results of all shards are
+    combined into a single result, which is the same as the result of running the query in a single process.
+
+    Use this class when the results of a query are so large that creating the result objects is limited by a single
+    CPU core. Queries are sent to the worker processes in compact form, see
+    :class:`~ansys.grantami.bomanalytics.QuerySerializer`. Results are returned without the responses they were created
+    from, unless the connection passed to :meth:`run` retains responses, so loading the results of all shards takes
+    less time than creating the result in a single process.
+
+    Use the runner as a context manager, or call :meth:`shutdown` when it is no longer required, to stop the worker
+    processes.
+
+    .. versionadded:: 2.5
+
+    Parameters
+    ----------
+    connection : Connection | Callable[[], BomAnalyticsClient]
+        Connection builder with authentication configured, or a function which returns a connected
+        :class:`~ansys.grantami.bomanalytics._connection.BomAnalyticsClient`. Connection builders cannot be pickled,
+        so if the worker processes are not started with the ``"fork"`` start method, provide a function defined at the
+        top level of a module instead.
+    processes : int, optional
+        Number of worker processes. The default is ``None``, in which case the number of CPUs is used.
+    mp_context : multiprocessing.context.BaseContext, optional
+        Context used to start the worker processes. The default is ``None``, in which case the default context of the
+        :mod:`multiprocessing` module is used.
+
+    Examples
+    --------
+    >>> builder = Connection("http://my_mi_server/mi_servicelayer").with_autologon()
+    >>> cxn = builder.connect()
+    >>> with ShardedQueryRunner(builder, processes=4) as runner:
+    ...     result = runner.run(query, cxn)
+    >>> result
+    <MaterialComplianceQueryResult: 100000 MaterialWithCompliance results>
+    """
+
+    def __init__(
+        self,
+        connection: Union[Connection, Callable[[], "BomAnalyticsClient"]],
+        processes: Optional[int] = None,
+        mp_context: Optional[BaseContext] = None,
+    ) -> None:
+        if processes is not None and processes < 1:
+            raise ValueError("processes must be at least 1.")
+        connect = connection.connect if isinstance(connection, Connection) else connection
+        self._processes = processes or os.cpu_count() or 1
+        self._serializer = QuerySerializer()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._processes,
+            mp_context=mp_context,
+            initializer=_start_worker,
+            initargs=(connect, logger.getEffectiveLevel()),
+        )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self._processes} processes>"
+
+    def __enter__(self) -> "ShardedQueryRunner":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
+
+    def run(self, query: "_ApiMixin", client: "BomAnalyticsClient") -> "ResultBaseClass":
+        """Run a record-based query in the worker processes.
+
+        Each shard contains a whole number of batches, so the requests sent to Granta MI are the same as the requests
+        sent by :meth:`BomAnalyticsClient.run() <ansys.grantami.bomanalytics._connection.BomAnalyticsClient.run>`. If
+        the query contains a single batch of records, it is run in the current process.
+
+        Parameters
+        ----------
+        query
+            A record-based compliance or impacted substances query object.
+        client : :class:`~ansys.grantami.bomanalytics._connection.BomAnalyticsClient`
+            Connection which defines the database details and maximum specification-to-specification link depth to
+            use in the worker processes.
+
+        Returns
+        -------
+        Query Result
+            Specific result object based on the provided query, which contains either the compliance or impacted
+            substances results.
+
+        Raises
+        ------
+        TypeError
+            Error raised if the query is not a record-based query.
+        :class:`~ansys.grantami.bomanalytics.GrantaMIException`
+            Error raised if the server encounters an error while processing the query with a severity
+            of ``critical``.
+        """
+        from .queries import _RecordBasedQueryBuilder
+
+        if not isinstance(query, _RecordBasedQueryBuilder):
+            raise TypeError(f"Only record-based queries can be run in worker processes, not {type(query).__name__}.")
+        shard_bounds = self._shard_bounds(query._data._record_count, query._data.batch_size)
+        if len(shard_bounds) <= 1:
+            return client.run(query)
+
+        document = self._serializer._query_document(query)
+        settings = self._serializer.dump_connection_settings(client)
+        logger.info(f"Running query {query} in {len(shard_bounds)} shards")
+        futures = []
+        for start, stop in shard_bounds:
+            shard = {**document, "records": _slice_columns(document["records"], start, stop)}
+            futures.append(self._executor.submit(_run_shard, _dumps(shard), settings, client.retain_responses))
+        try:
+            results = [_load_shard_result(future.result()) for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Merging {len(results)} shard results")
+        return _merge_shard_results(results)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _shard_bounds(self, record_count: int, batch_size: Optional[int]) -> List[Tuple[int, int]]:
+        """Divide the records into at most one shard per process, with a whole number of batches in each shard."""
+        batch_size = batch_size or record_count or 1
+        batch_count = -(-record_count // batch_size)
+        shard_count = min(self._processes, batch_count)
+        bounds = []
+        for shard in range(shard_count):
+            first_batch = batch_count * shard // shard_count
+            last_batch = batch_count * (shard + 1) // shard_count
+            bounds.append((first_batch * batch_size, min(last_batch * batch_size, record_count)))
+        return bounds
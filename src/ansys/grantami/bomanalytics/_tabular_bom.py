@@ -0,0 +1,637 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Conversion of flat tabular data, such as CSV files and ERP exports, into BoMs."""
+
+from dataclasses import replace
+from itertools import chain
+from pathlib import Path
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Type,
+    Union,
+    cast,
+)
+from xml.etree.ElementTree import Element
+from xml.sax.saxutils import escape, quoteattr
+
+from ._allowed_types import _check_validation_level
+from ._bom_helper import BoMHandler, T, _mod_map
+from .bom_types._base_types import BaseType
+
+_ROW_FIELDS = (
+    "item_type",
+    "level",
+    "key",
+    "parent",
+    "part_number",
+    "part_name",
+    "quantity",
+    "quantity_unit",
+    "mass_per_unit_of_measure",
+    "mass_per_unit_of_measure_unit",
+    "percentage",
+    "mass",
+    "mass_unit",
+    "dimension_type",
+    "identity",
+    "name",
+    "external_identity",
+    "db_key",
+    "record_guid",
+    "record_history_guid",
+    "record_history_identity",
+)
+
+_ITEM_TYPES = {"part": "Part", "material": "Material", "substance": "Substance", "process": "Process"}
+
+# The list on the parent object to which each type of item is added
+_CHILD_LISTS = {"Part": "components", "Material": "materials", "Substance": "substances", "Process": "processes"}
+
+_INDENT = "    "
+
+
+class _Row(NamedTuple):
+    """A row converted into a BoM object, with the information which positions the object in the BoM."""
+
+    item: BaseType
+    item_type: str
+    row_number: int
+    level: Optional[int]
+    key: Optional[str]
+    parent: Optional[str]
+
+
+def _is_missing(value: Any) -> bool:
+    # NaN is used for empty cells by pandas, and is the only value which is not equal to itself
+    return value is None or value != value or (isinstance(value, str) and not value.strip())
+
+
+class _RowParser:
+    """Converts rows into BoM objects of a specific BoM version."""
+
+    __slots__ = ("_module", "_columns", "_db_key", "_dimension_types", "_reference_type")
+
+    def __init__(self, module: ModuleType, columns: Dict[str, str], db_key: str) -> None:
+        self._module = module
+        self._columns = columns
+        self._db_key = db_key
+        self._dimension_types = {member.name.lower(): member for member in module.DimensionType}
+        # BoM versions which extend record references require the extended type, so that the BoM is equal to the same
+        # BoM loaded from XML
+        self._reference_type: Callable[..., BaseType] = getattr(
+            module, "ExtendedMIRecordReference", module.MIRecordReference
+        )
+
+    def parse(self, row: Mapping[str, Any], row_number: int) -> _Row:
+        columns = self._columns
+        module = self._module
+
+        def get_text(field: str) -> Optional[str]:
+            value = row.get(columns[field])
+            return None if _is_missing(value) else str(value).strip()
+
+        def get_number(field: str) -> Optional[float]:
+            value: Any = row.get(columns[field])
+            if _is_missing(value):
+                return None
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                raise ValueError(
+                    f"Row {row_number}: value '{value}' of '{columns[field]}' is not a valid number."
+                ) from None
+
+        def get_integer(field: str) -> Optional[int]:
+            number = get_number(field)
+            if number is None:
+                return None
+            if not number.is_integer():
+                raise ValueError(f"Row {row_number}: value '{number}' of '{columns[field]}' is not a valid integer.")
+            return int(number)
+
+        def get_unitted_value(field: str, unit_field: str) -> Any:
+            value = get_number(field)
+            if value is None:
+                return None
+            return module.UnittedValue(value=value, unit=get_text(unit_field))
+
+        item_type_text = get_text("item_type") or "Part"
+        item_type = _ITEM_TYPES.get(item_type_text.lower())
+        if item_type is None:
+            raise ValueError(
+                f"Row {row_number}: item type '{item_type_text}' is not supported. Specify one of 'Part', 'Material', "
+                f"'Substance' or 'Process'."
+            )
+
+        record_guid = get_text("record_guid")
+        record_history_guid = get_text("record_history_guid")
+        record_history_identity = get_integer("record_history_identity")
+        reference: Optional[BaseType] = None
+        if record_guid is not None or record_history_guid is not None or record_history_identity is not None:
+            reference = self._reference_type(
+                db_key=get_text("db_key") or self._db_key,
+                record_guid=record_guid,
+                record_history_guid=record_history_guid,
+                record_history_identity=record_history_identity,
+            )
+
+        item: BaseType
+        key = get_text("key")
+        if item_type == "Part":
+            part_number = get_text("part_number")
+            if part_number is None:
+                raise ValueError(f"Row {row_number}: Part items must have a part number.")
+            item = module.Part(
+                part_number=part_number,
+                part_name=get_text("part_name"),
+                quantity=get_unitted_value("quantity", "quantity_unit"),
+                mass_per_unit_of_measure=get_unitted_value("mass_per_unit_of_measure", "mass_per_unit_of_measure_unit"),
+                mi_part_reference=reference,
+                external_identity=get_text("external_identity"),
+            )
+            if key is None:
+                key = part_number
+        else:
+            if reference is None:
+                raise ValueError(
+                    f"Row {row_number}: {item_type} items must reference a Granta MI record by record GUID, record "
+                    f"history GUID, or record history identity."
+                )
+            common_fields = {
+                "identity": get_text("identity"),
+                "name": get_text("name"),
+                "external_identity": get_text("external_identity"),
+                "percentage": get_number("percentage"),
+            }
+            if item_type == "Material":
+                item = module.Material(
+                    mi_material_reference=reference, mass=get_unitted_value("mass", "mass_unit"), **common_fields
+                )
+            elif item_type == "Substance":
+                item = module.Substance(mi_substance_reference=reference, **common_fields)
+            else:
+                dimension_type_text = get_text("dimension_type") or "Mass"
+                dimension_type = self._dimension_types.get(dimension_type_text.lower())
+                if dimension_type is None:
+                    raise ValueError(
+                        f"Row {row_number}: dimension type '{dimension_type_text}' is not supported. Specify one of "
+                        f"{', '.join(repr(member.name) for member in module.DimensionType)}."
+                    )
+                item = module.Process(
+                    mi_process_reference=reference,
+                    dimension_type=dimension_type,
+                    quantity=get_unitted_value("quantity", "quantity_unit"),
+                    **common_fields,
+                )
+        return _Row(item, item_type, row_number, get_integer("level"), key, get_text("parent"))
+
+
+def _attach(parent: BaseType, row: _Row) -> None:
+    children = getattr(parent, _CHILD_LISTS[row.item_type], None)
+    if children is None:
+        raise ValueError(f"Row {row.row_number}: a {row.item_type} cannot be added to a {type(parent).__name__}.")
+    children.append(row.item)
+
+
+def _check_row_mode(row: _Row, uses_levels: bool) -> None:
+    if (row.level is not None) != uses_levels:
+        state = "missing" if uses_levels else "specified"
+        raise ValueError(
+            f"Row {row.row_number}: BoM level is {state}. Either all rows or no rows must specify a BoM level."
+        )
+
+
+def _check_level(row: _Row, depth: int) -> int:
+    level = cast(int, row.level)
+    if not 1 <= level <= depth:
+        raise ValueError(
+            f"Row {row.row_number}: BoM level {level} is not valid. Levels start at 1, and must be at most one more "
+            f"than the level of the previous row."
+        )
+    return level
+
+
+class _PartFrame:
+    """A part which is being written, and the materials, substances, and processes which are not yet written."""
+
+    __slots__ = ("part", "depth", "has_components")
+
+    def __init__(self, part: BaseType, depth: int) -> None:
+        self.part = part
+        self.depth = depth
+        self.has_components = False
+
+
+class _StreamingBoMWriter:
+    """
+    Writes a BoM in XML form as items are received in document order.
+
+    Each part is converted to XML with the schema-aware BoM writer, but child parts are written as they are received
+    instead of being added to the parent part. Only the parts on the path from the root to the current item, and the
+    materials, substances, and processes of these parts, are held in memory.
+    """
+
+    def __init__(self, bom_handler: BoMHandler, bom: BaseType, write: Callable[[str], Any], validation: str):
+        self._bom_handler = bom_handler
+        self._bom = bom
+        self._write = write
+        self._validation = validation
+        schema = bom_handler._get_xmlschema_for_bom(cast(Any, bom))
+        self._prefixes = {
+            namespace: prefix for prefix, namespace in schema.namespaces.items() if prefix not in ("", "xml", "xsd")
+        }
+        self._names: Dict[str, str] = {}
+        namespace = bom.namespace
+        self._components_tag = self._qualify(f"{{{namespace}}}Components")
+        self._part_number_tag = f"{{{namespace}}}PartNumber"
+        self._path: List[tuple[BaseType, Optional[_PartFrame]]] = [(bom, None)]
+        self.part_count = 0
+
+    def _qualify(self, name: str) -> str:
+        try:
+            return self._names[name]
+        except KeyError:
+            pass
+        if name[0] == "{":
+            namespace, _, local_name = name[1:].partition("}")
+            try:
+                qualified_name = f"{self._prefixes[namespace]}:{local_name}"
+            except KeyError:
+                raise ValueError(f"Namespace {namespace} is not defined in the BoM XML schema.") from None
+        else:
+            qualified_name = name
+        self._names[name] = qualified_name
+        return qualified_name
+
+    def start(self) -> None:
+        declarations = "".join(
+            f" xmlns:{prefix}={quoteattr(namespace)}" for namespace, prefix in self._prefixes.items()
+        )
+        self._write(f"<{self._qualify(f'{{{self._bom.namespace}}}PartsEco')}{declarations}>\n")
+        self._write(f"{_INDENT}<{self._components_tag}>\n")
+
+    def add(self, row: _Row) -> None:
+        path = self._path
+        level = _check_level(row, len(path))
+        while len(path) > level:
+            self._close(path.pop()[1])
+        parent, parent_frame = path[-1]
+        if row.item_type != "Part":
+            _attach(parent, row)
+            path.append((row.item, None))
+            return
+        if parent_frame is not None:
+            self._start_components(parent_frame)
+            depth = parent_frame.depth + 2
+        elif parent is self._bom:
+            depth = 2
+        else:
+            raise ValueError(f"Row {row.row_number}: a Part cannot be added to a {type(parent).__name__}.")
+        path.append((row.item, _PartFrame(row.item, depth)))
+        self.part_count += 1
+
+    def finish(self) -> None:
+        while len(self._path) > 1:
+            self._close(self._path.pop()[1])
+        self._write(f"{_INDENT}</{self._components_tag}>\n</{self._qualify(f'{{{self._bom.namespace}}}PartsEco')}>\n")
+
+    def write_part(self, part: BaseType) -> None:
+        """Write a complete root part and all its children."""
+        self._write_element(self._encode_part(part), 2)
+        parts = [part]
+        while parts:
+            self.part_count += 1
+            parts.extend(cast(Any, parts.pop()).components)
+
+    def _start_components(self, frame: _PartFrame) -> None:
+        if frame.has_components:
+            return
+        # Materials, substances, and processes are written after the child parts, so they are removed from the part
+        # header
+        header = self._encode_part(replace(cast(Any, frame.part), materials=[], substances=[], processes=[]))
+        indent = _INDENT * frame.depth
+        self._write(f"{indent}<{self._qualify(header.tag)}{self._format_attributes(header)}>\n")
+        for child in header:
+            self._write_element(child, frame.depth + 1)
+        self._write(f"{indent}{_INDENT}<{self._components_tag}>\n")
+        frame.has_components = True
+
+    def _close(self, frame: Optional[_PartFrame]) -> None:
+        if frame is None:
+            return
+        if not frame.has_components:
+            self._write_element(self._encode_part(frame.part), frame.depth)
+            return
+        indent = _INDENT * frame.depth
+        self._write(f"{indent}{_INDENT}</{self._components_tag}>\n")
+        part = cast(Any, frame.part)
+        if part.materials or part.substances or part.processes:
+            tail = self._encode_part(
+                type(part)(
+                    part_number=part.part_number,
+                    materials=part.materials,
+                    substances=part.substances,
+                    processes=part.processes,
+                )
+            )
+            for child in tail:
+                if child.tag != self._part_number_tag:
+                    self._write_element(child, frame.depth + 1)
+        self._write(f"{indent}</{self._qualify(f'{{{self._bom.namespace}}}Part')}>\n")
+
+    def _encode_part(self, part: BaseType) -> Element:
+        bom = cast(Any, type(self._bom))(components=[part])
+        root = self._bom_handler._encode_bom(cast(Any, bom), self._validation)
+        return root[0][0]
+
+    def _format_attributes(self, element: Element) -> str:
+        return "".join(f" {self._qualify(name)}={quoteattr(value)}" for name, value in element.attrib.items())
+
+    def _write_element(self, element: Element, depth: int) -> None:
+        output: List[str] = []
+        stack: List[tuple[Element, int, bool]] = [(element, depth, False)]
+        while stack:
+            current, current_depth, is_end = stack.pop()
+            indent = _INDENT * current_depth
+            tag = self._qualify(current.tag)
+            if is_end:
+                output.append(f"{indent}</{tag}>\n")
+            elif len(current) > 0:
+                output.append(f"{indent}<{tag}{self._format_attributes(current)}>\n")
+                stack.append((current, current_depth, True))
+                stack.extend((child, current_depth + 1, False) for child in reversed(current))
+            elif current.text:
+                output.append(f"{indent}<{tag}{self._format_attributes(current)}>{escape(current.text)}</{tag}>\n")
+            else:
+                output.append(f"{indent}<{tag}{self._format_attributes(current)} />\n")
+        self._write("".join(output))
+
+
+class TabularBoMBuilder(Generic[T]):
+    def __init__(
+        self,
+        bom_type: Type[T],
+        columns: Optional[Mapping[str, str]] = None,
+        db_key: str = "MI_Restricted_Substances",
+    ):
+        """
+        Builder for BoMs defined by flat rows of data, such as CSV files and exports from ERP or PLM systems.
+
+        Each row defines a single part, material, substance, or process. The position of each item in the BoM is
+        defined in one of two ways:
+
+        * **BoM level**: Rows are in document order, and each row specifies the level of its item in the BoM. Root
+          parts have level 1. The parent of an item at level *n* is the last preceding item at level *n-1*.
+        * **Parent key**: Each row specifies the key of its parent item, or no parent for root parts. The key of an
+          item is specified in the ``key`` field, and defaults to the part number for parts. Rows can be in any order,
+          and items are linked to their parents by looking up the parent key in a hash table.
+
+        If any row specifies a BoM level, all rows must specify a BoM level.
+
+        Rows are processed in a single pass, in time proportional to the number of rows. When a BoM is written to XML
+        with :meth:`write_xml` from rows which specify BoM levels, each part is written when all its child items have
+        been read, and only the items on the path from the root part to the current row are held in memory. BoMs with
+        millions of rows can therefore be written with bounded memory. Rows which use parent keys are linked into a
+        complete BoM before the BoM is written.
+
+        Rows are mappings from column names to values, such as the dictionaries produced by :class:`csv.DictReader`
+        or :meth:`pandas.DataFrame.to_dict` with ``orient="records"``. Values can be strings or numbers. Empty strings,
+        ``None``, and ``NaN`` values are treated as missing. The following fields are read from each row:
+
+        * ``item_type``: ``Part``, ``Material``, ``Substance``, or ``Process``. Case-insensitive, and defaults to
+          ``Part``.
+        * ``level``: BoM level of the item.
+        * ``key`` and ``parent``: Key of the item and of its parent.
+        * ``part_number``, ``part_name``: Part number and name of a part. A part number is required for parts.
+        * ``quantity``, ``quantity_unit``: Quantity of a part or a process.
+        * ``mass_per_unit_of_measure``, ``mass_per_unit_of_measure_unit``: Mass per unit of measure of a part.
+        * ``percentage``: Percentage of a material, substance, or process.
+        * ``mass``, ``mass_unit``: Mass of a material.
+        * ``dimension_type``: Dimension type of a process. Defaults to ``Mass``.
+        * ``identity``, ``name``, ``external_identity``: Identifying information for the item.
+        * ``db_key``, ``record_guid``, ``record_history_guid``, ``record_history_identity``: Reference to a Granta MI
+          record. A record reference is required for materials, substances, and processes.
+
+        .. versionadded:: 2.5
+
+        Parameters
+        ----------
+        bom_type : Type[:class:`.eco2505.BillOfMaterials`] | Type[:class:`.eco2412.BillOfMaterials`] | \
+                   Type[:class:`.eco2301.BillOfMaterials`]
+            The type of BoM to build.
+        columns : Mapping[str, str], optional
+            Names of the columns which contain each field, if they differ from the field names. For example,
+            ``{"part_number": "Part No.", "level": "BoM Level"}``.
+        db_key : str, default: "MI_Restricted_Substances"
+            Database key used for record references in rows which do not specify a database key.
+
+        Raises
+        ------
+        ValueError
+            If ``bom_type`` is not a supported BoM type, or ``columns`` contains a name which is not a field name.
+
+        Examples
+        --------
+        >>> builder = TabularBoMBuilder(eco2505.BillOfMaterials, columns={"part_number": "ID", "level": "BoM Level"})
+        >>> with open("bom.csv", newline="") as f:
+        ...     bom = builder.build(csv.DictReader(f))
+        """
+        try:
+            module = _mod_map[bom_type]
+        except KeyError:
+            raise ValueError(f"{bom_type} is not a supported BoM type.") from None
+        unknown_fields = set(columns or {}).difference(_ROW_FIELDS)
+        if unknown_fields:
+            raise ValueError(
+                f"Column names were specified for unknown fields: {', '.join(sorted(unknown_fields))}. Valid fields "
+                f"are: {', '.join(_ROW_FIELDS)}."
+            )
+        self._bom_type: Type[T] = bom_type
+        self._parser = _RowParser(module, {field: (columns or {}).get(field, field) for field in _ROW_FIELDS}, db_key)
+        self._bom_handler: Optional[BoMHandler] = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self._bom_type.__module__}.{self._bom_type.__name__}>"
+
+    def _parse_rows(self, rows: Iterable[Mapping[str, Any]]) -> Iterator[_Row]:
+        parse = self._parser.parse
+        for row_number, row in enumerate(rows, start=1):
+            yield parse(row, row_number)
+
+    def build(self, rows: Iterable[Mapping[str, Any]]) -> T:
+        """
+        Build a BillOfMaterials object from rows.
+
+        Parameters
+        ----------
+        rows : Iterable[Mapping[str, Any]]
+            Rows which define the items in the BoM. Rows are consumed in a single pass, so an iterator can be used.
+
+        Returns
+        -------
+        :class:`.eco2505.BillOfMaterials` | :class:`.eco2412.BillOfMaterials` | :class:`.eco2301.BillOfMaterials`
+            The BoM defined by the rows.
+
+        Raises
+        ------
+        ValueError
+            If a row is not valid, if the rows do not define a valid hierarchy, or if the rows do not define any parts.
+        """
+        bom = self._bom_type(components=[])
+        parsed_rows = self._parse_rows(rows)
+        first_row = next(parsed_rows, None)
+        if first_row is None:
+            raise ValueError("The rows do not define any parts.")
+        all_rows = chain([first_row], parsed_rows)
+        if first_row.level is not None:
+            path: List[BaseType] = [bom]
+            for row in all_rows:
+                _check_row_mode(row, uses_levels=True)
+                del path[_check_level(row, len(path)) :]
+                _attach(path[-1], row)
+                path.append(row.item)
+        else:
+            bom.components.extend(cast(Any, self._link_rows(all_rows)))
+        return bom
+
+    @staticmethod
+    def _link_rows(rows: Iterable[_Row]) -> List[BaseType]:
+        """
+        Link rows to their parents by parent key, and return the root parts.
+
+        Rows whose parent has not yet been read are held until the parent is read, so rows can be in any order.
+        """
+        items_by_key: Dict[str, BaseType] = {}
+        waiting_rows: Dict[str, List[_Row]] = {}
+        root_parts: List[BaseType] = []
+        row_count = 0
+        for row in rows:
+            _check_row_mode(row, uses_levels=False)
+            row_count += 1
+            if row.parent is None:
+                if row.item_type != "Part":
+                    raise ValueError(f"Row {row.row_number}: {row.item_type} items must have a parent.")
+                root_parts.append(row.item)
+            else:
+                parent = items_by_key.get(row.parent)
+                if parent is None:
+                    waiting_rows.setdefault(row.parent, []).append(row)
+                else:
+                    _attach(parent, row)
+            if row.key is not None:
+                if row.key in items_by_key:
+                    raise ValueError(f"Row {row.row_number}: key '{row.key}' is used by more than one item.")
+                items_by_key[row.key] = row.item
+                for child_row in waiting_rows.pop(row.key, []):
+                    _attach(row.item, child_row)
+        if waiting_rows:
+            key, unlinked_rows = next(iter(waiting_rows.items()))
+            raise ValueError(f"Row {unlinked_rows[0].row_number}: no item has the parent key '{key}'.")
+        if not root_parts:
+            raise ValueError("The rows do not define any parts.")
+
+        # Items whose parents form a cycle are linked to each other, but not to a root part
+        linked_count = 0
+        stack: List[Any] = list(root_parts)
+        while stack:
+            item = stack.pop()
+            linked_count += 1
+            for list_name in _CHILD_LISTS.values():
+                stack.extend(getattr(item, list_name, ()))
+        if linked_count != row_count:
+            raise ValueError(
+                f"{row_count - linked_count} rows are not linked to a root part, because their parent keys form a "
+                f"cycle."
+            )
+        return root_parts
+
+    def write_xml(self, rows: Iterable[Mapping[str, Any]], file: Union[Path, TextIO], validation: str = "lax") -> int:
+        """
+        Write the BoM defined by rows to XML.
+
+        If the rows specify BoM levels, each part is written as soon as all its child items have been read, and the
+        complete BoM is never held in memory. If a row is not valid, the rows which precede it have already been
+        written, and the output is incomplete.
+
+        Parameters
+        ----------
+        rows : Iterable[Mapping[str, Any]]
+            Rows which define the items in the BoM. Rows are consumed in a single pass, so an iterator can be used.
+        file : pathlib.Path | TextIO
+            The path of the file to write, or a text stream to write to.
+        validation : str, default: "lax"
+            The level of validation to perform against the BoM XML schema. Each part is validated as it is written.
+            See :meth:`.BoMHandler.dump_bom` for the available levels. Use ``"none"`` for the fastest conversion.
+
+        Returns
+        -------
+        int
+            The number of parts written.
+
+        Raises
+        ------
+        ValueError
+            If a row is not valid, if the rows do not define a valid hierarchy, if the rows do not define any parts,
+            or if a part is not valid according to the BoM XML schema.
+        ValueError
+            If the ``validation`` argument is not a valid validation level.
+        """
+        _check_validation_level(validation)
+        if isinstance(file, Path):
+            with open(file, "w", encoding="utf-8") as f:
+                return self._write_xml(rows, f, validation)
+        return self._write_xml(rows, file, validation)
+
+    def _write_xml(self, rows: Iterable[Mapping[str, Any]], file: TextIO, validation: str) -> int:
+        if self._bom_handler is None:
+            self._bom_handler = BoMHandler()
+        bom = self._bom_type(components=[])
+        writer = _StreamingBoMWriter(self._bom_handler, bom, file.write, validation)
+        parsed_rows = self._parse_rows(rows)
+        first_row = next(parsed_rows, None)
+        if first_row is None:
+            raise ValueError("The rows do not define any parts.")
+        all_rows = chain([first_row], parsed_rows)
+        if first_row.level is not None:
+            writer.start()
+            for row in all_rows:
+                _check_row_mode(row, uses_levels=True)
+                writer.add(row)
+        else:
+            root_parts = self._link_rows(all_rows)
+            writer.start()
+            for part in root_parts:
+                writer.write_part(part)
+        writer.finish()
+        return writer.part_count
@@ -23,7 +23,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Protocol, Tuple
+from typing import Any, Dict, Iterable, List, NoReturn, Protocol, Tuple
 
 
 @dataclass(frozen=True)
@@ -39,6 +39,8 @@ class HasNamespace(Protocol):
     Protocol defining that an inheritor has an attribute *namespace*.
     """
 
+    __slots__ = ()
+
     namespace: str
 
 
@@ -47,6 +49,8 @@ class SupportsCustomFields(Protocol):
     Protocol defining that an inheritor has methods to process and write custom fields.
     """
 
+    __slots__ = ()
+
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: Any) -> Dict[str, Any]: ...
 
@@ -73,8 +77,15 @@ class BaseType(HasNamespace, SupportsCustomFields):
         Mapping from XML namespace prefix to namespace URI.
     namespace : str
         XML Namespace URI for the object, should exist as a value in the ``_namespaces`` map.
+
+    Notes
+    -----
+    Subclasses are slotted dataclasses, so instances have no ``__dict__``. ``dataclass(slots=True)`` replaces the
+    decorated class, so methods of subclasses must call ``super()`` with explicit arguments.
     """
 
+    __slots__ = ()
+
     _props: List[Tuple[str, str, QualifiedXMLName]] = []
     _list_props: List[Tuple[str, str, QualifiedXMLName, QualifiedXMLName]] = []
     _simple_values: List[Tuple[str, QualifiedXMLName]] = []
@@ -117,3 +128,48 @@ class BaseType(HasNamespace, SupportsCustomFields):
         bom_writer: BaseBoMWriter
             Helper object that maintains information about the global namespaces.
         """
+
+
+class _SharedEmptyList(list):
+    """
+    Empty list which is shared between BoM objects, and which cannot be modified.
+
+    The list compares equal to any other empty list. Copying or pickling the list returns the shared instance.
+    """
+
+    __slots__ = ()
+
+    def _raise_immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(
+            "This empty list is shared between BoM objects and cannot be modified. Assign a new list to the field "
+            "instead."
+        )
+
+    append = _raise_immutable
+    extend = _raise_immutable
+    insert = _raise_immutable
+    remove = _raise_immutable
+    pop = _raise_immutable
+    clear = _raise_immutable
+    sort = _raise_immutable
+    reverse = _raise_immutable
+    __setitem__ = _raise_immutable
+    __delitem__ = _raise_immutable
+    __iadd__ = _raise_immutable
+    __imul__ = _raise_immutable
+
+    def __reduce__(self) -> Tuple[Any, Tuple]:
+        return _get_shared_empty_list, ()
+
+    def __copy__(self) -> "_SharedEmptyList":
+        return self
+
+    def __deepcopy__(self, memo: Dict) -> "_SharedEmptyList":
+        return self
+
+
+_SHARED_EMPTY_LIST = _SharedEmptyList()
+
+
+def _get_shared_empty_list() -> _SharedEmptyList:
+    return _SHARED_EMPTY_LIST
@@ -0,0 +1,264 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from typing import Any, Dict, Generic, Optional, Tuple, Type, TypeVar
+
+from ._base_types import BaseType, QualifiedXMLName
+from ._bom_reader import _GenericBoMReader
+from ._bom_writer import _GenericBoMWriter
+
+TBom = TypeVar("TBom", bound=BaseType)
+
+
+class _ConversionTable:
+    """
+    Mapping between the fields of a source type and the fields of a target type.
+
+    Fields are matched on their qualified XML name, with the source Eco namespace replaced by the target Eco
+    namespace. Fields without a match are converted via xmlschema dictionary form instead.
+    """
+
+    __slots__ = (
+        "simple_values",
+        "props",
+        "list_props",
+        "unmatched_simple_values",
+        "unmatched_props",
+        "unmatched_list_props",
+    )
+
+    def __init__(self) -> None:
+        # (source attribute, target attribute or None, source field name)
+        self.simple_values: list[Tuple[str, Optional[str], QualifiedXMLName]] = []
+        # (source attribute, target attribute or None, target type or None, source field name)
+        self.props: list[Tuple[str, Optional[str], Optional[Type[BaseType]], QualifiedXMLName]] = []
+        # (source attribute, target attribute or None, target type or None, source container and item names)
+        self.list_props: list[
+            Tuple[str, Optional[str], Optional[Type[BaseType]], QualifiedXMLName, QualifiedXMLName]
+        ] = []
+        # Target fields not populated by any source field, in the same format as the target type definition
+        self.unmatched_simple_values: list[Tuple[str, QualifiedXMLName]] = []
+        self.unmatched_props: list[Tuple[str, str, QualifiedXMLName]] = []
+        self.unmatched_list_props: list[Tuple[str, str, QualifiedXMLName, QualifiedXMLName]] = []
+
+
+class _PendingConversion:
+    """A target type whose children are still being converted."""
+
+    __slots__ = ("type_", "kwargs", "children", "unmatched", "target", "key")
+
+    def __init__(self, type_: Type[BaseType], target: Any, key: Any):
+        self.type_ = type_
+        self.kwargs: Dict[str, Any] = {}
+        self.children: list[Tuple[BaseType, Type[BaseType], Any, Any]] = []
+        self.unmatched: Dict[str, Any] = {}
+        self.target = target
+        self.key = key
+
+
+class _BoMConverter(Generic[TBom]):
+    def __init__(self, writer: _GenericBoMWriter, reader: _GenericBoMReader[TBom]):
+        """
+        Converts BillOfMaterials objects from one BoM version to another, without an intermediate dictionary.
+
+        The produced BoM and the fields reported as not deserialized are the same as when the source BoM is converted
+        to xmlschema dictionary form by the source writer, and the dictionary is read by the target reader. Fields
+        which are defined with the same qualified XML name on the source and target types are copied directly. Any
+        other fields, including those handled by ``_write_custom_fields`` and ``_process_custom_fields``, are converted
+        via dictionary form.
+
+        Parameters
+        ----------
+        writer: _GenericBoMWriter
+            Writer for the source BoM version.
+        reader: _GenericBoMReader
+            Reader for the target BoM version.
+        """
+        self._writer = writer
+        self._reader = reader
+        self._source_namespace = writer.target_namespace
+        self._target_namespace = reader.target_namespace
+        self._namespaces = {
+            prefix: self._target_namespace if namespace == self._source_namespace else namespace
+            for prefix, namespace in writer._schema.namespaces.items()
+        }
+        self._tables: Dict[Tuple[Type[BaseType], Type[BaseType]], _ConversionTable] = {}
+
+    def convert(self, bom: BaseType) -> Tuple[TBom, list[str]]:
+        """
+        Convert a BillOfMaterials object into a BillOfMaterials object of the target version.
+
+        The hierarchy is traversed depth-first with an explicit work stack, in the same way as the BoM reader.
+
+        Parameters
+        ----------
+        bom: BaseType
+            Source BillOfMaterials object.
+
+        Returns
+        -------
+        tuple[TBom, list]
+            A tuple containing the converted BillOfMaterials object, and any fields in the source BoM that could not be
+            converted.
+        """
+        reader = self._reader
+        reader._reset(self._namespaces)
+        root: list[Any] = [None]
+        stack = [self._expand_type(bom, reader._bom_type, root, 0)]
+        while stack:
+            pending = stack[-1]
+            if pending.children:
+                source_obj, child_type, target, key = pending.children.pop()
+                stack.append(self._expand_type(source_obj, child_type, target, key))
+                continue
+            stack.pop()
+            pending.kwargs.update(pending.type_._process_custom_fields(pending.unmatched, reader))
+            reader._append_unserialized_fields(pending.type_.__name__, pending.unmatched)
+            pending.target[pending.key] = pending.type_(**pending.kwargs)
+        converted_bom: TBom = root[0]
+        return converted_bom, reader._undeserialized_fields
+
+    def _expand_type(self, source_obj: BaseType, type_: Type[BaseType], target: Any, key: Any) -> "_PendingConversion":
+        table = self._get_table(type(source_obj), type_)
+        writer = self._writer
+        pending = _PendingConversion(type_, target, key)
+        kwargs = pending.kwargs
+        unmatched = pending.unmatched
+        children: list[Tuple[BaseType, Type[BaseType], Any, Any]] = []
+
+        for source_property_name, target_property_name, source_field_name in table.simple_values:
+            value = getattr(source_obj, source_property_name)
+            if target_property_name is not None:
+                kwargs[target_property_name] = value
+            elif value is not None:
+                unmatched[writer._generate_contextual_qualified_name(source_field_name)] = value
+        for source_property_name, target_property_name, child_type, source_field_name in table.props:
+            value = getattr(source_obj, source_property_name)
+            if value is None:
+                continue
+            if target_property_name is not None and child_type is not None:
+                children.append((value, child_type, kwargs, target_property_name))
+            else:
+                unmatched[writer._generate_contextual_qualified_name(source_field_name)] = writer._convert_to_dict(
+                    value
+                )
+        for source_property_name, target_property_name, item_type, container_name, item_name in table.list_props:
+            values = getattr(source_obj, source_property_name)
+            if values is None or len(values) == 0:
+                continue
+            if target_property_name is not None and item_type is not None:
+                items: list[Any] = [None] * len(values)
+                kwargs[target_property_name] = items
+                children.extend((value, item_type, items, idx) for idx, value in enumerate(values))
+            else:
+                container_field_name = writer._generate_contextual_qualified_name(container_name)
+                item_field_name = writer._generate_contextual_qualified_name(item_name)
+                unmatched[container_field_name] = {
+                    item_field_name: [writer._convert_to_dict(value) for value in values]
+                }
+        source_obj._write_custom_fields(unmatched, writer)
+
+        for target_property_name, _ in table.unmatched_simple_values:
+            # Consistent with the reader, which always populates simple values
+            kwargs[target_property_name] = None
+        if unmatched:
+            self._read_unmatched_fields(table, unmatched, kwargs)
+
+        children.reverse()
+        pending.children = children
+        return pending
+
+    def _read_unmatched_fields(self, table: _ConversionTable, obj: Dict[str, Any], kwargs: Dict[str, Any]) -> None:
+        """
+        Populate target fields with no equivalent source field from source fields in dictionary form.
+
+        This supports fields which are written with ``_write_custom_fields`` by the source type, and are declared
+        as standard fields on the target type.
+        """
+        reader = self._reader
+        for target_property_name, field_name in table.unmatched_simple_values:
+            value = reader.get_field(obj, field_name)
+            if value is not None:
+                kwargs[target_property_name] = value
+        for target_type, target_property_name, field_name in table.unmatched_props:
+            field_obj = reader.get_field(obj, field_name)
+            if field_obj is not None:
+                kwargs[target_property_name] = reader.create_type(target_type, field_obj)
+        for target_type, target_property_name, container_name, item_name in table.unmatched_list_props:
+            container_obj = reader.get_field(obj, container_name)
+            if container_obj is not None:
+                items_obj = reader.get_field(container_obj, item_name)
+                if items_obj is not None and len(items_obj) > 0:
+                    kwargs[target_property_name] = [reader.create_type(target_type, item) for item in items_obj]
+
+    def _get_table(self, source_type: Type[BaseType], target_type: Type[BaseType]) -> _ConversionTable:
+        try:
+            return self._tables[(source_type, target_type)]
+        except KeyError:
+            table = self._tables[(source_type, target_type)] = self._create_table(source_type, target_type)
+            return table
+
+    def _create_table(self, source_type: Type[BaseType], target_type: Type[BaseType]) -> _ConversionTable:
+        def key(field_name: QualifiedXMLName) -> Tuple[str, str]:
+            # Qualified names are compared by value, since subclasses of QualifiedXMLName never compare equal
+            namespace = field_name.namespace
+            if namespace == self._source_namespace:
+                namespace = self._target_namespace
+            return field_name.local_name, namespace
+
+        target_simple_values = {key(field_name): prop for prop, field_name in target_type._simple_values}
+        target_props = {key(field_name): (type_name, prop) for type_name, prop, field_name in target_type._props}
+        target_list_props = {
+            (key(container_name), key(item_name)): (type_name, prop)
+            for type_name, prop, container_name, item_name in target_type._list_props
+        }
+        class_members = self._reader._class_members
+
+        table = _ConversionTable()
+        for prop, field_name in source_type._simple_values:
+            target_prop = target_simple_values.pop(key(field_name), None)
+            table.simple_values.append((prop, target_prop, field_name))
+        for _, prop, field_name in source_type._props:
+            target_type_name, target_prop = target_props.pop(key(field_name), (None, None))
+            child_type = class_members[target_type_name] if target_type_name is not None else None
+            table.props.append((prop, target_prop, child_type, field_name))
+        for _, prop, container_name, item_name in source_type._list_props:
+            target_type_name, target_prop = target_list_props.pop((key(container_name), key(item_name)), (None, None))
+            item_type = class_members[target_type_name] if target_type_name is not None else None
+            table.list_props.append((prop, target_prop, item_type, container_name, item_name))
+
+        table.unmatched_simple_values = [
+            (prop, field_name)
+            for prop, field_name in target_type._simple_values
+            if key(field_name) in target_simple_values
+        ]
+        table.unmatched_props = [
+            (type_name, prop, field_name)
+            for type_name, prop, field_name in target_type._props
+            if key(field_name) in target_props
+        ]
+        table.unmatched_list_props = [
+            (type_name, prop, container_name, item_name)
+            for type_name, prop, container_name, item_name in target_type._list_props
+            if (key(container_name), key(item_name)) in target_list_props
+        ]
+        return table
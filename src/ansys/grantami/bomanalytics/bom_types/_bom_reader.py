@@ -22,21 +22,36 @@
 
 import inspect
 from types import ModuleType
-from typing import Any, Dict, Generic, Iterable, Type, TypeVar
-
-from xmlschema import XMLSchema
+from typing import TYPE_CHECKING, Any, Dict, Generic, Type, TypeVar
 
 from ._base_types import BaseType, QualifiedXMLName
 
+if TYPE_CHECKING:
+    from xmlschema import XMLSchema
+
 TBom = TypeVar("TBom", bound=BaseType)
 TAny = TypeVar("TAny", bound=BaseType)
 
 
+class _PendingType:
+    """A type whose children are still being deserialized by the reader."""
+
+    __slots__ = ("type_", "obj", "kwargs", "children", "target", "key")
+
+    def __init__(self, type_: Type[BaseType], obj: Dict, target: Any, key: Any):
+        self.type_ = type_
+        self.obj = obj
+        self.kwargs: Dict[str, Any] = {}
+        self.children: list[tuple[str, Dict, Any, Any]] = []
+        self.target = target
+        self.key = key
+
+
 class _GenericBoMReader(Generic[TBom]):
     _namespaces: dict[str, str]
     _class_members: Dict[str, Type[BaseType]]
     _bom_type: Type[TBom]
-    _schema: XMLSchema
+    _schema: "XMLSchema"
 
     def __init_subclass__(cls, xml_type_modules: list[ModuleType], bom_type: Type[TBom]):
         """
@@ -54,7 +69,7 @@ class _GenericBoMReader(Generic[TBom]):
             )
         cls._bom_type = bom_type
 
-    def __init__(self, schema: XMLSchema):
+    def __init__(self, schema: "XMLSchema"):
         """
         Reader to convert a JSON formatted BoM, created by xmlschema, into a populated BillOfMaterials object.
 
@@ -103,14 +118,31 @@ class _GenericBoMReader(Generic[TBom]):
                 _, prefix = k.split(":")
                 namespaces[prefix] = v
 
-        self._namespaces = namespaces
+        self._reset(namespaces)
 
         bom = self._create_type(self._bom_type, obj)
         return bom, self.__undeserialized_fields
 
+    def _reset(self, namespaces: Dict[str, str]) -> None:
+        """
+        Prepare the reader to deserialize a new BoM.
+
+        Parameters
+        ----------
+        namespaces : Dict[str, str]
+            Mapping from the namespace prefixes used in the source dictionary to namespace URIs.
+        """
+        self._namespaces = namespaces
+        self.__undeserialized_fields = []
+
+    @property
+    def _undeserialized_fields(self) -> list[str]:
+        """Fields which have not been deserialized since the reader was last reset."""
+        return self.__undeserialized_fields
+
     def create_type(self, type_name: str, obj: Dict) -> BaseType:
         """
-        Recursively deserialize a dictionary of XML fields to a hierarchy of Python objects.
+        Deserialize a dictionary of XML fields to a hierarchy of Python objects.
 
         Keeps track of any fields which have not been deserialized, so they can be optionally reported to the user
         following deserialization.
@@ -127,49 +159,57 @@ class _GenericBoMReader(Generic[TBom]):
         return self._create_type(target_type, obj)
 
     def _create_type(self, type_: Type[TAny], obj: Dict) -> TAny:
-        local_obj = obj.copy()
+        """
+        Deserialize a dictionary of XML fields to a hierarchy of Python objects.
+
+        The hierarchy is traversed depth-first with an explicit work stack instead of recursion, so the depth of the
+        BoM is not limited by the Python recursion limit. Objects are instantiated once all their children have been
+        instantiated.
+        """
+        root: list[Any] = [None]
+        stack = [self._expand_type(type_, obj, root, 0)]
+        while stack:
+            pending = stack[-1]
+            if pending.children:
+                child_type_name, child_obj, target, key = pending.children.pop()
+                child_type = self._class_members[child_type_name]
+                stack.append(self._expand_type(child_type, child_obj, target, key))
+                continue
+            stack.pop()
+            pending.kwargs.update(pending.type_._process_custom_fields(pending.obj, self))
+            self._append_unserialized_fields(pending.type_.__name__, pending.obj)
+            pending.target[pending.key] = pending.type_(**pending.kwargs)
+        instance: TAny = root[0]
+        return instance
+
+    def _expand_type(self, type_: Type[BaseType], obj: Dict, target: Any, key: Any) -> "_PendingType":
+        """
+        Extract the simple values and child objects for a type from a dictionary of XML fields.
 
-        kwargs = {}
+        Child objects are returned in the order they must be processed, last item first, together with the container
+        and key under which each child instance must be stored.
+        """
+        pending = _PendingType(type_, obj.copy(), target, key)
+        local_obj = pending.obj
+        kwargs = pending.kwargs
+        children: list[tuple[str, Dict, Any, Any]] = []
         for target_type, target_property_name, field_name in type_._props:
-            kwargs.update(self._deserialize_single_type(local_obj, target_type, target_property_name, field_name))
+            field_obj = self.get_field(local_obj, field_name)
+            if field_obj is not None:
+                children.append((target_type, field_obj, kwargs, target_property_name))
         for target_type, target_property_name, container_name, item_name in type_._list_props:
-            kwargs.update(
-                self._deserialize_list_type(local_obj, target_type, target_property_name, container_name, item_name)
-            )
+            container_obj = self.get_field(local_obj, container_name)
+            if container_obj is not None:
+                items_obj = self.get_field(container_obj, item_name)
+                if items_obj is not None and len(items_obj) > 0:
+                    items: list[Any] = [None] * len(items_obj)
+                    kwargs[target_property_name] = items
+                    children.extend((target_type, item_obj, items, idx) for idx, item_obj in enumerate(items_obj))
         for target, field_name in type_._simple_values:
-            field_obj = self.get_field(local_obj, field_name)
-            kwargs[target] = field_obj
-        kwargs.update(type_._process_custom_fields(local_obj, self))
-        self._append_unserialized_fields(type_.__name__, local_obj)
-        instance = type_(**kwargs)
-        return instance
-
-    def _deserialize_list_type(
-        self,
-        obj: Dict,
-        target_type: str,
-        target_property_name: str,
-        container_name: QualifiedXMLName,
-        item_name: QualifiedXMLName,
-    ) -> Dict[str, Iterable]:
-        container_obj = self.get_field(obj, container_name)
-        if container_obj is not None:
-            items_obj = self.get_field(container_obj, item_name)
-            if items_obj is not None and len(items_obj) > 0:
-                return {target_property_name: [self.create_type(target_type, item_dict) for item_dict in items_obj]}
-        return {}
-
-    def _deserialize_single_type(
-        self,
-        obj: Dict,
-        target_type: str,
-        target_property_name: str,
-        field_name: QualifiedXMLName,
-    ) -> Dict[str, Any]:
-        field_obj = self.get_field(obj, field_name)
-        if field_obj is not None:
-            return {target_property_name: self.create_type(target_type, field_obj)}
-        return {}
+            kwargs[target] = self.get_field(local_obj, field_name)
+        children.reverse()
+        pending.children = children
+        return pending
 
     def _append_unserialized_fields(self, type_name: str, obj: Dict) -> None:
         for k, v in obj.items():
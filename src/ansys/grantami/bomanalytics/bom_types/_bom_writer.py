@@ -20,31 +20,65 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import TYPE_CHECKING, Dict, Generic, TypeVar, cast
+import inspect
+from types import ModuleType
+from typing import TYPE_CHECKING, Dict, Generic, Optional, Type, TypeVar, cast
 
-from xmlschema import XMLSchema
-
-from ._base_types import QualifiedXMLName
+from ._base_types import BaseType, QualifiedXMLName
 
 if TYPE_CHECKING:
-    from ._base_types import BaseType
+    from xmlschema import XMLSchema
 
 T = TypeVar("T", bound="BaseType")
 
 
 class _GenericBoMWriter(Generic[T]):
-    _schema: XMLSchema
+    _class_members: Dict[str, Type[BaseType]] = {}
+    _schema: "XMLSchema"
+    _qualified_names: Dict[QualifiedXMLName, str]
+
+    def __init_subclass__(cls, xml_type_modules: Optional[list[ModuleType]] = None):
+        """
+        Bind this generic class to a specific set of xml types.
+
+        xml_type_modules : list[ModuleType], optional
+            A list of modules for which the contained classes should be registered as XML types. The qualified names
+            used by these types are generated once when the writer is initialized, instead of for each serialized
+            field.
+        """
+        cls._class_members = {}
+        for xml_type_module in xml_type_modules or []:
+            cls._class_members.update(
+                {k: v for k, v in inspect.getmembers(xml_type_module, inspect.isclass) if issubclass(v, BaseType)}
+            )
 
-    def __init__(self, schema: XMLSchema):
+    def __init__(self, schema: "XMLSchema"):
         """
         Writer to convert BillOfMaterials objects into the format ready for XML serialization.
 
         Parameters
         ----------
         schema: XMLSchema
-            Parsed XMLSchema representing a valid Eco BoM format
+            Parsed XMLSchema representing a valid Eco BoM format. The namespace prefixes defined on the schema must not
+            be modified after the writer has been created.
         """
         self._schema = schema
+        self._qualified_names = {}
+        for type_ in self._class_members.values():
+            for field_name in self._get_declared_field_names(type_):
+                try:
+                    self._generate_contextual_qualified_name(field_name)
+                except KeyError:
+                    # Names which cannot be resolved with this schema are reported if and when they are used.
+                    pass
+
+    @staticmethod
+    def _get_declared_field_names(type_: Type[BaseType]) -> list[QualifiedXMLName]:
+        field_names = [field_name for _, field_name in type_._simple_values]
+        field_names.extend(field_name for _, _, field_name in type_._props)
+        for _, _, container_name, item_name in type_._list_props:
+            field_names.extend((container_name, item_name))
+        return field_names
 
     @property
     def target_namespace(self) -> str:
@@ -60,7 +94,17 @@ class _GenericBoMWriter(Generic[T]):
         """
         Convert a QualifiedXMLName object into a qualified name, including the relevant prefix for the current
         serialization operation.
+
+        Results are memoized per writer, since the namespace prefixes are fixed by the schema.
         """
+        try:
+            return self._qualified_names[field_name]
+        except KeyError:
+            qualified_name = self._resolve_qualified_name(field_name)
+            self._qualified_names[field_name] = qualified_name
+            return qualified_name
+
+    def _resolve_qualified_name(self, field_name: QualifiedXMLName) -> str:
         namespace_prefixes = [k for k, v in self._schema.namespaces.items() if v == field_name.namespace]
         if len(namespace_prefixes) == 1:
             namespace_prefix = namespace_prefixes[0]
@@ -77,28 +121,37 @@ class _GenericBoMWriter(Generic[T]):
         return f"{namespace_prefix}:{field_name.local_name}"
 
     def _convert_to_dict(self, obj: "BaseType") -> Dict:
-        value = {}
-
-        for prop, field_name in obj._simple_values:
-            prop_value = getattr(obj, prop)
-            if prop_value is not None:
-                value[self._generate_contextual_qualified_name(field_name)] = prop_value
-        for _, prop, item_name in obj._props:
-            prop_value = getattr(obj, prop)
-            if prop_value is not None:
-                prop_value = self._convert_to_dict(cast("BaseType", prop_value))
-                value[self._generate_contextual_qualified_name(item_name)] = prop_value
-        for _, prop, container_name, item_name in obj._list_props:
-            prop_value = getattr(obj, prop)
-            if prop_value is not None and len(prop_value) > 0:
-                prop_value = {
-                    self._generate_contextual_qualified_name(item_name): [
-                        self._convert_to_dict(item_obj) for item_obj in prop_value
-                    ]
-                }
-                value[self._generate_contextual_qualified_name(container_name)] = prop_value
-        obj._write_custom_fields(value, self)
-        return value
+        """
+        Convert an object and all its children into xmlschema dictionary form.
+
+        The hierarchy is traversed with an explicit work stack instead of recursion, so the depth of the BoM is not
+        limited by the Python recursion limit. The dictionary for each child object is added to its parent before it
+        is populated, so the order of the fields in the output is the same as the declaration order.
+        """
+        root: Dict = {}
+        stack: list[tuple["BaseType", Dict]] = [(obj, root)]
+        while stack:
+            current_obj, value = stack.pop()
+            for prop, field_name in current_obj._simple_values:
+                prop_value = getattr(current_obj, prop)
+                if prop_value is not None:
+                    value[self._generate_contextual_qualified_name(field_name)] = prop_value
+            for _, prop, item_name in current_obj._props:
+                prop_value = getattr(current_obj, prop)
+                if prop_value is not None:
+                    child_value: Dict = {}
+                    value[self._generate_contextual_qualified_name(item_name)] = child_value
+                    stack.append((cast("BaseType", prop_value), child_value))
+            for _, prop, container_name, item_name in current_obj._list_props:
+                prop_value = getattr(current_obj, prop)
+                if prop_value is not None and len(prop_value) > 0:
+                    item_values: list[Dict] = [{} for _ in prop_value]
+                    value[self._generate_contextual_qualified_name(container_name)] = {
+                        self._generate_contextual_qualified_name(item_name): item_values
+                    }
+                    stack.extend(zip(prop_value, item_values))
+            current_obj._write_custom_fields(value, self)
+        return root
 
     def convert_bom_to_dict(self, obj: T) -> Dict:
         """
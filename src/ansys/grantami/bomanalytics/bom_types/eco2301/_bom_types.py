@@ -35,6 +35,8 @@ if TYPE_CHECKING:
 
 
 class BaseTypeEco2301(BaseType):
+    __slots__ = ()
+
     namespace = "http://www.grantadesign.com/23/01/BillOfMaterialsEco"
 
 
@@ -126,7 +128,7 @@ class Category(Enum):
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class EndOfLifeFate(BaseTypeEco2301):
     """
     The fate of a material at the end-of-life of the product. For example if a material can be recycled, and what
@@ -144,7 +146,7 @@ class EndOfLifeFate(BaseTypeEco2301):
     """Fraction of the total mass or volume of material to which this fate applies."""
 
 
-@dataclass
+@dataclass(slots=True)
 class UnittedValue(BaseTypeEco2301):
     """
     A physical quantity with a unit. If provided in an input then the unit must exist within the MI database,
@@ -161,7 +163,7 @@ class UnittedValue(BaseTypeEco2301):
     dimensionless."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Location(BaseTypeEco2301):
     """
     Defines the manufacturing location for the BoM for use in process calculations.
@@ -192,7 +194,7 @@ class Location(BaseTypeEco2301):
     to reference this element."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricityMix(BaseTypeEco2301):
     """
     If the product consumes electrical power, then the amount of CO2 produced to generate depends upon the mix of
@@ -211,7 +213,7 @@ class ElectricityMix(BaseTypeEco2301):
     """The percentage of electrical power production within the destination country that comes from fossil fuels."""
 
 
-@dataclass
+@dataclass(slots=True)
 class MobileMode(BaseTypeEco2301):
     """
     If the product is transported as part of its use then this type contains details about the way in which it is
@@ -234,7 +236,7 @@ class MobileMode(BaseTypeEco2301):
     """The distance the product will be transported each day as part of its use."""
 
 
-@dataclass
+@dataclass(slots=True)
 class StaticMode(BaseTypeEco2301):
     """
     Specifies the primary energy conversion that occurs during the product's use.
@@ -260,7 +262,7 @@ class StaticMode(BaseTypeEco2301):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(StaticMode, cls)._process_custom_fields(obj, bom_reader)
         usage_ref = _QualifiedEco2301Name("Usage")
         usage_obj = bom_reader.get_field(obj, usage_ref)
         if usage_obj is not None:
@@ -271,7 +273,7 @@ class StaticMode(BaseTypeEco2301):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(StaticMode, self)._write_custom_fields(obj, bom_writer)
         hours_ref = _QualifiedEco2301Name("HoursUsedPerDay")
         days_ref = _QualifiedEco2301Name("DaysUsedPerYear")
         usage_dict = {
@@ -282,7 +284,7 @@ class StaticMode(BaseTypeEco2301):
         obj[bom_writer._generate_contextual_qualified_name(usage_ref)] = usage_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class UtilitySpecification(BaseTypeEco2301):
     """
     Specifies how much use can be obtained from the product represented by this BoM in comparison to a
@@ -309,7 +311,7 @@ class UtilitySpecification(BaseTypeEco2301):
     """Directly specifies the utility."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductLifeSpan(BaseTypeEco2301):
     """
     Specifies the average life span for the product represented by the BoM.
@@ -335,7 +337,7 @@ class ProductLifeSpan(BaseTypeEco2301):
     industry-average example."""
 
 
-@dataclass
+@dataclass(slots=True)
 class UsePhase(BaseTypeEco2301):
     """
     Provides information about the sustainability of the product whilst in use, including electricity use, emissions
@@ -362,7 +364,7 @@ class UsePhase(BaseTypeEco2301):
     """Provides information about the expected mobile use of the product."""
 
 
-@dataclass
+@dataclass(slots=True)
 class BoMDetails(BaseTypeEco2301):
     """
     Explanatory information about a BoM.
@@ -385,7 +387,7 @@ class BoMDetails(BaseTypeEco2301):
     """The product name."""
 
 
-@dataclass
+@dataclass(slots=True)
 class TransportStage(BaseTypeEco2301):
     """
     Defines the transportation applied to an object, in terms of the generic transportation type (stored in the
@@ -412,7 +414,7 @@ class TransportStage(BaseTypeEco2301):
     to reference this element."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Specification(BaseTypeEco2301):
     """
     A specification for a surface treatment, part, process, or material. Refers to a record within the MI Database
@@ -450,7 +452,7 @@ class Specification(BaseTypeEco2301):
     to reference this element."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Substance(BaseTypeEco2301):
     """
     A substance within a part, semi-finished part, material or specification. The substance is stored in the
@@ -490,7 +492,7 @@ class Substance(BaseTypeEco2301):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(Substance, cls)._process_custom_fields(obj, bom_reader)
 
         category_ref = _QualifiedEco2301Name("Category")
         category_type_obj = bom_reader.get_field(obj, category_ref)
@@ -499,7 +501,7 @@ class Substance(BaseTypeEco2301):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(Substance, self)._write_custom_fields(obj, bom_writer)
 
         if self.category is not None:
             category_ref = _QualifiedEco2301Name("Category")
@@ -507,7 +509,7 @@ class Substance(BaseTypeEco2301):
             obj[category_field_name] = self.category.to_string()
 
 
-@dataclass
+@dataclass(slots=True)
 class Process(BaseTypeEco2301):
     """
     A process that is applied to a subassembly, part, semi-finished part or material. The process is stored in the
@@ -556,7 +558,7 @@ class Process(BaseTypeEco2301):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(Process, cls)._process_custom_fields(obj, bom_reader)
 
         dimension_type_ref = _QualifiedEco2301Name("DimensionType")
         dimension_type_obj = bom_reader.get_field(obj, dimension_type_ref)
@@ -564,14 +566,14 @@ class Process(BaseTypeEco2301):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(Process, self)._write_custom_fields(obj, bom_writer)
 
         dimension_type_ref = _QualifiedEco2301Name("DimensionType")
         dimension_field_name = bom_writer._generate_contextual_qualified_name(dimension_type_ref)
         obj[dimension_field_name] = self.dimension_type.to_string()
 
 
-@dataclass
+@dataclass(slots=True)
 class Material(BaseTypeEco2301):
     """
     A Material within a part or semi-finished part. The material is stored in the Database.
@@ -637,7 +639,7 @@ class Material(BaseTypeEco2301):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(Material, cls)._process_custom_fields(obj, bom_reader)
 
         recycle_content_ref = _QualifiedEco2301Name("RecycleContent")
         recycle_content_obj = bom_reader.get_field(obj, recycle_content_ref)
@@ -653,7 +655,7 @@ class Material(BaseTypeEco2301):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(Material, self)._write_custom_fields(obj, bom_writer)
         recycle_content_ref = _QualifiedEco2301Name("RecycleContent")
         recycle_content_name = bom_writer._generate_contextual_qualified_name(recycle_content_ref)
         recycle_element = {}
@@ -668,7 +670,7 @@ class Material(BaseTypeEco2301):
             obj[recycle_content_name] = recycle_element
 
 
-@dataclass
+@dataclass(slots=True)
 class Part(BaseTypeEco2301):
     """
     A single part which may or may not be stored in the MI Database.
@@ -766,7 +768,7 @@ class Part(BaseTypeEco2301):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(Part, cls)._process_custom_fields(obj, bom_reader)
         # TODO support non_mi_part_reference (issue #95)
         # non_mi_part_ref_obj = bom_reader.get_field(Part, obj, "NonMIPartReference")
         # if non_mi_part_ref_obj is not None:
@@ -781,7 +783,7 @@ class Part(BaseTypeEco2301):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(Part, self)._write_custom_fields(obj, bom_writer)
         # TODO support non_mi_part_reference (issue #95)
         # if self.non_mi_part_reference is not None:
         #     non_mi_field_name = bom_writer._get_qualified_name(self, "NonMIPartReference")
@@ -822,7 +824,7 @@ class Part(BaseTypeEco2301):
 #
 #     @classmethod
 #     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-#         props = super()._process_custom_fields(obj, bom_reader)
+#         props = super(Part, self)._process_custom_fields(obj, bom_reader)
 #
 #         data_obj = bom_reader.get_field(AnnotationSource, obj, "Data")
 #         if data_obj is not None:
@@ -868,7 +870,7 @@ class Part(BaseTypeEco2301):
 #     of the annotation. If absent, no source information is provided."""
 
 
-@dataclass
+@dataclass(slots=True)
 class BillOfMaterials(BaseTypeEco2301):
     """
     Type representing the root Bill of Materials object.
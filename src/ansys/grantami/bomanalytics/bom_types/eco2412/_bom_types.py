@@ -35,6 +35,8 @@ if TYPE_CHECKING:
 
 
 class BaseType2412(BaseType):
+    __slots__ = ()
+
     namespace = "http://www.grantadesign.com/24/12/BillOfMaterialsEco"
 
 
@@ -126,7 +128,7 @@ class Category(Enum):
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class EndOfLifeFate(BaseType2412):
     """
     The fate of a material at the end-of-life of the product. For example if a material can be recycled, and what
@@ -144,7 +146,7 @@ class EndOfLifeFate(BaseType2412):
     """Fraction of the total mass or volume of material to which this fate applies."""
 
 
-@dataclass
+@dataclass(slots=True)
 class UnittedValue(BaseType2412):
     """
     A physical quantity with a unit. If provided in an input then the unit must exist within the MI database,
@@ -161,7 +163,7 @@ class UnittedValue(BaseType2412):
     dimensionless."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Location(BaseType2412):
     """
     Defines the manufacturing location for the BoM for use in process calculations.
@@ -192,7 +194,7 @@ class Location(BaseType2412):
     to reference this element."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricityMix(BaseType2412):
     """
     If the product consumes electrical power, then the amount of CO2 produced to generate depends upon the mix of
@@ -211,7 +213,7 @@ class ElectricityMix(BaseType2412):
     """The percentage of electrical power production within the destination country that comes from fossil fuels."""
 
 
-@dataclass
+@dataclass(slots=True)
 class MobileMode(BaseType2412):
     """
     If the product is transported as part of its use then this type contains details about the way in which it is
@@ -234,7 +236,7 @@ class MobileMode(BaseType2412):
     """The distance the product will be transported each day as part of its use."""
 
 
-@dataclass
+@dataclass(slots=True)
 class StaticMode(BaseType2412):
     """
     Specifies the primary energy conversion that occurs during the product's use.
@@ -264,7 +266,7 @@ class StaticMode(BaseType2412):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(StaticMode, cls)._process_custom_fields(obj, bom_reader)
         usage_ref = _QualifiedEco2412Name("Usage")
         usage_obj = bom_reader.get_field(obj, usage_ref)
         if usage_obj is not None:
@@ -275,7 +277,7 @@ class StaticMode(BaseType2412):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(StaticMode, self)._write_custom_fields(obj, bom_writer)
         hours_ref = _QualifiedEco2412Name("HoursUsedPerDay")
         days_ref = _QualifiedEco2412Name("DaysUsedPerYear")
         usage_dict = {
@@ -286,7 +288,7 @@ class StaticMode(BaseType2412):
         obj[bom_writer._generate_contextual_qualified_name(usage_ref)] = usage_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class UtilitySpecification(BaseType2412):
     """
     Specifies how much use can be obtained from the product represented by this BoM in comparison to a
@@ -315,7 +317,7 @@ class UtilitySpecification(BaseType2412):
     """Directly specifies the utility."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductLifeSpan(BaseType2412):
     """
     Specifies the average life span for the product represented by the BoM.
@@ -341,7 +343,7 @@ class ProductLifeSpan(BaseType2412):
     industry-average example."""
 
 
-@dataclass
+@dataclass(slots=True)
 class UsePhase(BaseType2412):
     """
     Provides information about the sustainability of the product whilst in use, including electricity use, emissions
@@ -368,7 +370,7 @@ class UsePhase(BaseType2412):
     """Provides information about the expected mobile use of the product."""
 
 
-@dataclass
+@dataclass(slots=True)
 class BoMDetails(BaseType2412):
     """
     Explanatory information about a BoM.
@@ -391,7 +393,7 @@ class BoMDetails(BaseType2412):
     """The product name."""
 
 
-@dataclass
+@dataclass(slots=True)
 class TransportStage(BaseType2412):
     """
     Defines the transportation applied to an object, in terms of the generic transportation type (stored in the
@@ -418,7 +420,7 @@ class TransportStage(BaseType2412):
     to reference this element."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Specification(BaseType2412):
     """
     A specification for a surface treatment, part, process, or material. Refers to a record within the MI Database
@@ -456,7 +458,7 @@ class Specification(BaseType2412):
     to reference this element."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Substance(BaseType2412):
     """
     A substance within a part, semi-finished part, material or specification. The substance is stored in the
@@ -496,7 +498,7 @@ class Substance(BaseType2412):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(Substance, cls)._process_custom_fields(obj, bom_reader)
 
         category_ref = _QualifiedEco2412Name("Category")
         category_type_obj = bom_reader.get_field(obj, category_ref)
@@ -505,7 +507,7 @@ class Substance(BaseType2412):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(Substance, self)._write_custom_fields(obj, bom_writer)
 
         if self.category is not None:
             category_ref = _QualifiedEco2412Name("Category")
@@ -513,7 +515,7 @@ class Substance(BaseType2412):
             obj[category_field_name] = self.category.to_string()
 
 
-@dataclass
+@dataclass(slots=True)
 class Process(BaseType2412):
     """
     A process that is applied to a subassembly, part, semi-finished part or material. The process is stored in the
@@ -578,7 +580,7 @@ class Process(BaseType2412):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(Process, cls)._process_custom_fields(obj, bom_reader)
 
         dimension_type_ref = _QualifiedEco2412Name("DimensionType")
         dimension_type_obj = bom_reader.get_field(obj, dimension_type_ref)
@@ -586,14 +588,14 @@ class Process(BaseType2412):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(Process, self)._write_custom_fields(obj, bom_writer)
 
         dimension_type_ref = _QualifiedEco2412Name("DimensionType")
         dimension_field_name = bom_writer._generate_contextual_qualified_name(dimension_type_ref)
         obj[dimension_field_name] = self.dimension_type.to_string()
 
 
-@dataclass
+@dataclass(slots=True)
 class Material(BaseType2412):
     """
     A Material within a part or semi-finished part. The material is stored in the Database.
@@ -659,7 +661,7 @@ class Material(BaseType2412):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(Material, cls)._process_custom_fields(obj, bom_reader)
 
         recycle_content_ref = _QualifiedEco2412Name("RecycleContent")
         recycle_content_obj = bom_reader.get_field(obj, recycle_content_ref)
@@ -675,7 +677,7 @@ class Material(BaseType2412):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(Material, self)._write_custom_fields(obj, bom_writer)
         recycle_content_ref = _QualifiedEco2412Name("RecycleContent")
         recycle_content_name = bom_writer._generate_contextual_qualified_name(recycle_content_ref)
         recycle_element = {}
@@ -690,7 +692,7 @@ class Material(BaseType2412):
             obj[recycle_content_name] = recycle_element
 
 
-@dataclass
+@dataclass(slots=True)
 class Part(BaseType2412):
     """
     A single part which may or may not be stored in the MI Database.
@@ -801,7 +803,7 @@ class Part(BaseType2412):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(Part, cls)._process_custom_fields(obj, bom_reader)
         # TODO support non_mi_part_reference (issue #95)
         # non_mi_part_ref_obj = bom_reader.get_field(Part, obj, "NonMIPartReference")
         # if non_mi_part_ref_obj is not None:
@@ -816,7 +818,7 @@ class Part(BaseType2412):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(Part, self)._write_custom_fields(obj, bom_writer)
         # TODO support non_mi_part_reference (issue #95)
         # if self.non_mi_part_reference is not None:
         #     non_mi_field_name = bom_writer._get_qualified_name(self, "NonMIPartReference")
@@ -857,7 +859,7 @@ class Part(BaseType2412):
 #
 #     @classmethod
 #     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-#         props = super()._process_custom_fields(obj, bom_reader)
+#         props = super(Part, self)._process_custom_fields(obj, bom_reader)
 #
 #         data_obj = bom_reader.get_field(AnnotationSource, obj, "Data")
 #         if data_obj is not None:
@@ -903,7 +905,7 @@ class Part(BaseType2412):
 #     of the annotation. If absent, no source information is provided."""
 
 
-@dataclass
+@dataclass(slots=True)
 class BillOfMaterials(BaseType2412):
     """
     Type representing the root Bill of Materials object.
@@ -20,9 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from . import _bom_types as bom_types
+from .. import gbt1205
 from .._bom_writer import _GenericBoMWriter
-from ._bom_types import BillOfMaterials
 
 
-class _BoMWriter(_GenericBoMWriter[BillOfMaterials]):
+class _BoMWriter(_GenericBoMWriter[bom_types.BillOfMaterials], xml_type_modules=[gbt1205, bom_types]):
     pass
@@ -35,6 +35,8 @@ if TYPE_CHECKING:
 
 
 class BaseType2505(BaseType):
+    __slots__ = ()
+
     namespace = "http://www.grantadesign.com/25/05/BillOfMaterialsEco"
 
 
@@ -126,7 +128,7 @@ class Category(Enum):
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtendedMIRecordReference(BaseType2505, MIRecordReference):
     """
     A type extending gbt:MIRecordReference that includes an EquivalentReferences element to hold an arbitrary number
@@ -146,7 +148,7 @@ class ExtendedMIRecordReference(BaseType2505, MIRecordReference):
     """Additional records which link to the analysis material."""
 
 
-@dataclass
+@dataclass(slots=True)
 class EndOfLifeFate(BaseType2505):
     """
     The fate of a material at the end-of-life of the product. For example if a material can be recycled, and what
@@ -164,7 +166,7 @@ class EndOfLifeFate(BaseType2505):
     """Fraction of the total mass or volume of material to which this fate applies."""
 
 
-@dataclass
+@dataclass(slots=True)
 class UnittedValue(BaseType2505):
     """
     A physical quantity with a unit. If provided in an input then the unit must exist within the MI database,
@@ -181,7 +183,7 @@ class UnittedValue(BaseType2505):
     dimensionless."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Location(BaseType2505):
     """
     Defines the manufacturing location for the BoM for use in process calculations.
@@ -212,7 +214,7 @@ class Location(BaseType2505):
     to reference this element."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricityMix(BaseType2505):
     """
     If the product consumes electrical power, then the amount of CO2 produced to generate depends upon the mix of
@@ -231,7 +233,7 @@ class ElectricityMix(BaseType2505):
     """The percentage of electrical power production within the destination country that comes from fossil fuels."""
 
 
-@dataclass
+@dataclass(slots=True)
 class MobileMode(BaseType2505):
     """
     If the product is transported as part of its use then this type contains details about the way in which it is
@@ -254,7 +256,7 @@ class MobileMode(BaseType2505):
     """The distance the product will be transported each day as part of its use."""
 
 
-@dataclass
+@dataclass(slots=True)
 class StaticMode(BaseType2505):
     """
     Specifies the primary energy conversion that occurs during the product's use.
@@ -284,7 +286,7 @@ class StaticMode(BaseType2505):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(StaticMode, cls)._process_custom_fields(obj, bom_reader)
         usage_ref = _QualifiedEco2505Name("Usage")
         usage_obj = bom_reader.get_field(obj, usage_ref)
         if usage_obj is not None:
@@ -295,7 +297,7 @@ class StaticMode(BaseType2505):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(StaticMode, self)._write_custom_fields(obj, bom_writer)
         hours_ref = _QualifiedEco2505Name("HoursUsedPerDay")
         days_ref = _QualifiedEco2505Name("DaysUsedPerYear")
         usage_dict = {
@@ -306,7 +308,7 @@ class StaticMode(BaseType2505):
         obj[bom_writer._generate_contextual_qualified_name(usage_ref)] = usage_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class UtilitySpecification(BaseType2505):
     """
     Specifies how much use can be obtained from the product represented by this BoM in comparison to a
@@ -335,7 +337,7 @@ class UtilitySpecification(BaseType2505):
     """Directly specifies the utility."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductLifeSpan(BaseType2505):
     """
     Specifies the average life span for the product represented by the BoM.
@@ -361,7 +363,7 @@ class ProductLifeSpan(BaseType2505):
     industry-average example."""
 
 
-@dataclass
+@dataclass(slots=True)
 class UsePhase(BaseType2505):
     """
     Provides information about the sustainability of the product whilst in use, including electricity use, emissions
@@ -388,7 +390,7 @@ class UsePhase(BaseType2505):
     """Provides information about the expected mobile use of the product."""
 
 
-@dataclass
+@dataclass(slots=True)
 class BoMDetails(BaseType2505):
     """
     Explanatory information about a BoM.
@@ -411,7 +413,7 @@ class BoMDetails(BaseType2505):
     """The product name."""
 
 
-@dataclass
+@dataclass(slots=True)
 class TransportStage(BaseType2505):
     """
     Defines the transportation applied to an object, in terms of the generic transportation type (stored in the
@@ -438,7 +440,7 @@ class TransportStage(BaseType2505):
     to reference this element."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Specification(BaseType2505):
     """
     A specification for a surface treatment, part, process, or material. Refers to a record within the MI Database
@@ -476,7 +478,7 @@ class Specification(BaseType2505):
     to reference this element."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Substance(BaseType2505):
     """
     A substance within a part, semi-finished part, material or specification. The substance is stored in the
@@ -516,7 +518,7 @@ class Substance(BaseType2505):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(Substance, cls)._process_custom_fields(obj, bom_reader)
 
         category_ref = _QualifiedEco2505Name("Category")
         category_type_obj = bom_reader.get_field(obj, category_ref)
@@ -525,7 +527,7 @@ class Substance(BaseType2505):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(Substance, self)._write_custom_fields(obj, bom_writer)
 
         category_ref = _QualifiedEco2505Name("Category")
         if self.category is not None:
@@ -533,7 +535,7 @@ class Substance(BaseType2505):
             obj[category_field_name] = self.category.to_string()
 
 
-@dataclass
+@dataclass(slots=True)
 class Process(BaseType2505):
     """
     A process that is applied to a subassembly, part, semi-finished part or material. The process is stored in the
@@ -598,7 +600,7 @@ class Process(BaseType2505):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(Process, cls)._process_custom_fields(obj, bom_reader)
 
         dimension_type_ref = _QualifiedEco2505Name("DimensionType")
         dimension_type_obj = bom_reader.get_field(obj, dimension_type_ref)
@@ -606,14 +608,14 @@ class Process(BaseType2505):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(Process, self)._write_custom_fields(obj, bom_writer)
 
         dimension_type_ref = _QualifiedEco2505Name("DimensionType")
         dimension_field_name = bom_writer._generate_contextual_qualified_name(dimension_type_ref)
         obj[dimension_field_name] = self.dimension_type.to_string()
 
 
-@dataclass
+@dataclass(slots=True)
 class Material(BaseType2505):
     """
     A Material within a part or semi-finished part. The material is stored in the Database.
@@ -679,7 +681,7 @@ class Material(BaseType2505):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(Material, cls)._process_custom_fields(obj, bom_reader)
 
         recycle_content_ref = _QualifiedEco2505Name("RecycleContent")
         recycle_content_obj = bom_reader.get_field(obj, recycle_content_ref)
@@ -695,7 +697,7 @@ class Material(BaseType2505):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(Material, self)._write_custom_fields(obj, bom_writer)
         recycle_content_ref = _QualifiedEco2505Name("RecycleContent")
         recycle_content_name = bom_writer._generate_contextual_qualified_name(recycle_content_ref)
         recycle_element = {}
@@ -710,7 +712,7 @@ class Material(BaseType2505):
             obj[recycle_content_name] = recycle_element
 
 
-@dataclass
+@dataclass(slots=True)
 class Part(BaseType2505):
     """
     A single part which may or may not be stored in the MI Database.
@@ -821,7 +823,7 @@ class Part(BaseType2505):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(Part, cls)._process_custom_fields(obj, bom_reader)
         # TODO support non_mi_part_reference (issue #95)
         # non_mi_part_ref_obj = bom_reader.get_field(Part, obj, "NonMIPartReference")
         # if non_mi_part_ref_obj is not None:
@@ -836,7 +838,7 @@ class Part(BaseType2505):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: _BoMWriter) -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(Part, self)._write_custom_fields(obj, bom_writer)
         # TODO support non_mi_part_reference (issue #95)
         # if self.non_mi_part_reference is not None:
         #     non_mi_field_name = bom_writer._get_qualified_name(self, "NonMIPartReference")
@@ -877,7 +879,7 @@ class Part(BaseType2505):
 #
 #     @classmethod
 #     def _process_custom_fields(cls, obj: Dict, bom_reader: _BoMReader) -> Dict[str, Any]:
-#         props = super()._process_custom_fields(obj, bom_reader)
+#         props = super(Part, self)._process_custom_fields(obj, bom_reader)
 #
 #         data_obj = bom_reader.get_field(AnnotationSource, obj, "Data")
 #         if data_obj is not None:
@@ -923,7 +925,7 @@ class Part(BaseType2505):
 #     of the annotation. If absent, no source information is provided."""
 
 
-@dataclass
+@dataclass(slots=True)
 class BillOfMaterials(BaseType2505):
     """
     Type representing the root Bill of Materials object.
@@ -34,6 +34,8 @@ if TYPE_CHECKING:
 
 
 class BaseTypeGbt1205(BaseType):
+    __slots__ = ()
+
     namespace = "http://www.grantadesign.com/12/05/GrantaBaseTypes"
 
 
@@ -94,7 +96,7 @@ class PseudoAttribute(Enum):
         return f"{self.name[0].lower()}{self.name[1:]}"
 
 
-@dataclass
+@dataclass(slots=True)
 class PartialTableReference(BaseTypeGbt1205):
     """
     A type that partially identifies a Table, but does not specify the MI Database. Usually, just one of the several
@@ -119,7 +121,7 @@ class PartialTableReference(BaseTypeGbt1205):
     safe way to refer to a table if the MI Database supports multiple locales."""
 
 
-@dataclass
+@dataclass(slots=True)
 class MIAttributeReference(BaseTypeGbt1205):
     """A type that allows identification of a particular Attribute in an MI Database. This may be done directly by
     specifying the Identity of the Attribute, or indirectly by specifying a lookup that will match (only) the
@@ -156,7 +158,7 @@ class MIAttributeReference(BaseTypeGbt1205):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: "_GenericBoMReader") -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(MIAttributeReference, cls)._process_custom_fields(obj, bom_reader)
         name_ref = _QualifiedGbt1205Name("name")
         name_obj = bom_reader.get_field(obj, name_ref)
         if name_obj is not None:
@@ -181,7 +183,7 @@ class MIAttributeReference(BaseTypeGbt1205):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: "_GenericBoMWriter") -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(MIAttributeReference, self)._write_custom_fields(obj, bom_writer)
         name_dict: Dict[str, Any] = {}
         if self.table_reference is not None:
             table_ref = _QualifiedGbt1205Name("table")
@@ -202,7 +204,7 @@ class MIAttributeReference(BaseTypeGbt1205):
             obj[bom_writer._generate_contextual_qualified_name(name_ref)] = name_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class MIRecordReference(BaseTypeGbt1205):
     """A type that allows identification of a particular Record in an
     MI Database. This may be done directly by specifying the Identity or GUID of the Record, or
@@ -254,7 +256,7 @@ class MIRecordReference(BaseTypeGbt1205):
 
     @classmethod
     def _process_custom_fields(cls, obj: Dict, bom_reader: "_GenericBoMReader") -> Dict[str, Any]:
-        props = super()._process_custom_fields(obj, bom_reader)
+        props = super(MIRecordReference, cls)._process_custom_fields(obj, bom_reader)
         identity_ref = _QualifiedGbt1205Name("identity")
         identity_obj = bom_reader.get_field(obj, identity_ref)
         if identity_obj is not None:
@@ -275,7 +277,7 @@ class MIRecordReference(BaseTypeGbt1205):
         return props
 
     def _write_custom_fields(self, obj: Dict, bom_writer: "_GenericBoMWriter") -> None:
-        super()._write_custom_fields(obj, bom_writer)
+        super(MIRecordReference, self)._write_custom_fields(obj, bom_writer)
         # Always write the wrapper object, even if incomplete. This way, users get an error when serializing, rather
         # than the serialization ignoring a populated value.
         identity_dict = {}
@@ -28,9 +28,17 @@ static class outside the main hierarchy implements the YAML API endpoint.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import copy
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
+import logging
 from numbers import Number
+from pathlib import Path
+import threading
+import time
 from types import NoneType
 from typing import (
     TYPE_CHECKING,
@@ -38,40 +46,57 @@ from typing import (
     Callable,
     Dict,
     Generator,
+    Generic,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
 )
 import warnings
 
 from ansys.grantami.bomanalytics_openapi.v2 import api, models
 from defusedxml import ElementTree
+from defusedxml.ElementTree import DefusedXMLParser
 
-from ._allowed_types import validate_argument_type
+from . import schemas
+from ._allowed_types import _check_validation_level, validate_argument_type
+from ._bom_diff import BoMDiff, _IncrementalComplianceUpdate
+from ._bom_partitioning import _BoMPartitioning
 from ._exceptions import GrantaMIException
+from ._execution_report import BatchStatistics, ExecutionReport, _record_batch
+from ._fingerprint import _CanonicalHasher
+from ._hooks import _emit_query_event
 from ._item_definitions import (
-    BomItemDefinitionFactory,
-    MaterialDefinitionFactory,
-    PartDefinitionFactory,
+    MaterialDefinition,
+    PartDefinition,
     RecordDefinition,
-    SpecificationDefinitionFactory,
-    SubstanceComplianceDefinitionFactory,
+    ReferenceType,
+    SpecificationDefinition,
+    SubstanceDefinition,
 )
 from ._logger import logger
-from ._query_results import QueryResultFactory, ResultBaseClass
+from ._query_results import BomComplianceQueryResult, QueryResultFactory, ResultBaseClass
+from ._record_columns import _RecordColumns
 from ._typing import _raise_if_empty
+from .bom_types import eco2301, eco2412, eco2505
 from .indicators import RoHSIndicator, WatchListIndicator, _Indicator
 
 if TYPE_CHECKING:
+    from xmlschema import XMLSchema
+
+    from ._bom_helper import BillOfMaterials, BoMHandler
     from ._connection import Connection  # noqa: F401
 
 
 _ImpactedSubstanceQuery = TypeVar("_ImpactedSubstanceQuery", bound="_ImpactedSubstanceMixin")
 _ComplianceQuery = TypeVar("_ComplianceQuery", bound="_ComplianceMixin")
 _SustainabilityQuery = TypeVar("_SustainabilityQuery", bound="_SustainabilityMixin")
+_ApiQuery = TypeVar("_ApiQuery", bound="_ApiMixin")
 
 _RecordQuery = TypeVar("_RecordQuery", bound="_RecordBasedQueryBuilder")
 _MaterialQuery = TypeVar("_MaterialQuery", bound="_MaterialQueryBuilder")
@@ -81,6 +106,9 @@ _SubstanceQuery = TypeVar("_SubstanceQuery", bound="_SubstanceQueryBuilder")
 
 _BomQuery = TypeVar("_BomQuery", bound="_BomQueryBuilder")
 
+_QueryBom = Union[str, bytes, "BillOfMaterials"]
+"""BoM stored in a BoM query, in any of the forms accepted by ``with_bom``, except for file paths."""
+
 _Responses = Union[
     models.GetImpactedSubstancesForMaterialsResponse,
     models.GetImpactedSubstancesForSpecificationsResponse,
@@ -104,6 +132,9 @@ EXCEPTION_MAP = {
 }
 """Map between log severity strings returned by the Granta MI server and Python logger methods."""
 
+_FINGERPRINT_CHUNK_SIZE = 1000
+"""Number of records converted to low-level API models at a time when a query is fingerprinted."""
+
 
 class _BaseQuery(ABC):
     """Interface expected by the client."""
@@ -114,58 +145,56 @@ class _BaseQuery(ABC):
     def _run_query(self, api_instance: api.ApiBase, static_arguments: Dict) -> ResultBaseClass:
         raise NotImplementedError
 
+    @abstractmethod
+    def _fingerprint(self, static_arguments: Dict) -> str:
+        raise NotImplementedError
 
-class _BaseQueryDataManager(ABC):
-    """Outlines an interface for managing *items* to provide to the query.
-
-    For example, the items to provide to the query might be the records or BoM-based dimensions.
-
-    This class doesn't specify how the objects are added to the ``_item_definitions`` attribute or how
-    they are converted to attributes.
-    """
-
-    _item_definitions: list
-    """List of BoM items to pass to the low-level API. """
-
-    _item_results: list
-    """List of results to be returned by the low-level API."""
-
-    item_type_name: str
-    """Name of the argument managed by this class and expected by the request object."""
 
-    def __init__(self) -> None:
-        self._messages: List[models.CommonLogEntry] = []
+class _QueryRun:
+    """Stores the batches to send to the server and the responses received for a single run of a query.
 
-    @property
-    def populated_inputs(self) -> bool:
-        """Whether the argument manager is populated. For example, this property
-        determines whether to perform a query on the items in the object.
+    A new object is created every time a query is run, so running a query does not modify the query object, and the
+    same query can be run again.
 
-        Returns
-        -------
-            Boolean cast of the ``_item_definitions`` attribute.
-        """
-
-        return bool(self._item_definitions)
-
-    def initialize_results(self) -> None:
-        """Reset the result properties of the object."""
+    Parameters
+    ----------
+    batches : Iterable[dict]
+        Batched kwargs to pass to the request constructor, in the order they are sent to the server.
+    extract_results : Callable
+        Function which extracts the individual results from a response object.
+    merge_results : Callable, optional
+        Function which combines the results of all batches, if the results must be merged before they are returned.
+    """
 
-        self._item_results = []
-        self._messages = []
+    def __init__(
+        self,
+        batches: Iterable[Dict[str, Any]],
+        extract_results: Callable[[models.ModelBase], List[models.ModelBase]],
+        merge_results: Optional[Callable[[List[models.ModelBase]], List[models.ModelBase]]] = None,
+    ) -> None:
+        self.batches = batches
+        self._extract_results = extract_results
+        self._merge_results = merge_results
+        self._item_results: List[models.ModelBase] = []
+        self.messages: List[models.CommonLogEntry] = []
+        """Messages returned by the server for all batches."""
+        self.report = ExecutionReport()
+        """Statistics for the batches sent to the server and for creating the result."""
 
     @property
     def item_results(self) -> List[models.ModelBase]:
-        """List of result items returned by the low-level API for the items in ``_item_definitions``.
+        """List of result items returned by the low-level API for all batches.
 
         Returns
         -------
             Results of the query.
         """
-        return self._item_results
+        if self._merge_results is None or not self._item_results:
+            return self._item_results
+        return self._merge_results(self._item_results)
 
-    def append_response(self, response: _Responses) -> None:
-        """Append a response from the low-level API to the object.
+    def append_response(self, response: _Responses, statistics: Optional[BatchStatistics] = None) -> None:
+        """Append a response from the low-level API to the run.
 
         This method extracts the results and server messages from the response object and appends
         them to the respective lists.
@@ -174,14 +203,37 @@ class _BaseQueryDataManager(ABC):
         ----------
         response
            Response returned by the low-level API.
+        statistics : BatchStatistics, optional
+           Statistics recorded while the batch was sent to the server.
         """
 
+        if statistics is not None:
+            self.report.batches.append(statistics)
         messages = _raise_if_empty(response.log_messages)
         self._emit_log_messages(messages)
-        self._messages.extend(messages)
-        results = self._extract_results_from_response(response)
+        self.messages.extend(messages)
+        results = self._extract_results(response)
         self._item_results.extend(results)
 
+    def create_result(self, **kwargs: Any) -> ResultBaseClass:
+        """Create the result object from the results and messages of all batches, and attach the execution report.
+
+        Parameters
+        ----------
+        **kwargs
+            Additional arguments required to create the result, such as the indicator definitions.
+
+        Returns
+        -------
+        ResultBaseClass
+            Result, with the type depending on the type of the results.
+        """
+        started = time.perf_counter()
+        result = QueryResultFactory.create_result(results=self.item_results, messages=self.messages, **kwargs)
+        self.report.result_build_time += time.perf_counter() - started
+        result._execution_report = self.report
+        return result
+
     @staticmethod
     def _emit_log_messages(log_messages: List[models.CommonLogEntry]) -> None:
         """Emit log entries for all messages using the appropriate method based on their severity. Raise an exception
@@ -203,6 +255,7 @@ class _BaseQueryDataManager(ABC):
             severity = _raise_if_empty(log_msg.severity)
             log_method = EXCEPTION_MAP.get(severity, logger.warning)
             log_method(log_msg.message)
+            _emit_query_event("on_log_message", severity, log_msg.message)
             if log_method == logger.critical:
                 message = _raise_if_empty(log_msg.message)
                 exception_messages.append(message)
@@ -210,20 +263,77 @@ class _BaseQueryDataManager(ABC):
             error_text = "\n".join(exception_messages)
             raise GrantaMIException(error_text)
 
+
+class _BaseQueryDataManager(ABC):
+    """Outlines an interface for managing *items* to provide to the query.
+
+    For example, the items to provide to the query might be the records or BoM-based dimensions.
+
+    This class doesn't specify how the objects are added to the ``_item_definitions`` attribute or how
+    they are converted to attributes. The results of a query are not stored in this class, but in the
+    :class:`_QueryRun` object created by :meth:`start_run` every time the query is run.
+    """
+
+    _item_definitions: list
+    """List of BoM items to pass to the low-level API. """
+
+    item_type_name: str
+    """Name of the argument managed by this class and expected by the request object."""
+
+    max_concurrent_requests: int = 1
+    """Maximum number of batches to send to the server at the same time."""
+
+    @property
+    def populated_inputs(self) -> bool:
+        """Whether the argument manager is populated. For example, this property
+        determines whether to perform a query on the items in the object.
+
+        Returns
+        -------
+            Boolean cast of the ``_item_definitions`` attribute.
+        """
+
+        return bool(self._item_definitions)
+
+    def start_run(self) -> _QueryRun:
+        """Create the object which stores the batches and responses for a single run of the query.
+
+        Returns
+        -------
+        _QueryRun
+            Object which generates the batches to send to the server and stores the responses.
+        """
+        return _QueryRun(self.batched_arguments, self._extract_results_from_response)
+
+    @abstractmethod
+    def empty_copy(self) -> "_BaseQueryDataManager":
+        """Create an argument manager with the same settings as this argument manager, but without any items.
+
+        Returns
+        -------
+        _BaseQueryDataManager
+            New argument manager of the same type.
+        """
+
     @abstractmethod
     def _extract_results_from_response(self, response: models.ModelBase) -> List[models.ModelBase]:
         pass
 
-    @property
-    def messages(self) -> List[models.CommonLogEntry]:
-        """Messages returned by the server when processing all items in ``_item_definitions``"""
-        return self._messages
-
     @property
     @abstractmethod
     def batched_arguments(self) -> Any:
         raise NotImplementedError
 
+    @abstractmethod
+    def update_fingerprint(self, hasher: _CanonicalHasher) -> None:
+        """Add the items in ``_item_definitions`` to a query fingerprint.
+
+        Parameters
+        ----------
+        hasher : _CanonicalHasher
+            Hasher for the query fingerprint.
+        """
+
 
 class _RecordQueryDataManager(_BaseQueryDataManager):
     """Stores records for use in queries and generates the list of models to send to the server.
@@ -237,9 +347,11 @@ class _RecordQueryDataManager(_BaseQueryDataManager):
     """
 
     def __init__(self, item_type_name: str = "", batch_size: Optional[int] = None) -> None:
-        super().__init__()
-        self._item_definitions = []
-        self._item_results = []
+        self._record_blocks: List[Union[List[RecordDefinition], _RecordColumns]] = []
+        """Records added to the query, in the order they were added. Each block is either a list of definition objects
+        or a column of records."""
+
+        self._record_count = 0
 
         self.item_type_name: str = item_type_name
         """ Name of the item collection as defined by the low-level API. For example, ``materials`` or ``parts``. """
@@ -250,7 +362,7 @@ class _RecordQueryDataManager(_BaseQueryDataManager):
         if not self.item_type_name:
             return "Uninitialized"
         else:
-            return f"{len(self._item_definitions)} {self.item_type_name}, batch size = {self.batch_size}"
+            return f"{self._record_count} {self.item_type_name}, batch size = {self.batch_size}"
 
     def __repr__(self) -> str:
         if not self.item_type_name:
@@ -261,7 +373,33 @@ class _RecordQueryDataManager(_BaseQueryDataManager):
             batch_text = "batch_size: None"
         else:
             batch_text = f"batch_size: {self.batch_size}"
-        return f"<{self.__class__.__name__} {{{item_text}, {batch_text}}}, length = {len(self._item_definitions)}>"
+        return f"<{self.__class__.__name__} {{{item_text}, {batch_text}}}, length = {self._record_count}>"
+
+    @property
+    def _item_definitions(self) -> List[RecordDefinition]:  # type: ignore[override]
+        """All records added to the query, as definition objects.
+
+        Records stored as columns are converted to new definition objects every time this property is accessed.
+        """
+        definitions: List[RecordDefinition] = []
+        for block in self._record_blocks:
+            definitions.extend(block if isinstance(block, list) else block.definitions())
+        return definitions
+
+    @property
+    def populated_inputs(self) -> bool:
+        """Whether any records have been added to the argument manager."""
+        return self._record_count > 0
+
+    def empty_copy(self) -> "_RecordQueryDataManager":
+        """Create an argument manager with the same item type name and batch size, but without any records.
+
+        Returns
+        -------
+        _RecordQueryDataManager
+            New argument manager.
+        """
+        return _RecordQueryDataManager(self.item_type_name, self.batch_size)
 
     def append_record_definition(self, item: RecordDefinition) -> None:
         """Append a record definition to the argument manager.
@@ -283,7 +421,35 @@ class _RecordQueryDataManager(_BaseQueryDataManager):
                 " query. This is not supported; RecordDefinition-derived objects without record references"
                 " can only be used as result objects for BoM queries."
             )
-        self._item_definitions.append(item)
+        if not self._record_blocks or not isinstance(self._record_blocks[-1], list):
+            self._record_blocks.append([])
+        cast(List[RecordDefinition], self._record_blocks[-1]).append(item)
+        self._record_count += 1
+
+    def append_record_columns(self, records: _RecordColumns) -> None:
+        """Append a column of records to the argument manager.
+
+        Parameters
+        ----------
+        records : _RecordColumns
+            Records to add, after any records that have already been added.
+        """
+        if len(records):
+            self._record_blocks.append(records)
+            self._record_count += len(records)
+
+    def _iter_models(self, chunk_size: int) -> Iterator[models.ModelBase]:
+        """Generate the low-level API model of every record in order.
+
+        Models are created for at most ``chunk_size`` records at a time, so the models for all records never exist at
+        the same time.
+        """
+        for block in self._record_blocks:
+            for start in range(0, len(block), chunk_size):
+                if isinstance(block, list):
+                    yield from (item._definition for item in block[start : start + chunk_size])  # noqa: E203
+                else:
+                    yield from block.models(start, start + chunk_size)
 
     @property
     def batched_arguments(
@@ -315,12 +481,30 @@ class _RecordQueryDataManager(_BaseQueryDataManager):
         if self.batch_size is None:
             raise RuntimeError('"batch_size" must be populated before record arguments can be generated.')
 
-        for batch_number, i in enumerate(range(0, len(self._item_definitions), self.batch_size)):
-            batch = [i._definition for i in self._item_definitions][i : i + self.batch_size]  # noqa: E203 E501
-            batch_str = ", ".join([f'"{item.reference_type}": "{item.reference_value}"' for item in batch])
-            logger.debug(f"Batch {batch_number + 1}, Items: {batch_str}")
+        record_models = self._iter_models(self.batch_size)
+        batch_number = 0
+        while True:
+            batch: List[Any] = list(islice(record_models, self.batch_size))
+            if not batch:
+                return
+            batch_number += 1
+            if logger.isEnabledFor(logging.DEBUG):
+                batch_str = ", ".join([f'"{item.reference_type}": "{item.reference_value}"' for item in batch])
+                logger.debug(f"Batch {batch_number}, Items: {batch_str}")
             yield {self.item_type_name: batch}
 
+    def update_fingerprint(self, hasher: _CanonicalHasher) -> None:
+        """Add the record references to a query fingerprint.
+
+        The batch size does not affect the fingerprint, because it does not affect the result of the query.
+
+        Parameters
+        ----------
+        hasher : _CanonicalHasher
+            Hasher for the query fingerprint.
+        """
+        hasher.add_sequence(self._iter_models(_FINGERPRINT_CHUNK_SIZE), self._record_count)
+
     def _extract_results_from_response(self, response: models.ModelBase) -> List[models.ModelBase]:
         """Extract the individual results from a response object.
 
@@ -359,7 +543,15 @@ class _RecordBasedQueryBuilder(_BaseQueryBuilder, ABC):
     operate on multiple items.
     """
 
-    _definition_factory: BomItemDefinitionFactory
+    _definition_type: Type[RecordDefinition]
+    """Type of the definition which represents each record added to the query."""
+
+    _bulk_reference_types: Dict[str, ReferenceType] = {
+        "record_history_ids": ReferenceType.MiRecordHistoryIdentity,
+        "record_history_guids": ReferenceType.MiRecordHistoryGuid,
+        "record_guids": ReferenceType.MiRecordGuid,
+    }
+    """Reference types supported by ``with_bulk_records``, by the name used in the ``reference_type`` argument."""
 
     def __init__(self) -> None:
         self._data: "_RecordQueryDataManager" = _RecordQueryDataManager()
@@ -456,12 +648,12 @@ class _RecordBasedQueryBuilder(_BaseQueryBuilder, ABC):
         <MaterialCompliance: 3 materials, batch size = 50, 0 indicators>
         """
 
-        for value in record_history_identities:
-            item_reference = self._definition_factory.create_definition_by_record_history_identity(
-                record_history_identity=value,
-                database_key=external_database_key,
-            )
-            self._data.append_record_definition(item_reference)
+        self._add_record_columns(
+            ReferenceType.MiRecordHistoryIdentity,
+            record_history_identities,
+            external_database_key,
+            argument_name="record_history_identities",
+        )
         return self
 
     @validate_argument_type("record_history_guids", [str], {str})
@@ -505,12 +697,12 @@ class _RecordBasedQueryBuilder(_BaseQueryBuilder, ABC):
         <MaterialCompliance: 2 materials, batch size = 100, 0 indicators>
         """
 
-        for value in record_history_guids:
-            item_reference = self._definition_factory.create_definition_by_record_history_guid(
-                record_history_guid=value,
-                database_key=external_database_key,
-            )
-            self._data.append_record_definition(item_reference)
+        self._add_record_columns(
+            ReferenceType.MiRecordHistoryGuid,
+            record_history_guids,
+            external_database_key,
+            argument_name="record_history_guids",
+        )
         return self
 
     @validate_argument_type("record_guids", [str], {str})
@@ -554,14 +746,100 @@ class _RecordBasedQueryBuilder(_BaseQueryBuilder, ABC):
         <MaterialCompliance: 2 materials, batch size = 100, 0 indicators>
         """
 
-        for value in record_guids:
-            item_reference = self._definition_factory.create_definition_by_record_guid(
-                record_guid=value,
-                database_key=external_database_key,
-            )
-            self._data.append_record_definition(item_reference)
+        self._add_record_columns(
+            ReferenceType.MiRecordGuid, record_guids, external_database_key, argument_name="record_guids"
+        )
         return self
 
+    @validate_argument_type("reference_type", str)
+    @validate_argument_type("external_database_key", str, NoneType)
+    def with_bulk_records(
+        self: _RecordQuery,
+        reference_type: str,
+        values: Iterable[Any],
+        external_database_key: Optional[str] = None,
+    ) -> _RecordQuery:
+        """
+        Add a large number of records of the same reference type to a query.
+
+        The values can be provided as any sequence or iterable, including NumPy arrays, pandas Series, and generators.
+        The records are stored in a compact columnar form, and the requests sent to Granta MI are only created
+        one batch at a time when the query is run. Use this method to add hundreds of thousands of records to a query.
+
+        If the records referenced by the ``values`` argument are stored in an external database, you must provide the
+        external database key using the ``external_database_key`` argument. See
+        :ref:`ref_grantami_bomanalytics_external_record_references` for more details.
+
+        .. versionadded:: 2.5
+
+        Parameters
+        ----------
+        reference_type : str
+            Type of the values. ``"record_history_ids"``, ``"record_history_guids"``, and ``"record_guids"`` are
+            supported by all record-based queries. Queries also support the reference types specific to their record
+            type: ``"material_ids"``, ``"part_numbers"``, ``"specification_ids"``, or ``"cas_numbers"``,
+            ``"ec_numbers"`` and ``"chemical_names"``.
+        values : Iterable
+            Values which reference the records. Record history identities must be integers, and all other values must
+            be non-empty strings.
+        external_database_key : str, optional
+            Required if records referenced by the ``values`` argument are stored in an external database.
+
+        Returns
+        -------
+        Query
+            Current query object.
+
+        Raises
+        ------
+        ValueError
+            Error to raise if the reference type is not supported by the query.
+        TypeError
+            Error to raise if any value is of the wrong type or is an empty string.
+
+        Examples
+        --------
+        >>> record_history_ids = numpy.arange(1, 200001)
+        >>> PartComplianceQuery().with_bulk_records("record_history_ids", record_history_ids)
+        <PartComplianceQuery: 200000 parts, batch size = 10, 0 indicators>
+        """
+        self._add_record_columns(self._get_bulk_reference_type(reference_type), values, external_database_key)
+        return self
+
+    def _get_bulk_reference_type(self, reference_type: str) -> ReferenceType:
+        try:
+            return self._bulk_reference_types[reference_type]
+        except KeyError:
+            supported = ", ".join(f'"{name}"' for name in self._bulk_reference_types)
+            raise ValueError(
+                f'Reference type "{reference_type}" is not supported by {self.__class__.__name__}. Supported reference '
+                f"types are {supported}."
+            ) from None
+
+    def _add_record_columns(
+        self,
+        reference_type: ReferenceType,
+        values: Iterable[Any],
+        external_database_key: Optional[str],
+        argument_name: str = "values",
+        amounts: Optional[Iterable[Any]] = None,
+        amounts_argument_name: str = "amounts",
+    ) -> None:
+        """Check the values and add them to the query as a column of records.
+
+        All values are checked before any records are added, so the query is not modified if a value is invalid.
+        """
+        records = _RecordColumns.from_values(
+            self._definition_type,
+            reference_type,
+            values,
+            database_key=external_database_key,
+            amounts=amounts,
+            argument_name=argument_name,
+            amounts_argument_name=amounts_argument_name,
+        )
+        self._data.append_record_columns(records)
+
 
 class _ApiMixin(_BaseQueryBuilder, _BaseQuery, ABC):
     """Provides API-specific mixins.
@@ -574,15 +852,48 @@ class _ApiMixin(_BaseQueryBuilder, _BaseQuery, ABC):
     """Type of object to send to the Granta MI server. The actual value is set in the concrete class
     definition."""
 
+    _request_parameters: Optional[Dict[str, Any]] = None
+    """Query-level arguments precomputed when the query was created from a :class:`QueryTemplate`, or ``None`` if
+    the arguments are computed every time the query is run. The arguments are shared with the template and with all
+    other queries created from it."""
+
     def __init__(self) -> None:
         super().__init__()
 
-    def _call_api(self, api_method: Callable[..., _Responses], arguments: Dict) -> None:
+    def as_template(self: _ApiQuery) -> "QueryTemplate[_ApiQuery]":
+        """Create a template with the same parameters and settings as this query, but without any items.
+
+        Use the template to create many queries which differ only in the records or BoM they are run against. The
+        arguments sent to Granta MI for the indicators, legislations, or units are computed once when the template
+        is created, and are shared by all queries created from the template.
+
+        .. versionadded:: 2.5
+
+        Returns
+        -------
+        QueryTemplate
+            Template which creates queries of the same type as this query.
+
+        Examples
+        --------
+        >>> template = (
+        ...     PartComplianceQuery()
+        ...     .with_indicators([indicator])
+        ...     .with_batch_size(50)
+        ...     .as_template()
+        ... )
+        >>> template.clone().with_part_numbers(["DRILL", "FLRY34"])
+        <PartComplianceQuery: 2 parts, batch size = 50, 1 indicators>
+        """
+        return QueryTemplate(self)
+
+    def _call_api(self, api_method: Callable[..., _Responses], arguments: Dict) -> _QueryRun:
         """Perform the actual call against the Granta MI database.
 
         This method finalizes the arguments by appending each batch of ``'item'`` arguments to the passed-in
         dictionary and uses them to instantiate the request object. It passes the request object to the
-        low-level API and returns the response as a list.
+        low-level API and stores the responses in a new :class:`_QueryRun` object. The query object is not modified,
+        so the query can be run again.
 
         Parameters
         ----------
@@ -590,16 +901,132 @@ class _ApiMixin(_BaseQueryBuilder, _BaseQuery, ABC):
             Method bound to the ``api.ComplianceApi`` or ``api.ImpactedSubstanceApi`` instance.
         arguments
             State of the query as a set of low-level API kwargs. Arguments include everything except the batched items.
+
+        Returns
+        -------
+        _QueryRun
+            Results and messages returned by the server for all batches.
         """
 
         self._validate_parameters()
         self._validate_items()
-        self._data.initialize_results()
-        for batch in self._data.batched_arguments:
-            args = {**arguments, **batch}
-            request = self._request_type(**args)
+        run = self._data.start_run()
+        # Batches are created one at a time when they are sent, unless they are sent concurrently
+        batches: Iterable[Dict[str, Any]] = run.batches
+        if self._data.max_concurrent_requests > 1:
+            batches = list(batches)
+            if len(batches) > 1:
+                self._call_api_concurrently(api_method, arguments, batches, run)
+                return run
+        for batch in batches:
+            run.append_response(*self._send_batch(api_method, {**arguments, **batch}))
+        return run
+
+    def _send_batch(
+        self, api_method: Callable[..., _Responses], request_arguments: Dict[str, Any]
+    ) -> Tuple[_Responses, BatchStatistics]:
+        """Create the request object for a single batch and send it to the server.
+
+        Returns
+        -------
+        tuple[_Responses, BatchStatistics]
+            Response returned by the server, and the statistics recorded while the batch was sent.
+        """
+        statistics = BatchStatistics()
+        with _record_batch(statistics):
+            request = self._request_type(**request_arguments)
             response = api_method(body=request)
-            self._data.append_response(response)
+        return response, statistics
+
+    def _call_api_concurrently(
+        self,
+        api_method: Callable[..., _Responses],
+        arguments: Dict,
+        batches: List[Dict[str, Any]],
+        run: _QueryRun,
+    ) -> None:
+        """Send the batches to the server from a pool of threads.
+
+        Responses are appended in the same order as the batches, so the result is the same as when the batches are
+        sent one at a time.
+        """
+        executor = ThreadPoolExecutor(max_workers=min(self._data.max_concurrent_requests, len(batches)))
+        try:
+            # Each batch runs in a copy of the current context, so hooks can identify the query the batch belongs to
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._send_batch, api_method, {**arguments, **batch})
+                for batch in batches
+            ]
+            for future in futures:
+                run.append_response(*future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fingerprint(self, static_arguments: Dict) -> str:
+        """Compute a fingerprint of the query and the connection-level arguments.
+
+        The fingerprint is computed from the type of the query, the arguments sent to the server for every batch, and
+        the items added to the query. Settings which only affect how the query is sent to the server, such as the batch
+        size, do not affect the fingerprint.
+
+        Parameters
+        ----------
+        static_arguments
+            Arguments set at the connection level, including the database key and any custom table names.
+
+        Returns
+        -------
+        str
+            SHA-256 hash of the canonical form of the query, as a hexadecimal string.
+        """
+        hasher = _CanonicalHasher()
+        hasher.add_value(self.__class__.__name__)
+        hasher.add_value(self._request_arguments(static_arguments))
+        self._data.update_fingerprint(hasher)
+        return hasher.hexdigest()
+
+    def _request_arguments(self, static_arguments: Dict) -> Dict:
+        """Combine the connection-level arguments with the query-level arguments, such as indicators or legislations.
+
+        Parameters
+        ----------
+        static_arguments
+            Arguments set at the connection level, including the database key and any custom table names.
+
+        Returns
+        -------
+            Arguments which are sent to the server with every batch of items.
+        """
+        parameters = self._request_parameters
+        if parameters is None:
+            parameters = self._query_parameters()
+        return {**static_arguments, **parameters}
+
+    @abstractmethod
+    def _query_parameters(self) -> Dict[str, Any]:
+        """Convert the query-level parameters, such as indicators or legislations, to low-level API kwargs.
+
+        Returns
+        -------
+            Arguments which are sent to the server with every batch of items.
+        """
+
+    @abstractmethod
+    def _copy_parameters(self) -> None:
+        """Replace the objects which store the query-level parameters with copies.
+
+        The parameters can then be modified without modifying the parameters of any other query.
+        """
+
+    def _unshare_parameters(self) -> None:
+        """Prepare the query-level parameters to be modified.
+
+        If the parameters are shared with a :class:`QueryTemplate`, they are copied first, and the precomputed request
+        arguments are discarded.
+        """
+        if self._request_parameters is not None:
+            self._copy_parameters()
+            self._request_parameters = None
 
     @abstractmethod
     def _run_query(
@@ -641,6 +1068,56 @@ class _ApiMixin(_BaseQueryBuilder, _BaseQuery, ABC):
         pass
 
 
+class QueryTemplate(Generic[_ApiQuery]):
+    """Creates queries with the same parameters and settings, but without any items.
+
+    Create a template with the ``as_template()`` method of any query. The template stores a copy of the query's
+    indicators, legislations, or units, and its settings such as the batch size. Later changes to the original query
+    do not affect the template.
+
+    The arguments sent to Granta MI for the indicators, legislations, or units are computed once, when the template is
+    created. Queries created with :meth:`clone` share these arguments with the template. If the parameters of a cloned
+    query are modified, the query copies the parameters first, so the template and other cloned queries are not
+    affected.
+
+    .. versionadded:: 2.5
+
+    Parameters
+    ----------
+    query : Query
+        Query to use as the basis of the template. Any items added to the query are ignored.
+    """
+
+    def __init__(self, query: _ApiQuery) -> None:
+        template = copy.copy(query)
+        template._data = query._data.empty_copy()
+        template._copy_parameters()
+        template._request_parameters = template._query_parameters()
+        self._query = template
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self._query.__class__.__name__}>"
+
+    def clone(self) -> _ApiQuery:
+        """Create a new query from the template.
+
+        Returns
+        -------
+        Query
+            Query with the parameters and settings of the template, and without any items.
+
+        Examples
+        --------
+        >>> template = MaterialImpactedSubstancesQuery().with_legislation_ids(["SINList"]).as_template()
+        >>> for material_ids in material_id_batches:
+        ...     query = template.clone().with_material_ids(material_ids)
+        ...     results.append(cxn.run(query))
+        """
+        query = copy.copy(self._query)
+        query._data = self._query._data.empty_copy()
+        return query
+
+
 class _ComplianceMixin(_ApiMixin, ABC):
     """Implements the compliance aspects of a query.
 
@@ -697,6 +1174,7 @@ class _ComplianceMixin(_ApiMixin, ABC):
         <MaterialCompliance: 0 materials, batch size = 100, 1 indicators>
         """
 
+        self._unshare_parameters()
         for value in indicators:
             self._indicators[value.name] = value
         return self
@@ -733,21 +1211,19 @@ class _ComplianceMixin(_ApiMixin, ABC):
         """
 
         api_method = getattr(api_instance, self._api_method)
-        arguments = {
-            **static_arguments,
-            "indicators": [i._definition for i in self._indicators.values()],
-        }
+        arguments = self._request_arguments(static_arguments)
 
         indicators_text = ", ".join(self._indicators)
         logger.debug(f"Indicators: {indicators_text}")
 
-        self._call_api(api_method, arguments)
-        result: ResultBaseClass = QueryResultFactory.create_result(
-            results=self._data.item_results,
-            messages=self._data.messages,
-            indicator_definitions=self._indicators,
-        )
-        return result
+        run = self._call_api(api_method, arguments)
+        return run.create_result(indicator_definitions=self._indicators)
+
+    def _query_parameters(self) -> Dict[str, Any]:
+        return {"indicators": [i._definition for i in self._indicators.values()]}
+
+    def _copy_parameters(self) -> None:
+        self._indicators = copy.deepcopy(self._indicators)
 
     def _validate_parameters(self) -> None:
         """Perform pre-flight checks on the indicators that have been added to the query.
@@ -812,6 +1288,7 @@ class _ImpactedSubstanceMixin(_ApiMixin, ABC):
             Error to raise if the method is called with values that do not match the types described earlier.
         """
 
+        self._unshare_parameters()
         self._legislations.extend(legislation_ids)
         return self
 
@@ -839,17 +1316,19 @@ class _ImpactedSubstanceMixin(_ApiMixin, ABC):
         """
 
         api_method = getattr(api_instance, self._api_method)
-        arguments = {"legislation_ids": self._legislations, **static_arguments}
+        arguments = self._request_arguments(static_arguments)
 
         legislations_text = ", ".join(['"' + leg + '"' for leg in self._legislations])
         logger.debug(f"Legislation ids: {legislations_text}")
 
-        self._call_api(api_method, arguments)
-        result: ResultBaseClass = QueryResultFactory.create_result(
-            results=self._data.item_results,
-            messages=self._data.messages,
-        )
-        return result
+        run = self._call_api(api_method, arguments)
+        return run.create_result()
+
+    def _query_parameters(self) -> Dict[str, Any]:
+        return {"legislation_ids": self._legislations}
+
+    def _copy_parameters(self) -> None:
+        self._legislations = list(self._legislations)
 
     def _validate_parameters(self) -> None:
         """Perform pre-flight checks on the legislations that have been added to the query.
@@ -872,7 +1351,11 @@ class _MaterialQueryBuilder(_RecordBasedQueryBuilder, ABC):
     """Provides the subclass for all queries where the items added to the query are direct references to material
     records."""
 
-    _definition_factory = MaterialDefinitionFactory()
+    _definition_type = MaterialDefinition
+    _bulk_reference_types = {
+        **_RecordBasedQueryBuilder._bulk_reference_types,
+        "material_ids": ReferenceType.MaterialId,
+    }
 
     def __init__(self) -> None:
         super().__init__()
@@ -919,12 +1402,9 @@ class _MaterialQueryBuilder(_RecordBasedQueryBuilder, ABC):
         <MaterialCompliance: 2 materials, batch size = 100, 0 indicators>
         """
 
-        for material_id in material_ids:
-            item_reference = self._definition_factory.create_definition_by_material_id(
-                material_id=material_id,
-                database_key=external_database_key,
-            )
-            self._data.append_record_definition(item_reference)
+        self._add_record_columns(
+            ReferenceType.MaterialId, material_ids, external_database_key, argument_name="material_ids"
+        )
         return self
 
 
@@ -994,7 +1474,11 @@ class _PartQueryBuilder(_RecordBasedQueryBuilder, ABC):
     """Provides the subclass for all queries where the items added to the query are direct references to part
     records."""
 
-    _definition_factory = PartDefinitionFactory()
+    _definition_type = PartDefinition
+    _bulk_reference_types = {
+        **_RecordBasedQueryBuilder._bulk_reference_types,
+        "part_numbers": ReferenceType.PartNumber,
+    }
 
     def __init__(self) -> None:
         super().__init__()
@@ -1038,12 +1522,9 @@ class _PartQueryBuilder(_RecordBasedQueryBuilder, ABC):
         <PartCompliance: 2 parts, batch size = 10, 0 indicators>
         """
 
-        for value in part_numbers:
-            item_reference = self._definition_factory.create_definition_by_part_number(
-                part_number=value,
-                database_key=external_database_key,
-            )
-            self._data.append_record_definition(item_reference)
+        self._add_record_columns(
+            ReferenceType.PartNumber, part_numbers, external_database_key, argument_name="part_numbers"
+        )
         return self
 
 
@@ -1115,7 +1596,11 @@ class _SpecificationQueryBuilder(_RecordBasedQueryBuilder, ABC):
     """Provides the subclass for all queries where the items added to the query are direct references to specification
     records."""
 
-    _definition_factory = SpecificationDefinitionFactory()
+    _definition_type = SpecificationDefinition
+    _bulk_reference_types = {
+        **_RecordBasedQueryBuilder._bulk_reference_types,
+        "specification_ids": ReferenceType.SpecificationId,
+    }
 
     def __init__(self) -> None:
         super().__init__()
@@ -1161,12 +1646,9 @@ class _SpecificationQueryBuilder(_RecordBasedQueryBuilder, ABC):
         <SpecificationComplianceQuery: 2 specifications, batch size = 10, 0 indicators>
         """
 
-        for specification_id in specification_ids:
-            item_reference = self._definition_factory.create_definition_by_specification_id(
-                specification_id=specification_id,
-                database_key=external_database_key,
-            )
-            self._data.append_record_definition(item_reference)
+        self._add_record_columns(
+            ReferenceType.SpecificationId, specification_ids, external_database_key, argument_name="specification_ids"
+        )
         return self
 
 
@@ -1239,7 +1721,13 @@ class _SubstanceQueryBuilder(_RecordBasedQueryBuilder, ABC):
     """Provides the subclass for all queries where the items added to the query are direct references to substance
     records."""
 
-    _definition_factory = SubstanceComplianceDefinitionFactory()
+    _definition_type = SubstanceDefinition
+    _bulk_reference_types = {
+        **_RecordBasedQueryBuilder._bulk_reference_types,
+        "cas_numbers": ReferenceType.CasNumber,
+        "ec_numbers": ReferenceType.EcNumber,
+        "chemical_names": ReferenceType.ChemicalName,
+    }
 
     def __init__(self) -> None:
         super().__init__()
@@ -1286,12 +1774,9 @@ class _SubstanceQueryBuilder(_RecordBasedQueryBuilder, ABC):
         <SubstanceComplianceQuery: 2 substances, batch size = 500, 0 indicators>
         """
 
-        for cas_number in cas_numbers:
-            item_reference = self._definition_factory.create_definition_by_cas_number(
-                cas_number=cas_number,
-                database_key=external_database_key,
-            )
-            self._data.append_record_definition(item_reference)
+        self._add_record_columns(
+            ReferenceType.CasNumber, cas_numbers, external_database_key, argument_name="cas_numbers"
+        )
         return self
 
     @validate_argument_type("ec_numbers", [str], {str})
@@ -1332,11 +1817,7 @@ class _SubstanceQueryBuilder(_RecordBasedQueryBuilder, ABC):
         <SubstanceComplianceQuery: 2 substances, batch size = 500, 0 indicators>
         """
 
-        for ec_number in ec_numbers:
-            item_reference = self._definition_factory.create_definition_by_ec_number(
-                ec_number=ec_number, database_key=external_database_key
-            )
-            self._data.append_record_definition(item_reference)
+        self._add_record_columns(ReferenceType.EcNumber, ec_numbers, external_database_key, argument_name="ec_numbers")
         return self
 
     @validate_argument_type("chemical_names", [str], {str})
@@ -1377,11 +1858,9 @@ class _SubstanceQueryBuilder(_RecordBasedQueryBuilder, ABC):
         <SubstanceComplianceQuery: 2 substances, batch size = 500, 0 indicators>
         """
 
-        for chemical_name in chemical_names:
-            item_reference = self._definition_factory.create_definition_by_chemical_name(
-                chemical_name=chemical_name, database_key=external_database_key
-            )
-            self._data.append_record_definition(item_reference)
+        self._add_record_columns(
+            ReferenceType.ChemicalName, chemical_names, external_database_key, argument_name="chemical_names"
+        )
         return self
 
     @validate_argument_type("record_history_identities_and_amounts", [(int, Number)], {(int, Number)})
@@ -1426,13 +1905,15 @@ class _SubstanceQueryBuilder(_RecordBasedQueryBuilder, ABC):
         <SubstanceComplianceQuery: 2 substances, batch size = 500, 0 indicators>
         """
 
-        for record_history_id, amount in record_history_identities_and_amounts:
-            item_reference = self._definition_factory.create_definition_by_record_history_identity(
-                record_history_identity=record_history_id,
-                database_key=external_database_key,
-            )
-            item_reference.percentage_amount = amount
-            self._data.append_record_definition(item_reference)
+        records = list(record_history_identities_and_amounts)
+        self._add_record_columns(
+            ReferenceType.MiRecordHistoryIdentity,
+            [value for value, _ in records],
+            external_database_key,
+            argument_name="record_history_identities_and_amounts",
+            amounts=[amount for _, amount in records],
+            amounts_argument_name="record_history_identities_and_amounts",
+        )
         return self
 
     @validate_argument_type("record_history_guids_and_amounts", [(str, Number)], {(str, Number)})
@@ -1480,13 +1961,15 @@ class _SubstanceQueryBuilder(_RecordBasedQueryBuilder, ABC):
         <SubstanceComplianceQuery: 2 substances, batch size = 500, 0 indicators>
 
         """
-        for record_history_guid, amount in record_history_guids_and_amounts:
-            item_reference = self._definition_factory.create_definition_by_record_history_guid(
-                record_history_guid=record_history_guid,
-                database_key=external_database_key,
-            )
-            item_reference.percentage_amount = amount
-            self._data.append_record_definition(item_reference)
+        records = list(record_history_guids_and_amounts)
+        self._add_record_columns(
+            ReferenceType.MiRecordHistoryGuid,
+            [value for value, _ in records],
+            external_database_key,
+            argument_name="record_history_guids_and_amounts",
+            amounts=[amount for _, amount in records],
+            amounts_argument_name="record_history_guids_and_amounts",
+        )
         return self
 
     @validate_argument_type("record_guids_and_amounts", [(str, Number)], {(str, Number)})
@@ -1534,12 +2017,15 @@ class _SubstanceQueryBuilder(_RecordBasedQueryBuilder, ABC):
         <SubstanceComplianceQuery: 2 substances, batch size = 500, 0 indicators>
         """
 
-        for record_guid, amount in record_guids_and_amounts:
-            item_reference = self._definition_factory.create_definition_by_record_guid(
-                record_guid=record_guid, database_key=external_database_key
-            )
-            item_reference.percentage_amount = amount
-            self._data.append_record_definition(item_reference)
+        records = list(record_guids_and_amounts)
+        self._add_record_columns(
+            ReferenceType.MiRecordGuid,
+            [value for value, _ in records],
+            external_database_key,
+            argument_name="record_guids_and_amounts",
+            amounts=[amount for _, amount in records],
+            amounts_argument_name="record_guids_and_amounts",
+        )
         return self
 
     @validate_argument_type("cas_numbers_and_amounts", [(str, Number)], {(str, Number)})
@@ -1584,12 +2070,15 @@ class _SubstanceQueryBuilder(_RecordBasedQueryBuilder, ABC):
         <SubstanceComplianceQuery: 2 substances, batch size = 500, 0 indicators>
         """
 
-        for cas_number, amount in cas_numbers_and_amounts:
-            item_reference = self._definition_factory.create_definition_by_cas_number(
-                cas_number=cas_number, database_key=external_database_key
-            )
-            item_reference.percentage_amount = amount
-            self._data.append_record_definition(item_reference)
+        records = list(cas_numbers_and_amounts)
+        self._add_record_columns(
+            ReferenceType.CasNumber,
+            [value for value, _ in records],
+            external_database_key,
+            argument_name="cas_numbers_and_amounts",
+            amounts=[amount for _, amount in records],
+            amounts_argument_name="cas_numbers_and_amounts",
+        )
         return self
 
     @validate_argument_type("ec_numbers_and_amounts", [(str, Number)], {(str, Number)})
@@ -1635,12 +2124,15 @@ class _SubstanceQueryBuilder(_RecordBasedQueryBuilder, ABC):
         <SubstanceComplianceQuery: 2 substances, batch size = 500, 0 indicators>
         """
 
-        for ec_number, amount in ec_numbers_and_amounts:
-            item_reference = self._definition_factory.create_definition_by_ec_number(
-                ec_number=ec_number, database_key=external_database_key
-            )
-            item_reference.percentage_amount = amount
-            self._data.append_record_definition(item_reference)
+        records = list(ec_numbers_and_amounts)
+        self._add_record_columns(
+            ReferenceType.EcNumber,
+            [value for value, _ in records],
+            external_database_key,
+            argument_name="ec_numbers_and_amounts",
+            amounts=[amount for _, amount in records],
+            amounts_argument_name="ec_numbers_and_amounts",
+        )
         return self
 
     @validate_argument_type("chemical_names_and_amounts", [(str, Number)], {(str, Number)})
@@ -1686,13 +2178,78 @@ class _SubstanceQueryBuilder(_RecordBasedQueryBuilder, ABC):
         <SubstanceComplianceQuery: 2 substances, batch size = 500, 0 indicators>
         """
 
-        for chemical_name, amount in chemical_names_and_amounts:
-            item_reference = self._definition_factory.create_definition_by_chemical_name(
-                chemical_name=chemical_name,
-                database_key=external_database_key,
-            )
-            item_reference.percentage_amount = amount
-            self._data.append_record_definition(item_reference)
+        records = list(chemical_names_and_amounts)
+        self._add_record_columns(
+            ReferenceType.ChemicalName,
+            [value for value, _ in records],
+            external_database_key,
+            argument_name="chemical_names_and_amounts",
+            amounts=[amount for _, amount in records],
+            amounts_argument_name="chemical_names_and_amounts",
+        )
+        return self
+
+    @validate_argument_type("reference_type", str)
+    @validate_argument_type("external_database_key", str, NoneType)
+    def with_bulk_records(
+        self: _SubstanceQuery,
+        reference_type: str,
+        values: Iterable[Any],
+        external_database_key: Optional[str] = None,
+        amounts: Optional[Iterable[Any]] = None,
+    ) -> _SubstanceQuery:
+        """
+        Add a large number of substances of the same reference type to a query, with optional amounts.
+
+        The values and amounts can be provided as any sequences or iterables, including NumPy arrays, pandas Series,
+        and generators. The substances are stored in a compact columnar form, and the requests sent to Granta MI are
+        only created one batch at a time when the query is run. Use this method to add hundreds of thousands of
+        substances to a query.
+
+        If the records referenced by the ``values`` argument are stored in an external database, you must provide the
+        external database key using the ``external_database_key`` argument. See
+        :ref:`ref_grantami_bomanalytics_external_record_references` for more details.
+
+        .. versionadded:: 2.5
+
+        Parameters
+        ----------
+        reference_type : str
+            Type of the values: ``"cas_numbers"``, ``"ec_numbers"``, ``"chemical_names"``, ``"record_history_ids"``,
+            ``"record_history_guids"``, or ``"record_guids"``.
+        values : Iterable
+            Values which reference the substances. Record history identities must be integers, and all other values
+            must be non-empty strings.
+        external_database_key : str, optional
+            Required if records referenced by the ``values`` argument are stored in an external database.
+        amounts : Iterable, optional
+            Amount of each substance in wt. %, in the same order as ``values``. If not specified, the amount of each
+            substance is set to 100%.
+
+        Returns
+        -------
+        Query
+            Current query object.
+
+        Raises
+        ------
+        ValueError
+            Error to raise if the reference type is not supported, if the number of amounts is not equal to the number
+            of values, or if an amount is not greater than 0 and less than or equal to 100.
+        TypeError
+            Error to raise if any value is of the wrong type or is an empty string, or if any amount is not a number.
+
+        Examples
+        --------
+        >>> substances = pandas.read_csv("substances.csv")
+        >>> query = SubstanceComplianceQuery().with_bulk_records(
+        ...     "cas_numbers", substances["CAS number"], amounts=substances["Amount"]
+        ... )
+        <SubstanceComplianceQuery: 1000000 substances, batch size = 500, 0 indicators>
+        """
+        self._add_record_columns(
+            self._get_bulk_reference_type(reference_type), values, external_database_key, amounts=amounts
+        )
         return self
 
 
@@ -1751,60 +2308,234 @@ class _BomFormat(Enum):
     bom_xml2505 = "http://www.grantadesign.com/25/05/BillOfMaterialsEco"
 
 
+_bom_format_schemas = {
+    _BomFormat.bom_xml1711: schemas.bom_schema_1711,
+    _BomFormat.bom_xml2301: schemas.bom_schema_2301,
+    _BomFormat.bom_xml2412: schemas.bom_schema_2412,
+    _BomFormat.bom_xml2505: schemas.bom_schema_2505,
+}
+_bom_xml_schemas: Dict[_BomFormat, "XMLSchema"] = {}
+_bom_handlers = threading.local()
+"""BoM handlers used to serialize BoM objects, one for each thread. BoM readers store the state of the BoM being read,
+so a BoM handler cannot be shared by threads."""
+
+
+def _get_bom_xml_schema(bom_format: _BomFormat) -> "XMLSchema":
+    """Get the parsed XML schema for a BoM format. Schemas are parsed on first use only."""
+    try:
+        return _bom_xml_schemas[bom_format]
+    except KeyError:
+        from xmlschema import XMLSchema
+
+        schema = _bom_xml_schemas[bom_format] = XMLSchema(_bom_format_schemas[bom_format])
+        return schema
+
+
+def _get_bom_handler() -> "BoMHandler":
+    """Get the BoM handler used to serialize BoM objects in the current thread. The handler is created on first use
+    only."""
+    handler: Optional[BoMHandler] = getattr(_bom_handlers, "handler", None)
+    if handler is None:
+        from ._bom_helper import BoMHandler
+
+        handler = _bom_handlers.handler = BoMHandler()
+    return handler
+
+
+_bom_query_validation_levels = ("none", "lax", "well-formed", "strict")
+
+_ROOT_TAG_CHUNK_SIZE = 1 << 16
+"""Number of characters or bytes of a BoM to parse at a time when reading the root tag."""
+
+
+class _RootTagFound(Exception):
+    def __init__(self, tag: str):
+        super().__init__(tag)
+        self.tag = tag
+
+
+class _RootTagTarget:
+    """Parser target which stops parsing at the first start tag."""
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        raise _RootTagFound(tag)
+
+    def close(self) -> None:
+        pass
+
+
+def _read_root_tag(bom: Union[str, bytes]) -> str:
+    """Get the qualified tag of the root element of an XML document without parsing the rest of the document.
+
+    The document is fed to the parser in chunks, and parsing stops at the end of the root start tag. The XML
+    declaration, any processing instructions and comments before the root element, and the root start tag must be
+    well-formed. The rest of the document is not checked. The same protections against entity expansion and external
+    references apply as when the entire document is parsed.
+
+    Raises
+    ------
+    ElementTree.ParseError
+        If the document is not valid XML before the end of the root start tag, or has no root element.
+    """
+    parser = DefusedXMLParser(target=_RootTagTarget())
+    try:
+        for i in range(0, len(bom), _ROOT_TAG_CHUNK_SIZE):
+            parser.feed(bom[i : i + _ROOT_TAG_CHUNK_SIZE])  # noqa: E203
+        parser.close()
+    except _RootTagFound as root:
+        return root.tag
+    # A document without a root element raises a ParseError when the parser is closed
+    raise ElementTree.ParseError("no element found")
+
+
 class _BomQueryDataManager(_BaseQueryDataManager):
     """Stores a BoM for use in queries and generates the kwarg to send to the server.
 
     Because of the base class, ``_item_definitions`` must be a list. However, this list only ever contains a
-    single string because only one BoM can be sent to the server in a single query.
+    single BoM because only one BoM can be sent to the server in a single query. The BoM is stored in the form it was
+    provided in: an XML string, UTF-8 encoded XML bytes, or a BillOfMaterials object. BoMs which are not provided as a
+    string are converted to a string once, when the BoM is first sent to the server.
     """
 
     def __init__(self, supported_bom_formats: List[_BomFormat]) -> None:
         super().__init__()
         self._item_definitions = []
-        self._item_results = []
         self._supported_bom_formats = supported_bom_formats
         self.item_type_name = "bom_xml"
+        self.incremental_update: Optional[_IncrementalComplianceUpdate] = None
+        """Incremental update to apply to the result, if the stored BoM contains only the changed parts of a BoM."""
+        self.max_parts_per_request: Optional[int] = None
+        """Maximum number of parts to send to the server in a single request, or ``None`` to send the BoM in a single
+        request."""
+        self.deduplicate_parts = False
+        """Whether to send identical parts to the server only once."""
+        self._bom_xml: Optional[str] = None
 
     def __repr__(self) -> str:
-        items_repr = f' {{bom: "{self._item_definitions[0][:100]}"}}' if self._item_definitions else ""
-        return f"<_BomQueryDataManager{items_repr}>"
+        if not self._item_definitions:
+            return "<_BomQueryDataManager>"
+        bom = self._item_definitions[0]
+        if isinstance(bom, str):
+            items_repr = f'"{bom[:100]}"'
+        elif isinstance(bom, bytes):
+            items_repr = f'"{bom[:100].decode("utf-8", errors="replace")}"'
+        else:
+            items_repr = f"<{type(bom).__name__} {type(bom).namespace}>"
+        return f"<_BomQueryDataManager {{bom: {items_repr}}}>"
 
     @property
     def bom(self) -> str:
         """BoM to use for the query. Because only one BoM is used per query, this property
         enforces storing only one BoM per ``_BomQueryDataManager`` instance.
 
+        If the BoM was not provided as a string, it is converted to a string the first time this property is accessed.
+        BillOfMaterials objects are serialized without validation.
+
         Returns
         -------
         bom : str
             BoM to use for the query.
         """
-        bom: str = self._item_definitions[0]
-        return bom
+        bom: _QueryBom = self._item_definitions[0]
+        if isinstance(bom, str):
+            return bom
+        # If two threads serialize the BoM at the same time, both produce the same string, so no lock is required
+        if self._bom_xml is None:
+            if isinstance(bom, bytes):
+                self._bom_xml = bom.decode("utf-8")
+            else:
+                self._bom_xml = _get_bom_handler().dump_bom(bom, validation="none")
+        return self._bom_xml
 
     @bom.setter
-    def bom(self, value: str) -> None:
-        self._validate_bom(value)
-        self._item_definitions = [value]
+    def bom(self, value: _QueryBom) -> None:
+        self.set_bom(value)
 
-    def _validate_bom(self, bom: str) -> _BomFormat:
+    def set_bom(self, bom: _QueryBom, validation: str = "lax") -> None:
+        """Validate the BoM to the specified level and store it for use in the query.
+
+        Parameters
+        ----------
+        bom : str | bytes | BillOfMaterials
+            BoM to use for the query.
+        validation : str, default: "lax"
+            ``"none"`` to store the BoM without validation, ``"lax"`` to check the root tag only,
+            ``"well-formed"`` to also check that the entire BoM is well-formed XML, or ``"strict"`` to validate the
+            entire BoM against the XML schema. For BillOfMaterials objects, the BoM format is determined from the type
+            of the object, and ``"strict"`` serializes the BoM with schema validation.
         """
-        Checks that the provided string is valid XML and that the root tag matches the root tag of a supported BoM
-        format.
+        _check_validation_level(validation, _bom_query_validation_levels)
+        self._bom_xml = None
+        if validation != "none":
+            self._validate_bom(bom, validation)
+        self._item_definitions = [bom]
+        self.incremental_update = None
+
+    def set_incremental_update(self, update: _IncrementalComplianceUpdate) -> None:
+        """Store the BoM containing the changed parts of a BoM for use in the query.
+
+        If no parts must be resubmitted, no BoM is stored.
+
+        Parameters
+        ----------
+        update : _IncrementalComplianceUpdate
+            Incremental update which defines the parts to resubmit.
         """
+        reduced_bom = update.reduced_bom
+        if reduced_bom is not None:
+            self.set_bom(reduced_bom, validation="none")
+        else:
+            self._item_definitions = []
+        self.incremental_update = update
+
+    def _validate_bom(self, bom: _QueryBom, validation: str = "lax") -> _BomFormat:
+        """
+        Checks that the root tag of the provided BoM matches the root tag of a supported BoM format.
+
+        By default, the BoM is parsed only until the end of the root start tag. If ``validation`` is ``"well-formed"``,
+        the entire BoM is parsed to check that it is well-formed XML. If ``validation`` is ``"strict"``, the BoM is also
+        validated against the XML schema for the BoM format.
+
+        For BillOfMaterials objects, the BoM format is determined from the namespace of the type, without serializing
+        the BoM. If ``validation`` is ``"strict"``, the BoM is serialized with schema validation, and the serialized
+        BoM is kept for use in the query.
+        """
+        if not isinstance(bom, (str, bytes)):
+            _bom_format = _BomFormat(type(bom).namespace)
+            if _bom_format not in self._supported_bom_formats:
+                raise ValueError(f"BoM format {_bom_format.name} ({_bom_format.value}) is not supported by this query.")
+            if validation == "strict":
+                self._bom_xml = _get_bom_handler().dump_bom(bom, validation="strict")
+            return _bom_format
+
         try:
-            root = ElementTree.XML(bom)
+            if validation == "well-formed":
+                root_tag = ElementTree.XML(bom).tag
+            else:
+                root_tag = _read_root_tag(bom)
         except ElementTree.ParseError as e:
             raise ValueError(f"BoM provided as input is not valid XML ({str(e)}).") from e
 
         valid_bom_formats = {f"{{{_format.value}}}PartsEco": _format for _format in _BomFormat}
         try:
-            _bom_format = valid_bom_formats[root.tag]
+            _bom_format = valid_bom_formats[root_tag]
         except KeyError:
             raise ValueError("Invalid input BoM. Ensure the document is compliant with the expected XML schema.")
         if _bom_format not in self._supported_bom_formats:
             raise ValueError(f"BoM format {_bom_format.name} ({_bom_format.value}) is not supported by this query.")
 
+        if validation == "strict":
+            from xmlschema import XMLSchemaValidationError
+
+            if isinstance(bom, bytes):
+                bom = self._bom_xml = bom.decode("utf-8")
+            try:
+                _get_bom_xml_schema(_bom_format).validate(bom)
+            except ElementTree.ParseError as e:
+                raise ValueError(f"BoM provided as input is not valid XML ({str(e)}).") from e
+            except XMLSchemaValidationError as e:
+                raise ValueError(f"Invalid input BoM:\n{e.msg}") from e
+
         return _bom_format
 
     @property
@@ -1823,7 +2554,112 @@ class _BomQueryDataManager(_BaseQueryDataManager):
         {"bom_xml1711": "<PartsEco xmlns..."}
         """
 
-        return [{self.item_type_name: self._item_definitions[0]}]
+        if not self._is_partitioned:
+            return [{self.item_type_name: self.bom}]
+        return self._partition_arguments(self._partition_bom(self.max_parts_per_request, self.deduplicate_parts))
+
+    @property
+    def _is_partitioned(self) -> bool:
+        return self.max_parts_per_request is not None or self.deduplicate_parts
+
+    def _partition_arguments(self, partitioning: _BoMPartitioning) -> List[Dict[str, str]]:
+        bom_handler = _get_bom_handler()
+        return [
+            {self.item_type_name: bom_handler.dump_bom(partition, validation="none")}
+            for partition in partitioning.partitions
+        ]
+
+    def start_run(self) -> _QueryRun:
+        """Create the object which stores the batches and responses for a single run of the query.
+
+        If the BoM is partitioned, the results for the partitions are merged into a single result for the BoM.
+
+        Returns
+        -------
+        _QueryRun
+            Object which generates the batches to send to the server and stores the responses.
+        """
+        if not self._is_partitioned:
+            return super().start_run()
+        partitioning = self._partition_bom(self.max_parts_per_request, self.deduplicate_parts)
+
+        def merge_results(results: List[models.ModelBase]) -> List[models.ModelBase]:
+            # The responses for the partitions of a BoM are all of the same type
+            if isinstance(results[0], models.GetComplianceForBomResponse):
+                return [partitioning.merge_compliance(cast(List[models.GetComplianceForBomResponse], results))]
+            return [
+                partitioning.merge_impacted_substances(cast(List[models.GetImpactedSubstancesForBomResponse], results))
+            ]
+
+        run = _QueryRun(self._partition_arguments(partitioning), self._extract_results_from_response, merge_results)
+        run.report.cache_hits = partitioning.reused_part_count
+        return run
+
+    def empty_copy(self) -> "_BomQueryDataManager":
+        """Create an argument manager with the same supported BoM formats and partitioning settings, but without a
+        BoM.
+
+        Returns
+        -------
+        _BomQueryDataManager
+            New argument manager.
+        """
+        data = _BomQueryDataManager(self._supported_bom_formats)
+        data.max_parts_per_request = self.max_parts_per_request
+        data.max_concurrent_requests = self.max_concurrent_requests
+        data.deduplicate_parts = self.deduplicate_parts
+        return data
+
+    def _partition_bom(self, max_parts: Optional[int], deduplicate: bool) -> _BoMPartitioning:
+        """Split the BoM into BoMs which contain at most ``max_parts`` parts each where possible, and optionally
+        remove identical parts.
+
+        The BoMs have the same format as the BoM provided to the query, so that they are accepted by the same versions
+        of Granta MI and no data is lost by converting the BoM.
+
+        Raises
+        ------
+        ValueError
+            Error to raise if the BoM is in the 17/11 format, which cannot be partitioned.
+        """
+        bom_handler = _get_bom_handler()
+        bom = self._item_definitions[0]
+        if isinstance(bom, (str, bytes)):
+            try:
+                bom = bom_handler.load_bom_from_text(self.bom, validation="none")
+            except ValueError as e:
+                raise ValueError("Only BoMs in the 23/01 format or later can be partitioned or deduplicated.") from e
+        partitioning = _BoMPartitioning(bom, max_parts, deduplicate)
+        logger.debug(
+            f"BoM split into {len(partitioning.partitions)} BoMs with "
+            f"{sum(len(partition.components) for partition in partitioning.partitions)} root parts"
+        )
+        return partitioning
+
+    def update_fingerprint(self, hasher: _CanonicalHasher) -> None:
+        """Add the BoM to a query fingerprint.
+
+        The BoM is added in the XML form that is sent to the server, so a BillOfMaterials object and the same BoM in
+        XML form produce the same fingerprint. BillOfMaterials objects are serialized once, and the serialized BoM is
+        reused when the query is run.
+
+        Partitioning and deduplication settings do not affect the fingerprint, because they do not affect the result
+        of the query. If the query only resubmits the changed parts of a BoM, the complete current BoM is added, since
+        the result is the same as the result for the complete BoM.
+
+        Parameters
+        ----------
+        hasher : _CanonicalHasher
+            Hasher for the query fingerprint.
+        """
+        if self.incremental_update is not None:
+            hasher.add_bom_xml(_get_bom_handler().dump_bom(self.incremental_update.current_bom, validation="none"))
+        elif not self._item_definitions:
+            hasher.add_value(None)
+        elif isinstance(self._item_definitions[0], str):
+            hasher.add_bom_xml(self._item_definitions[0])
+        else:
+            hasher.add_bom_xml(self.bom)
 
     def _extract_results_from_response(self, response: models.ModelBase) -> List[models.ModelBase]:
         """Extracts the individual results from a response object.
@@ -1854,20 +2690,45 @@ class _BomQueryBuilder(_BaseQueryBuilder, ABC):
     def __init__(self) -> None:
         self._data: _BomQueryDataManager = _BomQueryDataManager(self._supported_bom_formats)
 
-    @validate_argument_type("bom", str)
-    def with_bom(self: _BomQuery, bom: str) -> _BomQuery:
+    @validate_argument_type(
+        "bom", str, bytes, Path, eco2301.BillOfMaterials, eco2412.BillOfMaterials, eco2505.BillOfMaterials
+    )
+    @validate_argument_type("validation", str)
+    def with_bom(self: _BomQuery, bom: Union[_QueryBom, Path], validation: str = "lax") -> _BomQuery:
         """Set the BoM to use for the query.
 
         See the documentation for the parent query class for supported BoM formats.
 
-        Minimal validation is performed on the provided BoM to ensure it defines a supported XML schema. XSD files are
-        provided in :mod:`~.schemas` for full validation.
+        By default, minimal validation is performed on the provided BoM to ensure it defines a supported XML schema.
+        XSD files are provided in :mod:`~.schemas` for full validation.
+
+        The BoM can be provided as an XML string, as UTF-8 encoded XML bytes, as the path to a UTF-8 encoded XML file,
+        or as a BillOfMaterials object. BillOfMaterials objects are not serialized until the query is run, and their
+        BoM format is determined from their type, so the BoM is never parsed. Do not modify a BillOfMaterials object
+        after adding it to a query.
 
         Parameters
         ----------
-        bom : str
+        bom : str | bytes | :class:`~pathlib.Path` | :class:`.eco2505.BillOfMaterials` | \
+              :class:`.eco2412.BillOfMaterials` | :class:`.eco2301.BillOfMaterials`
            BoM to use for the query.
 
+           .. versionchanged:: 2.5
+              Added support for bytes, file paths, and BillOfMaterials objects.
+        validation : str, default: "lax"
+           The level of validation to perform on the BoM:
+
+           * ``"lax"``: Check that the root element of the BoM is the root element of a BoM format supported by the
+             query. The BoM is only parsed until the end of the root start tag, so the time taken does not depend on
+             the size of the BoM. Any XML errors after the root start tag are reported by Granta MI when the query is
+             run.
+           * ``"well-formed"``: Additionally check that the entire BoM is well-formed XML.
+           * ``"strict"``: Additionally validate the entire BoM against the XML schema for the BoM format.
+           * ``"none"``: Do not validate the BoM. Use this level only for BoMs from a trusted source, such as BoMs
+             created with :meth:`.BoMHandler.dump_bom`. Invalid BoMs are reported by Granta MI when the query is run.
+
+           .. versionadded:: 2.5
+
         Returns
         -------
         Query
@@ -1878,14 +2739,22 @@ class _BomQueryBuilder(_BaseQueryBuilder, ABC):
         TypeError
            Error raised if the method is called with values that do not match the types described earlier.
         ValueError
-            Error raised if the bom isn't valid XML, or isn't in a known supported BoM format.
+            Error raised if the bom isn't valid XML, or isn't in a known supported BoM format. Only the XML before the
+            end of the root start tag is checked unless ``validation="well-formed"`` or ``validation="strict"`` is
+            specified.
+        ValueError
+            Error raised if ``validation="strict"`` is specified and the BoM isn't valid according to the XML schema.
+        ValueError
+            Error raised if the ``validation`` argument is not a valid validation level.
 
         Notes
         -----
         See the :py:mod:`ansys.grantami.bomanalytics.schemas` subpackage for Ansys Granta XML BoM Schema Definitions.
 
         """
-        self._data.bom = bom
+        if isinstance(bom, Path):
+            bom = bom.read_text(encoding="utf-8")
+        self._data.set_bom(bom, validation)
         return self
 
     def _validate_items(self) -> None:
@@ -1901,7 +2770,119 @@ class _BomQueryBuilder(_BaseQueryBuilder, ABC):
             raise ValueError("No BoM has been added to the query.")
 
 
-class BomComplianceQuery(_ComplianceMixin, _BomQueryBuilder):
+class _PartitionedBomQueryBuilder(_BomQueryBuilder, ABC):
+    """Subclass for BoM queries where the BoM can be split into smaller BoMs which are analyzed independently."""
+
+    @validate_argument_type("max_parts_per_request", int)
+    @validate_argument_type("max_concurrent_requests", int)
+    def with_partitioning(self: _BomQuery, max_parts_per_request: int, max_concurrent_requests: int = 4) -> _BomQuery:
+        """Split the BoM into smaller BoMs when the query is run, and send them to Granta MI concurrently.
+
+        The results for the smaller BoMs are merged into a single result, which is equivalent to the result for the
+        entire BoM. Partitioning reduces the time taken to analyze large BoMs, and avoids large requests which may
+        exceed limits on the size of a request or the time taken to process a request.
+
+        The BoM is split between assemblies which do not reference a record, and have no exemptions or child items
+        other than parts. The results for these assemblies are determined from the results of their child parts. For
+        compliance queries, the compliance of the assembly for each indicator is the worst compliance of its child
+        parts. For impacted substances queries, a substance impacted in more than one of the smaller BoMs for the same
+        legislation is reported once, with the maximum percentage amount in any of the smaller BoMs.
+
+        Any other part is sent together with all its child parts. A request can contain more than
+        ``max_parts_per_request`` parts if such a part contains more parts.
+
+        Partitioning is only supported for BoMs in the 23/01 format or later. The smaller BoMs are sent in the same
+        format as the BoM provided to the query.
+
+        .. versionadded:: 2.5
+
+        Parameters
+        ----------
+        max_parts_per_request : int
+            Maximum number of parts to include in a single request to Granta MI.
+        max_concurrent_requests : int, default: 4
+            Maximum number of requests to send to Granta MI at the same time.
+
+        Returns
+        -------
+        Query
+            Current query object.
+
+        Raises
+        ------
+        ValueError
+            Error raised if ``max_parts_per_request`` or ``max_concurrent_requests`` is less than 1.
+        TypeError
+            Error raised if the method is called with values that do not match the types described earlier.
+
+        Examples
+        --------
+        >>> query = (
+        ...     BomComplianceQuery()
+        ...     .with_bom("<PartsEco xmlns...")
+        ...     .with_indicators([indicator])
+        ...     .with_partitioning(max_parts_per_request=1000)
+        ... )
+        >>> cxn.run(query)
+        <BomComplianceQueryResult: 1 PartWithCompliance results>
+        """
+        if max_parts_per_request < 1:
+            raise ValueError("Maximum number of parts per request must be a positive integer")
+        if max_concurrent_requests < 1:
+            raise ValueError("Maximum number of concurrent requests must be a positive integer")
+        self._data.max_parts_per_request = max_parts_per_request
+        self._data.max_concurrent_requests = max_concurrent_requests
+        return self
+
+    @validate_argument_type("deduplicate", bool)
+    def with_deduplication(self: _BomQuery, deduplicate: bool = True) -> _BomQuery:
+        """Send identical parts in the BoM to Granta MI only once when the query is run.
+
+        BoMs often contain the same part or sub-assembly many times, for example below different parent assemblies.
+        With deduplication, the BoM is split in the same way as with :meth:`with_partitioning`, and only one
+        occurrence of each distinct part is sent to Granta MI together with its child parts. The result for this
+        occurrence is used for every occurrence of the part in the BoM, so the result of the query has the same
+        hierarchy as the result for the entire BoM.
+
+        Parts are identical if they and all their child parts are equal, ignoring the quantity of the parts and the
+        internal IDs of all items, which do not affect the result.
+
+        Deduplication can be combined with :meth:`with_partitioning`. Deduplication is only supported for BoMs in the
+        23/01 format or later.
+
+        .. versionadded:: 2.5
+
+        Parameters
+        ----------
+        deduplicate : bool, default: True
+            Whether to send identical parts to Granta MI only once.
+
+        Returns
+        -------
+        Query
+            Current query object.
+
+        Raises
+        ------
+        TypeError
+            Error raised if the method is called with values that do not match the types described earlier.
+
+        Examples
+        --------
+        >>> query = (
+        ...     BomComplianceQuery()
+        ...     .with_bom("<PartsEco xmlns...")
+        ...     .with_indicators([indicator])
+        ...     .with_deduplication()
+        ... )
+        >>> cxn.run(query)
+        <BomComplianceQueryResult: 1 PartWithCompliance results>
+        """
+        self._data.deduplicate_parts = deduplicate
+        return self
+
+
+class BomComplianceQuery(_ComplianceMixin, _PartitionedBomQueryBuilder):
     """Evaluates compliance for a BoM against a number of indicators.
 
     The BoM must be in the Ansys Granta 1711 XML BoM format or Ansys Granta 2301 XML BoM format.
@@ -1942,8 +2923,90 @@ class BomComplianceQuery(_ComplianceMixin, _BomQueryBuilder):
     _api_method = "post_compliance_bom"
     _request_type = models.GetComplianceForBomRequest
 
+    @validate_argument_type("bom", eco2505.BillOfMaterials)
+    @validate_argument_type("previous_bom", eco2505.BillOfMaterials)
+    @validate_argument_type("previous_result", BomComplianceQueryResult)
+    def with_bom_changes(
+        self,
+        bom: eco2505.BillOfMaterials,
+        previous_bom: eco2505.BillOfMaterials,
+        previous_result: BomComplianceQueryResult,
+    ) -> "BomComplianceQuery":
+        """Set the BoM to use for the query as a modified version of a BoM that has already been evaluated.
+
+        The BoM is compared with the previous BoM with :class:`~ansys.grantami.bomanalytics.BoMDiff`, and only the
+        changed parts are submitted to Granta MI. Running the query returns a result for the entire BoM, which is
+        created by replacing the results for the changed parts in the previous result. The previous result is not
+        modified.
+
+        Parts which were added or modified are resubmitted together with all their child parts. If the child parts of
+        an assembly have changed, the compliance of the assembly is determined from its child parts if the assembly
+        does not reference a record, and has no exemptions or child items other than parts. Otherwise, the assembly is
+        resubmitted. If no parts must be resubmitted, the query is not sent to Granta MI.
+
+        The query must use the same indicators as the query used to obtain ``previous_result``.
+
+        .. versionadded:: 2.5
+
+        Parameters
+        ----------
+        bom : :class:`~ansys.grantami.bomanalytics.bom_types.eco2505.BillOfMaterials`
+            BoM to use for the query.
+        previous_bom : :class:`~ansys.grantami.bomanalytics.bom_types.eco2505.BillOfMaterials`
+            Previous version of the BoM.
+        previous_result : :class:`~ansys.grantami.bomanalytics._query_results.BomComplianceQueryResult`
+            Result of running a compliance query for ``previous_bom``.
+
+        Returns
+        -------
+        Query
+            Current query object.
 
-class BomImpactedSubstancesQuery(_ImpactedSubstanceMixin, _BomQueryBuilder):
+        Raises
+        ------
+        TypeError
+            Error raised if the method is called with values that do not match the types described earlier.
+
+        Examples
+        --------
+        >>> previous_result = cxn.run(
+        ...     BomComplianceQuery().with_bom(bom_handler.dump_bom(previous_bom)).with_indicators([indicator])
+        ... )
+        >>> query = (
+        ...     BomComplianceQuery()
+        ...     .with_bom_changes(bom, previous_bom, previous_result)
+        ...     .with_indicators([indicator])
+        ... )
+        >>> cxn.run(query)
+        <BomComplianceQueryResult: 1 PartWithCompliance results>
+        """
+        update = _IncrementalComplianceUpdate(BoMDiff(previous_bom, bom), previous_result)
+        self._data.set_incremental_update(update)
+        return self
+
+    def _run_query(
+        self,
+        api_instance: api.ComplianceApi,  # type: ignore[override]
+        static_arguments: Dict,
+    ) -> ResultBaseClass:
+        update = self._data.incremental_update
+        if update is None:
+            return super()._run_query(api_instance, static_arguments)
+
+        indicator_names = update.indicator_names
+        if indicator_names is not None and sorted(indicator_names) != sorted(self._indicators):
+            raise ValueError(
+                "The indicators added to the query must be the same as the indicators used for the previous result."
+            )
+        if update.reduced_bom is None:
+            logger.debug("No parts have changed, the query is not sent to Granta MI")
+            self._validate_parameters()
+            return update.apply(None)
+        result = super()._run_query(api_instance, static_arguments)
+        return update.apply(cast(BomComplianceQueryResult, result))
+
+
+class BomImpactedSubstancesQuery(_ImpactedSubstanceMixin, _PartitionedBomQueryBuilder):
     """Gets the substances impacted by a list of legislations for a BoM.
 
     The BoM must be in the Ansys Granta 1711 XML BoM format or Ansys Granta 2301 XML BoM format.
@@ -2012,6 +3075,7 @@ class _SustainabilityMixin(_ApiMixin):
             Unit for mass.
 
         """
+        self._unshare_parameters()
         if distance is not None:
             self._preferred_units.distance_unit = distance
         if energy is not None:
@@ -2030,17 +3094,16 @@ class _SustainabilityMixin(_ApiMixin):
         Sets the arguments ``preferred_units`` from user inputs.
         """
         api_method = getattr(api_instance, self._api_method)
-        arguments = {
-            **static_arguments,
-            "preferred_units": self._preferred_units,
-        }
-
-        self._call_api(api_method, arguments)
-        result: ResultBaseClass = QueryResultFactory.create_result(
-            results=self._data.item_results,
-            messages=self._data.messages,
-        )
-        return result
+        arguments = self._request_arguments(static_arguments)
+
+        run = self._call_api(api_method, arguments)
+        return run.create_result()
+
+    def _query_parameters(self) -> Dict[str, Any]:
+        return {"preferred_units": self._preferred_units}
+
+    def _copy_parameters(self) -> None:
+        self._preferred_units = copy.deepcopy(self._preferred_units)
 
     def _validate_parameters(self) -> None:
         pass
@@ -22,11 +22,13 @@
 
 import os
 from typing import cast
+import uuid
 
 from defusedxml import ElementTree
 
 from ansys.grantami.bomanalytics import Connection, indicators
 from ansys.grantami.bomanalytics._connection import BomAnalyticsClient
+from ansys.grantami.bomanalytics.bom_types import eco2505
 
 sl_url = os.getenv("TEST_SL_URL", "http://localhost/mi_servicelayer")
 read_username = os.getenv("TEST_USER")
@@ -40,6 +42,9 @@ ci_unit_tests = os.getenv("CI") and not os.getenv("TEST_SL_URL")
 
 LICENSE_RESPONSE = {"LogMessages": [], "RestrictedSubstances": True, "Sustainability": True}
 LEGISLATIONS = ["SINList", "CCC"]
+LEGISLATION = "SINList"
+ROHS = "RoHS"
+MATERIAL_IDS = [f"material-{index}" for index in range(25)]
 
 
 two_legislation_indicator = indicators.WatchListIndicator(
@@ -109,3 +114,139 @@ def get_mi_version() -> tuple[int, int] | None:
     print(f"Granta MI version {parsed_version}")
     _mi_version_cache = cast(tuple[int, int], tuple(parsed_version))
     return _mi_version_cache
+
+
+def echo_materials(request, context):
+    """Impacted substances response which contains one result for each material in the request."""
+    body = request.json()
+    return {
+        "Materials": [
+            {
+                "Legislations": [],
+                "ReferenceType": material["ReferenceType"],
+                "ReferenceValue": material["ReferenceValue"],
+            }
+            for material in body["Materials"]
+        ],
+        "LogMessages": [{"Severity": "information", "Message": f"Database {body['DatabaseKey']}"}],
+    }
+
+
+def make_guid(name: str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_OID, name))
+
+
+def make_reference(name: str) -> eco2505.ExtendedMIRecordReference:
+    return eco2505.ExtendedMIRecordReference(db_key="MI_Restricted_Substances", record_guid=make_guid(name))
+
+
+def make_material(name: str) -> eco2505.Material:
+    return eco2505.Material(mi_material_reference=make_reference(name), percentage=100.0)
+
+
+def make_bom() -> eco2505.BillOfMaterials:
+    """
+    Create a BoM with assemblies that can and cannot be rolled up locally.
+
+    Part numbers starting with "NC" are reported as non-compliant by the mocked server.
+    """
+    return eco2505.BillOfMaterials(
+        components=[
+            eco2505.Part(
+                part_number="Product",
+                components=[
+                    eco2505.Part(
+                        part_number="Assembly1",
+                        components=[
+                            eco2505.Part(part_number="P1", materials=[make_material("M1")]),
+                            eco2505.Part(part_number="P2", materials=[make_material("M2")]),
+                        ],
+                    ),
+                    eco2505.Part(
+                        part_number="Assembly2",
+                        mi_part_reference=make_reference("A2"),
+                        components=[
+                            eco2505.Part(part_number="P3", materials=[make_material("M3")]),
+                            eco2505.Part(part_number="P4", internal_id="P4-1"),
+                            eco2505.Part(part_number="P4", internal_id="P4-2"),
+                        ],
+                    ),
+                ],
+            ),
+            eco2505.Part(part_number="Spare", materials=[make_material("M5")]),
+        ]
+    )
+
+
+def find_part(bom: eco2505.BillOfMaterials, *part_numbers: str) -> eco2505.Part:
+    parts = bom.components
+    for part_number in part_numbers:
+        part = next(p for p in parts if p.part_number == part_number)
+        parts = part.components
+    return part
+
+
+def iter_parts(parts):
+    stack = list(reversed(parts))
+    while stack:
+        part = stack.pop()
+        yield part
+        stack.extend(reversed(part.components))
+
+
+def make_large_bom() -> eco2505.BillOfMaterials:
+    bom = make_bom()
+    find_part(bom, "Product", "Assembly1", "P2").part_number = "NC2"
+    find_part(bom, "Product", "Assembly1").components.append(
+        eco2505.Part(
+            part_number="Subassembly",
+            components=[
+                eco2505.Part(part_number="P6", materials=[make_material("M1")]),
+                eco2505.Part(part_number="P7", materials=[make_material("M6")]),
+            ],
+        )
+    )
+    find_part(bom, "Product", "Assembly1", "P1").materials[0].percentage = 50.0
+    return bom
+
+
+def part_result(part: eco2505.Part) -> dict:
+    """Compliance of a part as reported by the mocked server."""
+    children = [part_result(child) for child in part.components]
+    flags = [child["Indicators"][0]["Flag"] for child in children]
+    if not children or part.mi_part_reference is not None or part.materials:
+        flags.append("RohsNonCompliant" if part.part_number.startswith("NC") else "RohsCompliant")
+    flag = max(flags, key=lambda flag: indicators.RoHSFlag[flag].value)
+    return {
+        "Indicators": [{"Name": ROHS, "Flag": flag}],
+        "InputPartNumber": part.part_number,
+        "Parts": children,
+        "Specifications": [],
+        "Materials": [],
+        "Substances": [],
+    }
+
+
+def summarize(part_results) -> list:
+    return [(part.input_part_number, part.indicators[ROHS].flag, summarize(part.parts)) for part in part_results]
+
+
+def impacted_substances_result(bom: eco2505.BillOfMaterials) -> dict:
+    """Impacted substances for a BoM as reported by the mocked server. Each material contains one substance."""
+    substances = {}
+    for part in iter_parts(bom.components):
+        for material in part.materials:
+            guid = material.mi_material_reference.record_guid
+            amount = max(material.percentage, substances.get(guid, 0.0))
+            substances[guid] = amount
+    return {
+        "Legislations": [
+            {
+                "LegislationId": LEGISLATION,
+                "ImpactedSubstances": [
+                    {"SubstanceName": guid, "MaxPercentageAmountInMaterial": amount, "LegislationThreshold": 0.1}
+                    for guid, amount in substances.items()
+                ],
+            }
+        ],
+    }
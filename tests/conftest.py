@@ -24,6 +24,7 @@ from collections import defaultdict
 import os
 import pathlib
 from typing import List
+from xml.etree import ElementTree
 
 import pytest
 import requests_mock
@@ -45,6 +46,13 @@ from .common import (
 from .examples_expectations import examples_expectations
 
 
+@pytest.fixture
+def isolated_namespace_registry(monkeypatch):
+    """xmlschema registers the BoM namespace prefixes globally when formatting validation errors, which changes the
+    prefixes used by subsequent calls to BoMHandler.dump_bom. Discard any namespaces registered during the test."""
+    monkeypatch.setattr(ElementTree, "_namespace_map", dict(ElementTree._namespace_map))
+
+
 @pytest.fixture
 def connection():
     return _get_connection(sl_url, read_username, read_password)
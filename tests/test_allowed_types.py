@@ -20,12 +20,15 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from array import array
+from collections import namedtuple
 from numbers import Number
 from typing import Optional
+from unittest.mock import Mock
 
 import pytest
 
-from ansys.grantami.bomanalytics._allowed_types import _check_type, validate_argument_type
+from ansys.grantami.bomanalytics._allowed_types import _compile_type_spec, validate_argument_type
 
 valid_types = [
     (int,),
@@ -354,10 +357,21 @@ class TestCheckType:
             ({"a": [1, 2], "b": [3, 4]}, {str: [int]}),
             ({"a": [1, 2], "b": [3, 4]}, object),
             ({"a": [1, 2], "b": [3, 4]}, {str: [object]}),
+            ([1, 2.5], [Number]),
+            ([("a", 1), ("b", 2.5)], [(str, Number)]),
+            ([namedtuple("Pair", ["name", "amount"])("a", 1)], [(str, Number)]),
+            ({("a", 1), ("b", 2.5)}, {(str, Number)}),
+            ([Mock(spec=int)], [int]),
+            ([("a", Mock(spec=int))], [(str, int)]),
+            (range(5), [int]),
+            (range(5), [Number]),
+            (array("q", [1, 2]), [int]),
+            (array("d", [1.5]), [float]),
+            (array("d", [1.5]), [Number]),
         ],
     )
     def test_check_type_success(self, obj, allowed_type):
-        _check_type(obj, allowed_type)
+        assert _compile_type_spec(allowed_type)(obj)
 
     @pytest.mark.parametrize(
         "obj, allowed_type",
@@ -374,11 +388,18 @@ class TestCheckType:
             ({"a": 5.5, "b": 10.0}, {float}),
             ({"a": 5.5, "b": 10.0}, {str: int}),
             ({"a": [1, 2], "b": [3, 4]}, {str: [str]}),
+            ([("a", 1), ("b", "2")], [(str, Number)]),
+            ([("a", 1), ["b", 2]], [(str, Number)]),
+            (range(5), [str]),
+            (range(5), (int,)),
+            (range(5), {int}),
+            (array("d", [1.5]), [int]),
+            (array("q", [1]), [str]),
+            (array("u", "ab"), [str]),
         ],
     )
     def test_check_type_wrong_type(self, obj, allowed_type):
-        with pytest.raises(AssertionError):
-            _check_type(obj, allowed_type)
+        assert not _compile_type_spec(allowed_type)(obj)
 
     @pytest.mark.parametrize(
         "obj, allowed_type",
@@ -386,8 +407,28 @@ class TestCheckType:
             (("test",), (str, str)),
             (("test", "test2"), (str, str, str)),
             (("test", "test2", "test3"), (str, str)),
+            ([("a", 1), ("b", 2, 3)], [(str, int)]),
         ],
     )
     def test_check_type_wrong_container_length(self, obj, allowed_type):
         with pytest.raises(ValueError):
-            _check_type(obj, allowed_type)
+            _compile_type_spec(allowed_type)(obj)
+
+
+class TestLargeContainers:
+    @staticmethod
+    @validate_argument_type("values", [int], {int})
+    def func(self, values):
+        return len(values)
+
+    def test_large_homogeneous_list(self):
+        assert self.func(None, list(range(100_000))) == 100_000
+
+    def test_invalid_item_in_large_list(self):
+        values = list(range(100_000))
+        values[-1] = "100000"
+        with pytest.raises(TypeError, match="Incorrect type for argument 'values'"):
+            self.func(None, values)
+
+    def test_range(self):
+        assert self.func(None, range(100_000)) == 100_000
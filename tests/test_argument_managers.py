@@ -23,6 +23,7 @@
 from dataclasses import dataclass
 import re
 
+from defusedxml import EntitiesForbidden
 import pytest
 
 from ansys.grantami.bomanalytics import queries
@@ -143,9 +144,38 @@ class TestBomNameSpaceParsing:
         parsed_format = queries._BomQueryDataManager(all_bom_formats)._validate_bom(bom)
         assert parsed_format == bom_format
 
-    def test_not_valid_xml(self):
+    @pytest.mark.parametrize("validation", ["well-formed", "strict"])
+    def test_not_valid_xml(self, validation):
         bom = example_boms["bom-1711"].content.replace("<Components>", "<Component>")
         with pytest.raises(ValueError, match="BoM provided as input is not valid XML"):
+            queries._BomQueryDataManager(all_bom_formats).set_bom(bom, validation=validation)
+
+    def test_lax_validation_only_parses_root_start_tag(self):
+        bom = example_boms["bom-1711"].content.replace("<Components>", "<Component>")
+        am = queries._BomQueryDataManager(all_bom_formats)
+        am.bom = bom
+        assert am.bom == bom
+
+    @pytest.mark.parametrize("bom", ["", "Not XML", '<?xml version="1.0"?>', "<PartsEco xmlns=>"])
+    @pytest.mark.parametrize("validation", ["lax", "well-formed"])
+    def test_not_valid_xml_before_end_of_root_start_tag(self, bom, validation):
+        with pytest.raises(ValueError, match="BoM provided as input is not valid XML"):
+            queries._BomQueryDataManager(all_bom_formats).set_bom(bom, validation=validation)
+
+    @pytest.mark.parametrize("encode", [False, True])
+    def test_root_tag_in_later_chunk(self, encode, monkeypatch):
+        monkeypatch.setattr(queries, "_ROOT_TAG_CHUNK_SIZE", 7)
+        bom = example_boms["sustainability-bom-2412"].content
+        bom = "<!-- " + "x" * 100 + " -->" + bom[bom.index("?>") + 2 :]  # noqa: E203
+        parsed_format = queries._BomQueryDataManager(all_bom_formats)._validate_bom(bom.encode() if encode else bom)
+        assert parsed_format == queries._BomFormat.bom_xml2412
+
+    def test_entities_are_forbidden(self):
+        bom = (
+            '<!DOCTYPE PartsEco [<!ENTITY a "b">]>'
+            '<PartsEco xmlns="http://www.grantadesign.com/23/01/BillOfMaterialsEco"/>'
+        )
+        with pytest.raises(EntitiesForbidden):
             queries._BomQueryDataManager(all_bom_formats).bom = bom
 
     def test_xml_but_not_a_bom(self):
@@ -174,6 +204,52 @@ class TestBomNameSpaceParsing:
             ].content
 
 
+class TestBomValidationLevels:
+    def test_no_validation_skips_parsing(self):
+        bom = example_boms["bom-1711"].content.replace("<Components>", "<Component>")
+        am = queries._BomQueryDataManager([queries._BomFormat.bom_xml2301])
+        am.set_bom(bom, validation="none")
+        assert am.bom == bom
+
+    @pytest.mark.parametrize("bom_key", ["bom-1711", "sustainability-bom-2301", "sustainability-bom-2505"])
+    def test_strict_validation_valid_bom(self, bom_key):
+        bom = example_boms[bom_key].content
+        am = queries._BomQueryDataManager(all_bom_formats)
+        am.set_bom(bom, validation="strict")
+        assert am.bom == bom
+
+    @pytest.mark.usefixtures("isolated_namespace_registry")
+    def test_strict_validation_invalid_bom(self):
+        bom = (
+            example_boms["sustainability-bom-2301"]
+            .content.replace("<PartNumber>", "<PartNo>")
+            .replace("</PartNumber>", "</PartNo>")
+        )
+        am = queries._BomQueryDataManager(all_bom_formats)
+        am.set_bom(bom, validation="lax")
+        with pytest.raises(ValueError, match="Invalid input BoM:"):
+            am.set_bom(bom, validation="strict")
+
+    def test_strict_validation_unsupported_format(self):
+        expected_error = re.escape(
+            "bom_xml2301 (http://www.grantadesign.com/23/01/BillOfMaterialsEco) is not supported by this query."
+        )
+        am = queries._BomQueryDataManager([queries._BomFormat.bom_xml1711])
+        with pytest.raises(ValueError, match=expected_error):
+            am.set_bom(example_boms["sustainability-bom-2301"].content, validation="strict")
+
+    def test_invalid_validation_level(self):
+        am = queries._BomQueryDataManager(all_bom_formats)
+        with pytest.raises(ValueError, match='validation "skip" is not a valid validation level'):
+            am.set_bom(example_boms["bom-1711"].content, validation="skip")
+
+    def test_well_formed_validation_valid_bom(self):
+        bom = example_boms["sustainability-bom-2301"].content
+        am = queries._BomQueryDataManager(all_bom_formats)
+        am.set_bom(bom, validation="well-formed")
+        assert am.bom == bom
+
+
 def test_add_boms_sequentially():
     # Check that properties are updated as expected when overwriting a bom with a bom from another version
     bom_manager = queries._BomQueryDataManager(all_bom_formats)
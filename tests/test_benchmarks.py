@@ -0,0 +1,134 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import dataclasses
+import json
+
+import pytest
+import requests_mock
+
+from benchmarks import (
+    BENCHMARKS,
+    BenchmarkResult,
+    QueryBenchmark,
+    compare,
+    dump_results,
+    load_results,
+    run_benchmark,
+)
+from benchmarks.__main__ import main
+from benchmarks._runner import _connect
+
+SCALE = 23
+
+
+@pytest.mark.parametrize("benchmark", BENCHMARKS, ids=lambda benchmark: benchmark.name)
+def test_benchmark_runs(benchmark):
+    result = run_benchmark(benchmark, SCALE, repeat=2, warmup=0, memory=False)
+    assert result.name == benchmark.name
+    assert result.wall_time > 0
+    assert result.throughput == pytest.approx(SCALE / result.wall_time)
+    assert result.peak_memory is None
+    if isinstance(benchmark, QueryBenchmark):
+        assert set(result.breakdown) == {"request_building", "server", "json_decode", "result_construction"}
+        assert sum(result.breakdown.values()) <= result.wall_time * 1.01
+    else:
+        assert result.breakdown == {}
+
+
+@pytest.mark.parametrize(
+    "name, attribute",
+    [
+        ("MaterialComplianceQuery", "compliance_by_material_and_indicator"),
+        ("PartImpactedSubstancesQuery", "impacted_substances_by_part"),
+        ("SubstanceComplianceQuery", "compliance_by_substance_and_indicator"),
+    ],
+)
+def test_responses_contain_every_record(name, attribute):
+    benchmark = next(benchmark for benchmark in BENCHMARKS if benchmark.name == name)
+    references = benchmark.prepare(1200)
+    query = benchmark.build(references)
+    with requests_mock.Mocker() as mocker:
+        connection = _connect(mocker)
+        responses = benchmark.responses(query, references)
+        mocker.post(requests_mock.ANY, [{"content": response} for response in responses])
+        result = connection.run(query)
+    assert len(responses) == result.execution_report.batch_count > 1
+    assert len(getattr(result, attribute)) == 1200
+
+
+def test_peak_memory_is_measured():
+    result = run_benchmark(BENCHMARKS[0], SCALE, repeat=1, warmup=0)
+    assert result.peak_memory > 0
+
+
+def make_result(name="Query", wall_time=1.0, peak_memory=1000, scale=100):
+    return BenchmarkResult(name, scale, 5, wall_time, wall_time, scale / wall_time, peak_memory)
+
+
+class TestCompare:
+    def test_within_tolerance(self):
+        assert compare([make_result()], [make_result(wall_time=1.19, peak_memory=1190)], tolerance=0.2) == []
+
+    def test_slower(self):
+        (regression,) = compare([make_result()], [make_result(wall_time=1.5)], tolerance=0.2)
+        assert (regression.name, regression.metric, regression.ratio) == ("Query", "wall_time", 1.5)
+        assert str(regression) == "Query: wall_time increased from 1 to 1.5 (1.50x)"
+
+    def test_more_memory(self):
+        (regression,) = compare([make_result()], [make_result(peak_memory=2000)], tolerance=0.2)
+        assert regression.metric == "peak_memory"
+
+    def test_memory_not_measured(self):
+        assert compare([make_result()], [make_result(peak_memory=None)]) == []
+
+    def test_different_benchmarks_are_ignored(self):
+        current = [make_result(name="Other", wall_time=10), make_result(scale=1000, wall_time=10)]
+        assert compare([make_result()], current) == []
+
+
+def test_results_round_trip():
+    results = [make_result(), dataclasses.replace(make_result(name="Other"), breakdown={"server": 0.5})]
+    document = json.loads(json.dumps(dump_results(results)))
+    assert document["environment"]["python"]
+    assert load_results(document) == results
+
+
+def test_invalid_results_document():
+    with pytest.raises(ValueError, match="Not a benchmark results document"):
+        load_results({"results": []})
+
+
+def test_command_line_regression_gate(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    arguments = ["run", "--scale", "5", "--repeat", "1", "--only", "BoMHandler.convert", "--no-memory"]
+    assert main([*arguments, "--output", str(baseline)]) == 0
+    assert "BoMHandler.convert" in capsys.readouterr().out
+
+    document = json.loads(baseline.read_text())
+    document["results"][0]["wall_time"] *= 10
+    current.write_text(json.dumps(document))
+    assert main(["compare", str(baseline), str(current)]) == 1
+    assert "REGRESSION BoMHandler.convert: wall_time" in capsys.readouterr().out
+    assert main(["compare", str(current), str(baseline)]) == 0
@@ -0,0 +1,297 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from copy import deepcopy
+
+import pytest
+import requests_mock
+
+from ansys.grantami.bomanalytics import (
+    BoMDiff,
+    BoMHandler,
+    PartChangeType,
+    PartKey,
+    indicators,
+    queries,
+)
+from ansys.grantami.bomanalytics.bom_types import eco2505
+
+from .common import (
+    ROHS,
+    find_part,
+    make_bom,
+    make_guid,
+    make_material,
+    make_reference,
+    part_result,
+    summarize,
+)
+
+
+class TestBoMDiff:
+    def test_identical_boms(self):
+        diff = BoMDiff(make_bom(), make_bom())
+        assert not diff.has_changes
+        assert diff.changes == []
+        assert repr(diff) == "<BoMDiff: 0 added, 0 removed, 0 modified>"
+
+    def test_added_part(self):
+        current_bom = make_bom()
+        added_part = eco2505.Part(part_number="P5", components=[eco2505.Part(part_number="P6")])
+        find_part(current_bom, "Product", "Assembly1").components.append(added_part)
+
+        diff = BoMDiff(make_bom(), current_bom)
+
+        assert diff.has_changes
+        assert len(diff.changes) == 1
+        change = diff.added[0]
+        assert change.change_type is PartChangeType.ADDED
+        assert change.path == (PartKey("Product"), PartKey("Assembly1"), PartKey("P5"))
+        assert change.previous_part is None
+        assert change.current_part is added_part
+        assert repr(change) == "<PartChange: Added Product / Assembly1 / P5>"
+
+    def test_removed_part(self):
+        previous_bom = make_bom()
+        current_bom = make_bom()
+        find_part(current_bom, "Product").components.pop(0)
+
+        diff = BoMDiff(previous_bom, current_bom)
+
+        assert len(diff.changes) == 1
+        change = diff.removed[0]
+        assert change.path == (PartKey("Product"), PartKey("Assembly1"))
+        assert change.previous_part is find_part(previous_bom, "Product", "Assembly1")
+        assert change.current_part is None
+
+    def test_modified_part(self):
+        current_bom = make_bom()
+        find_part(current_bom, "Product", "Assembly1", "P2").materials.append(make_material("M6"))
+
+        diff = BoMDiff(make_bom(), current_bom)
+
+        assert [change.path for change in diff.modified] == [
+            (PartKey("Product"), PartKey("Assembly1"), PartKey("P2")),
+        ]
+        assert not diff.added and not diff.removed
+
+    def test_child_part_changes_do_not_modify_parent(self):
+        current_bom = make_bom()
+        find_part(current_bom, "Product", "Assembly1").components.pop()
+        diff = BoMDiff(make_bom(), current_bom)
+        assert diff.modified == []
+        assert len(diff.removed) == 1
+
+    def test_parts_are_matched_on_internal_id(self):
+        current_bom = make_bom()
+        assembly = find_part(current_bom, "Product", "Assembly2")
+        assembly.components[2].internal_id = "P4-3"
+
+        diff = BoMDiff(make_bom(), current_bom)
+
+        assert [change.path[-1] for change in diff.added] == [PartKey("P4", "P4-3")]
+        assert [change.path[-1] for change in diff.removed] == [PartKey("P4", "P4-2")]
+
+    def test_parts_are_matched_on_record_reference(self):
+        current_bom = make_bom()
+        find_part(current_bom, "Product", "Assembly2").mi_part_reference = make_reference("A3")
+
+        diff = BoMDiff(make_bom(), current_bom)
+
+        assert [change.path[-1].mi_part_reference for change in diff.added] == [
+            ("MI_Restricted_Substances", None, None, make_guid("A3"), None, None)
+        ]
+        assert len(diff.removed) == 1
+
+    def test_duplicate_keys_are_matched_in_order(self):
+        previous_bom = eco2505.BillOfMaterials(
+            components=[eco2505.Part(part_number="P1", part_name=name) for name in ("A", "B")]
+        )
+        current_bom = eco2505.BillOfMaterials(
+            components=[eco2505.Part(part_number="P1", part_name=name) for name in ("A", "C", "D")]
+        )
+
+        diff = BoMDiff(previous_bom, current_bom)
+
+        assert [change.current_part.part_name for change in diff.modified] == ["C"]
+        assert [change.current_part.part_name for change in diff.added] == ["D"]
+
+    def test_reordered_parts(self):
+        current_bom = make_bom()
+        current_bom.components.reverse()
+        diff = BoMDiff(make_bom(), current_bom)
+        assert diff.changes == []
+        assert diff.has_changes
+
+
+@pytest.fixture(scope="module")
+def bom_handler():
+    return BoMHandler()
+
+
+class TestIncrementalCompliance:
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_connection, bom_handler):
+        self.connection = mock_connection
+        self.bom_handler = bom_handler
+        self.submitted_boms = []
+        self.previous_bom = make_bom()
+        self.previous_result = self.run(self.full_query(self.previous_bom))
+        self.submitted_boms.clear()
+
+    def respond(self, request, context):
+        bom = self.bom_handler.load_bom_from_text(request.json()["BomXml"])
+        self.submitted_boms.append(bom)
+        return {"Parts": [part_result(part) for part in bom.components], "LogMessages": []}
+
+    def run(self, query):
+        with requests_mock.Mocker() as mocker:
+            mocker.get(requests_mock.ANY, text="")
+            mocker.post(url=requests_mock.ANY, json=self.respond)
+            return self.connection.run(query)
+
+    def full_query(self, bom):
+        return (
+            queries.BomComplianceQuery()
+            .with_bom(self.bom_handler.dump_bom(bom))
+            .with_indicators([indicators.RoHSIndicator(name=ROHS, legislation_ids=["RoHS_EU"])])
+        )
+
+    def incremental_query(self, bom, previous_bom=None, previous_result=None):
+        return (
+            queries.BomComplianceQuery()
+            .with_bom_changes(bom, previous_bom or self.previous_bom, previous_result or self.previous_result)
+            .with_indicators([indicators.RoHSIndicator(name=ROHS, legislation_ids=["RoHS_EU"])])
+        )
+
+    def check_incremental_result(self, current_bom, expected_submitted_parts):
+        result = self.run(self.incremental_query(current_bom))
+        submitted_parts = [part.part_number for bom in self.submitted_boms for part in bom.components]
+        assert submitted_parts == expected_submitted_parts
+
+        self.submitted_boms.clear()
+        expected_result = self.run(self.full_query(current_bom))
+        assert summarize(result.compliance_by_part_and_indicator) == summarize(
+            expected_result.compliance_by_part_and_indicator
+        )
+        assert result.compliance_by_indicator[ROHS].flag is expected_result.compliance_by_indicator[ROHS].flag
+        return result
+
+    def test_no_changes_are_not_submitted(self):
+        result = self.check_incremental_result(make_bom(), [])
+        assert summarize(result.compliance_by_part_and_indicator) == summarize(
+            self.previous_result.compliance_by_part_and_indicator
+        )
+        assert result.execution_report.batch_count == 0
+        assert result.execution_report.cache_hits == 2
+
+    def test_modified_part_below_assembly_is_rolled_up(self):
+        current_bom = make_bom()
+        find_part(current_bom, "Product", "Assembly1", "P2").part_number = "NC2"
+        result = self.check_incremental_result(current_bom, ["NC2"])
+        # P1, Assembly2, and Spare are reused from the previous result
+        assert result.execution_report.batch_count == 1
+        assert result.execution_report.cache_hits == 3
+
+    def test_modified_part_below_referenced_assembly_resubmits_assembly(self):
+        current_bom = make_bom()
+        find_part(current_bom, "Product", "Assembly2", "P3").part_number = "NC3"
+        self.check_incremental_result(current_bom, ["Assembly2"])
+
+    def test_added_part(self):
+        current_bom = make_bom()
+        find_part(current_bom, "Product", "Assembly1").components.insert(
+            1, eco2505.Part(part_number="NC5", materials=[make_material("M5")])
+        )
+        self.check_incremental_result(current_bom, ["NC5"])
+
+    def test_removed_part(self):
+        previous_bom = make_bom()
+        find_part(previous_bom, "Product", "Assembly1", "P2").part_number = "NC2"
+        self.previous_result = self.run(self.full_query(previous_bom))
+        self.previous_bom = previous_bom
+        self.submitted_boms.clear()
+
+        current_bom = deepcopy(previous_bom)
+        find_part(current_bom, "Product", "Assembly1").components.pop()
+        result = self.check_incremental_result(current_bom, [])
+        assert result.compliance_by_indicator[ROHS].flag is indicators.RoHSFlag.RohsCompliant
+
+    def test_removed_root_part(self):
+        current_bom = make_bom()
+        current_bom.components.pop()
+        self.check_incremental_result(current_bom, [])
+
+    def test_removing_all_child_parts_resubmits_assembly(self):
+        current_bom = make_bom()
+        find_part(current_bom, "Product", "Assembly1").components.clear()
+        self.check_incremental_result(current_bom, ["Assembly1"])
+
+    def test_reordered_parts(self):
+        current_bom = make_bom()
+        find_part(current_bom, "Product").components.reverse()
+        current_bom.components.reverse()
+        self.check_incremental_result(current_bom, [])
+
+    def test_multiple_changes(self):
+        current_bom = make_bom()
+        find_part(current_bom, "Product", "Assembly1", "P1").materials.append(make_material("M6"))
+        find_part(current_bom, "Product", "Assembly2", "P3").part_number = "NC3"
+        current_bom.components.append(eco2505.Part(part_number="NC6", materials=[make_material("M7")]))
+        self.check_incremental_result(current_bom, ["P1", "Assembly2", "NC6"])
+
+    def test_previous_result_is_not_modified(self):
+        expected_summary = summarize(self.previous_result.compliance_by_part_and_indicator)
+        current_bom = make_bom()
+        find_part(current_bom, "Product", "Assembly1", "P2").part_number = "NC2"
+        self.run(self.incremental_query(current_bom))
+        assert summarize(self.previous_result.compliance_by_part_and_indicator) == expected_summary
+
+    def test_different_indicators_raises_exception(self):
+        query = (
+            queries.BomComplianceQuery()
+            .with_bom_changes(make_bom(), self.previous_bom, self.previous_result)
+            .with_indicators([indicators.RoHSIndicator(name="Other", legislation_ids=["RoHS_EU"])])
+        )
+        with pytest.raises(ValueError, match="must be the same as the indicators used for the previous result"):
+            self.run(query)
+
+    def test_mismatched_previous_result_raises_exception(self):
+        current_bom = make_bom()
+        find_part(current_bom, "Product", "Assembly1", "P2").part_number = "NC2"
+        previous_bom = make_bom()
+        previous_bom.components.pop()
+        with pytest.raises(ValueError, match="does not correspond to the previous BoM"):
+            self.run(self.incremental_query(current_bom, previous_bom=previous_bom))
+
+    def test_with_bom_replaces_incremental_update(self):
+        query = self.incremental_query(make_bom()).with_bom(self.bom_handler.dump_bom(make_bom()))
+        self.run(query)
+        assert len(self.submitted_boms) == 1
+
+    @pytest.mark.parametrize("argument", ["bom", "previous_bom", "previous_result"])
+    def test_invalid_argument_type_raises_exception(self, argument):
+        kwargs = {"bom": make_bom(), "previous_bom": make_bom(), "previous_result": self.previous_result}
+        kwargs[argument] = "<PartsEco"
+        with pytest.raises(TypeError, match=f"Incorrect type for argument '{argument}'"):
+            queries.BomComplianceQuery().with_bom_changes(**kwargs)
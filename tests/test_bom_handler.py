@@ -21,10 +21,12 @@
 # SOFTWARE.
 
 from abc import ABC
+from copy import deepcopy
 from dataclasses import fields, is_dataclass
 from difflib import context_diff
 from enum import Enum
 from itertools import product
+import pickle
 import re
 from typing import Any, Dict, Literal, Optional
 import uuid
@@ -34,6 +36,7 @@ import pytest
 
 from ansys.grantami.bomanalytics import BoMHandler
 from ansys.grantami.bomanalytics.bom_types import eco2301, eco2412, eco2505, gbt1205
+from ansys.grantami.bomanalytics.bom_types._base_types import BaseType
 
 from .inputs import BoM, example_boms
 
@@ -148,6 +151,257 @@ class TestRoundTripBoMs:
             bom_handler.load_bom_from_file(input_bom, False)
 
 
+all_supported_boms = pytest.mark.parametrize(
+    "input_bom_key",
+    [
+        "medium-test-bom-2301",
+        "sustainability-bom-2301",
+        "bom-with-annotations-2301",
+        "medium-test-bom-2412",
+        "sustainability-bom-2412",
+        "bom-with-annotations-2412",
+        "medium-test-bom-2505",
+        "sustainability-bom-2505",
+        "sustainability-bom-xdb-refs-2505",
+        "bom-with-annotations-2505",
+    ],
+)
+
+
+@pytest.fixture(scope="module")
+def bom_handler():
+    return BoMHandler()
+
+
+class TestValidationLevels:
+    @all_supported_boms
+    @pytest.mark.parametrize("validation", ["none", "strict"])
+    def test_load_bom_from_text_matches_lax(self, bom_handler, input_bom_key, validation):
+        input_bom = example_boms[input_bom_key].content
+        expected_bom = bom_handler.load_bom_from_text(input_bom)
+        assert bom_handler.load_bom_from_text(input_bom, validation=validation) == expected_bom
+
+    @all_supported_boms
+    @pytest.mark.parametrize("validation", ["none", "strict"])
+    def test_load_bom_from_file_matches_lax(self, bom_handler, input_bom_key, validation):
+        input_bom = example_boms[input_bom_key].path
+        expected_bom = bom_handler.load_bom_from_file(input_bom)
+        assert bom_handler.load_bom_from_file(input_bom, validation=validation) == expected_bom
+
+    @all_supported_boms
+    @pytest.mark.parametrize("validation", ["none", "strict"])
+    def test_dump_bom_matches_lax(self, bom_handler, input_bom_key, validation):
+        bom = bom_handler.load_bom_from_text(example_boms[input_bom_key].content)
+        assert bom_handler.dump_bom(bom, validation=validation) == bom_handler.dump_bom(bom)
+
+    @pytest.mark.parametrize("bom_types", [eco2505, eco2412, eco2301])
+    def test_dump_bom_without_validation_orders_elements(self, bom_handler, bom_types):
+        bom = BoMFactory(bom_types).make_bom("utility")
+        expected_xml = bom_handler.dump_bom(bom)
+        assert bom_handler.dump_bom(bom, validation="none") == expected_xml
+        assert bom_handler.load_bom_from_text(expected_xml, validation="none") == bom
+
+    @pytest.mark.parametrize(
+        "input_bom_key",
+        ["bom-with-annotations-2301", "bom-with-annotations-2412", "bom-with-annotations-2505"],
+    )
+    def test_unsupported_data_without_validation_raises_exception(self, bom_handler, input_bom_key):
+        input_bom = example_boms[input_bom_key].content
+        with pytest.raises(ValueError, match="The following fields in the provided BoM could not be deserialized"):
+            bom_handler.load_bom_from_text(input_bom, allow_unsupported_data=False, validation="none")
+
+    def test_unknown_elements_without_validation_are_reported(self, bom_handler):
+        input_bom = example_boms["sustainability-bom-2505"].content.replace(
+            "</PartsEco>", "<UnknownElement>Value</UnknownElement></PartsEco>"
+        )
+        with pytest.raises(ValueError, match='field "UnknownElement" with value "Value"'):
+            bom_handler.load_bom_from_text(input_bom, allow_unsupported_data=False, validation="none")
+
+    @pytest.mark.parametrize("validation", ["lax", "strict"])
+    @pytest.mark.usefixtures("isolated_namespace_registry")
+    def test_invalid_bom_raises_exception(self, bom_handler, validation):
+        input_bom = re.sub(
+            r"<Quantity Unit=\"(.+?)\">.+?</Quantity>",
+            r'<Quantity Unit="\1">Many</Quantity>',
+            example_boms["medium-test-bom-2505"].content,
+        )
+        with pytest.raises(ValueError, match="Invalid BoM:") as e:
+            bom_handler.load_bom_from_text(input_bom, validation=validation)
+        error_count = str(e.value).count("failed validating 'Many'")
+        assert error_count > 1 if validation == "lax" else error_count == 1
+
+    def test_invalid_value_without_validation_raises_exception(self, bom_handler):
+        input_bom = re.sub(
+            r"<Quantity Unit=\"(.+?)\">.+?</Quantity>",
+            r'<Quantity Unit="\1">Many</Quantity>',
+            example_boms["medium-test-bom-2505"].content,
+        )
+        with pytest.raises(ValueError, match="Value 'Many' of '.*Quantity' could not be decoded"):
+            bom_handler.load_bom_from_text(input_bom, validation="none")
+
+    def test_invalid_xml_without_validation_raises_exception(self, bom_handler):
+        with pytest.raises(ValueError, match=r"BoM provided as input is not valid XML"):
+            bom_handler.load_bom_from_text("<PartsEco", validation="none")
+
+    def test_unknown_namespace_without_validation_raises_exception(self, bom_handler):
+        with pytest.raises(ValueError, match="BoM is not compliant with any supported Ansys Granta BoM XML schema"):
+            bom_handler.load_bom_from_text(example_boms["bom-1711"].content, validation="none")
+
+    @pytest.mark.parametrize("validation", ["", "Lax", "skip", None])
+    def test_invalid_validation_level_raises_exception(self, bom_handler, validation):
+        input_bom = example_boms["sustainability-bom-2505"].content
+        with pytest.raises(ValueError, match=f'validation "{validation}" is not a valid validation level'):
+            bom_handler.load_bom_from_text(input_bom, validation=validation)
+        with pytest.raises(ValueError, match=f'validation "{validation}" is not a valid validation level'):
+            bom_handler.load_bom_from_file(example_boms["sustainability-bom-2505"].path, validation=validation)
+        bom = bom_handler.load_bom_from_text(input_bom)
+        with pytest.raises(ValueError, match=f'validation "{validation}" is not a valid validation level'):
+            bom_handler.dump_bom(bom, validation=validation)
+
+
+load_boms_keys = [
+    "medium-test-bom-2301",
+    "sustainability-bom-2412",
+    "bom-with-annotations-2505",
+    "sustainability-bom-2505",
+]
+
+
+@pytest.fixture(scope="module")
+def expected_boms(bom_handler):
+    return [bom_handler.load_bom_from_file(example_boms[key].path) for key in load_boms_keys]
+
+
+class TestLoadBoMs:
+    @pytest.mark.parametrize("workers", [None, 1, 2])
+    def test_results_are_in_input_order(self, bom_handler, expected_boms, workers):
+        file_paths = [example_boms[key].path for key in load_boms_keys]
+        results = list(bom_handler.load_boms(file_paths, workers=workers))
+        assert [result.file_path for result in results] == file_paths
+        assert [result.bom for result in results] == expected_boms
+        assert all(result.error is None for result in results)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_in_completion_order(self, bom_handler, expected_boms, workers):
+        file_paths = [example_boms[key].path for key in load_boms_keys]
+        results = list(bom_handler.load_boms(file_paths, workers=workers, in_completion_order=True))
+        boms_by_path = {result.file_path: result.bom for result in results}
+        assert len(results) == len(file_paths)
+        assert [boms_by_path[path] for path in file_paths] == expected_boms
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_errors_are_reported_per_file(self, bom_handler, tmp_path, workers):
+        invalid_bom = tmp_path / "invalid.xml"
+        invalid_bom.write_text("<PartsEco", encoding="utf-8")
+        file_paths = [
+            example_boms["sustainability-bom-2505"].path,
+            tmp_path / "missing.xml",
+            invalid_bom,
+            example_boms["bom-with-annotations-2505"].path,
+        ]
+        results = list(bom_handler.load_boms(file_paths, allow_unsupported_data=False, workers=workers))
+
+        assert [result.file_path for result in results] == file_paths
+        assert isinstance(results[0].bom, eco2505.BillOfMaterials)
+        assert results[0].error is None
+        assert isinstance(results[1].error, FileNotFoundError)
+        assert results[2].error is not None
+        assert isinstance(results[3].error, ValueError)
+        assert "could not be deserialized" in str(results[3].error)
+        assert all(result.bom is None for result in results[1:])
+
+    def test_validation_level_is_used(self, bom_handler):
+        input_bom = example_boms["medium-test-bom-2505"].path
+        results = list(bom_handler.load_boms([input_bom], validation="none", workers=2))
+        assert results[0].bom == bom_handler.load_bom_from_file(input_bom)
+
+    def test_no_files(self, bom_handler):
+        assert list(bom_handler.load_boms([], workers=2)) == []
+
+    @pytest.mark.parametrize("workers", [0, -1])
+    def test_invalid_workers_raises_exception(self, bom_handler, workers):
+        with pytest.raises(ValueError, match=f'workers "{workers}" is not a valid number of worker processes'):
+            bom_handler.load_boms([example_boms["sustainability-bom-2505"].path], workers=workers)
+
+    def test_invalid_validation_level_raises_exception(self, bom_handler):
+        with pytest.raises(ValueError, match='validation "skip" is not a valid validation level'):
+            bom_handler.load_boms([example_boms["sustainability-bom-2505"].path], validation="skip")
+
+
+def iter_empty_lists(obj):
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        for field in fields(current):
+            value = getattr(current, field.name)
+            if isinstance(value, list):
+                if not value:
+                    yield value
+                stack.extend(item for item in value if is_dataclass(item))
+            elif is_dataclass(value):
+                stack.append(value)
+
+
+class TestCompactBoMs:
+    @pytest.mark.parametrize("bom_types", [eco2301, eco2412, eco2505, gbt1205])
+    def test_bom_types_have_no_instance_dictionary(self, bom_types):
+        for bom_type in vars(bom_types).values():
+            if isinstance(bom_type, type) and issubclass(bom_type, BaseType):
+                assert "__slots__" in vars(bom_type), bom_type.__name__
+
+    @pytest.mark.parametrize("input_bom_key", load_boms_keys)
+    def test_compacted_bom_is_unchanged(self, bom_handler, input_bom_key):
+        expected_bom = bom_handler.load_bom_from_file(example_boms[input_bom_key].path)
+        bom = bom_handler.load_bom_from_file(example_boms[input_bom_key].path)
+
+        assert bom_handler.compact(bom) is bom
+
+        assert bom == expected_bom
+        assert bom_handler.dump_bom(bom) == bom_handler.dump_bom(expected_bom)
+        assert len({id(value) for value in iter_empty_lists(bom)}) == 1
+
+    def test_compacted_bom_survives_copy_and_pickle(self, bom_handler):
+        bom = bom_handler.compact(bom_handler.load_bom_from_file(example_boms["medium-test-bom-2505"].path))
+        shared_empty_list = next(iter_empty_lists(bom))
+        for copied_bom in (deepcopy(bom), pickle.loads(pickle.dumps(bom))):
+            assert copied_bom == bom
+            assert all(value is shared_empty_list for value in iter_empty_lists(copied_bom))
+
+    def test_shared_empty_list_cannot_be_modified(self, bom_handler):
+        bom = bom_handler.compact(eco2505.BillOfMaterials(components=[eco2505.Part(part_number="P1")]))
+        part = bom.components[0]
+        with pytest.raises(TypeError, match="shared between BoM objects"):
+            part.components.append(eco2505.Part(part_number="P2"))
+        with pytest.raises(TypeError, match="shared between BoM objects"):
+            part.rohs_exemptions += ["7(c)-I"]
+        assert part.components == []
+        part.components = [eco2505.Part(part_number="P2")]
+        assert bom.components[0].components[0].part_number == "P2"
+
+
+class TestBoMWriterQualifiedNames:
+    @pytest.mark.parametrize("bom_types", [eco2301, eco2412, eco2505])
+    def test_declared_names_are_precomputed(self, bom_types):
+        bom_handler = BoMHandler()
+        writer = next(w for w in bom_handler._writers.values() if w.target_namespace == bom_types.Part.namespace)
+
+        for type_ in [bom_types.Part, bom_types.Material, bom_types.Substance, bom_types.Process]:
+            for _, field_name in type_._simple_values:
+                assert field_name in writer._qualified_names
+            for _, _, container_name, item_name in type_._list_props:
+                assert container_name in writer._qualified_names
+                assert item_name in writer._qualified_names
+
+    @pytest.mark.parametrize("bom_types", [eco2301, eco2412, eco2505])
+    def test_memoized_names_match_resolved_names(self, bom_types):
+        bom_handler = BoMHandler()
+        writer = next(w for w in bom_handler._writers.values() if w.target_namespace == bom_types.Part.namespace)
+        bom_handler.dump_bom(BoMFactory(bom_types).make_bom("utility"))
+
+        for field_name, qualified_name in writer._qualified_names.items():
+            assert writer._resolve_qualified_name(field_name) == qualified_name
+
+
 class RoundTripWithAssertionsBoMTester(ABC):
     _namespace_map: dict[str, str]
     _default_namespace: str
@@ -670,6 +924,12 @@ def test_bom_can_be_deserialized(use_phase_utility_kwarg, bom_types):
     assert rebuilt == bom
 
 
+def test_unsupported_data_is_reported_for_each_load():
+    bom_handler = BoMHandler()
+    bom_handler.load_bom_from_text(example_boms["bom-with-annotations-2505"].content)
+    bom_handler.load_bom_from_text(example_boms["sustainability-bom-2505"].content, allow_unsupported_data=False)
+
+
 @pytest.mark.parametrize("bom_types", [eco2505, eco2412, eco2301])
 def test_unexpected_args_raises_error(bom_types):
     with pytest.raises(TypeError, match="unexpected keyword argument 'unexpected_kwarg'"):
@@ -840,3 +1100,31 @@ class TestBoMConversion:
         bom_handler = BoMHandler()
         with pytest.raises(ValueError, match='target_bom_version "24/12" is not a valid BoM target.'):
             bom_handler.convert(source_bom, "24/12")
+
+    @pytest.mark.parametrize("source_bom_types", [eco2301, eco2412, eco2505])
+    @pytest.mark.parametrize("target_bom_types", [eco2301, eco2412, eco2505])
+    def test_conversion_matches_dictionary_conversion(
+        self, source_bom_types, target_bom_types, use_phase_utility_kwarg
+    ):
+        source_bom = BoMFactory(source_bom_types).make_bom(use_phase_utility_kwarg)
+
+        # Convert via xmlschema dictionary form, replacing the Eco namespace declarations
+        target_namespace = target_bom_types.BillOfMaterials.namespace
+        writer = next(w for w in self.bom_handler._writers.values() if w.target_namespace == source_bom.namespace)
+        reader = next(r for r in self.bom_handler._readers.values() if r.target_namespace == target_namespace)
+        bom_dict = {
+            k: target_namespace if k.startswith("@xmlns") and v == source_bom.namespace else v
+            for k, v in writer.convert_bom_to_dict(source_bom).items()
+        }
+        expected_bom, expected_fields = reader.read_bom(bom_dict)
+
+        converter = self.bom_handler._get_converter(writer._schema, reader._schema)
+        converted_bom, converted_fields = converter.convert(source_bom)
+
+        assert converted_bom == expected_bom
+        assert sorted(converted_fields) == sorted(expected_fields)
+
+    def test_unsupported_data_is_reported_for_each_conversion(self, use_phase_utility_kwarg):
+        self.bom_handler.convert(BoMFactory(eco2505).make_bom(use_phase_utility_kwarg), eco2301.BillOfMaterials)
+        compatible_bom = BoMFactory(eco2505, compatibility_level=eco2301).make_bom(use_phase_utility_kwarg)
+        self.bom_handler.convert(compatible_bom, eco2301.BillOfMaterials, allow_unsupported_data=False)
@@ -0,0 +1,138 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import pytest
+
+from ansys.grantami.bomanalytics import BoMHandler, BoMIndex
+from ansys.grantami.bomanalytics.bom_types import eco2412, eco2505
+
+from .common import find_part, make_bom, make_guid
+from .inputs import example_boms
+
+
+def walk(obj, parent=None, depth=0):
+    """Reference implementation of the traversal, which yields each object with its parent and depth."""
+    yield obj, parent, depth
+    for name in obj.__dataclass_fields__:
+        value = getattr(obj, name)
+        children = value if isinstance(value, list) else [value]
+        for child in children:
+            if hasattr(child, "__dataclass_fields__") and hasattr(child, "namespace"):
+                yield from walk(child, obj, depth + 1)
+
+
+class TestBoMIndex:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        self.bom = make_bom()
+        self.index = BoMIndex(self.bom)
+
+    def test_index_is_built_lazily(self):
+        assert repr(self.index) == "<BoMIndex: not built>"
+        assert self.index.part_count == 9
+        assert repr(self.index) == "<BoMIndex: 19 items>"
+        assert self.index.bom is self.bom
+
+    def test_statistics(self):
+        assert self.index.max_part_depth == 3
+        assert self.index.counts == {
+            eco2505.BillOfMaterials: 1,
+            eco2505.Part: 9,
+            eco2505.Material: 4,
+            eco2505.ExtendedMIRecordReference: 5,
+        }
+
+    def test_parents_and_depths(self):
+        p1 = find_part(self.bom, "Product", "Assembly1", "P1")
+        assembly = find_part(self.bom, "Product", "Assembly1")
+        product = find_part(self.bom, "Product")
+        assert self.index.parent(p1) is assembly
+        assert self.index.depth(p1) == 3
+        assert self.index.parent(p1.materials[0]) is p1
+        assert self.index.depth(p1.materials[0].mi_material_reference) == 5
+        assert self.index.ancestors(p1) == [assembly, product, self.bom]
+        assert self.index.parent(self.bom) is None
+        assert self.index.depth(self.bom) == 0
+
+    def test_item_not_in_bom(self):
+        with pytest.raises(ValueError, match="Part object is not in the indexed BoM"):
+            self.index.parent(eco2505.Part(part_number="P1"))
+
+    def test_lookups(self):
+        p4_parts = self.index.parts_by_part_number("P4")
+        assert [part.internal_id for part in p4_parts] == ["P4-1", "P4-2"]
+        assert self.index.parts_by_part_number("P5") == []
+        assert self.index.item_by_internal_id("P4-2") is p4_parts[1]
+        assert self.index.item_by_internal_id("P4-3") is None
+        assert self.index.items_by_record_guid(make_guid("A2")) == [find_part(self.bom, "Product", "Assembly2")]
+        assert self.index.items_by_record_guid(make_guid("M3")) == [
+            find_part(self.bom, "Product", "Assembly2", "P3").materials[0]
+        ]
+        assert self.index.items_of_type(eco2505.Material) == [
+            find_part(self.bom, *path).materials[0]
+            for path in [("Product", "Assembly1", "P1"), ("Product", "Assembly1", "P2"), ("Product", "Assembly2", "P3")]
+        ] + [find_part(self.bom, "Spare").materials[0]]
+
+    def test_lookups_by_record_history(self):
+        reference = eco2505.MIRecordReference(
+            db_key="MI_Restricted_Substances", record_history_identity=123, record_history_guid=make_guid("H")
+        )
+        spare = find_part(self.bom, "Spare")
+        spare.mi_part_reference = reference
+        self.index.invalidate()
+        assert self.index.items_by_record_history_identity(123) == [spare]
+        assert self.index.items_by_record_history_guid(make_guid("H")) == [spare]
+
+    def test_invalidate_rebuilds_index(self):
+        assert self.index.part_count == 9
+        find_part(self.bom, "Spare").components.append(eco2505.Part(part_number="Screw"))
+        assert self.index.part_count == 9
+        self.index.invalidate()
+        assert self.index.part_count == 10
+        assert self.index.max_part_depth == 3
+        assert self.index.depth(self.index.parts_by_part_number("Screw")[0]) == 2
+
+
+@pytest.mark.parametrize("bom_key", ["medium-test-bom-2412", "medium-test-bom-2505", "sustainability-bom-2301"])
+def test_index_matches_full_traversal(bom_key):
+    bom = BoMHandler().load_bom_from_text(example_boms[bom_key].content)
+    index = BoMIndex(bom)
+    expected = list(walk(bom))
+
+    assert index.items == [obj for obj, _, _ in expected]
+    for obj, parent, depth in expected:
+        assert index.parent(obj) is parent
+        assert index.depth(obj) == depth
+    parts = [obj for obj, _, _ in expected if type(obj).__name__ == "Part"]
+    assert index.part_count == len(parts)
+    assert index.max_part_depth == max(index.depth(part) for part in parts)
+    for part in parts:
+        assert any(p is part for p in index.parts_by_part_number(part.part_number))
+
+
+def test_index_supports_other_bom_versions():
+    bom = eco2412.BillOfMaterials(components=[eco2412.Part(part_number="P1", components=[eco2412.Part("P2")])])
+    index = BoMIndex(bom)
+    assert index.part_count == 2
+    assert index.max_part_depth == 2
+    assert index.parts_by_part_number("P2") == [bom.components[0].components[0]]
@@ -0,0 +1,341 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+import requests_mock
+
+from ansys.grantami.bomanalytics import BoMHandler, indicators, queries
+from ansys.grantami.bomanalytics.bom_types import eco2505
+
+from .common import (
+    LEGISLATION,
+    ROHS,
+    find_part,
+    impacted_substances_result,
+    iter_parts,
+    make_large_bom,
+    make_material,
+    make_reference,
+    part_result,
+    summarize,
+)
+from .inputs import example_boms, example_payloads
+
+
+def make_bom_with_duplicates() -> eco2505.BillOfMaterials:
+    """Create a BoM where the same bracket appears under both wings, with different quantities and IDs."""
+
+    def make_wing(part_number, quantity, internal_id):
+        bracket = eco2505.Part(
+            part_number="Bracket",
+            mi_part_reference=make_reference("Bracket"),
+            quantity=eco2505.UnittedValue(value=quantity, unit="Each"),
+            internal_id=internal_id,
+            components=[
+                eco2505.Part(part_number="NC1", materials=[make_material("M2")]),
+                eco2505.Part(part_number="P2", materials=[make_material("M3")]),
+            ],
+        )
+        panel = eco2505.Part(part_number="Panel", materials=[make_material("M1")])
+        return eco2505.Part(part_number=part_number, components=[bracket, panel])
+
+    return eco2505.BillOfMaterials(
+        components=[
+            eco2505.Part(
+                part_number="Product", components=[make_wing("LeftWing", 2.0, "L1"), make_wing("RightWing", 4.0, "R1")]
+            ),
+            eco2505.Part(part_number="Spare", materials=[make_material("M5")]),
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def bom_handler():
+    return BoMHandler()
+
+
+class TestPartitionedQueries:
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_connection, bom_handler):
+        self.connection = mock_connection
+        self.bom_handler = bom_handler
+        self.submitted_boms = []
+        self.log_messages = []
+
+    def respond(self, request, context):
+        bom = self.bom_handler.load_bom_from_text(request.json()["BomXml"])
+        self.submitted_boms.append(bom)
+        if request.path.endswith("compliance/bom"):
+            response = {"Parts": [part_result(part) for part in bom.components]}
+        else:
+            response = impacted_substances_result(bom)
+        response["LogMessages"] = self.log_messages
+        return response
+
+    def run(self, query):
+        with requests_mock.Mocker() as mocker:
+            mocker.get(requests_mock.ANY, text="")
+            mocker.post(url=requests_mock.ANY, json=self.respond)
+            return self.connection.run(query)
+
+    def compliance_query(self, bom):
+        return (
+            queries.BomComplianceQuery()
+            .with_bom(self.bom_handler.dump_bom(bom))
+            .with_indicators([indicators.RoHSIndicator(name=ROHS, legislation_ids=["RoHS_EU"])])
+        )
+
+    def impacted_substances_query(self, bom):
+        return (
+            queries.BomImpactedSubstancesQuery()
+            .with_bom(self.bom_handler.dump_bom(bom))
+            .with_legislation_ids([LEGISLATION])
+        )
+
+    def submitted_parts(self):
+        return [[part.part_number for part in bom.components] for bom in self.submitted_boms]
+
+    @pytest.mark.parametrize(
+        ["max_parts", "expected_submitted_parts"],
+        [
+            (100, [["Product", "Spare"]]),
+            (11, [["Product"], ["Spare"]]),
+            (5, [["P1", "NC2", "Subassembly"], ["Assembly2", "Spare"]]),
+            (2, [["P1", "NC2"], ["P6", "P7"], ["Assembly2"], ["Spare"]]),
+            (1, [["P1"], ["NC2"], ["P6"], ["P7"], ["Assembly2"], ["Spare"]]),
+        ],
+    )
+    @pytest.mark.parametrize("max_concurrent_requests", [1, 4])
+    def test_compliance_matches_unpartitioned_result(
+        self, max_parts, expected_submitted_parts, max_concurrent_requests
+    ):
+        bom = make_large_bom()
+        expected_result = self.run(self.compliance_query(bom))
+        self.submitted_boms.clear()
+
+        query = self.compliance_query(bom).with_partitioning(max_parts, max_concurrent_requests)
+        result = self.run(query)
+
+        # Partitions are submitted concurrently, so they may arrive in any order
+        assert sorted(self.submitted_parts()) == sorted(expected_submitted_parts)
+        assert summarize(result.compliance_by_part_and_indicator) == summarize(
+            expected_result.compliance_by_part_and_indicator
+        )
+        assert result.compliance_by_indicator[ROHS].flag is indicators.RoHSFlag.RohsNonCompliant
+
+    @pytest.mark.parametrize("max_parts", [100, 5, 1])
+    def test_impacted_substances_matches_unpartitioned_result(self, max_parts):
+        bom = make_large_bom()
+        expected_result = self.run(self.impacted_substances_query(bom))
+        self.submitted_boms.clear()
+
+        result = self.run(self.impacted_substances_query(bom).with_partitioning(max_parts))
+
+        def summarize_substances(substances):
+            return [(s.chemical_name, s.max_percentage_amount_in_material) for s in substances]
+
+        assert summarize_substances(result.impacted_substances) == summarize_substances(
+            expected_result.impacted_substances
+        )
+        assert list(result.impacted_substances_by_legislation) == [LEGISLATION]
+
+    def test_messages_from_all_partitions_are_combined(self):
+        self.log_messages = [{"Severity": "warning", "Message": "Partition warning"}]
+        result = self.run(self.compliance_query(make_large_bom()).with_partitioning(2))
+        assert len(self.submitted_boms) == 4
+        assert [message.message for message in result.messages] == ["Partition warning"] * 4
+
+    def test_concurrent_partitions_are_reported(self):
+        result = self.run(self.compliance_query(make_large_bom()).with_partitioning(2, max_concurrent_requests=4))
+        report = result.execution_report
+        assert report.batch_count == 4
+        assert all(batch.request_bytes > 0 and batch.response_bytes > 0 for batch in report.batches)
+        assert report.cache_hits == 0
+
+    def test_bom_object_is_partitioned(self):
+        bom = make_large_bom()
+        expected_result = self.run(self.compliance_query(bom))
+        self.submitted_boms.clear()
+
+        query = (
+            queries.BomComplianceQuery()
+            .with_bom(bom)
+            .with_indicators([indicators.RoHSIndicator(name=ROHS, legislation_ids=["RoHS_EU"])])
+            .with_partitioning(5, max_concurrent_requests=1)
+        )
+        result = self.run(query)
+
+        assert self.submitted_parts() == [["P1", "NC2", "Subassembly"], ["Assembly2", "Spare"]]
+        assert summarize(result.compliance_by_part_and_indicator) == summarize(
+            expected_result.compliance_by_part_and_indicator
+        )
+
+    @pytest.mark.parametrize("version", ["2301", "2412", "2505"])
+    def test_bom_is_partitioned_in_its_own_format(self, version):
+        bom = self.bom_handler.load_bom_from_text(example_boms[f"medium-test-bom-{version}"].content)
+        query = (
+            queries.BomImpactedSubstancesQuery()
+            .with_bom(bom)
+            .with_legislation_ids([LEGISLATION])
+            .with_partitioning(2, max_concurrent_requests=1)
+        )
+        self.run(query)
+
+        assert len(self.submitted_boms) > 1
+        assert all(type(submitted) is type(bom) for submitted in self.submitted_boms)
+        original_parts = list(iter_parts(bom.components))
+        submitted_parts = [part for submitted in self.submitted_boms for part in submitted.components]
+        assert all(part in original_parts for part in submitted_parts)
+
+    def test_1711_bom_cannot_be_partitioned(self):
+        query = (
+            queries.BomComplianceQuery()
+            .with_bom(example_boms["compliance-bom-1711"].content)
+            .with_indicators([indicators.RoHSIndicator(name=ROHS, legislation_ids=["RoHS_EU"])])
+            .with_partitioning(10)
+        )
+        with pytest.raises(ValueError, match="23/01 format or later"):
+            self.run(query)
+
+    @pytest.mark.parametrize(
+        ["max_parts", "expected_submitted_parts"],
+        [
+            (None, [["Bracket", "Panel", "Spare"]]),
+            (3, [["Bracket"], ["Panel", "Spare"]]),
+        ],
+    )
+    def test_deduplicated_compliance_matches_full_result(self, max_parts, expected_submitted_parts):
+        bom = make_bom_with_duplicates()
+        expected_result = self.run(self.compliance_query(bom))
+        self.submitted_boms.clear()
+
+        query = self.compliance_query(bom).with_deduplication()
+        if max_parts is not None:
+            query = query.with_partitioning(max_parts, max_concurrent_requests=1)
+        result = self.run(query)
+
+        assert self.submitted_parts() == expected_submitted_parts
+        assert summarize(result.compliance_by_part_and_indicator) == summarize(
+            expected_result.compliance_by_part_and_indicator
+        )
+        # The bracket and panel of the right wing are not submitted
+        assert result.execution_report.cache_hits == 2
+        assert result.execution_report.batch_count == len(expected_submitted_parts)
+        product = result.compliance_by_part_and_indicator[0]
+        left_bracket, right_bracket = (wing.parts[0] for wing in product.parts)
+        assert left_bracket is not right_bracket
+        assert left_bracket.indicators[ROHS].flag is indicators.RoHSFlag.RohsNonCompliant
+        assert right_bracket.indicators[ROHS].flag is indicators.RoHSFlag.RohsNonCompliant
+
+    def test_deduplicated_impacted_substances_matches_full_result(self):
+        bom = make_bom_with_duplicates()
+        expected_result = self.run(self.impacted_substances_query(bom))
+        self.submitted_boms.clear()
+
+        result = self.run(self.impacted_substances_query(bom).with_deduplication())
+
+        assert self.submitted_parts() == [["Bracket", "Panel", "Spare"]]
+        assert [s.chemical_name for s in result.impacted_substances] == [
+            s.chemical_name for s in expected_result.impacted_substances
+        ]
+
+    def test_parts_with_different_content_are_not_deduplicated(self):
+        bom = make_bom_with_duplicates()
+        find_part(bom, "Product", "RightWing", "Bracket", "P2").materials[0].percentage = 50.0
+        self.run(self.compliance_query(bom).with_deduplication())
+        assert self.submitted_parts() == [["Bracket", "Panel", "Bracket", "Spare"]]
+
+    def test_deduplication_can_be_disabled(self):
+        bom = make_bom_with_duplicates()
+        self.run(self.compliance_query(bom).with_deduplication().with_deduplication(False))
+        assert self.submitted_parts() == [["Product", "Spare"]]
+
+
+@pytest.mark.parametrize("argument_name", ["max_parts_per_request", "max_concurrent_requests"])
+def test_invalid_partitioning_arguments(argument_name):
+    kwargs = {"max_parts_per_request": 10, argument_name: 0}
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        queries.BomComplianceQuery().with_partitioning(**kwargs)
+    kwargs[argument_name] = "10"
+    with pytest.raises(TypeError):
+        queries.BomImpactedSubstancesQuery().with_partitioning(**kwargs)
+
+
+class TestMergedImpactedSubstances:
+    """The merged response for the partitions of a BoM is the same as the response for the entire BoM."""
+
+    UNSPLIT = example_payloads["GetImpactedSubstancesForBom.Response"].data
+
+    def partition_response(self, *substance_indices):
+        (legislation,) = self.UNSPLIT["Legislations"]
+        substances = [dict(legislation["ImpactedSubstances"][idx]) for idx in substance_indices]
+        return {
+            "Legislations": [{"LegislationId": legislation["LegislationId"], "ImpactedSubstances": substances}],
+            "LogMessages": [],
+        }
+
+    def run(self, connection, responses, max_parts):
+        query = (
+            queries.BomImpactedSubstancesQuery()
+            .with_bom(make_large_bom())
+            .with_legislation_ids([LEGISLATION])
+            .with_partitioning(max_parts, max_concurrent_requests=1)
+        )
+        with requests_mock.Mocker() as mocker:
+            mocker.post(requests_mock.ANY, [{"json": response} for response in responses])
+            return connection.run(query)
+
+    def summarize(self, result):
+        return [
+            (legislation, [repr(substance) for substance in substances])
+            for legislation, substances in result.impacted_substances_by_legislation.items()
+        ]
+
+    @pytest.mark.parametrize(
+        "partition_substances",
+        [
+            [(0,), (1,)],
+            [(0, 1), (1, 0)],
+            [(0, 0), (1, 1)],
+            [(0, 1, 0), (1,)],
+        ],
+    )
+    def test_merged_response_matches_unsplit_response(self, mock_connection, partition_substances):
+        expected = self.run(mock_connection, [self.UNSPLIT], max_parts=100)
+        responses = [self.partition_response(*indices) for indices in partition_substances]
+        result = self.run(mock_connection, responses, max_parts=11)
+        assert result.execution_report.batch_count == 2
+        assert self.summarize(result) == self.summarize(expected)
+
+    def test_maximum_amount_is_reported(self, mock_connection):
+        first, second = self.partition_response(0, 1), self.partition_response(0)
+        first["Legislations"][0]["ImpactedSubstances"] = [
+            {**substance, "MaxPercentageAmountInMaterial": 0.5}
+            for substance in first["Legislations"][0]["ImpactedSubstances"]
+        ]
+        first["Legislations"][0]["ImpactedSubstances"].append(
+            {**first["Legislations"][0]["ImpactedSubstances"][0], "MaxPercentageAmountInMaterial": 2.0}
+        )
+        second["Legislations"][0]["ImpactedSubstances"][0]["MaxPercentageAmountInMaterial"] = 1.0
+        result = self.run(mock_connection, [first, second], max_parts=11)
+        amounts = [substance.max_percentage_amount_in_material for substance in result.impacted_substances]
+        assert amounts == [2.0, 0.5]
@@ -0,0 +1,168 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from contextlib import contextmanager
+import sys
+from typing import Iterator
+
+import pytest
+
+from ansys.grantami.bomanalytics import BoMDiff, BoMHandler
+from ansys.grantami.bomanalytics._bom_helper import _pack_bom, _unpack_bom
+from ansys.grantami.bomanalytics.bom_types import eco2301, eco2412, eco2505
+
+DEPTH = 2000
+WIDTH = 2000
+STACK_HEADROOM = 60
+"""Number of frames available to the code under test, regardless of the size of the BoM."""
+
+
+def _stack_depth() -> int:
+    depth = 0
+    frame = sys._getframe()
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+@contextmanager
+def limited_stack(headroom: int = STACK_HEADROOM) -> Iterator[None]:
+    """Restrict the recursion limit to a fixed number of frames above the current frame."""
+    original_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(_stack_depth() + headroom)
+    try:
+        yield
+    finally:
+        sys.setrecursionlimit(original_limit)
+
+
+def make_record_reference(bom_types, identifier: str):
+    return bom_types.MIRecordReference(db_key="MI_Restricted_Substances", record_history_guid=identifier)
+
+
+def make_deep_bom(bom_types, depth: int):
+    root = bom_types.Part(part_number="Part0")
+    parent = root
+    for idx in range(1, depth):
+        child = bom_types.Part(
+            part_number=f"Part{idx}",
+            quantity=bom_types.UnittedValue(1.0, "Each"),
+            materials=[
+                bom_types.Material(
+                    mi_material_reference=make_record_reference(bom_types, f"Material{idx}"),
+                    percentage=100.0,
+                )
+            ],
+        )
+        parent.components.append(child)
+        parent = child
+    return bom_types.BillOfMaterials(components=[root])
+
+
+def make_wide_bom(bom_types, width: int):
+    root = bom_types.Part(part_number="Root")
+    for idx in range(width):
+        root.components.append(
+            bom_types.Part(
+                part_number=f"Part{idx}",
+                substances=[
+                    bom_types.Substance(
+                        mi_substance_reference=make_record_reference(bom_types, f"Substance{idx}"),
+                        percentage=50.0,
+                    )
+                ],
+            )
+        )
+    return bom_types.BillOfMaterials(components=[root])
+
+
+def iter_part_numbers(bom) -> Iterator[str]:
+    # Dataclass equality and repr are recursive, so compare BoMs by walking the parts depth-first.
+    stack = list(reversed(bom.components))
+    while stack:
+        part = stack.pop()
+        yield part.part_number
+        stack.extend(reversed(part.components))
+
+
+@pytest.fixture(scope="module")
+def bom_handler() -> BoMHandler:
+    return BoMHandler()
+
+
+@pytest.mark.parametrize("bom_types", [eco2301, eco2412, eco2505])
+@pytest.mark.parametrize(["bom_factory", "size"], [(make_deep_bom, DEPTH), (make_wide_bom, WIDTH)])
+class TestConstantStackUsage:
+    def test_write_and_read(self, bom_handler, bom_types, bom_factory, size):
+        bom = bom_factory(bom_types, size)
+        schema = bom_handler._get_xmlschema_for_bom(bom)
+        writer = bom_handler._writers[schema]
+        reader = bom_handler._readers[schema]
+
+        with limited_stack():
+            bom_dict = writer.convert_bom_to_dict(bom)
+            result, undeserialized_fields = reader.read_bom(bom_dict)
+
+        assert isinstance(result, bom_types.BillOfMaterials)
+        assert not undeserialized_fields
+        assert list(iter_part_numbers(result)) == list(iter_part_numbers(bom))
+
+    @pytest.mark.parametrize("target_bom_types", [eco2301, eco2412, eco2505])
+    def test_convert(self, bom_handler, bom_types, bom_factory, size, target_bom_types):
+        bom = bom_factory(bom_types, size)
+
+        with limited_stack():
+            result = bom_handler.convert(bom, target_bom_types.BillOfMaterials, allow_unsupported_data=False)
+
+        assert isinstance(result, target_bom_types.BillOfMaterials)
+        assert list(iter_part_numbers(result)) == list(iter_part_numbers(bom))
+
+    def test_pack_and_unpack(self, bom_types, bom_factory, size):
+        bom = bom_factory(bom_types, size)
+
+        with limited_stack():
+            result = _unpack_bom(*_pack_bom(bom))
+
+        assert isinstance(result, bom_types.BillOfMaterials)
+        assert list(iter_part_numbers(result)) == list(iter_part_numbers(bom))
+
+
+@pytest.mark.parametrize(["bom_factory", "size"], [(make_deep_bom, DEPTH), (make_wide_bom, WIDTH)])
+def test_diff(bom_factory, size):
+    previous_bom = bom_factory(eco2505, size)
+    current_bom = bom_factory(eco2505, size)
+
+    with limited_stack():
+        diff = BoMDiff(previous_bom, current_bom)
+
+    assert not diff.has_changes
+
+
+def test_limited_stack_detects_recursion():
+    def recurse(depth: int) -> int:
+        return depth if depth == 0 else recurse(depth - 1)
+
+    with pytest.raises(RecursionError):
+        with limited_stack():
+            recurse(STACK_HEADROOM)
@@ -0,0 +1,109 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+
+import pytest
+import requests_mock
+
+from ansys.grantami.bomanalytics import QuerySerializer, queries
+from ansys.grantami.bomanalytics._execution_report import (
+    BatchStatistics,
+    ExecutionReport,
+    _record_batch,
+)
+
+from .common import LEGISLATIONS, MATERIAL_IDS, echo_materials
+
+
+class TestRecordQueryReport:
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_connection):
+        query = (
+            queries.MaterialImpactedSubstancesQuery()
+            .with_material_ids(MATERIAL_IDS)
+            .with_legislation_ids(LEGISLATIONS)
+            .with_batch_size(10)
+        )
+        mock_connection.retain_responses = True
+        with requests_mock.Mocker() as mocker:
+            mocker.post(requests_mock.ANY, json=echo_materials)
+            self.result = mock_connection.run(query)
+            self.requests = mocker.request_history
+        self.report = self.result.execution_report
+
+    def test_one_entry_per_batch(self):
+        assert self.report.batch_count == 3
+        assert [batch.request_bytes for batch in self.report.batches] == [len(r.body) for r in self.requests]
+
+    def test_response_sizes(self):
+        for batch in self.report.batches:
+            assert batch.response_bytes > 0
+            assert batch.retries == 0
+        assert self.report.response_bytes == sum(batch.response_bytes for batch in self.report.batches)
+
+    def test_times_are_recorded(self):
+        for batch in self.report.batches:
+            assert batch.server_latency > 0
+            assert batch.serialization_time > 0
+            assert batch.deserialization_time > 0
+        assert self.report.result_build_time > 0
+        assert self.report.cache_hits == 0
+
+    def test_to_dict(self):
+        exported = self.report.to_dict()
+        assert json.loads(json.dumps(exported)) == exported
+        assert exported["batch_count"] == 3
+        assert exported["request_bytes"] == self.report.request_bytes
+        assert len(exported["batches"]) == 3
+        assert set(exported["batches"][0]) == {
+            "request_bytes",
+            "response_bytes",
+            "server_latency",
+            "serialization_time",
+            "deserialization_time",
+            "retries",
+        }
+
+    def test_loaded_result_has_no_report(self):
+        serializer = QuerySerializer()
+        assert serializer.load_result(serializer.dump_result(self.result)).execution_report is None
+
+
+def test_totals():
+    report = ExecutionReport(
+        batches=[
+            BatchStatistics(request_bytes=10, response_bytes=100, server_latency=1.0, retries=1),
+            BatchStatistics(request_bytes=20, response_bytes=200, server_latency=2.0),
+        ]
+    )
+    assert (report.request_bytes, report.response_bytes, report.server_latency, report.retries) == (30, 300, 3.0, 1)
+
+
+def test_request_bytes_of_text_body_are_counted_in_utf8(mock_connection):
+    statistics = BatchStatistics()
+    body = '{"ReferenceValue": "matériau"}'
+    with requests_mock.Mocker() as mocker, _record_batch(statistics):
+        mocker.post(requests_mock.ANY, json={})
+        mock_connection.request("POST", f"{mock_connection.api_url}/test", body=body)
+    assert statistics.request_bytes == len(body.encode("utf-8")) == len(body) + 1
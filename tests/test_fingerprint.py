@@ -0,0 +1,195 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import re
+from xml.etree import ElementTree
+
+import pytest
+
+from ansys.grantami.bomanalytics import BoMHandler, indicators, queries
+from ansys.grantami.bomanalytics.bom_types import eco2505
+
+from .common import ROHS, find_part, make_bom
+from .inputs import example_boms
+
+BOM_XML = """<?xml version="1.0" encoding="utf-8"?>
+<PartsEco xmlns="http://www.grantadesign.com/25/05/BillOfMaterialsEco" id="BoM1">
+    <Components>
+        <Part id="P1">
+            <Quantity Unit="Each">2</Quantity>
+            <PartNumber>Part1</PartNumber>
+        </Part>
+    </Components>
+</PartsEco>
+"""
+
+EQUIVALENT_BOM_XML = (
+    '<!-- Exported BoM --><eco:PartsEco xmlns:eco="http://www.grantadesign.com/25/05/BillOfMaterialsEco" id="BoM1">'
+    '<eco:Components><eco:Part id="P1"><eco:Quantity Unit="Each"> 2 </eco:Quantity><eco:PartNumber>Part1'
+    "</eco:PartNumber></eco:Part></eco:Components></eco:PartsEco>"
+)
+
+
+@pytest.fixture(scope="module")
+def bom_handler():
+    return BoMHandler()
+
+
+def reformat(bom: str) -> str:
+    """Remove the whitespace between elements and replace the default namespace with generated prefixes."""
+    bom = re.sub(r">\s+<", "><", bom)
+    return ElementTree.tostring(ElementTree.fromstring(bom), encoding="unicode")
+
+
+class TestBoMFingerprints:
+    def test_equivalent_xml_has_same_fingerprint(self):
+        assert BoMHandler.fingerprint(BOM_XML) == BoMHandler.fingerprint(EQUIVALENT_BOM_XML)
+
+    def test_attribute_order_is_ignored(self):
+        reordered = BOM_XML.replace('<Part id="P1">', '<Part id="P1" xmlns:a="urn:a" a:b="c">')
+        other_order = BOM_XML.replace('<Part id="P1">', '<Part xmlns:a="urn:a" a:b="c" id="P1">')
+        assert BoMHandler.fingerprint(reordered) == BoMHandler.fingerprint(other_order)
+        assert BoMHandler.fingerprint(reordered) != BoMHandler.fingerprint(BOM_XML)
+
+    def test_bytes_and_str_have_same_fingerprint(self):
+        assert BoMHandler.fingerprint(BOM_XML.encode("utf-8")) == BoMHandler.fingerprint(BOM_XML)
+
+    @pytest.mark.parametrize(
+        ["old", "new"],
+        [
+            ("Part1", "Part2"),
+            ('id="P1"', 'id="P2"'),
+            ('Unit="Each"', 'Unit="kg"'),
+            ("25/05", "24/12"),
+            ("<PartNumber>Part1</PartNumber>", "<Name>Part1</Name>"),
+        ],
+    )
+    def test_changed_xml_has_different_fingerprint(self, old, new):
+        assert BoMHandler.fingerprint(BOM_XML.replace(old, new)) != BoMHandler.fingerprint(BOM_XML)
+
+    @pytest.mark.parametrize("bom_name", ["medium-test-bom-2412", "sustainability-bom-2505", "compliance-bom-1711"])
+    def test_reformatted_example_bom_has_same_fingerprint(self, bom_name):
+        content = example_boms[bom_name].content
+        assert BoMHandler.fingerprint(reformat(content)) == BoMHandler.fingerprint(content)
+
+    def test_invalid_xml_raises_value_error(self):
+        with pytest.raises(ValueError, match="not valid XML"):
+            BoMHandler.fingerprint("<PartsEco>")
+
+    def test_loaded_boms_have_same_fingerprint(self, bom_handler):
+        content = example_boms["medium-test-bom-2505"].content
+        bom = bom_handler.load_bom_from_text(content)
+        reloaded_bom = bom_handler.load_bom_from_text(reformat(content))
+        assert BoMHandler.fingerprint(bom) == BoMHandler.fingerprint(reloaded_bom)
+        assert BoMHandler.fingerprint(bom) == BoMHandler.fingerprint(BoMHandler.compact(reloaded_bom))
+
+    def test_object_fingerprint_is_sensitive_to_changes(self):
+        bom = make_bom()
+        fingerprint = BoMHandler.fingerprint(bom)
+        find_part(bom, "Product", "Assembly1", "P1").materials[0].percentage = 50.0
+        assert BoMHandler.fingerprint(bom) != fingerprint
+
+    def test_object_fingerprint_ignores_numeric_type_and_empty_lists(self):
+        bom = eco2505.BillOfMaterials(
+            components=[eco2505.Part(part_number="P1", quantity=eco2505.UnittedValue(value=2.0), substances=[])]
+        )
+        equivalent_bom = eco2505.BillOfMaterials(
+            components=[eco2505.Part(part_number="P1", quantity=eco2505.UnittedValue(value=2))]
+        )
+        assert BoMHandler.fingerprint(bom) == BoMHandler.fingerprint(equivalent_bom)
+
+    def test_object_fingerprint_depends_on_bom_version(self, bom_handler):
+        bom = bom_handler.load_bom_from_text(example_boms["medium-test-bom-2412"].content)
+        converted_bom = bom_handler.convert(bom, eco2505.BillOfMaterials)
+        assert BoMHandler.fingerprint(bom) != BoMHandler.fingerprint(converted_bom)
+
+
+class TestQueryFingerprints:
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_connection):
+        self.connection = mock_connection
+
+    @staticmethod
+    def compliance_query(bom=BOM_XML, legislation_ids=("RoHS_EU",)):
+        return (
+            queries.BomComplianceQuery()
+            .with_bom(bom)
+            .with_indicators([indicators.RoHSIndicator(name=ROHS, legislation_ids=list(legislation_ids))])
+        )
+
+    def test_equivalent_queries_have_same_fingerprint(self):
+        query = self.compliance_query()
+        equivalent_query = self.compliance_query(bom=EQUIVALENT_BOM_XML).with_partitioning(1)
+        assert self.connection.fingerprint(query) == self.connection.fingerprint(equivalent_query)
+
+    @pytest.mark.parametrize("bom_name", ["medium-test-bom-2301", "medium-test-bom-2412", "medium-test-bom-2505"])
+    def test_bom_object_and_xml_have_same_fingerprint(self, bom_name, bom_handler):
+        bom_xml = example_boms[bom_name].content
+        xml_query = queries.BomImpactedSubstancesQuery().with_bom(bom_xml).with_legislation_ids([ROHS])
+        object_query = (
+            queries.BomImpactedSubstancesQuery()
+            .with_bom(bom_handler.load_bom_from_text(bom_xml))
+            .with_legislation_ids([ROHS])
+        )
+        assert self.connection.fingerprint(object_query) == self.connection.fingerprint(xml_query)
+
+    def test_query_type_affects_fingerprint(self):
+        compliance_query = self.compliance_query()
+        sustainability_query = queries.BomSustainabilityQuery().with_bom(BOM_XML)
+        summary_query = queries.BomSustainabilitySummaryQuery().with_bom(BOM_XML)
+        fingerprints = {self.connection.fingerprint(q) for q in [compliance_query, sustainability_query, summary_query]}
+        assert len(fingerprints) == 3
+
+    def test_query_arguments_affect_fingerprint(self):
+        fingerprint = self.connection.fingerprint(self.compliance_query())
+        assert self.connection.fingerprint(self.compliance_query(legislation_ids=["RoHS_CN"])) != fingerprint
+        assert self.connection.fingerprint(self.compliance_query(bom=BOM_XML.replace(">2<", ">3<"))) != fingerprint
+
+    def test_units_affect_fingerprint(self):
+        query = queries.BomSustainabilityQuery().with_bom(BOM_XML)
+        fingerprint = self.connection.fingerprint(query)
+        assert self.connection.fingerprint(query.with_units(mass="g")) != fingerprint
+
+    def test_legislations_affect_fingerprint(self):
+        query = queries.MaterialImpactedSubstancesQuery().with_material_ids(["plastic-abs"])
+        fingerprint = self.connection.fingerprint(query)
+        assert self.connection.fingerprint(query.with_legislation_ids(["SINList"])) != fingerprint
+
+    def test_records_affect_fingerprint_but_batch_size_does_not(self):
+        query = queries.MaterialComplianceQuery().with_material_ids(["plastic-abs", "plastic-pc"])
+        fingerprint = self.connection.fingerprint(query)
+        assert self.connection.fingerprint(query.with_batch_size(1)) == fingerprint
+        assert self.connection.fingerprint(query.with_material_ids(["plastic-pa"])) != fingerprint
+
+    @pytest.mark.parametrize(
+        "configure",
+        [
+            lambda connection: connection.set_database_details(database_key="MI_Custom"),
+            lambda connection: connection.set_database_details(substances_table_name="Chemicals"),
+            lambda connection: setattr(connection, "maximum_spec_link_depth", 2),
+        ],
+    )
+    def test_connection_settings_affect_fingerprint(self, configure):
+        query = self.compliance_query()
+        fingerprint = self.connection.fingerprint(query)
+        configure(self.connection)
+        assert self.connection.fingerprint(query) != fingerprint
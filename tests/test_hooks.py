@@ -0,0 +1,204 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import pytest
+import requests_mock
+
+from ansys.grantami.bomanalytics import (
+    BoMHandler,
+    GrantaMIException,
+    MetricsCollector,
+    TracingAdapter,
+    queries,
+)
+from ansys.grantami.bomanalytics._hooks import HOOK_EVENTS, QueryHooks
+
+from .common import (
+    LEGISLATIONS,
+    MATERIAL_IDS,
+    echo_materials,
+    impacted_substances_result,
+    make_large_bom,
+)
+
+
+def make_query():
+    return (
+        queries.MaterialImpactedSubstancesQuery()
+        .with_material_ids(MATERIAL_IDS)
+        .with_legislation_ids(LEGISLATIONS)
+        .with_batch_size(10)
+    )
+
+
+class Recorder:
+    """Records the name and arguments of every event."""
+
+    def __init__(self):
+        self.events = []
+        for event in HOOK_EVENTS:
+            setattr(self, event, lambda *args, event=event: self.events.append((event, args)))
+
+    def names(self):
+        return [name for name, _ in self.events]
+
+
+class TestEvents:
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_connection):
+        self.connection = mock_connection
+        self.recorder = Recorder()
+        self.connection.hooks.register_all(self.recorder)
+
+    def run(self, query, response=echo_materials):
+        with requests_mock.Mocker() as mocker:
+            mocker.post(requests_mock.ANY, json=response)
+            return self.connection.run(query)
+
+    def test_event_order(self):
+        query = make_query()
+        result = self.run(query)
+        batch_events = ["on_batch_request", "on_batch_response", "on_log_message"]
+        assert self.recorder.names() == ["on_query_start", *batch_events * 3, "on_query_end"]
+        assert all(args[0] is query for _, args in self.recorder.events)
+        _, (_, end_result, error, elapsed) = self.recorder.events[-1]
+        assert end_result is result and error is None and elapsed > 0
+
+    def test_batch_response_statistics(self):
+        result = self.run(make_query())
+        statistics = [args[1] for name, args in self.recorder.events if name == "on_batch_response"]
+        assert statistics == result.execution_report.batches
+        request_sizes = [args[1] for name, args in self.recorder.events if name == "on_batch_request"]
+        assert request_sizes == [batch.request_bytes for batch in statistics]
+
+    def test_log_message_arguments(self):
+        self.run(make_query())
+        messages = [args[1:] for name, args in self.recorder.events if name == "on_log_message"]
+        assert messages == [("information", "Database MI_Restricted_Substances")] * 3
+
+    def test_query_error(self):
+        response = {"Materials": [], "LogMessages": [{"Severity": "critical-error", "Message": "Failed"}]}
+        with pytest.raises(GrantaMIException):
+            self.run(make_query(), response)
+        name, (_, result, error, _) = self.recorder.events[-1]
+        assert name == "on_query_end"
+        assert result is None
+        assert isinstance(error, GrantaMIException)
+
+    def test_concurrent_batches_are_associated_with_query(self):
+        bom = make_large_bom()
+        query = queries.BomImpactedSubstancesQuery().with_bom(bom).with_legislation_ids(["SINList"])
+        query.with_partitioning(2, max_concurrent_requests=4)
+
+        def respond(request, context):
+            response = impacted_substances_result(BoMHandler().load_bom_from_text(request.json()["BomXml"]))
+            response["LogMessages"] = []
+            return response
+
+        self.run(query, respond)
+        batch_events = [args for name, args in self.recorder.events if name.startswith("on_batch")]
+        assert len(batch_events) == 8
+        assert all(args[0] is query for args in batch_events)
+
+    def test_exceptions_in_callbacks_are_logged(self, caplog):
+        def fail(*args):
+            raise RuntimeError("Callback failed")
+
+        self.connection.hooks.register("on_query_start", fail)
+        result = self.run(make_query())
+        assert len(result.impacted_substances_by_material) == len(MATERIAL_IDS)
+        assert "on_query_start" in caplog.text
+
+    def test_unregistered_callbacks_are_not_invoked(self):
+        self.connection.hooks.unregister_all(self.recorder)
+        assert not self.connection.hooks
+        self.run(make_query())
+        assert self.recorder.events == []
+
+
+class TestRegistry:
+    def test_callbacks_are_invoked_in_order(self):
+        hooks = QueryHooks()
+        calls = []
+        hooks.register("on_query_start", lambda query: calls.append(1))
+        hooks.register("on_query_start", lambda query: calls.append(2))
+        hooks._emit("on_query_start", None)
+        assert calls == [1, 2]
+
+    def test_unknown_event(self):
+        with pytest.raises(ValueError, match="Unknown event"):
+            QueryHooks().register("on_query_finished", print)
+
+    def test_unregister_missing_callback(self):
+        with pytest.raises(ValueError, match="not registered"):
+            QueryHooks().unregister("on_query_start", print)
+
+
+def test_metrics_collector(mock_connection):
+    collector = MetricsCollector()
+    mock_connection.hooks.register_all(collector)
+    with requests_mock.Mocker() as mocker:
+        mocker.post(requests_mock.ANY, json=echo_materials)
+        result = mock_connection.run(make_query())
+        mock_connection.run(make_query())
+    metrics = collector.snapshot()["MaterialImpactedSubstancesQuery"]
+    assert metrics["queries"] == 2
+    assert metrics["failures"] == 0
+    assert metrics["batches"] == 6
+    assert metrics["request_bytes"] == 2 * result.execution_report.request_bytes
+    assert metrics["log_messages"] == {"information": 6}
+    collector.reset()
+    assert collector.snapshot() == {}
+
+
+def test_tracing_adapter(mock_connection):
+    spans = []
+    mock_connection.hooks.register_all(TracingAdapter(spans.append))
+    with requests_mock.Mocker() as mocker:
+        mocker.post(requests_mock.ANY, json=echo_materials)
+        mock_connection.run(make_query())
+    assert [span.name for span in spans] == ["batch", "batch", "batch", "query"]
+    query_span = spans[-1]
+    assert query_span.attributes == {"query.type": "MaterialImpactedSubstancesQuery"}
+    assert [event[0] for event in query_span.events] == ["log_message"] * 3
+    for span in spans[:-1]:
+        assert span.trace_id == query_span.trace_id
+        assert span.parent_id == query_span.span_id
+        assert query_span.start_time <= span.start_time <= span.end_time <= query_span.end_time
+        assert span.attributes["request.bytes"] > 0
+
+
+def test_tracing_adapters_record_spans_independently(mock_connection):
+    first_spans, second_spans = [], []
+    mock_connection.hooks.register_all(TracingAdapter(first_spans.append))
+    mock_connection.hooks.register_all(TracingAdapter(second_spans.append))
+    with requests_mock.Mocker() as mocker:
+        mocker.post(requests_mock.ANY, json=echo_materials)
+        mock_connection.run(make_query())
+    for spans in (first_spans, second_spans):
+        assert [span.name for span in spans] == ["batch", "batch", "batch", "query"]
+        query_span = spans[-1]
+        assert all(span.trace_id == query_span.trace_id for span in spans)
+        assert all(span.parent_id == query_span.span_id for span in spans[:-1])
+    assert first_spans[-1].trace_id != second_spans[-1].trace_id
+    assert {id(span) for span in first_spans}.isdisjoint(id(span) for span in second_spans)
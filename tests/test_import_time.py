@@ -0,0 +1,89 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import ansys.grantami.bomanalytics as bomanalytics
+
+HEAVY_MODULES = ("xmlschema", "elementpath", "requests", "ansys.openapi", "ansys.grantami.bomanalytics_openapi")
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+
+def get_loaded_modules(code: str) -> list[str]:
+    result = run_python(f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))")
+    return json.loads(result.stdout)
+
+
+STARTUP_BENCHMARK = """
+import json, time
+start = time.perf_counter()
+import ansys.grantami.bomanalytics as bomanalytics
+imported = time.perf_counter()
+bomanalytics.BoMHandler, bomanalytics.Connection
+print(json.dumps({"package": imported - start, "dependencies": time.perf_counter() - imported}))
+"""
+
+
+class TestLazyImports:
+    def test_package_import_does_not_load_dependencies(self):
+        modules = get_loaded_modules("import ansys.grantami.bomanalytics")
+        assert [m for m in modules if m.startswith(HEAVY_MODULES)] == []
+        assert "ansys.grantami.bomanalytics._bom_helper" not in modules
+
+    def test_queries_import_does_not_load_xmlschema(self):
+        modules = get_loaded_modules("import ansys.grantami.bomanalytics.queries")
+        assert [m for m in modules if m.startswith(("xmlschema", "elementpath"))] == []
+        assert "ansys.grantami.bomanalytics._bom_helper" not in modules
+
+    def test_bom_handler_does_not_load_api_client(self):
+        modules = get_loaded_modules("from ansys.grantami.bomanalytics import BoMHandler")
+        assert "xmlschema" in modules
+        assert [m for m in modules if m.startswith(("requests", "ansys.openapi"))] == []
+
+    def test_startup_benchmark(self):
+        times = json.loads(run_python(STARTUP_BENCHMARK).stdout)
+        assert times["package"] < times["dependencies"]
+
+    @pytest.mark.parametrize("name", [name for name in bomanalytics.__all__ if name != "__version__"])
+    def test_public_names_are_available(self, name):
+        value = getattr(bomanalytics, name)
+        assert value is not None
+        assert name in dir(bomanalytics)
+        assert vars(bomanalytics)[name] is value
+
+    def test_star_import(self):
+        namespace: dict = {}
+        exec("from ansys.grantami.bomanalytics import *", namespace)
+        assert namespace["BoMHandler"] is bomanalytics.BoMHandler
+        assert namespace["queries"] is bomanalytics.queries
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+            bomanalytics.Unknown
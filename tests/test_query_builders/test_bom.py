@@ -20,9 +20,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from unittest.mock import patch
+
 import pytest
 
-from ansys.grantami.bomanalytics import queries
+from ansys.grantami.bomanalytics import BoMHandler, queries
+from ansys.grantami.bomanalytics.bom_types import eco2301, eco2505
 
 from ..inputs import example_boms
 
@@ -55,8 +58,78 @@ def test_add_bom_wrong_type(query_type):
     assert "Incorrect type for argument 'bom'" in str(e.value)
 
 
+@all_bom_queries
+@pytest.mark.parametrize("validation", ["none", "lax", "strict"])
+def test_add_bom_validation(query_type, validation):
+    bom = example_boms["sustainability-bom-2301"].content
+    query = query_type().with_bom(bom, validation=validation)
+    assert query._data.bom == bom
+
+
+@all_bom_queries
+def test_add_bom_validation_wrong_type(query_type):
+    bom = example_boms["sustainability-bom-2301"].content
+    with pytest.raises(TypeError) as e:
+        query_type().with_bom(bom, validation=True)
+    assert "Incorrect type for argument 'validation'" in str(e.value)
+
+
 @all_bom_queries
 def test_no_bom(query_type):
     query = query_type()
     with pytest.raises(ValueError, match=r"No BoM has been added to the query"):
         query._validate_items()
+
+
+@all_bom_queries
+@pytest.mark.parametrize("bom_key", ["sustainability-bom-2301", "sustainability-bom-2412", "sustainability-bom-2505"])
+def test_add_bom_object(query_type, bom_key):
+    bom_handler = BoMHandler()
+    bom = bom_handler.load_bom_from_text(example_boms[bom_key].content)
+    with patch.object(queries.ElementTree, "XML", side_effect=AssertionError("BoM was parsed")):
+        query = query_type().with_bom(bom)
+    assert query._data._item_definitions == [bom]
+    assert query._data.bom == bom_handler.dump_bom(bom)
+
+
+def test_bom_object_is_serialized_once():
+    bom = BoMHandler().load_bom_from_text(example_boms["sustainability-bom-2505"].content)
+    query = queries.BomSustainabilityQuery().with_bom(bom)
+    with patch.object(BoMHandler, "dump_bom", autospec=True, side_effect=BoMHandler.dump_bom) as dump_bom:
+        assert query._data.batched_arguments == query._data.batched_arguments
+    assert dump_bom.call_count == 1
+
+
+def test_add_bom_object_strict_validation():
+    reference = eco2505.MIRecordReference(db_key="MI_Restricted_Substances", record_guid="Not a GUID")
+    material = eco2505.Material(mi_material_reference=reference, percentage=100.0)
+    bom = eco2505.BillOfMaterials(components=[eco2505.Part(part_number="Part1", materials=[material])])
+    queries.BomSustainabilityQuery().with_bom(bom)
+    with pytest.raises(ValueError, match="Invalid BoM object"):
+        queries.BomSustainabilityQuery().with_bom(bom, validation="strict")
+    reference.record_guid = "00000000-0000-0000-0000-000000000000"
+    query = queries.BomSustainabilityQuery().with_bom(bom, validation="strict")
+    assert "<eco:PartNumber>Part1</eco:PartNumber>" in query._data.bom
+
+
+def test_add_bom_object_unsupported_format():
+    data_manager = queries._BomQueryDataManager([queries._BomFormat.bom_xml2505])
+    with pytest.raises(ValueError, match="bom_xml2301 .* is not supported by this query"):
+        data_manager.bom = eco2301.BillOfMaterials(components=[])
+
+
+@all_bom_queries
+def test_add_bom_bytes(query_type):
+    bom = example_boms["sustainability-bom-2301"].content
+    query = query_type().with_bom(bom.encode("utf-8"))
+    assert query._data.bom == bom
+
+
+@all_bom_queries
+@pytest.mark.parametrize("validation", ["none", "lax", "strict"])
+def test_add_bom_path(query_type, validation, tmp_path):
+    bom = example_boms["sustainability-bom-2301"].content
+    bom_path = tmp_path / "bom.xml"
+    bom_path.write_text(bom, encoding="utf-8")
+    query = query_type().with_bom(bom_path, validation=validation)
+    assert query._data.bom == bom
@@ -0,0 +1,195 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from array import array
+
+import pytest
+
+from ansys.grantami.bomanalytics import queries
+from ansys.grantami.bomanalytics._fingerprint import _CanonicalHasher
+
+from .common import check_query_manager_attributes
+
+record_query_types = [
+    queries.MaterialComplianceQuery,
+    queries.MaterialImpactedSubstancesQuery,
+    queries.PartComplianceQuery,
+    queries.PartImpactedSubstancesQuery,
+    queries.SpecificationComplianceQuery,
+    queries.SpecificationImpactedSubstancesQuery,
+    queries.SubstanceComplianceQuery,
+]
+
+
+def model_dicts(query):
+    return [model.to_dict() for batch in query._data.batched_arguments for model in batch[query._data.item_type_name]]
+
+
+def fingerprint(query):
+    hasher = _CanonicalHasher()
+    query._data.update_fingerprint(hasher)
+    return hasher.hexdigest()
+
+
+@pytest.mark.parametrize("query_type", record_query_types)
+class TestGenericReferenceTypes:
+    def test_record_history_ids_from_generator(self, query_type):
+        query = query_type().with_bulk_records("record_history_ids", (i for i in range(1, 4)))
+        assert check_query_manager_attributes(
+            query, ["record_guid", "record_history_guid"], "record_history_identity", [1, 2, 3]
+        )
+
+    def test_bulk_records_match_list_methods(self, query_type):
+        guids = ["00000000-0000-0000-0000-000000000001", "00000000-0000-0000-0000-000000000002"]
+        query = query_type().with_bulk_records("record_guids", guids, external_database_key="MI_Other")
+        expected = query_type().with_record_guids(guids, external_database_key="MI_Other")
+        assert model_dicts(query) == model_dicts(expected)
+        assert fingerprint(query) == fingerprint(expected)
+
+    def test_unsupported_reference_type_raises_value_error(self, query_type):
+        with pytest.raises(ValueError, match='Reference type "record_ids" is not supported'):
+            query_type().with_bulk_records("record_ids", [1])
+
+    @pytest.mark.parametrize("values", ["12345", {"a": 1}, 12345])
+    def test_values_which_are_not_sequences_raise_type_error(self, query_type, values):
+        with pytest.raises(TypeError, match="Incorrect type for argument 'values'"):
+            query_type().with_bulk_records("record_history_guids", values)
+
+    @pytest.mark.parametrize("values", [[1, "2"], [1, 2.0], [1, True]])
+    def test_invalid_record_history_ids_raise_type_error(self, query_type, values):
+        query = query_type()
+        with pytest.raises(TypeError, match="Incorrect type for item 1 of argument 'values'"):
+            query.with_bulk_records("record_history_ids", values)
+        assert not query._data.populated_inputs
+
+    def test_empty_string_raises_type_error(self, query_type):
+        with pytest.raises(TypeError, match="Item 2 of argument 'values' is an empty string"):
+            query_type().with_bulk_records("record_guids", ["a", "b", ""])
+
+
+class TestQuerySpecificReferenceTypes:
+    @pytest.mark.parametrize(
+        ["query_type", "reference_type", "method_name"],
+        [
+            (queries.MaterialComplianceQuery, "material_ids", "with_material_ids"),
+            (queries.PartImpactedSubstancesQuery, "part_numbers", "with_part_numbers"),
+            (queries.SpecificationComplianceQuery, "specification_ids", "with_specification_ids"),
+            (queries.SubstanceComplianceQuery, "cas_numbers", "with_cas_numbers"),
+            (queries.SubstanceComplianceQuery, "ec_numbers", "with_ec_numbers"),
+            (queries.SubstanceComplianceQuery, "chemical_names", "with_chemical_names"),
+        ],
+    )
+    def test_bulk_records_match_list_methods(self, query_type, reference_type, method_name):
+        values = ["Value 1", "Value 2", "Value 3"]
+        query = query_type().with_bulk_records(reference_type, iter(values))
+        expected = getattr(query_type(), method_name)(values)
+        assert model_dicts(query) == model_dicts(expected)
+        assert fingerprint(query) == fingerprint(expected)
+
+    def test_reference_type_of_other_record_type_raises_value_error(self):
+        with pytest.raises(ValueError, match='"part_numbers" is not supported by MaterialComplianceQuery'):
+            queries.MaterialComplianceQuery().with_bulk_records("part_numbers", ["PN-1"])
+
+
+class TestSubstanceAmounts:
+    def test_amounts_match_list_method(self):
+        values = [("50-00-0", 25), ("57-24-9", 0.1)]
+        query = queries.SubstanceComplianceQuery().with_bulk_records(
+            "cas_numbers", [cas for cas, _ in values], amounts=array("d", [amount for _, amount in values])
+        )
+        expected = queries.SubstanceComplianceQuery().with_cas_numbers_and_amounts(values)
+        assert model_dicts(query) == model_dicts(expected)
+        assert fingerprint(query) == fingerprint(expected)
+        assert [d.percentage_amount for d in query._data._item_definitions] == [25.0, 0.1]
+
+    def test_default_amount_is_100_percent(self):
+        query = queries.SubstanceComplianceQuery().with_bulk_records("ec_numbers", ["200-001-8"])
+        assert [model["percentage_amount"] for model in model_dicts(query)] == [100]
+
+    def test_mismatched_amounts_raise_value_error(self):
+        with pytest.raises(ValueError, match="contains 1 amounts, but 2 record references were specified"):
+            queries.SubstanceComplianceQuery().with_bulk_records("cas_numbers", ["50-00-0", "57-24-9"], amounts=[50])
+
+    @pytest.mark.parametrize("amount", [0, -1, 100.1, float("nan")])
+    def test_out_of_range_amount_raises_value_error(self, amount):
+        with pytest.raises(ValueError, match="percentage_amount must be between 0 and 100"):
+            queries.SubstanceComplianceQuery().with_bulk_records("cas_numbers", ["50-00-0"], amounts=[amount])
+
+    def test_non_numeric_amount_raises_type_error(self):
+        with pytest.raises(TypeError, match="percentage_amount must be a number"):
+            queries.SubstanceComplianceQuery().with_bulk_records("cas_numbers", ["50-00-0"], amounts=["50"])
+
+    def test_invalid_pair_does_not_add_any_substances(self):
+        query = queries.SubstanceComplianceQuery()
+        with pytest.raises(ValueError):
+            query.with_cas_numbers_and_amounts([("50-00-0", 25), ("57-24-9", 0)])
+        assert not query._data.populated_inputs
+
+
+class TestNumPyAndPandas:
+    def test_numpy_arrays(self):
+        np = pytest.importorskip("numpy")
+        query = queries.SubstanceComplianceQuery().with_bulk_records(
+            "record_history_ids", np.arange(1, 4, dtype=np.int64), amounts=np.array([10.0, 20.0, 30.0])
+        )
+        expected = queries.SubstanceComplianceQuery().with_record_history_ids_and_amounts([(1, 10), (2, 20), (3, 30)])
+        assert model_dicts(query) == model_dicts(expected)
+
+    def test_pandas_series(self):
+        pd = pytest.importorskip("pandas")
+        frame = pd.DataFrame({"cas": ["50-00-0", "57-24-9"], "amount": [25.0, 0.1]})
+        query = queries.SubstanceComplianceQuery().with_bulk_records(
+            "cas_numbers", frame["cas"], amounts=frame["amount"]
+        )
+        expected = queries.SubstanceComplianceQuery().with_cas_numbers_and_amounts(
+            [("50-00-0", 25.0), ("57-24-9", 0.1)]
+        )
+        assert model_dicts(query) == model_dicts(expected)
+
+    def test_missing_values_raise_type_error(self):
+        pd = pytest.importorskip("pandas")
+        with pytest.raises(TypeError, match="Incorrect type for item 1 of argument 'values'"):
+            queries.PartComplianceQuery().with_bulk_records("part_numbers", pd.Series(["PN-1", None]))
+
+
+class TestLargeQueries:
+    def test_batches_span_calls_in_order(self):
+        query = (
+            queries.PartComplianceQuery()
+            .with_batch_size(4)
+            .with_part_numbers(["A", "B", "C"])
+            .with_bulk_records("record_history_ids", range(1, 4))
+            .with_part_numbers(["D"])
+        )
+        batches = [batch["parts"] for batch in query._data.batched_arguments]
+        assert [len(batch) for batch in batches] == [4, 3]
+        assert [model.reference_value for batch in batches for model in batch] == ["A", "B", "C", "1", "2", "3", "D"]
+
+    def test_large_query_is_built_and_batched(self):
+        count = 200_000
+        query = queries.SubstanceComplianceQuery().with_bulk_records(
+            "cas_numbers", (f"{i}-00-0" for i in range(count)), amounts=array("d", [50.0]) * count
+        )
+        assert repr(query) == f"<SubstanceComplianceQuery: {count} substances, batch size = 500, 0 indicators>"
+        batches = query._data.batched_arguments
+        assert len(next(batches)["substances"]) == 500
+        assert sum(1 for _ in batches) == count // 500 - 1
@@ -0,0 +1,127 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import copy
+
+import pytest
+import requests_mock
+
+from ansys.grantami.bomanalytics import indicators, queries
+
+from ..common import INDICATORS, LEGISLATIONS
+from ..inputs import example_payloads
+
+compliance_query_types = [
+    queries.MaterialComplianceQuery,
+    queries.PartComplianceQuery,
+    queries.SpecificationComplianceQuery,
+    queries.SubstanceComplianceQuery,
+    queries.BomComplianceQuery,
+]
+impacted_substances_query_types = [
+    queries.MaterialImpactedSubstancesQuery,
+    queries.PartImpactedSubstancesQuery,
+    queries.SpecificationImpactedSubstancesQuery,
+    queries.BomImpactedSubstancesQuery,
+]
+
+EXTRA_INDICATOR = indicators.RoHSIndicator(name="Extra", legislation_ids=["RoHS"])
+
+
+@pytest.mark.parametrize("query_type", compliance_query_types)
+class TestComplianceTemplates:
+    def test_clone_shares_precomputed_indicators(self, query_type):
+        template = query_type().with_indicators(list(INDICATORS.values())).as_template()
+        first, second = template.clone(), template.clone()
+        assert isinstance(first, query_type)
+        assert first._request_parameters is second._request_parameters
+        expected = query_type().with_indicators(list(INDICATORS.values()))._request_arguments({})
+        assert first._request_arguments({}) == expected
+
+    def test_template_is_not_affected_by_original_query(self, query_type):
+        query = query_type().with_indicators(list(INDICATORS.values()))
+        template = query.as_template()
+        query.with_indicators([EXTRA_INDICATOR])
+        assert list(template.clone()._indicators) == list(INDICATORS)
+
+    def test_modifying_clone_copies_indicators(self, query_type):
+        template = query_type().with_indicators(list(INDICATORS.values())).as_template()
+        modified = template.clone().with_indicators([EXTRA_INDICATOR])
+        assert modified._request_parameters is None
+        assert list(modified._indicators) == [*INDICATORS, "Extra"]
+        assert len(modified._request_arguments({})["indicators"]) == 3
+        assert list(template.clone()._indicators) == list(INDICATORS)
+
+
+@pytest.mark.parametrize("query_type", impacted_substances_query_types)
+class TestImpactedSubstancesTemplates:
+    def test_modifying_clone_copies_legislations(self, query_type):
+        template = query_type().with_legislation_ids(LEGISLATIONS).as_template()
+        modified = template.clone().with_legislation_ids(["Extra"])
+        assert modified._legislations == [*LEGISLATIONS, "Extra"]
+        assert template.clone()._request_arguments({}) == {"legislation_ids": LEGISLATIONS}
+
+
+class TestTemplateSettings:
+    def test_records_are_not_copied(self):
+        query = queries.PartComplianceQuery().with_part_numbers(["PN-1", "PN-2"]).with_batch_size(3)
+        clone = query.as_template().clone()
+        assert not clone._data.populated_inputs
+        assert clone._data.batch_size == 3
+        assert len(query._data._item_definitions) == 2
+
+    def test_clones_have_independent_records(self):
+        template = queries.SubstanceComplianceQuery().as_template()
+        first = template.clone().with_cas_numbers(["50-00-0"])
+        second = template.clone().with_cas_numbers(["57-24-9", "64-17-5"])
+        assert [item.cas_number for item in first._data._item_definitions] == ["50-00-0"]
+        assert [item.cas_number for item in second._data._item_definitions] == ["57-24-9", "64-17-5"]
+
+    def test_partitioning_settings_are_copied(self):
+        query = queries.BomComplianceQuery().with_partitioning(50, max_concurrent_requests=2).with_deduplication()
+        data = query.as_template().clone()._data
+        assert data.max_parts_per_request == 50
+        assert data.max_concurrent_requests == 2
+        assert data.deduplicate_parts
+
+    def test_modifying_clone_copies_units(self):
+        template = queries.BomSustainabilityQuery().with_units(mass="kg").as_template()
+        modified = template.clone().with_units(mass="lb")
+        assert modified._preferred_units.mass_unit == "lb"
+        assert template.clone()._preferred_units.mass_unit == "kg"
+
+    def test_repr(self):
+        assert repr(queries.PartComplianceQuery().as_template()) == "<QueryTemplate: PartComplianceQuery>"
+
+
+class TestRerunQuery:
+    def test_results_are_not_accumulated(self, mock_connection):
+        query = queries.MaterialImpactedSubstancesQuery().with_material_ids(["A", "B", "C"]).with_batch_size(2)
+        query.with_legislation_ids(LEGISLATIONS)
+        response = copy.deepcopy(example_payloads["GetImpactedSubstancesForMaterials.Response"].data)
+        response["LogMessages"] = [{"Severity": "warning", "Message": "Batch message"}]
+        with requests_mock.Mocker() as mocker:
+            mocker.post(requests_mock.ANY, json=response)
+            first = mock_connection.run(query)
+            second = mock_connection.run(query)
+        assert len(first.messages) == 2
+        assert len(second.messages) == 2
@@ -0,0 +1,211 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+
+import pytest
+import requests_mock
+
+from ansys.grantami.bomanalytics import QuerySerializer, indicators, queries
+from ansys.grantami.bomanalytics._serialization import _ModelSerializer
+
+from .common import CUSTOM_TABLES, INDICATORS, LEGISLATIONS
+from .inputs import example_boms, example_payloads
+
+serializer = QuerySerializer()
+
+
+def round_trip(query):
+    loaded = serializer.load_query(serializer.dump_query(query))
+    assert type(loaded) is type(query)
+    return loaded
+
+
+class TestRecordQueries:
+    def test_compliance_query(self):
+        query = (
+            queries.PartComplianceQuery()
+            .with_part_numbers(["PN-1", "PN-2"])
+            .with_record_history_ids([123])
+            .with_record_guids(["00000000-0000-0000-0000-000000000000"], external_database_key="OTHER_DB")
+            .with_indicators(list(INDICATORS.values()))
+            .with_batch_size(7)
+        )
+        loaded = round_trip(query)
+        assert loaded._data.batch_size == 7
+        assert loaded._request_arguments({}) == query._request_arguments({})
+        assert list(loaded._data.batched_arguments) == list(query._data.batched_arguments)
+
+    def test_substance_amounts(self):
+        query = (
+            queries.SubstanceComplianceQuery()
+            .with_cas_numbers_and_amounts([("50-00-0", 12.5), ("57-24-9", 50)])
+            .with_cas_numbers(["64-17-5"])
+            .with_indicators([INDICATORS["One legislation"]])
+        )
+        loaded = round_trip(query)
+        assert list(loaded._data.batched_arguments) == list(query._data.batched_arguments)
+        assert [item.percentage_amount for item in loaded._data._item_definitions] == [12.5, 50, 100]
+
+    def test_bulk_records(self):
+        query = queries.MaterialImpactedSubstancesQuery().with_legislation_ids(LEGISLATIONS)
+        query.with_bulk_records("material_ids", [f"material-{index}" for index in range(1000)])
+        loaded = round_trip(query)
+        assert loaded._legislations == LEGISLATIONS
+        assert list(loaded._data.batched_arguments) == list(query._data.batched_arguments)
+
+    def test_indicator_options(self):
+        indicator = indicators.RoHSIndicator(name="RoHS", legislation_ids=["RoHS"], ignore_exemptions=True)
+        loaded = round_trip(queries.MaterialComplianceQuery().with_indicators([indicator]))
+        assert loaded._indicators["RoHS"]._ignore_exemptions is True
+        assert loaded._indicators["RoHS"].legislation_ids == ["RoHS"]
+
+
+class TestBomQueries:
+    bom = example_boms["medium-test-bom-2505"].content
+
+    def test_bom_and_partitioning(self):
+        query = queries.BomImpactedSubstancesQuery().with_bom(self.bom).with_legislation_ids(LEGISLATIONS)
+        query.with_partitioning(5, max_concurrent_requests=2).with_deduplication()
+        loaded = round_trip(query)
+        assert loaded._data.bom == self.bom
+        assert loaded._data.max_parts_per_request == 5
+        assert loaded._data.max_concurrent_requests == 2
+        assert loaded._data.deduplicate_parts
+        assert loaded._data.batched_arguments == query._data.batched_arguments
+
+    def test_sustainability_units(self):
+        query = queries.BomSustainabilityQuery().with_bom(self.bom).with_units(mass="kg", energy="MJ")
+        loaded = round_trip(query)
+        assert loaded._preferred_units == query._preferred_units
+
+    def test_query_without_bom(self):
+        loaded = round_trip(queries.BomComplianceQuery())
+        assert not loaded._data.populated_inputs
+
+
+class TestDocumentChecks:
+    def test_document_is_compact(self):
+        text = serializer.dump_query(queries.MaterialComplianceQuery().with_material_ids(["A"]))
+        assert " " not in text
+        assert json.loads(text)["version"] == 1
+
+    def test_unsupported_version(self):
+        document = json.loads(serializer.dump_query(queries.MaterialComplianceQuery()))
+        document["version"] = 2
+        with pytest.raises(ValueError, match="version 2"):
+            serializer.load_query(json.dumps(document))
+
+    def test_wrong_format(self):
+        text = serializer.dump_query(queries.MaterialComplianceQuery())
+        with pytest.raises(ValueError, match="format"):
+            serializer.load_result(text)
+
+    def test_unknown_query_type(self):
+        document = json.loads(serializer.dump_query(queries.MaterialComplianceQuery()))
+        document["type"] = "QueryTemplate"
+        with pytest.raises(ValueError, match="unknown type"):
+            serializer.load_query(json.dumps(document))
+
+    def test_not_a_query(self):
+        with pytest.raises(TypeError):
+            serializer.dump_query(queries.MaterialComplianceQuery().as_template())
+
+
+def test_connection_settings(mock_connection, mock_connection_with_custom_db):
+    mock_connection_with_custom_db.maximum_spec_link_depth = 3
+    text = serializer.dump_connection_settings(mock_connection_with_custom_db)
+    serializer.load_connection_settings(mock_connection, text)
+    assert mock_connection._db_key == mock_connection_with_custom_db._db_key
+    assert mock_connection._table_names == mock_connection_with_custom_db._table_names
+    assert mock_connection.maximum_spec_link_depth == 3
+    assert len(json.loads(text)["table_names"]) == len(CUSTOM_TABLES)
+
+
+@pytest.mark.parametrize(
+    ["payload", "type_name"],
+    [
+        ("GetImpactedSubstancesForMaterials.Response", "GetImpactedSubstancesForMaterialsResponse"),
+        ("GetComplianceForMaterials.Response", "GetComplianceForMaterialsResponse"),
+    ],
+)
+def test_models_round_trip(payload, type_name):
+    model_serializer = _ModelSerializer()
+    data = example_payloads[payload].data
+    model = model_serializer.from_json(data, type_name)
+    assert type(model).__name__ == type_name
+    assert model_serializer.to_json(model) == data
+
+
+class TestResults:
+    def run(self, connection, query, payload, retain_responses=True):
+        connection.retain_responses = retain_responses
+        with requests_mock.Mocker() as mocker:
+            mocker.post(requests_mock.ANY, json=example_payloads[payload].data)
+            return connection.run(query)
+
+    def test_compliance_result(self, mock_connection):
+        query = (
+            queries.MaterialComplianceQuery()
+            .with_material_ids(["A"])
+            .with_indicators(
+                [
+                    indicators.WatchListIndicator(name="Indicator 1", legislation_ids=["Mock"]),
+                    indicators.RoHSIndicator(name="Indicator 2", legislation_ids=["Mock"]),
+                ]
+            )
+        )
+        result = self.run(mock_connection, query, "GetComplianceForMaterials.Response")
+        loaded = serializer.load_result(serializer.dump_result(result))
+        assert type(loaded) is type(result)
+        assert loaded.messages == result.messages
+        assert [repr(material) for material in loaded.compliance_by_material_and_indicator] == [
+            repr(material) for material in result.compliance_by_material_and_indicator
+        ]
+        assert list(loaded.compliance_by_indicator) == list(result.compliance_by_indicator)
+        assert serializer.dump_result(loaded) == serializer.dump_result(result)
+
+    def test_impacted_substances_result(self, mock_connection):
+        query = queries.BomImpactedSubstancesQuery().with_bom(TestBomQueries.bom).with_legislation_ids(LEGISLATIONS)
+        result = self.run(mock_connection, query, "GetImpactedSubstancesForBom.Response")
+        loaded = serializer.load_result(serializer.dump_result(result))
+        assert type(loaded) is type(result)
+        assert [repr(substance) for substance in loaded.impacted_substances] == [
+            repr(substance) for substance in result.impacted_substances
+        ]
+        assert serializer.dump_result(loaded) == serializer.dump_result(result)
+
+    def test_responses_are_not_retained_by_default(self, mock_connection):
+        query = queries.MaterialImpactedSubstancesQuery().with_material_ids(["A"]).with_legislation_ids(LEGISLATIONS)
+        result = self.run(mock_connection, query, "GetImpactedSubstancesForMaterials.Response", retain_responses=False)
+        assert result._response_items is None
+        with pytest.raises(ValueError, match="Set retain_responses to True"):
+            serializer.dump_result(result)
+
+    def test_result_without_response_cannot_be_serialized(self, mock_connection):
+        query = queries.MaterialImpactedSubstancesQuery().with_material_ids(["A"]).with_legislation_ids(LEGISLATIONS)
+        result = self.run(mock_connection, query, "GetImpactedSubstancesForMaterials.Response")
+        # Results updated with BoM changes are not created from a response
+        result._response_items = None
+        with pytest.raises(ValueError, match="not created from a response"):
+            serializer.dump_result(result)
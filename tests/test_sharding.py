@@ -0,0 +1,159 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import gc
+import multiprocessing
+import pickle
+
+from ansys.openapi.common import Unset
+import pytest
+import requests_mock
+
+from ansys.grantami.bomanalytics import Connection, QuerySerializer, ShardedQueryRunner, queries
+from ansys.grantami.bomanalytics._sharding import (
+    _dump_shard_result,
+    _load_shard_result,
+    _slice_columns,
+)
+
+from .common import LEGISLATIONS, LICENSE_RESPONSE, MATERIAL_IDS, echo_materials, sl_url
+
+# Worker processes inherit the mocked HTTP adapter only if they are forked while the mocker is active
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="Worker processes must be forked"
+)
+
+
+@pytest.fixture
+def mocker():
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json=LICENSE_RESPONSE)
+        m.post(requests_mock.ANY, json=echo_materials)
+        yield m
+
+
+@pytest.fixture
+def builder(mocker):
+    return Connection(api_url=sl_url).with_anonymous()
+
+
+@pytest.fixture
+def runner(builder):
+    with ShardedQueryRunner(builder, processes=3, mp_context=multiprocessing.get_context("fork")) as runner:
+        yield runner
+
+
+def make_query(batch_size):
+    return (
+        queries.MaterialImpactedSubstancesQuery()
+        .with_material_ids(MATERIAL_IDS[:10])
+        .with_bulk_records("material_ids", MATERIAL_IDS[10:])
+        .with_legislation_ids(LEGISLATIONS)
+        .with_batch_size(batch_size)
+    )
+
+
+def test_sharded_result_matches_single_process_result(runner, builder):
+    client = builder.connect()
+    client.set_database_details(database_key="OTHER_DB")
+    query = make_query(batch_size=4)
+    expected = client.run(query)
+    result = runner.run(query, client)
+    assert type(result) is type(expected)
+    assert [material.material_id for material in result.impacted_substances_by_material] == MATERIAL_IDS
+    assert result.messages == expected.messages
+    assert [message.message for message in result.messages] == ["Database OTHER_DB"] * 7
+    assert result.execution_report.batch_count == 7
+
+
+def test_shard_results_do_not_include_responses(runner, builder):
+    result = runner.run(make_query(batch_size=4), builder.connect())
+    assert result._response_items is None
+
+
+def test_sharded_result_with_retained_responses_can_be_serialized(runner, builder):
+    client = builder.connect()
+    client.retain_responses = True
+    serializer = QuerySerializer()
+    result = serializer.load_result(serializer.dump_result(runner.run(make_query(batch_size=4), client)))
+    assert [material.material_id for material in result.impacted_substances_by_material] == MATERIAL_IDS
+
+
+def test_unset_marker_is_preserved_in_shard_result():
+    assert _load_shard_result(_dump_shard_result([Unset]))[0] is Unset
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_garbage_collection_is_restored_after_loading_shard_result(enabled):
+    was_enabled = gc.isenabled()
+    (gc.enable if enabled else gc.disable)()
+    try:
+        assert _load_shard_result(pickle.dumps(["result"])) == ["result"]
+        assert gc.isenabled() is enabled
+    finally:
+        (gc.enable if was_enabled else gc.disable)()
+
+
+def test_single_batch_runs_in_current_process(runner, builder, mocker):
+    result = runner.run(make_query(batch_size=100), builder.connect())
+    assert len(result.impacted_substances_by_material) == len(MATERIAL_IDS)
+    assert len([request for request in mocker.request_history if request.method == "POST"]) == 1
+
+
+def test_bom_query_raises_type_error(runner, builder):
+    with pytest.raises(TypeError, match="record-based"):
+        runner.run(queries.BomImpactedSubstancesQuery(), builder.connect())
+
+
+@pytest.mark.parametrize(
+    ["record_count", "batch_size", "processes", "expected"],
+    [
+        (25, 4, 3, [(0, 8), (8, 16), (16, 25)]),
+        (25, 10, 3, [(0, 10), (10, 20), (20, 25)]),
+        (25, 20, 3, [(0, 20), (20, 25)]),
+        (3, 1, 2, [(0, 1), (1, 3)]),
+        (0, 10, 2, []),
+    ],
+)
+def test_shards_contain_whole_batches(record_count, batch_size, processes, expected):
+    runner = ShardedQueryRunner(lambda: None, processes=processes)
+    try:
+        assert runner._shard_bounds(record_count, batch_size) == expected
+    finally:
+        runner.shutdown()
+
+
+def test_slice_columns():
+    columns = [
+        {"reference_type": "CasNumber", "values": ["a", "b", "c"], "amounts": [1, 2, 3]},
+        {"reference_type": "EcNumber", "values": ["d", "e"]},
+    ]
+    assert _slice_columns(columns, 2, 4) == [
+        {"reference_type": "CasNumber", "values": ["c"], "amounts": [3]},
+        {"reference_type": "EcNumber", "values": ["d"]},
+    ]
+
+
+def test_invalid_process_count():
+    with pytest.raises(ValueError, match="at least 1"):
+        ShardedQueryRunner(lambda: None, processes=0)
@@ -0,0 +1,172 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import pytest
+import requests_mock
+
+from ansys.grantami.bomanalytics import BoMHandler, indicators, queries
+from ansys.grantami.bomanalytics.bom_types import eco2301, eco2412, eco2505
+from benchmarks import LEGISLATION_THRESHOLD, BoMShape, SyntheticDatabase
+
+from .common import iter_parts
+
+INDICATORS = [
+    indicators.WatchListIndicator(name="Watch list", legislation_ids=["SINList"]),
+    indicators.RoHSIndicator(name="RoHS", legislation_ids=["RoHS"]),
+]
+SHAPE = BoMShape(depth=2, fan_out=3, materials_per_part=2, substances_per_part=1, transport_stages=2)
+
+
+def run(connection, query, response):
+    with requests_mock.Mocker() as mocker:
+        mocker.post(requests_mock.ANY, json=response)
+        return connection.run(query)
+
+
+@pytest.mark.parametrize("bom_type", [eco2301.BillOfMaterials, eco2412.BillOfMaterials, eco2505.BillOfMaterials])
+def test_generated_boms_are_valid(bom_type, isolated_namespace_registry):
+    bom = SyntheticDatabase().generate_bom(SHAPE, bom_type)
+    assert isinstance(bom, bom_type)
+    handler = BoMHandler()
+    text = handler.dump_bom(bom, validation="strict")
+    loaded_bom = handler.load_bom_from_text(text)
+    assert isinstance(loaded_bom, bom_type)
+    assert loaded_bom == bom
+
+
+def test_same_seed_generates_same_bom():
+    handler = BoMHandler()
+    first = handler.dump_bom(SyntheticDatabase(seed=3).generate_bom(SHAPE))
+    assert handler.dump_bom(SyntheticDatabase(seed=3).generate_bom(SHAPE)) == first
+    assert handler.dump_bom(SyntheticDatabase(seed=3).generate_bom(SHAPE, seed=4)) != first
+    assert handler.dump_bom(SyntheticDatabase(seed=4).generate_bom(SHAPE, seed=3)) != first
+
+
+class TestShape:
+    def test_complete_levels(self):
+        bom = SyntheticDatabase().generate_bom(SHAPE)
+        parts = list(iter_parts(bom.components))
+        assert len(parts) == SHAPE.part_count == 13
+        leaves = [part for part in parts if not part.components]
+        assert len(leaves) == 9
+        assert all(len(part.materials) == 2 and len(part.substances) == 1 for part in leaves)
+        assert all(len(material.processes) == 1 for part in leaves for material in part.materials)
+        assert not any(part.materials for part in parts if part.components)
+        assert len(bom.transport_phase) == 2
+        internal_ids = [part.internal_id for part in parts] + [stage.internal_id for stage in bom.transport_phase]
+        assert len(set(internal_ids)) == len(internal_ids)
+
+    @pytest.mark.parametrize("part_count", [1, 9, 10, 11, 10_000])
+    def test_with_part_count(self, part_count):
+        shape = BoMShape.with_part_count(part_count, fan_out=9)
+        assert shape.part_count == part_count
+        bom = SyntheticDatabase().generate_bom(shape)
+        assert sum(1 for _ in iter_parts(bom.components)) == part_count
+
+    def test_invalid_part_count(self):
+        with pytest.raises(ValueError, match="at least one part"):
+            BoMShape.with_part_count(0)
+
+    def test_part_transport_stages(self):
+        shape = BoMShape(depth=1, fan_out=2, transport_stages_per_part=3)
+        bom = SyntheticDatabase().generate_bom(shape, eco2412.BillOfMaterials)
+        assert [len(part.transport_phase) for part in iter_parts(bom.components)] == [0, 3, 3]
+
+    def test_part_transport_stages_not_supported_by_2301(self):
+        shape = BoMShape(transport_stages_per_part=1)
+        with pytest.raises(ValueError, match="23/01 BoMs do not support transport stages in parts"):
+            SyntheticDatabase().generate_bom(shape, eco2301.BillOfMaterials)
+
+    def test_invalid_bom_type(self):
+        with pytest.raises(ValueError, match="is not a BillOfMaterials class"):
+            SyntheticDatabase().generate_bom(SHAPE, eco2505.Part)
+
+
+class TestResponses:
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_connection):
+        self.connection = mock_connection
+
+    @pytest.mark.parametrize(
+        "above_threshold_fraction, part_flag",
+        [(0.0, "WatchListAllSubstancesBelowThreshold"), (1.0, "WatchListHasSubstanceAboveThreshold")],
+    )
+    def test_compliance(self, above_threshold_fraction, part_flag):
+        database = SyntheticDatabase(above_threshold_fraction=above_threshold_fraction)
+        bom = database.generate_bom(SHAPE)
+        query = queries.BomComplianceQuery().with_bom(bom).with_indicators(INDICATORS)
+        result = run(self.connection, query, database.compliance_response(bom, INDICATORS))
+        (product,) = result.compliance_by_part_and_indicator
+        assert product.indicators["Watch list"].flag.name == part_flag
+        leaf = product.parts[0].parts[0]
+        assert len(leaf.materials) == 2
+        assert len(leaf.substances) == 1
+        assert len(leaf.materials[0].substances) == 3
+
+    def test_compliance_rolls_up_worst_flag(self):
+        database = SyntheticDatabase(above_threshold_fraction=0.2)
+        bom = database.generate_bom(SHAPE)
+        query = queries.BomComplianceQuery().with_bom(bom).with_indicators(INDICATORS)
+        result = run(self.connection, query, database.compliance_response(bom, INDICATORS))
+
+        def is_compliant(item):
+            return item.indicators["RoHS"].flag.name in ("RohsCompliant", "RohsBelowThreshold")
+
+        def check(part):
+            contents = [*part.parts, *part.materials, *part.substances]
+            assert is_compliant(part) == all(is_compliant(item) for item in contents)
+            for child in part.parts:
+                check(child)
+
+        check(result.compliance_by_part_and_indicator[0])
+
+    def test_impacted_substances(self):
+        database = SyntheticDatabase(substances_per_material=2)
+        bom = database.generate_bom(BoMShape(depth=1, fan_out=4, substances_per_part=1))
+        query = queries.BomImpactedSubstancesQuery().with_bom(bom).with_legislation_ids(["SINList", "CCC"])
+        result = run(self.connection, query, database.impacted_substances_response(bom, ["SINList", "CCC"]))
+        assert list(result.impacted_substances_by_legislation) == ["SINList", "CCC"]
+        substances = result.impacted_substances_by_legislation["SINList"]
+        assert 0 < len(substances) <= 4 * 3
+        assert len({substance.cas_number for substance in substances}) == len(substances)
+        assert all(substance.legislation_threshold == LEGISLATION_THRESHOLD for substance in substances)
+
+    @pytest.mark.parametrize("bom_type", [eco2301.BillOfMaterials, eco2505.BillOfMaterials])
+    def test_sustainability(self, bom_type):
+        database = SyntheticDatabase()
+        bom = database.generate_bom(SHAPE, bom_type)
+        query = queries.BomSustainabilityQuery().with_bom(bom)
+        result = run(self.connection, query, database.sustainability_response(bom))
+        product = result.part
+        assert product.identity == bom.components[0].internal_id
+        assert [part.identity for part in product.parts] == [part.internal_id for part in bom.components[0].components]
+        child_mass = sum(part.reported_mass.value for part in product.parts)
+        assert product.reported_mass.value == pytest.approx(bom.components[0].quantity.value * child_mass)
+        child_energy = sum(part.embodied_energy.value for part in product.parts)
+        assert product.embodied_energy.value == pytest.approx(child_energy)
+        assert [stage.identity for stage in result.transport_stages] == [s.internal_id for s in bom.transport_phase]
+
+    def test_records_from_another_database(self):
+        bom = SyntheticDatabase(seed=1).generate_bom(SHAPE)
+        with pytest.raises(ValueError, match="is not a record in this synthetic database"):
+            SyntheticDatabase(seed=2).compliance_response(bom, INDICATORS)
@@ -0,0 +1,283 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import csv
+import io
+import math
+
+import pytest
+
+from ansys.grantami.bomanalytics import BoMHandler, TabularBoMBuilder
+from ansys.grantami.bomanalytics.bom_types import eco2301, eco2412, eco2505
+
+from .common import make_guid
+
+GLASS_DOOR_CSV = f"""BoM Level,Item Type,ID,Name,Quantity,Unit of measure,Mass,Mass unit,Material GUID
+1,Part,24X6-30,Glass door,1,Each,,,
+2,Part,P-30-L,Panel,1,Each,15.3,kg/Part,
+3,Material,,Aluminium,100,,,,{make_guid("Aluminium")}
+2,Part,HA-42-Al,Hinge,2,Each,,,
+3,Part,DIN-7991-M8-20,Screw,8,Each,0.01,kg/Part,
+4,Material,,Steel,100,,,,{make_guid("Steel")}
+3,Material,,Aluminium,100,,,,{make_guid("Aluminium")}
+2,Part,321-51,Glass,1.51,m^2,19.6,kg/m^2,
+3,Material,,Glass,100,,,,{make_guid("Glass")}
+"""
+
+GLASS_DOOR_COLUMNS = {
+    "level": "BoM Level",
+    "item_type": "Item Type",
+    "part_number": "ID",
+    "part_name": "Name",
+    "name": "Name",
+    "quantity": "Quantity",
+    "quantity_unit": "Unit of measure",
+    "percentage": "Quantity",
+    "mass_per_unit_of_measure": "Mass",
+    "mass_per_unit_of_measure_unit": "Mass unit",
+    "record_guid": "Material GUID",
+}
+
+
+def glass_door_rows():
+    return csv.DictReader(io.StringIO(GLASS_DOOR_CSV))
+
+
+def keyed_rows():
+    """Rows which define the same BoM as the glass door CSV by parent keys, in an order where children precede their
+    parents."""
+    unit = {"quantity_unit": "Each"}
+    return [
+        {"item_type": "Material", "parent": "Screw", "record_guid": make_guid("Steel"), "name": "Steel"},
+        {"part_number": "DIN-7991-M8-20", "key": "Screw", "parent": "HA-42-Al", "quantity": 8, **unit},
+        {"part_number": "24X6-30", "quantity": 1, **unit},
+        {"part_number": "P-30-L", "parent": "24X6-30", "quantity": 1, **unit},
+        {"item_type": "material", "parent": "P-30-L", "record_guid": make_guid("Aluminium"), "name": "Aluminium"},
+        {"part_number": "HA-42-Al", "parent": "24X6-30", "quantity": 2, **unit},
+        {"item_type": "Material", "parent": "HA-42-Al", "record_guid": make_guid("Aluminium"), "name": "Aluminium"},
+    ]
+
+
+@pytest.fixture(scope="module")
+def bom_handler():
+    return BoMHandler()
+
+
+class TestBuildFromLevels:
+    def test_build_glass_door(self):
+        bom = TabularBoMBuilder(eco2505.BillOfMaterials, columns=GLASS_DOOR_COLUMNS).build(glass_door_rows())
+
+        assert isinstance(bom, eco2505.BillOfMaterials)
+        [door] = bom.components
+        assert door.part_number == "24X6-30"
+        assert door.part_name == "Glass door"
+        assert door.quantity == eco2505.UnittedValue(value=1.0, unit="Each")
+        assert [part.part_number for part in door.components] == ["P-30-L", "HA-42-Al", "321-51"]
+        panel, hinge, glass = door.components
+        assert panel.mass_per_unit_of_measure == eco2505.UnittedValue(value=15.3, unit="kg/Part")
+        assert [part.part_number for part in hinge.components] == ["DIN-7991-M8-20"]
+        assert hinge.components[0].materials[0].name == "Steel"
+        assert hinge.materials[0].name == "Aluminium"
+        assert hinge.materials[0].percentage == 100.0
+        assert hinge.materials[0].mi_material_reference.record_guid == make_guid("Aluminium")
+        assert hinge.materials[0].mi_material_reference.db_key == "MI_Restricted_Substances"
+        assert glass.quantity == eco2505.UnittedValue(value=1.51, unit="m^2")
+
+    def test_processes_and_substances(self):
+        rows = [
+            {"level": 1, "part_number": "P1"},
+            {"level": 2, "item_type": "Substance", "record_history_identity": 12, "percentage": 0.5},
+            {"level": 2, "item_type": "Material", "record_history_guid": make_guid("M1"), "db_key": "MI_Custom"},
+            {"level": 3, "item_type": "Process", "record_guid": make_guid("Casting")},
+            {"level": 3, "item_type": "Process", "record_guid": make_guid("Drilling"), "dimension_type": "massremoved"},
+        ]
+        [part] = TabularBoMBuilder(eco2505.BillOfMaterials).build(rows).components
+        assert part.substances[0].mi_substance_reference.record_history_identity == 12
+        assert part.substances[0].percentage == 0.5
+        [material] = part.materials
+        assert material.mi_material_reference.db_key == "MI_Custom"
+        assert [process.dimension_type for process in material.processes] == [
+            eco2505.DimensionType.Mass,
+            eco2505.DimensionType.MassRemoved,
+        ]
+
+    def test_missing_values_are_ignored(self):
+        rows = [{"level": 1, "part_number": "P1", "part_name": " ", "quantity": math.nan, "quantity_unit": None}]
+        [part] = TabularBoMBuilder(eco2505.BillOfMaterials).build(rows).components
+        assert part.part_name is None
+        assert part.quantity is None
+
+    def test_other_bom_version(self):
+        bom = TabularBoMBuilder(eco2301.BillOfMaterials, columns=GLASS_DOOR_COLUMNS).build(glass_door_rows())
+        assert isinstance(bom, eco2301.BillOfMaterials)
+        assert isinstance(bom.components[0].components[0], eco2301.Part)
+
+
+class TestBuildFromParentKeys:
+    def test_rows_in_any_order(self):
+        bom = TabularBoMBuilder(eco2505.BillOfMaterials).build(keyed_rows())
+        [door] = bom.components
+        assert [part.part_number for part in door.components] == ["P-30-L", "HA-42-Al"]
+        hinge = door.components[1]
+        assert hinge.components[0].part_number == "DIN-7991-M8-20"
+        assert hinge.components[0].materials[0].name == "Steel"
+        assert hinge.materials[0].name == "Aluminium"
+
+    def test_rows_are_consumed_in_single_pass(self):
+        bom = TabularBoMBuilder(eco2505.BillOfMaterials).build(iter(keyed_rows()))
+        assert len(bom.components) == 1
+
+    def test_same_bom_as_levels(self, bom_handler):
+        levelled_rows = [
+            {"level": 1, "part_number": "24X6-30", "quantity": 1, "quantity_unit": "Each"},
+            {"level": 2, "part_number": "P-30-L", "quantity": 1, "quantity_unit": "Each"},
+            {"level": 2, "part_number": "HA-42-Al", "quantity": 2, "quantity_unit": "Each"},
+            {"level": 3, "part_number": "DIN-7991-M8-20", "quantity": 8, "quantity_unit": "Each"},
+            {"level": 4, "item_type": "Material", "record_guid": make_guid("Steel"), "name": "Steel"},
+            {"level": 3, "item_type": "Material", "record_guid": make_guid("Aluminium"), "name": "Aluminium"},
+        ]
+        builder = TabularBoMBuilder(eco2505.BillOfMaterials)
+        keyed_bom = builder.build(row for row in keyed_rows() if row.get("parent") != "P-30-L")
+        assert bom_handler.dump_bom(keyed_bom) == bom_handler.dump_bom(builder.build(levelled_rows))
+
+
+class TestWriteXml:
+    @pytest.mark.parametrize("validation", ["none", "lax", "strict"])
+    def test_streamed_xml_matches_built_bom(self, bom_handler, validation):
+        builder = TabularBoMBuilder(eco2505.BillOfMaterials, columns=GLASS_DOOR_COLUMNS)
+        output = io.StringIO()
+
+        part_count = builder.write_xml(glass_door_rows(), output, validation=validation)
+
+        assert part_count == 5
+        loaded_bom = bom_handler.load_bom_from_text(output.getvalue(), validation="strict")
+        assert bom_handler.dump_bom(loaded_bom) == bom_handler.dump_bom(builder.build(glass_door_rows()))
+
+    @pytest.mark.parametrize("bom_type", [eco2301.BillOfMaterials, eco2412.BillOfMaterials, eco2505.BillOfMaterials])
+    def test_loaded_xml_equals_built_bom(self, bom_handler, bom_type):
+        rows = [
+            {"level": 1, "part_number": "P1", "record_guid": make_guid("P1"), "quantity": 2, "quantity_unit": "Each"},
+            {"level": 2, "item_type": "Material", "record_guid": make_guid("M1"), "percentage": 80},
+            {
+                "level": 3,
+                "item_type": "Process",
+                "record_history_guid": make_guid("Casting"),
+                "quantity": 1.5,
+                "quantity_unit": "kg",
+            },
+            {"level": 2, "item_type": "Substance", "record_history_identity": 12, "percentage": 0.5},
+        ]
+        builder = TabularBoMBuilder(bom_type)
+        output = io.StringIO()
+        builder.write_xml(rows, output)
+        assert bom_handler.load_bom_from_text(output.getvalue()) == builder.build(rows)
+
+    def test_write_parent_keys_to_path(self, bom_handler, tmp_path):
+        builder = TabularBoMBuilder(eco2505.BillOfMaterials)
+        file_path = tmp_path / "bom.xml"
+
+        assert builder.write_xml(keyed_rows(), file_path) == 4
+
+        loaded_bom = bom_handler.load_bom_from_file(file_path)
+        assert bom_handler.dump_bom(loaded_bom) == bom_handler.dump_bom(builder.build(keyed_rows()))
+
+    def test_special_characters_are_escaped(self, bom_handler):
+        output = io.StringIO()
+        TabularBoMBuilder(eco2505.BillOfMaterials).write_xml([{"level": 1, "part_number": 'A&B <"C">'}], output)
+        assert bom_handler.load_bom_from_text(output.getvalue()).components[0].part_number == 'A&B <"C">'
+
+    def test_invalid_part_raises_value_error(self):
+        rows = [{"level": 1, "part_number": "P1"}, {"level": 2, "item_type": "Material", "record_guid": "Not a GUID"}]
+        with pytest.raises(ValueError, match="Invalid BoM object"):
+            TabularBoMBuilder(eco2505.BillOfMaterials).write_xml(rows, io.StringIO())
+
+    def test_invalid_validation_level_raises_value_error(self):
+        with pytest.raises(ValueError, match='validation "full" is not a valid validation level'):
+            TabularBoMBuilder(eco2505.BillOfMaterials).write_xml([], io.StringIO(), validation="full")
+
+
+class TestInvalidRows:
+    @pytest.mark.parametrize(
+        ["rows", "message"],
+        [
+            ([], "The rows do not define any parts"),
+            ([{"level": 1, "item_type": "Assembly", "part_number": "A"}], "Row 1: item type 'Assembly' is not"),
+            ([{"level": 1, "part_name": "A"}], "Row 1: Part items must have a part number"),
+            ([{"level": 1, "part_number": "A", "quantity": "two"}], "Row 1: value 'two' of 'quantity' is not a valid"),
+            ([{"level": 1.5, "part_number": "A"}], "Row 1: value '1.5' of 'level' is not a valid integer"),
+            ([{"level": 2, "part_number": "A"}], "Row 1: BoM level 2 is not valid"),
+            ([{"level": 1, "part_number": "A"}, {"level": 3, "part_number": "B"}], "Row 2: BoM level 3 is not valid"),
+            ([{"level": 1, "part_number": "A"}, {"part_number": "B"}], "Row 2: BoM level is missing"),
+            ([{"part_number": "A"}, {"level": 1, "part_number": "B"}], "Row 2: BoM level is specified"),
+            ([{"level": 1, "part_number": "A"}, {"level": 2, "item_type": "Material"}], "Row 2: Material items must"),
+            (
+                [{"level": 1, "item_type": "Material", "record_guid": make_guid("M")}],
+                "Row 1: a Material cannot be added to a BillOfMaterials",
+            ),
+            (
+                [
+                    {"level": 1, "part_number": "A"},
+                    {"level": 2, "item_type": "Material", "record_guid": make_guid("M")},
+                    {"level": 3, "part_number": "B"},
+                ],
+                "Row 3: a Part cannot be added to a Material",
+            ),
+            (
+                [
+                    {"level": 1, "part_number": "A"},
+                    {"level": 2, "item_type": "Process", "record_guid": make_guid("P"), "dimension_type": "Weight"},
+                ],
+                "Row 2: dimension type 'Weight' is not supported",
+            ),
+            ([{"item_type": "Material", "record_guid": make_guid("M")}], "Row 1: Material items must have a parent"),
+            ([{"part_number": "A"}, {"part_number": "A"}], "Row 2: key 'A' is used by more than one item"),
+            ([{"part_number": "A"}, {"part_number": "B", "parent": "C"}], "Row 2: no item has the parent key 'C'"),
+            (
+                [{"part_number": "A"}, {"part_number": "B", "parent": "C"}, {"part_number": "C", "parent": "B"}],
+                "2 rows are not linked to a root part",
+            ),
+        ],
+    )
+    def test_invalid_rows_raise_value_error(self, rows, message):
+        builder = TabularBoMBuilder(eco2505.BillOfMaterials)
+        with pytest.raises(ValueError, match=message):
+            builder.build(rows)
+        with pytest.raises(ValueError, match=message):
+            builder.write_xml(rows, io.StringIO(), validation="none")
+
+
+def test_unknown_column_field_raises_value_error():
+    with pytest.raises(ValueError, match="Column names were specified for unknown fields: part_no"):
+        TabularBoMBuilder(eco2505.BillOfMaterials, columns={"part_no": "Part Number"})
+
+
+def test_unsupported_bom_type_raises_value_error():
+    with pytest.raises(ValueError, match="is not a supported BoM type"):
+        TabularBoMBuilder(eco2505.Part)
+
+
+def test_repr():
+    builder = TabularBoMBuilder(eco2505.BillOfMaterials)
+    assert (
+        repr(builder) == "<TabularBoMBuilder: ansys.grantami.bomanalytics.bom_types.eco2505._bom_types.BillOfMaterials>"
+    )
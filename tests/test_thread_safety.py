@@ -0,0 +1,115 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+import requests_mock
+
+from ansys.grantami.bomanalytics import queries
+from ansys.grantami.bomanalytics.queries import _get_bom_handler
+
+from .common import MATERIAL_IDS, echo_materials
+from .inputs import example_boms
+
+THREADS = 16
+RUNS_PER_THREAD = 8
+
+
+class TestConcurrentRuns:
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_connection):
+        self.connection = mock_connection
+
+    def run_concurrently(self, run):
+        with requests_mock.Mocker() as mocker:
+            mocker.post(requests_mock.ANY, json=echo_materials)
+            with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                futures = [executor.submit(run) for _ in range(THREADS * RUNS_PER_THREAD)]
+                return [future.result() for future in futures]
+
+    def test_same_query_from_many_threads(self):
+        query = (
+            queries.MaterialImpactedSubstancesQuery()
+            .with_material_ids(MATERIAL_IDS)
+            .with_legislation_ids(["SINList"])
+            .with_batch_size(3)
+        )
+        results = self.run_concurrently(lambda: self.connection.run(query))
+        for result in results:
+            assert [material.material_id for material in result.impacted_substances_by_material] == MATERIAL_IDS
+            assert len(result.messages) == 9
+        assert len(query._data._item_definitions) == len(MATERIAL_IDS)
+
+    def test_template_clones_from_many_threads(self):
+        template = queries.MaterialImpactedSubstancesQuery().with_legislation_ids(["SINList"]).as_template()
+        counter = iter(range(THREADS * RUNS_PER_THREAD))
+        lock = threading.Lock()
+
+        def run():
+            with lock:
+                index = next(counter)
+            material_ids = MATERIAL_IDS[: index % len(MATERIAL_IDS) + 1]
+            result = self.connection.run(template.clone().with_material_ids(material_ids))
+            return material_ids, [material.material_id for material in result.impacted_substances_by_material]
+
+        for material_ids, result_ids in self.run_concurrently(run):
+            assert result_ids == material_ids
+
+    def test_configuration_change_is_atomic(self):
+        query = queries.MaterialImpactedSubstancesQuery().with_material_ids(MATERIAL_IDS).with_legislation_ids(["L"])
+        query.with_batch_size(1)
+        stop = threading.Event()
+
+        def change_database():
+            while not stop.is_set():
+                self.connection.set_database_details(database_key="OTHER_DB", substances_table_name="Other")
+                self.connection.set_database_details()
+
+        changer = threading.Thread(target=change_database)
+        changer.start()
+        try:
+            results = self.run_concurrently(lambda: self.connection.run(query))
+        finally:
+            stop.set()
+            changer.join()
+        for result in results:
+            assert len({message.message for message in result.messages}) == 1
+
+
+def test_bom_handlers_are_not_shared_by_threads():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        handlers = list(executor.map(lambda _: _get_bom_handler(), range(2)))
+    assert _get_bom_handler() is _get_bom_handler()
+    assert _get_bom_handler() not in handlers
+
+
+def test_bom_query_serialized_from_many_threads():
+    # BoMs provided as XML are read in each thread before they are partitioned. Each thread loads the XML schemas to
+    # create its own BoM handler, so fewer threads are used than in other tests.
+    bom = example_boms["sustainability-bom-2505"].content
+    query = queries.BomImpactedSubstancesQuery().with_bom(bom).with_partitioning(1).with_deduplication()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        arguments = list(executor.map(lambda _: query._data.batched_arguments, range(THREADS * 2)))
+    assert len(arguments[0]) > 1
+    assert all(argument == arguments[0] for argument in arguments)